@@ -20,6 +20,8 @@ import clara.customization.models  # noqa: F401
 import clara.notifications.models  # noqa: F401
 import clara.dav_sync.models  # noqa: F401
 import clara.git_sync.models  # noqa: F401
+import clara.exports.models  # noqa: F401
+import clara.imports.models  # noqa: F401
 
 config = context.config
 settings = get_settings()
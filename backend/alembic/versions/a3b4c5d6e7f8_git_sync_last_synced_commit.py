@@ -0,0 +1,29 @@
+"""add last_synced_commit to git_sync_configs
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-17 23:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3b4c5d6e7f8'
+down_revision: Union[str, Sequence[str], None] = 'f2a3b4c5d6e7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'git_sync_configs',
+        sa.Column('last_synced_commit', sa.String(length=40), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('git_sync_configs', 'last_synced_commit')
@@ -0,0 +1,29 @@
+"""add blob_sha to git_sync_mappings
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-17 23:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4c5d6e7f8a9'
+down_revision: Union[str, Sequence[str], None] = 'a3b4c5d6e7f8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'git_sync_mappings',
+        sa.Column('blob_sha', sa.String(length=40), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('git_sync_mappings', 'blob_sha')
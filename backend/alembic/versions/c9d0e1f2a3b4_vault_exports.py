@@ -0,0 +1,72 @@
+"""add vault_exports
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9d0e1f2a3b4'
+down_revision: Union[str, Sequence[str], None] = 'b8c9d0e1f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'vault_exports',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('vault_id', sa.Uuid(), nullable=False),
+        sa.Column('requested_by', sa.Uuid(), nullable=False),
+        sa.Column('format', sa.String(10), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('progress', sa.Integer(), nullable=False),
+        sa.Column('fingerprint', sa.String(64), nullable=False),
+        sa.Column('storage_key', sa.String(1000), nullable=True),
+        sa.Column('size_bytes', sa.BigInteger(), nullable=True),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['vault_id'],
+            ['vaults.id'],
+            name=op.f('fk_vault_exports_vault_id_vaults'),
+        ),
+        sa.ForeignKeyConstraint(
+            ['requested_by'],
+            ['users.id'],
+            name=op.f('fk_vault_exports_requested_by_users'),
+        ),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_vault_exports')),
+    )
+    op.create_index(op.f('ix_vault_exports_vault_id'), 'vault_exports', ['vault_id'])
+    op.create_index(
+        'ix_vault_exports_vault_id_created_at',
+        'vault_exports',
+        ['vault_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_vault_exports_vault_id_created_at', table_name='vault_exports')
+    op.drop_index(op.f('ix_vault_exports_vault_id'), table_name='vault_exports')
+    op.drop_table('vault_exports')
@@ -0,0 +1,78 @@
+"""add contact_imports
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-17 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd0e1f2a3b4c5'
+down_revision: Union[str, Sequence[str], None] = 'c9d0e1f2a3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'contact_imports',
+        sa.Column('id', sa.Uuid(), nullable=False),
+        sa.Column('vault_id', sa.Uuid(), nullable=False),
+        sa.Column('requested_by', sa.Uuid(), nullable=False),
+        sa.Column('filename', sa.String(500), nullable=False),
+        sa.Column('storage_key', sa.String(1000), nullable=False),
+        sa.Column('field_map', sa.JSON(), nullable=True),
+        sa.Column('status', sa.String(20), nullable=False),
+        sa.Column('progress', sa.Integer(), nullable=False),
+        sa.Column('size_bytes', sa.BigInteger(), nullable=False),
+        sa.Column('rows_processed', sa.Integer(), nullable=False),
+        sa.Column('imported', sa.Integer(), nullable=False),
+        sa.Column('failed', sa.Integer(), nullable=False),
+        sa.Column('errors', sa.JSON(), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(
+            ['vault_id'], ['vaults.id'], name=op.f('fk_contact_imports_vault_id_vaults')
+        ),
+        sa.ForeignKeyConstraint(
+            ['requested_by'],
+            ['users.id'],
+            name=op.f('fk_contact_imports_requested_by_users'),
+        ),
+        sa.PrimaryKeyConstraint('id', name=op.f('pk_contact_imports')),
+    )
+    op.create_index(
+        op.f('ix_contact_imports_vault_id'), 'contact_imports', ['vault_id']
+    )
+    op.create_index(
+        'ix_contact_imports_vault_id_created_at',
+        'contact_imports',
+        ['vault_id', sa.text('created_at DESC'), sa.text('id DESC')],
+        postgresql_where=sa.text('deleted_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        'ix_contact_imports_vault_id_created_at', table_name='contact_imports'
+    )
+    op.drop_index(op.f('ix_contact_imports_vault_id'), table_name='contact_imports')
+    op.drop_table('contact_imports')
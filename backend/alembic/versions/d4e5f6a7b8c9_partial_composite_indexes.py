@@ -0,0 +1,156 @@
+"""partial composite indexes for vault-scoped queries
+
+Revision ID: d4e5f6a7b8c9
+Revises: b3c4d5e6f7a8
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4e5f6a7b8c9'
+down_revision: Union[str, Sequence[str], None] = 'b3c4d5e6f7a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+LIVE_ROWS = sa.text('deleted_at IS NULL')
+
+VAULT_SCOPED_TABLES = (
+    'activities',
+    'activity_participants',
+    'activity_types',
+    'addresses',
+    'contact_methods',
+    'contact_relationships',
+    'contacts',
+    'custom_field_definitions',
+    'custom_field_values',
+    'dav_sync_accounts',
+    'dav_sync_mappings',
+    'debts',
+    'file_links',
+    'files',
+    'gifts',
+    'git_sync_configs',
+    'git_sync_mappings',
+    'journal_entries',
+    'journal_entry_contacts',
+    'notes',
+    'notifications',
+    'pets',
+    'relationship_types',
+    'reminders',
+    'stay_in_touch_configs',
+    'tags',
+    'tasks',
+    'template_modules',
+    'template_pages',
+    'templates',
+)
+
+# (name, table, columns, partial)
+DOMAIN_INDEXES = (
+    (
+        'ix_activities_vault_id_happened_at',
+        'activities',
+        ['vault_id', sa.text('happened_at DESC'), sa.text('id DESC')],
+        True,
+    ),
+    (
+        'ix_journal_entries_vault_id_entry_date',
+        'journal_entries',
+        ['vault_id', sa.text('entry_date DESC'), sa.text('id DESC')],
+        True,
+    ),
+    (
+        'ix_reminders_vault_id_status_next_expected_date',
+        'reminders',
+        ['vault_id', 'status', 'next_expected_date'],
+        True,
+    ),
+    (
+        'ix_notifications_user_id_vault_id_read_created_at',
+        'notifications',
+        ['user_id', 'vault_id', 'read', sa.text('created_at DESC')],
+        True,
+    ),
+    (
+        'ix_activity_participants_activity_id',
+        'activity_participants',
+        ['activity_id'],
+        False,
+    ),
+    (
+        'ix_activity_participants_contact_id',
+        'activity_participants',
+        ['contact_id'],
+        False,
+    ),
+    ('ix_contact_methods_contact_id', 'contact_methods', ['contact_id'], False),
+    ('ix_addresses_contact_id', 'addresses', ['contact_id'], False),
+    ('ix_pets_contact_id', 'pets', ['contact_id'], False),
+    (
+        'ix_contact_relationships_contact_id',
+        'contact_relationships',
+        ['contact_id'],
+        False,
+    ),
+)
+
+
+def _existing_tables() -> set[str]:
+    return set(sa.inspect(op.get_bind()).get_table_names())
+
+
+def upgrade() -> None:
+    # notifications has no create_table migration yet; skip it where absent.
+    tables = _existing_tables()
+    # CONCURRENTLY keeps large tables writable while the indexes build.
+    with op.get_context().autocommit_block():
+        for table in VAULT_SCOPED_TABLES:
+            if table not in tables:
+                continue
+            op.create_index(
+                f'ix_{table}_vault_id_created_at',
+                table,
+                ['vault_id', sa.text('created_at DESC'), sa.text('id DESC')],
+                postgresql_where=LIVE_ROWS,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, table, columns, partial in DOMAIN_INDEXES:
+            if table not in tables:
+                continue
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_where=LIVE_ROWS if partial else None,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    tables = _existing_tables()
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(DOMAIN_INDEXES):
+            if table in tables:
+                op.drop_index(
+                    name,
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
+        for table in reversed(VAULT_SCOPED_TABLES):
+            if table in tables:
+                op.drop_index(
+                    f'ix_{table}_vault_id_created_at',
+                    table_name=table,
+                    postgresql_concurrently=True,
+                    if_exists=True,
+                )
@@ -0,0 +1,73 @@
+"""full-text search vectors
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5f6a7b8c9d0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6a7b8c9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _weighted(config: str, weight: str, *columns: str) -> str:
+    text = " || ' ' || ".join(f"coalesce({c}, '')" for c in columns)
+    return f"setweight(to_tsvector('{config}', {text}), '{weight}')"
+
+
+# Keep in sync with clara.search.repository.SOURCES.
+SEARCH_VECTORS = {
+    'contacts': ' || '.join([
+        _weighted('simple', 'A', 'first_name', 'last_name', 'nickname'),
+        _weighted('simple', 'B', 'notes_summary'),
+    ]),
+    'notes': ' || '.join([
+        _weighted('english', 'A', 'title'),
+        _weighted('english', 'B', 'body_markdown'),
+    ]),
+    'activities': ' || '.join([
+        _weighted('english', 'A', 'title'),
+        _weighted('english', 'B', 'description', 'location'),
+    ]),
+    'journal_entries': ' || '.join([
+        _weighted('english', 'A', 'title'),
+        _weighted('english', 'B', 'body_markdown'),
+    ]),
+}
+
+
+def upgrade() -> None:
+    for table, expression in SEARCH_VECTORS.items():
+        op.add_column(
+            table,
+            sa.Column(
+                'search_vector',
+                postgresql.TSVECTOR(),
+                sa.Computed(expression, persisted=True),
+            ),
+        )
+    with op.get_context().autocommit_block():
+        for table in SEARCH_VECTORS:
+            op.create_index(
+                f'ix_{table}_search_vector',
+                table,
+                ['search_vector'],
+                postgresql_using='gin',
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    for table in SEARCH_VECTORS:
+        op.drop_index(f'ix_{table}_search_vector', table_name=table)
+        op.drop_column(table, 'search_vector')
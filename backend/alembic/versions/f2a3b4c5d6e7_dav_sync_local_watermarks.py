@@ -0,0 +1,29 @@
+"""add local_watermarks to dav_sync_accounts
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-17 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a3b4c5d6e7'
+down_revision: Union[str, Sequence[str], None] = 'e1f2a3b4c5d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'dav_sync_accounts',
+        sa.Column('local_watermarks', sa.JSON(), nullable=False, server_default='{}'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('dav_sync_accounts', 'local_watermarks')
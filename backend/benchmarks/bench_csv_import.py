@@ -0,0 +1,102 @@
+"""Contact CSV import throughput, before and after.
+
+"before" is the old loop: one ``ContactRepository.create`` (INSERT, then a
+refreshing SELECT) per row. "inline" is ``import_csv`` as the request
+endpoint runs it (multi-row INSERT … RETURNING per batch) and "job" is the
+background job's ``copy_contacts`` path, which uses ``COPY`` on asyncpg.
+Runs against in-memory SQLite unless ``--database-url`` points at a
+``postgresql+asyncpg://`` database (rows are inserted into random vault ids
+and rolled back). Prints rows/second.
+
+Usage: ``python benchmarks/bench_csv_import.py [--rows 20000] [--database-url URL]``
+"""
+
+import argparse
+import asyncio
+import csv
+import importlib
+import io
+import os
+import pkgutil
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+
+os.environ.setdefault("SECRET_KEY", "bench-secret-key-for-clara-123456")
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/bench")
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import clara
+from clara.base.model import Base
+from clara.contacts.repository import ContactRepository
+from clara.integrations.csv_io import copy_contacts, import_csv, iter_import_batches
+
+
+def _csv(rows: int) -> str:
+    out = io.StringIO()
+    writer = csv.writer(out)
+    writer.writerow(["first_name", "last_name", "nickname", "birthdate", "favorite"])
+    for i in range(rows):
+        writer.writerow([f"First{i}", f"Last{i}", f"nick{i}", "1990-01-02", i % 2])
+    return out.getvalue()
+
+
+async def _before(session: AsyncSession, data: str) -> None:
+    repo = ContactRepository(session=session, vault_id=uuid.uuid4())
+    for row in csv.DictReader(io.StringIO(data)):
+        await repo.create(
+            first_name=row["first_name"],
+            last_name=row["last_name"],
+            nickname=row["nickname"],
+        )
+
+
+async def _inline(session: AsyncSession, data: str) -> None:
+    await import_csv(session, uuid.uuid4(), data)
+
+
+async def _job(session: AsyncSession, data: str) -> None:
+    vault_id = uuid.uuid4()
+    for batch in iter_import_batches(io.StringIO(data)):
+        await copy_contacts(session, vault_id, batch.rows)
+
+
+async def main(rows: int, database_url: str | None) -> None:
+    for module in pkgutil.walk_packages(clara.__path__, f"{clara.__name__}."):
+        if module.name.endswith(".models"):
+            importlib.import_module(module.name)
+    if database_url:
+        engine = create_async_engine(database_url)
+    else:
+        engine = create_async_engine(
+            "sqlite+aiosqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    data = _csv(rows)
+    runs: dict[str, Callable[[AsyncSession, str], Awaitable[None]]] = {
+        "before": _before,
+        "inline": _inline,
+        "job": _job,
+    }
+    for label, run in runs.items():
+        async with factory() as session:
+            start = time.perf_counter()
+            await run(session, data)
+            elapsed = time.perf_counter() - start
+            await session.rollback()
+        print(f"{label:>6}: {rows / elapsed:8.0f} rows/s")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--database-url")
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.database_url))
@@ -0,0 +1,111 @@
+"""DAV listing and parse CPU cost, before and after.
+
+"before" is the old pipeline: the etag listing parsed with ElementTree,
+every vCard fully parsed with ``vobject.readOne`` just to read its UID,
+and parsed again when the card is converted. "after" is the shipped one:
+regex pre-scans for etags and UIDs, and a ``DavResource`` that parses its
+data once on first use. Prints CPU seconds per phase for the corpus.
+
+Usage: ``python benchmarks/bench_dav_parse.py [--cards 10000]``
+"""
+
+import argparse
+import os
+import time
+from collections.abc import Callable
+
+os.environ.setdefault("SECRET_KEY", "bench-secret-key-for-clara-123456")
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/bench")
+
+import vobject
+
+from clara.dav_sync.client import (
+    DavResource,
+    _parse_multistatus,
+    scan_etags,
+    scan_uid,
+)
+from clara.dav_sync.converters.contact import vcard_to_contact_data
+
+
+def _vcards(count: int) -> list[str]:
+    return [
+        "BEGIN:VCARD\r\nVERSION:3.0\r\n"
+        f"UID:urn:uuid:00000000-0000-0000-0000-{i:012d}\r\n"
+        f"N:Last{i};First{i};;;\r\nFN:First{i} Last{i}\r\n"
+        f"EMAIL;TYPE=home:person{i}@example.com\r\nTEL;TYPE=cell:+1555{i:07d}\r\n"
+        f"ADR;TYPE=home:;;{i} Main St;Town;;{i % 99999:05d};US\r\n"
+        f"CATEGORIES:Group{i % 20},Imported\r\n"
+        "END:VCARD\r\n"
+        for i in range(count)
+    ]
+
+
+def _etag_listing(count: int) -> str:
+    responses = "".join(
+        f"<d:response><d:href>/dav/addressbooks/u/contacts/{i}.vcf</d:href>"
+        f'<d:propstat><d:prop><d:getetag>"etag-{i}"</d:getetag></d:prop>'
+        "<d:status>HTTP/1.1 200 OK</d:status></d:propstat></d:response>"
+        for i in range(count)
+    )
+    return (
+        '<?xml version="1.0"?><d:multistatus xmlns:d="DAV:">'
+        f"{responses}</d:multistatus>"
+    )
+
+
+def _listing_before(xml: str) -> None:
+    for _href, _etag, _ in _parse_multistatus(xml):
+        pass
+
+
+def _listing_after(xml: str) -> None:
+    for _href, _etag in scan_etags(xml):
+        pass
+
+
+def _uids_before(cards: list[str]) -> list[str]:
+    return [vobject.readOne(text).uid.value for text in cards]
+
+
+def _uids_after(cards: list[str]) -> list[str | None]:
+    return [scan_uid(text) for text in cards]
+
+
+def _apply_before(cards: list[str]) -> None:
+    for uid, text in zip(_uids_before(cards), cards, strict=True):
+        DavResource(uid, "", None, text)
+        vcard_to_contact_data(vobject.readOne(text))
+
+
+def _apply_after(cards: list[str]) -> None:
+    for text in cards:
+        resource = DavResource(scan_uid(text) or "", "", None, text)
+        vcard_to_contact_data(resource.vcard)
+
+
+def _cpu(run: Callable[[], object]) -> float:
+    start = time.process_time()
+    run()
+    return time.process_time() - start
+
+
+def main(count: int) -> None:
+    cards = _vcards(count)
+    xml = _etag_listing(count)
+    phases = (
+        ("etag listing", lambda: _listing_before(xml), lambda: _listing_after(xml)),
+        ("uid scan", lambda: _uids_before(cards), lambda: _uids_after(cards)),
+        ("uid + convert", lambda: _apply_before(cards), lambda: _apply_after(cards)),
+    )
+    print(f"{count} cards, CPU seconds")
+    for label, before, after in phases:
+        b, a = _cpu(before), _cpu(after)
+        print(f"{label:>14}: before {b:7.3f}  after {a:7.3f}  ({b / a:5.1f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.cards)
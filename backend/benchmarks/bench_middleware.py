@@ -0,0 +1,181 @@
+"""Request throughput through the middleware stack, before and after.
+
+"before" rebuilds the app with the CSRF, request-size and logging
+middleware as ``BaseHTTPMiddleware`` dispatch functions (what the app
+used to run). "after" is ``create_app()`` as shipped, with the same logic
+as pure ASGI middleware. Both serve ``GET /api/v1/health`` and the
+contacts list of a seeded in-memory SQLite vault. Prints requests/second.
+The contacts run authenticates with a JWT, so it needs the Redis at
+``REDIS_URL`` for the blacklist check.
+
+Usage: ``python benchmarks/bench_middleware.py [--requests 2000] [--concurrency 16]``
+"""
+
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import pkgutil
+import time
+from collections.abc import AsyncGenerator
+
+os.environ.setdefault("SECRET_KEY", "bench-secret-key-for-clara-123456")
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/bench")
+
+import structlog
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+from starlette.middleware import Middleware
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.middleware.base import RequestResponseEndpoint as CallNext
+from starlette.requests import Request
+from starlette.responses import Response
+
+import clara
+from clara.auth.models import User, Vault, VaultMembership, VaultSettings
+from clara.auth.security import create_access_token
+from clara.base.model import Base
+from clara.config import get_settings
+from clara.contacts.models import Contact
+from clara.database import get_session
+from clara.main import create_app
+from clara.middleware import (
+    CSRFMiddleware,
+    RequestLoggingMiddleware,
+    RequestSizeLimitMiddleware,
+    _csrf_ok,
+)
+
+logger = structlog.get_logger()
+
+
+async def _legacy_csrf(request: Request, call_next: CallNext) -> Response:
+    if request.method not in {"GET", "HEAD", "OPTIONS"} and not _csrf_ok(request):
+        return JSONResponse(
+            status_code=403, content={"detail": "CSRF token missing or invalid"}
+        )
+    return await call_next(request)
+
+
+async def _legacy_size(request: Request, call_next: CallNext) -> Response:
+    settings = get_settings()
+    content_length = request.headers.get("content-length")
+    if content_length is not None and int(content_length) > settings.max_body_size:
+        return JSONResponse(
+            status_code=413, content={"detail": "Request body too large"}
+        )
+    return await call_next(request)
+
+
+async def _legacy_log(request: Request, call_next: CallNext) -> Response:
+    start = time.monotonic()
+    response = await call_next(request)
+    logger.info(
+        "request_handled",
+        method=request.method,
+        path=request.url.path,
+        status=response.status_code,
+        duration_ms=round((time.monotonic() - start) * 1000, 1),
+    )
+    return response
+
+
+_LEGACY = {
+    RequestLoggingMiddleware: _legacy_log,
+    RequestSizeLimitMiddleware: _legacy_size,
+    CSRFMiddleware: _legacy_csrf,
+}
+
+
+def _legacy_app() -> FastAPI:
+    app = create_app()
+    app.user_middleware = [
+        Middleware(BaseHTTPMiddleware, dispatch=_LEGACY[m.cls])
+        if m.cls in _LEGACY
+        else m
+        for m in app.user_middleware
+    ]
+    return app
+
+
+async def _seed() -> tuple[async_sessionmaker[AsyncSession], str, str]:
+    for module in pkgutil.walk_packages(clara.__path__, f"{clara.__name__}."):
+        if module.name.endswith(".models"):
+            importlib.import_module(module.name)
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        user = User(email="bench@example.com", name="Bench", hashed_password="x")
+        session.add(user)
+        await session.flush()
+        vault = Vault(name="Bench", owner_user_id=user.id)
+        session.add(vault)
+        await session.flush()
+        session.add(VaultMembership(user_id=user.id, vault_id=vault.id, role="owner"))
+        session.add(VaultSettings(vault_id=vault.id))
+        session.add_all(
+            Contact(vault_id=vault.id, first_name=f"Contact {i}") for i in range(50)
+        )
+        await session.commit()
+    return factory, create_access_token(str(user.id)), str(vault.id)
+
+
+async def _throughput(
+    app: FastAPI, url: str, token: str, requests: int, concurrency: int
+) -> float:
+    headers = {"Authorization": f"Bearer {token}"}
+    remaining = requests
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://bench"
+    ) as client:
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                resp = await client.get(url, headers=headers)
+                resp.raise_for_status()
+
+        await client.get(url, headers=headers)
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start)
+
+
+async def main(requests: int, concurrency: int) -> None:
+    logging.disable(logging.CRITICAL)
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+    factory, token, vault_id = await _seed()
+
+    async def bench_session() -> AsyncGenerator[AsyncSession, None]:
+        async with factory() as session:
+            yield session
+
+    urls = {
+        "health": "/api/v1/health",
+        "contacts": f"/api/v1/vaults/{vault_id}/contacts",
+    }
+    for label, build in (("before", _legacy_app), ("after", create_app)):
+        app = build()
+        app.dependency_overrides[get_session] = bench_session
+        for name, url in urls.items():
+            rps = await _throughput(app, url, token, requests, concurrency)
+            print(f"{label:>6} {name:>8}: {rps:8.0f} req/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
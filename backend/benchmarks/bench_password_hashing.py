@@ -0,0 +1,85 @@
+"""Latency of cheap GETs while argon2 password checks are in flight.
+
+Fires a steady stream of ``GET /api/v1/health`` requests at the ASGI app
+while a batch of concurrent password verifications (what ``/auth/login``
+and PAT auth do) runs, once with ``verify_password`` called inline on the
+event loop and once with ``verify_password_async``. Prints p50/p99 GET
+latency for each mode.
+
+Usage: ``python benchmarks/bench_password_hashing.py [--logins 32]``
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+
+os.environ.setdefault("SECRET_KEY", "bench-secret-key-for-clara-123456")
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/bench")
+
+from httpx import ASGITransport, AsyncClient
+
+from clara.auth.security import hash_password, verify_password, verify_password_async
+from clara.main import create_app
+
+
+async def _inline(plain: str, hashed: str) -> bool:
+    return verify_password(plain, hashed)
+
+
+async def _measure(
+    verify: Callable[[str, str], Awaitable[bool]], logins: int, hashed: str
+) -> list[float]:
+    latencies: list[float] = []
+    done = asyncio.Event()
+
+    async with AsyncClient(
+        transport=ASGITransport(app=create_app()), base_url="http://bench"
+    ) as client:
+
+        async def poll() -> None:
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/api/v1/health")
+                latencies.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.001)
+
+        async def login(i: int) -> None:
+            await asyncio.sleep(i * 0.005)
+            await verify("password", hashed)
+
+        async def login_burst() -> None:
+            await asyncio.gather(*(login(i) for i in range(logins)))
+            done.set()
+
+        await asyncio.gather(poll(), login_burst())
+    return latencies
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    print(
+        f"{label:>8}: {len(latencies):5d} GETs  "
+        f"p50={_percentile(latencies, 50):8.2f} ms  "
+        f"p99={_percentile(latencies, 99):8.2f} ms  "
+        f"max={max(latencies):8.2f} ms"
+    )
+
+
+async def main(logins: int) -> None:
+    logging.disable(logging.CRITICAL)
+    hashed = hash_password("password")
+    _report("inline", await _measure(_inline, logins, hashed))
+    _report("pooled", await _measure(verify_password_async, logins, hashed))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=32)
+    asyncio.run(main(parser.parse_args().logins))
@@ -0,0 +1,97 @@
+"""vCard import throughput, before and after.
+
+"before" is the old loop: ``vobject.readComponents`` over the whole file on
+the event loop and one ``ContactRepository.create`` plus a flush per card.
+"after" is ``import_vcard`` as shipped: cards parsed in chunks on the
+process pool, tags resolved through a per-import cache and one INSERT per
+table per chunk. Runs against in-memory SQLite. Prints cards/second.
+
+Usage: ``python benchmarks/bench_vcard_import.py [--cards 5000] [--workers 4]``
+"""
+
+import argparse
+import asyncio
+import importlib
+import os
+import pkgutil
+import time
+import uuid
+
+os.environ.setdefault("SECRET_KEY", "bench-secret-key-for-clara-123456")
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/bench")
+
+import vobject
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+import clara
+from clara.base.model import Base
+from clara.config import get_settings
+from clara.contacts.models import Address, ContactMethod
+from clara.contacts.repository import ContactRepository
+from clara.dav_sync.converters.contact import vcard_to_contact_data
+from clara.integrations.vcard import import_vcard
+
+
+def _vcards(count: int) -> str:
+    return "".join(
+        "BEGIN:VCARD\r\nVERSION:3.0\r\n"
+        f"N:Last{i};First{i};;;\r\nFN:First{i} Last{i}\r\n"
+        f"EMAIL;TYPE=home:person{i}@example.com\r\nTEL;TYPE=cell:+1555{i:07d}\r\n"
+        f"ADR;TYPE=home:;;{i} Main St;Town;;{i % 99999:05d};US\r\n"
+        f"CATEGORIES:Group{i % 20},Imported\r\n"
+        "END:VCARD\r\n"
+        for i in range(count)
+    )
+
+
+async def _before(session: AsyncSession, data: str) -> None:
+    vault_id = uuid.uuid4()
+    repo = ContactRepository(session=session, vault_id=vault_id)
+    for vcard in vobject.readComponents(data):
+        parsed = vcard_to_contact_data(vcard)
+        contact = await repo.create(**parsed["contact_fields"])
+        for cm in parsed["contact_methods"]:
+            session.add(ContactMethod(vault_id=vault_id, contact_id=contact.id, **cm))
+        for addr in parsed["addresses"]:
+            session.add(Address(vault_id=vault_id, contact_id=contact.id, **addr))
+        await session.flush()
+
+
+async def _after(session: AsyncSession, data: str) -> None:
+    await import_vcard(session, uuid.uuid4(), data)
+
+
+async def main(cards: int, workers: int) -> None:
+    get_settings().vcard_parse_workers = workers
+    for module in pkgutil.walk_packages(clara.__path__, f"{clara.__name__}."):
+        if module.name.endswith(".models"):
+            importlib.import_module(module.name)
+    engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    data = _vcards(cards)
+    async with factory() as session:
+        await _after(session, _vcards(1))  # start the parse pool
+        await session.rollback()
+    for label, run in (("before", _before), ("after", _after)):
+        async with factory() as session:
+            start = time.perf_counter()
+            await run(session, data)
+            elapsed = time.perf_counter() - start
+            await session.rollback()
+        print(f"{label:>6}: {cards / elapsed:8.0f} cards/s")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+    asyncio.run(main(args.cards, args.workers))
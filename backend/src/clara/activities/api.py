@@ -57,13 +57,18 @@ ActivitySvc = Annotated[ActivityService, Depends(get_activity_service)]
 async def list_activity_types(
     svc: TypeSvc, pagination: PaginationParams = Depends()
 ) -> PaginatedResponse[ActivityTypeRead]:
-    items, total = await svc.list_types(
-        offset=pagination.offset, limit=pagination.limit
+    page = await svc.list_types(
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
     return PaginatedResponse(
-        items=[ActivityTypeRead.model_validate(t) for t in items],
+        items=[ActivityTypeRead.model_validate(t) for t in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
@@ -96,13 +101,19 @@ async def list_activities(
     pagination: PaginationParams = Depends(),
     q: str | None = None,
 ) -> PaginatedResponse[ActivityRead]:
-    items, total = await svc.list_activities(
-        offset=pagination.offset, limit=pagination.limit, q=q
+    page = await svc.list_activities(
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        q=q,
     )
     return PaginatedResponse(
-        items=[ActivityRead.model_validate(a) for a in items],
+        items=[ActivityRead.model_validate(a) for a in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from clara.base.model import VaultScopedModel
@@ -16,6 +16,16 @@ class ActivityType(VaultScopedModel):
 
 class Activity(VaultScopedModel):
     __tablename__ = "activities"
+    __table_args__ = (
+        Index(
+            "ix_activities_vault_id_happened_at",
+            "vault_id",
+            text("happened_at DESC"),
+            text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
     activity_type_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("activity_types.id"), nullable=True
     )
@@ -32,10 +42,10 @@ class Activity(VaultScopedModel):
 class ActivityParticipant(VaultScopedModel):
     __tablename__ = "activity_participants"
     activity_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("activities.id")
+        Uuid, ForeignKey("activities.id"), index=True
     )
     contact_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("contacts.id")
+        Uuid, ForeignKey("contacts.id"), index=True
     )
     role: Mapped[str] = mapped_column(String(100), default="")
     activity: Mapped[Activity] = relationship(back_populates="participants")
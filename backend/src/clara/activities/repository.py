@@ -1,11 +1,10 @@
 import uuid
-from collections.abc import Sequence
 
-from sqlalchemy import Select, func, or_, select
+from sqlalchemy import Select, or_, select
 from sqlalchemy.orm import selectinload
 
 from clara.activities.models import Activity, ActivityParticipant, ActivityType
-from clara.base.repository import BaseRepository
+from clara.base.repository import BaseRepository, Page
 
 
 class ActivityTypeRepository(BaseRepository[ActivityType]):
@@ -23,14 +22,14 @@ class ActivityRepository(BaseRepository[Activity]):
         )
 
     async def list(
-        self, *, offset: int = 0, limit: int = 50, q: str | None = None
-    ) -> tuple[Sequence[Activity], int]:
-        base_where = (
-            select(func.count())
-            .select_from(Activity)
-            .where(Activity.vault_id == self.vault_id)
-            .where(Activity.deleted_at.is_(None))
-        )
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+        q: str | None = None,
+    ) -> Page[Activity]:
+        base_where = self._count_query()
         items_stmt = self._base_query()
         if q:
             pattern = f"%{q}%"
@@ -40,32 +39,35 @@ class ActivityRepository(BaseRepository[Activity]):
             )
             base_where = base_where.where(filt)
             items_stmt = items_stmt.where(filt)
-        total: int = (await self.session.execute(base_where)).scalar_one()
-        items_stmt = (
-            items_stmt.order_by(Activity.happened_at.desc())
-            .offset(offset)
-            .limit(limit)
+        return await self._paginate(
+            items_stmt,
+            order_by=Activity.happened_at.desc(),
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count_stmt=base_where,
         )
-        result = await self.session.execute(items_stmt)
-        return result.scalars().all(), total
 
     async def list_by_contact(
-        self, contact_id: uuid.UUID, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Activity], int]:
+        self,
+        contact_id: uuid.UUID,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Activity]:
         base = (
             self._base_query()
             .join(ActivityParticipant)
             .where(ActivityParticipant.contact_id == contact_id)
         )
-        count_stmt = select(func.count()).select_from(base.subquery())
-        total: int = (await self.session.execute(count_stmt)).scalar_one()
-        items_stmt = (
-            base.order_by(Activity.happened_at.desc())
-            .offset(offset)
-            .limit(limit)
+        return await self._paginate(
+            base,
+            order_by=Activity.happened_at.desc(),
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
         )
-        result = await self.session.execute(items_stmt)
-        return result.scalars().unique().all(), total
 
 
 class ActivityParticipantRepository(BaseRepository[ActivityParticipant]):
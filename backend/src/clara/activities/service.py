@@ -1,5 +1,4 @@
 import uuid
-from collections.abc import Sequence
 
 from clara.activities.models import Activity, ActivityType
 from clara.activities.repository import (
@@ -14,6 +13,7 @@ from clara.activities.schemas import (
     ActivityUpdate,
     ParticipantInput,
 )
+from clara.base.repository import Page
 from clara.exceptions import NotFoundError
 
 
@@ -22,9 +22,13 @@ class ActivityTypeService:
         self.repo = repo
 
     async def list_types(
-        self, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[ActivityType], int]:
-        return await self.repo.list(offset=offset, limit=limit)
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[ActivityType]:
+        return await self.repo.list(offset=offset, limit=limit, cursor=cursor)
 
     async def get_type(self, type_id: uuid.UUID) -> ActivityType:
         t = await self.repo.get_by_id(type_id)
@@ -56,9 +60,16 @@ class ActivityService:
         self.participant_repo = participant_repo
 
     async def list_activities(
-        self, *, offset: int = 0, limit: int = 50, q: str | None = None
-    ) -> tuple[Sequence[Activity], int]:
-        return await self.repo.list(offset=offset, limit=limit, q=q)
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+        q: str | None = None,
+    ) -> Page[Activity]:
+        return await self.repo.list(
+            offset=offset, limit=limit, cursor=cursor, q=q
+        )
 
     async def list_by_contact(
         self,
@@ -66,9 +77,10 @@ class ActivityService:
         *,
         offset: int = 0,
         limit: int = 50,
-    ) -> tuple[Sequence[Activity], int]:
+        cursor: str | None = None,
+    ) -> Page[Activity]:
         return await self.repo.list_by_contact(
-            contact_id, offset=offset, limit=limit
+            contact_id, offset=offset, limit=limit, cursor=cursor
         )
 
     async def get_activity(self, activity_id: uuid.UUID) -> Activity:
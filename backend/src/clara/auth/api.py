@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import io
 import logging
@@ -12,6 +13,8 @@ import qrcode
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy import delete, select
 
+from clara.auth import context_cache as auth_context
+from clara.auth import pat_cache
 from clara.auth.models import PersonalAccessToken, RecoveryCode, TotpDevice, User
 from clara.auth.schemas import (
     AuthResponse,
@@ -39,8 +42,8 @@ from clara.auth.security import (
     decode_reset_token,
     decrypt_totp_secret,
     encrypt_totp_secret,
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
 )
 from clara.auth.service import AuthService
 from clara.config import get_settings
@@ -188,8 +191,9 @@ async def reset_password(body: ResetPasswordRequest, db: Db) -> dict[str, bool]:
     user = await db.get(User, uuid.UUID(payload["sub"]))
     if user is None:
         raise HTTPException(status_code=404, detail="User not found")
-    user.hashed_password = hash_password(body.password)
+    user.hashed_password = await hash_password_async(body.password)
     await db.flush()
+    auth_context.invalidate_user(db, user.id)
     return {"ok": True}
 
 
@@ -287,11 +291,14 @@ async def two_factor_setup(user: CurrentUser, db: Db) -> TwoFactorSetupResponse:
     )
 
     recovery_codes = _generate_recovery_codes()
-    for code in recovery_codes:
+    code_hashes = await asyncio.gather(
+        *(hash_password_async(code) for code in recovery_codes)
+    )
+    for code_hash in code_hashes:
         db.add(
             RecoveryCode(
                 user_id=user.id,
-                code_hash=hash_password(code),
+                code_hash=code_hash,
                 used=False,
             )
         )
@@ -391,7 +398,7 @@ async def two_factor_recovery(
     ).scalars().all()
     matched = None
     for code in codes:
-        if verify_password(body.code, code.code_hash):
+        if await verify_password_async(body.code, code.code_hash):
             matched = code
             break
 
@@ -460,7 +467,7 @@ async def create_token(body: PatCreate, user: CurrentUser, db: Db) -> PatCreateR
         user_id=user.id,
         name=body.name,
         token_prefix=raw_token[:12],
-        token_hash=hash_password(raw_token),
+        token_hash=await hash_password_async(raw_token),
         scopes=body.scopes,
         expires_at=expires_at,
     )
@@ -486,3 +493,4 @@ async def revoke_token(token_id: uuid.UUID, user: CurrentUser, db: Db) -> None:
         raise HTTPException(status_code=404, detail="Token not found")
     await db.delete(pat)
     await db.flush()
+    await pat_cache.forget(token_id)
@@ -0,0 +1,245 @@
+"""Cached auth context: the current user and their vault membership.
+
+Every authenticated request needs the ``User`` row and, for vault routes, the
+``VaultMembership`` row. Both are kept as detached snapshots in an in-process
+TTL LRU and attached to the request session with ``merge(load=False)``, which
+issues no SQL. Memberships are also shared through Redis so that the JWT
+blacklist ``EXISTS`` and the membership ``GET`` go out in one pipelined round
+trip. User rows carry password and 2FA state and never leave the process.
+
+Writes that change a user or a membership call ``invalidate_user`` /
+``invalidate_membership``. Once the write commits they evict locally, drop
+the Redis copy and publish on ``CHANNEL`` so every other worker's ``listen``
+loop evicts too; evicting earlier would let a concurrent request re-cache
+the old row. The TTL bounds staleness if a message is missed.
+"""
+
+import asyncio
+import contextlib
+import json
+import uuid
+from datetime import datetime
+from typing import Any
+
+import structlog
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from clara.auth.models import User, VaultMembership
+from clara.cache import TTLCache
+from clara.config import get_settings
+from clara.database import after_commit
+from clara.redis import get_async_redis
+
+logger = structlog.get_logger()
+
+CHANNEL = "clara:auth-context"
+LISTEN_RETRY_MIN_SECONDS = 1.0
+LISTEN_RETRY_MAX_SECONDS = 30.0
+
+type MembershipKey = tuple[uuid.UUID, uuid.UUID]
+
+_users: TTLCache[uuid.UUID, User] | None = None
+_memberships: TTLCache[MembershipKey, VaultMembership] | None = None
+
+
+def _get_users() -> TTLCache[uuid.UUID, User]:
+    global _users
+    if _users is None:
+        _users = TTLCache(ttl=get_settings().auth_context_ttl_seconds)
+    return _users
+
+
+def _get_memberships() -> TTLCache[MembershipKey, VaultMembership]:
+    global _memberships
+    if _memberships is None:
+        _memberships = TTLCache(ttl=get_settings().auth_context_ttl_seconds)
+    return _memberships
+
+
+def _enabled() -> bool:
+    return get_settings().auth_context_ttl_seconds > 0
+
+
+def _membership_key(user_id: uuid.UUID, vault_id: uuid.UUID) -> str:
+    return f"authctx:member:{user_id}:{vault_id}"
+
+
+def _snapshot[M: (User, VaultMembership)](obj: M) -> M:
+    values = {
+        attr.key: getattr(obj, attr.key) for attr in inspect(type(obj)).column_attrs
+    }
+    copy = type(obj)(**values)
+    make_transient_to_detached(copy)
+    return copy
+
+
+def _dump_membership(membership: VaultMembership) -> str:
+    data: dict[str, Any] = {}
+    for attr in inspect(VaultMembership).column_attrs:
+        value = getattr(membership, attr.key)
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        data[attr.key] = value
+    return json.dumps(data)
+
+
+def _load_membership(raw: str | bytes) -> VaultMembership:
+    data = json.loads(raw)
+    for attr in inspect(VaultMembership).column_attrs:
+        value = data.get(attr.key)
+        if value is None:
+            continue
+        python_type = attr.columns[0].type.python_type
+        if python_type is uuid.UUID:
+            data[attr.key] = uuid.UUID(value)
+        elif python_type is datetime:
+            data[attr.key] = datetime.fromisoformat(value)
+    membership = VaultMembership(**data)
+    make_transient_to_detached(membership)
+    return membership
+
+
+async def prefetch(
+    jti: str | None, user_id: uuid.UUID, vault_id: uuid.UUID | None
+) -> bool:
+    """Check the JWT blacklist and warm the membership in one round trip.
+
+    Returns whether ``jti`` is blacklisted. A membership found in Redis is
+    put in the local cache for ``get_membership`` to pick up.
+    """
+    want_membership = (
+        _enabled()
+        and vault_id is not None
+        and _get_memberships().get((user_id, vault_id)) is None
+    )
+    if jti is None and not want_membership:
+        return False
+    pipe = get_async_redis().pipeline(transaction=False)
+    if jti is not None:
+        pipe.exists(f"blacklist:{jti}")
+    if want_membership and vault_id is not None:
+        pipe.get(_membership_key(user_id, vault_id))
+    results = await pipe.execute()
+    blacklisted = bool(results.pop(0)) if jti is not None else False
+    if want_membership and vault_id is not None and results[0] is not None:
+        _get_memberships().put((user_id, vault_id), _load_membership(results[0]))
+    return blacklisted
+
+
+async def get_user(session: AsyncSession, user_id: uuid.UUID) -> User | None:
+    if not _enabled():
+        return await session.get(User, user_id)
+    cached = _get_users().get(user_id)
+    if cached is not None:
+        return await session.merge(cached, load=False)
+    user = await session.get(User, user_id)
+    if user is not None:
+        if inspect(user).expired_attributes:
+            await session.refresh(user)
+        _get_users().put(user_id, _snapshot(user))
+    return user
+
+
+async def get_membership(
+    session: AsyncSession, user_id: uuid.UUID, vault_id: uuid.UUID
+) -> VaultMembership | None:
+    if _enabled():
+        cached = _get_memberships().get((user_id, vault_id))
+        if cached is not None:
+            return await session.merge(cached, load=False)
+    stmt = select(VaultMembership).where(
+        VaultMembership.user_id == user_id,
+        VaultMembership.vault_id == vault_id,
+    )
+    membership = (await session.execute(stmt)).scalar_one_or_none()
+    if membership is not None and _enabled():
+        _get_memberships().put((user_id, vault_id), _snapshot(membership))
+        await get_async_redis().setex(
+            _membership_key(user_id, vault_id),
+            get_settings().auth_context_ttl_seconds,
+            _dump_membership(membership),
+        )
+    return membership
+
+
+def _evict(message: str) -> None:
+    kind, _, rest = message.partition(":")
+    if kind == "user":
+        _get_users().discard(uuid.UUID(rest))
+    elif kind == "member":
+        user_id, _, vault_id = rest.partition(":")
+        _get_memberships().discard((uuid.UUID(user_id), uuid.UUID(vault_id)))
+
+
+def invalidate_user(session: AsyncSession, user_id: uuid.UUID) -> None:
+    """Forget a user everywhere after ``is_active`` or credentials change."""
+    message = f"user:{user_id}"
+
+    async def publish() -> None:
+        _evict(message)
+        if _enabled():
+            await get_async_redis().publish(CHANNEL, message)
+
+    after_commit(session, publish)
+
+
+def invalidate_membership(
+    session: AsyncSession, user_id: uuid.UUID, vault_id: uuid.UUID
+) -> None:
+    """Forget a membership everywhere after its role changes or it is removed."""
+    message = f"member:{user_id}:{vault_id}"
+
+    async def publish() -> None:
+        _evict(message)
+        if _enabled():
+            redis = get_async_redis()
+            await redis.delete(_membership_key(user_id, vault_id))
+            await redis.publish(CHANNEL, message)
+
+    after_commit(session, publish)
+
+
+def _handle(message: dict[str, Any]) -> None:
+    if message.get("type") != "message":
+        return
+    data = message["data"]
+    try:
+        _evict(data.decode() if isinstance(data, bytes) else data)
+    except ValueError:
+        logger.warning("auth_context_bad_invalidation", data=data)
+
+
+async def listen() -> None:
+    """Evict entries named on ``CHANNEL`` until cancelled (one per worker).
+
+    A lost Redis connection is logged and retried with backoff. Messages
+    sent meanwhile are missed, so the local caches are dropped before
+    resubscribing.
+    """
+    delay = LISTEN_RETRY_MIN_SECONDS
+    while True:
+        pubsub = get_async_redis().pubsub()
+        try:
+            await pubsub.subscribe(CHANNEL)
+            delay = LISTEN_RETRY_MIN_SECONDS
+            async for message in pubsub.listen():
+                _handle(message)
+        except Exception:
+            logger.exception("auth_context_listen_failed", retry_in=delay)
+        finally:
+            with contextlib.suppress(Exception):
+                await pubsub.aclose()  # type: ignore[no-untyped-call]
+        reset()
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, LISTEN_RETRY_MAX_SECONDS)
+
+
+def reset() -> None:
+    """Drop every locally cached entry."""
+    global _users, _memberships
+    _users = None
+    _memberships = None
@@ -0,0 +1,171 @@
+"""Verified personal-access-token cache and buffered ``last_used_at`` writes.
+
+Argon2 verification is deliberately slow, so once a raw token verifies we keep
+``HMAC(secret_key, token) -> pat_id`` for a short TTL, in process and, when
+``pat_cache_redis`` is on, in Redis so other workers skip the hash as well.
+The digest is keyed, so a leaked cache entry cannot be used to test token
+guesses offline. A hit is still resolved against the PAT row, so a deleted
+token never authenticates; revoking also evicts the entry straight away.
+
+``last_used_at`` is informational, so uses are buffered in process and written
+in one batch UPDATE every ``pat_last_used_flush_seconds`` by a task the app
+lifespan runs, and once more at shutdown.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import uuid
+from datetime import datetime
+from typing import cast
+
+import structlog
+from sqlalchemy import Table, bindparam, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from clara.auth.models import PersonalAccessToken
+from clara.cache import TTLCache
+from clara.config import get_settings
+from clara.database import after_commit, run_after_commit
+from clara.redis import get_async_redis
+
+logger = structlog.get_logger()
+
+
+class _UsageBuffer:
+    def __init__(self) -> None:
+        self.pending: dict[uuid.UUID, datetime] = {}
+
+    def record(self, pat_id: uuid.UUID, when: datetime) -> None:
+        self.pending[pat_id] = when
+
+    def discard(self, written: dict[uuid.UUID, datetime]) -> None:
+        """Forget written uses, keeping any newer use of the same token."""
+        for pat_id, when in written.items():
+            if self.pending.get(pat_id) == when:
+                del self.pending[pat_id]
+
+    def drain(self) -> dict[uuid.UUID, datetime]:
+        pending, self.pending = self.pending, {}
+        return pending
+
+
+_verified: TTLCache[str, uuid.UUID] | None = None
+_usage = _UsageBuffer()
+
+
+def _get_verified() -> TTLCache[str, uuid.UUID]:
+    global _verified
+    if _verified is None:
+        _verified = TTLCache(ttl=get_settings().pat_cache_ttl_seconds)
+    return _verified
+
+
+def token_digest(token: str) -> str:
+    key = get_settings().secret_key.get_secret_value().encode()
+    return hmac.new(key, token.encode(), hashlib.sha256).hexdigest()
+
+
+def _redis_key(digest: str) -> str:
+    return f"pat:verified:{digest}"
+
+
+def _redis_reverse_key(pat_id: uuid.UUID) -> str:
+    return f"pat:digest:{pat_id}"
+
+
+async def lookup(token: str) -> uuid.UUID | None:
+    """Return the PAT id a raw token already verified against, if cached."""
+    digest = token_digest(token)
+    pat_id = _get_verified().get(digest)
+    if pat_id is not None:
+        return pat_id
+    settings = get_settings()
+    if not settings.pat_cache_redis:
+        return None
+    raw = await get_async_redis().get(_redis_key(digest))
+    if raw is None:
+        return None
+    pat_id = uuid.UUID(raw.decode() if isinstance(raw, bytes) else raw)
+    _get_verified().put(digest, pat_id)
+    return pat_id
+
+
+async def remember(token: str, pat_id: uuid.UUID) -> None:
+    settings = get_settings()
+    digest = token_digest(token)
+    _get_verified().put(digest, pat_id)
+    if settings.pat_cache_redis:
+        ttl = settings.pat_cache_ttl_seconds
+        redis = get_async_redis()
+        await redis.setex(_redis_key(digest), ttl, str(pat_id))
+        await redis.setex(_redis_reverse_key(pat_id), ttl, digest)
+
+
+async def forget(pat_id: uuid.UUID) -> None:
+    """Evict a revoked token from the local and shared caches."""
+    _get_verified().discard_where(lambda _, cached: cached == pat_id)
+    if get_settings().pat_cache_redis:
+        redis = get_async_redis()
+        digest = await redis.get(_redis_reverse_key(pat_id))
+        if digest is not None:
+            if isinstance(digest, bytes):
+                digest = digest.decode()
+            await redis.delete(_redis_key(digest), _redis_reverse_key(pat_id))
+
+
+def record_use(pat_id: uuid.UUID, when: datetime) -> None:
+    _usage.record(pat_id, when)
+
+
+async def flush_usage(session: AsyncSession) -> int:
+    """Write buffered ``last_used_at`` values in ``session``'s transaction.
+
+    The values stay buffered until the transaction commits, so a rollback
+    leaves them for the next flush. Returns the number of tokens written.
+    """
+    if not _usage.pending:
+        return 0
+    written = dict(_usage.pending)
+    # Core executemany rather than ORM bulk-by-PK: tokens revoked since
+    # their last use simply match no row instead of raising StaleDataError.
+    table = cast(Table, PersonalAccessToken.__table__)
+    await session.execute(
+        update(table)
+        .where(table.c.id == bindparam("pat_id"))
+        .values(last_used_at=bindparam("used_at")),
+        [{"pat_id": pat_id, "used_at": when} for pat_id, when in written.items()],
+    )
+
+    async def discard() -> None:
+        _usage.discard(written)
+
+    after_commit(session, discard)
+    return len(written)
+
+
+async def flush_pending(factory: async_sessionmaker[AsyncSession]) -> int:
+    """Flush buffered uses in a transaction of their own."""
+    async with factory() as session:
+        written = await flush_usage(session)
+        await session.commit()
+        await run_after_commit(session)
+    return written
+
+
+async def run_flusher(factory: async_sessionmaker[AsyncSession]) -> None:
+    """Flush buffered uses every ``pat_last_used_flush_seconds``, forever."""
+    interval = get_settings().pat_last_used_flush_seconds
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_pending(factory)
+        except Exception:
+            logger.exception("pat_usage_flush_failed")
+
+
+def reset() -> None:
+    """Drop all cached verifications and pending usage (tests, key rotation)."""
+    global _verified
+    _verified = None
+    _usage.drain()
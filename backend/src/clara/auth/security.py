@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import uuid as uuid_mod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -14,6 +16,7 @@ from clara.config import get_settings
 from clara.crypto import get_fernet
 
 _ph = argon2.PasswordHasher()
+_hash_executor: ThreadPoolExecutor | None = None
 
 
 def hash_password(password: str) -> str:
@@ -31,6 +34,30 @@ def verify_password(plain: str, hashed: str) -> bool:
     return bcrypt.checkpw(plain.encode(), hashed.encode())
 
 
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=get_settings().password_hash_workers,
+            thread_name_prefix="clara-hash",
+        )
+    return _hash_executor
+
+
+async def hash_password_async(password: str) -> str:
+    """``hash_password`` on the bounded hashing pool, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_executor(), hash_password, password)
+
+
+async def verify_password_async(plain: str, hashed: str) -> bool:
+    """``verify_password`` on the bounded hashing pool, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_hash_executor(), verify_password, plain, hashed
+    )
+
+
 def needs_rehash(hashed: str) -> bool:
     """True if hash is legacy bcrypt and should be upgraded to argon2."""
     return not hashed.startswith("$argon2")
@@ -9,9 +9,9 @@ from clara.auth.security import (
     create_2fa_temp_token,
     create_access_token,
     create_refresh_token,
-    hash_password,
+    hash_password_async,
     needs_rehash,
-    verify_password,
+    verify_password_async,
 )
 from clara.exceptions import ConflictError, InvalidCredentialsError
 
@@ -50,7 +50,7 @@ class AuthService:
         user = User(
             email=data.email,
             name=data.name,
-            hashed_password=hash_password(data.password),
+            hashed_password=await hash_password_async(data.password),
             default_vault_id=vault.id,
         )
         self.session.add(user)
@@ -75,14 +75,14 @@ class AuthService:
                 select(User).where(User.email == data.email)
             )
         ).scalar_one_or_none()
-        if user is None or not verify_password(
+        if user is None or not await verify_password_async(
             data.password, user.hashed_password
         ):
             raise InvalidCredentialsError("Invalid credentials")
 
         # Upgrade legacy bcrypt hash to argon2
         if needs_rehash(user.hashed_password):
-            user.hashed_password = hash_password(data.password)
+            user.hashed_password = await hash_password_async(data.password)
             await self.session.flush()
 
         has_device = (
@@ -3,6 +3,7 @@ import uuid
 from fastapi import APIRouter, HTTPException
 from sqlalchemy import select
 
+from clara.auth import context_cache as auth_context
 from clara.auth.models import User, Vault, VaultMembership, VaultSettings
 from clara.auth.schemas import (
     MemberInvite,
@@ -84,6 +85,15 @@ async def delete_vault(
     vault = await db.get(Vault, vault_id)
     if vault is None:
         raise HTTPException(status_code=404, detail="Vault not found")
+    memberships = (
+        await db.execute(
+            select(VaultMembership).where(VaultMembership.vault_id == vault_id)
+        )
+    ).scalars().all()
+    # Deleted explicitly: the vault's members relationship does not cascade.
+    for membership in memberships:
+        await db.delete(membership)
+        auth_context.invalidate_membership(db, membership.user_id, vault_id)
     await db.delete(vault)
     await db.flush()
 
@@ -185,6 +195,7 @@ async def update_member_role(
             raise HTTPException(status_code=400, detail="Cannot demote sole owner")
     membership.role = body.role
     await db.flush()
+    auth_context.invalidate_membership(db, user_id, vault_id)
     user = await db.get(User, user_id)
     return MemberRead(
         user_id=user_id,
@@ -223,6 +234,7 @@ async def remove_member(
             raise HTTPException(status_code=400, detail="Cannot remove sole owner")
     await db.delete(membership)
     await db.flush()
+    auth_context.invalidate_membership(db, user_id, vault_id)
 
 
 # --- Vault settings ---
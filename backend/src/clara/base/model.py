@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import DateTime, ForeignKey, MetaData, Uuid, func
+from sqlalchemy import DateTime, ForeignKey, Index, MetaData, Uuid, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 convention = {
@@ -45,3 +46,19 @@ class VaultScopedModel(TimestampMixin, SoftDeleteMixin, Base):
     vault_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("vaults.id"), index=True
     )
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        table = cls.__dict__.get("__table__")
+        if table is not None:
+            # Every vault-scoped list filters on live rows of one vault and
+            # pages by created_at, so give each table a matching partial index.
+            live_rows = table.c.deleted_at.is_(None)
+            Index(
+                f"ix_{table.name}_vault_id_created_at",
+                table.c.vault_id,
+                table.c.created_at.desc(),
+                table.c.id.desc(),
+                postgresql_where=live_rows,
+                sqlite_where=live_rows,
+            )
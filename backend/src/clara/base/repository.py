@@ -1,15 +1,37 @@
 import uuid
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Iterator, Sequence
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any, TypeVar
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select, UnaryExpression, func, literal, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.base import ExecutableOption
 
 from clara.base.model import VaultScopedModel
 from clara.exceptions import NotFoundError
+from clara.pagination import decode_cursor, encode_cursor
 
 ModelT = TypeVar("ModelT", bound=VaultScopedModel)
+STREAM_BATCH_SIZE = 500
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Page[T]:
+    """One page of a list query.
+
+    ``total`` is only computed in offset mode; cursor pages skip the COUNT.
+    Unpacks as ``(items, total)`` for callers that predate cursors.
+    """
+
+    items: Sequence[T]
+    total: int | None
+    next_cursor: str | None = None
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter((self.items, self.total))
 
 
 class BaseRepository[ModelT: VaultScopedModel]:
@@ -31,24 +53,102 @@ class BaseRepository[ModelT: VaultScopedModel]:
         result = await self.session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list(
-        self, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[ModelT], int]:
-        count_stmt = (
+    def _count_query(self) -> Select[Any]:
+        return (
             select(func.count())
             .select_from(self.model)
             .where(self.model.vault_id == self.vault_id)
             .where(self.model.deleted_at.is_(None))
         )
-        total = (await self.session.execute(count_stmt)).scalar_one()
-        items_stmt = (
-            self._base_query()
-            .offset(offset)
-            .limit(limit)
-            .order_by(self.model.created_at.desc())
+
+    async def _paginate(
+        self,
+        stmt: Select[tuple[ModelT]],
+        *,
+        order_by: Any = None,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+        count_stmt: Select[Any] | None = None,
+    ) -> Page[ModelT]:
+        """Run ``stmt`` as one page, by offset or by keyset cursor.
+
+        Rows are ordered by ``order_by`` (default ``created_at DESC``) with
+        ``id`` as tie-breaker. With a cursor the page starts right after the
+        sort value and id it carries, and no COUNT is issued.
+        """
+        if order_by is None:
+            order_by = self.model.created_at.desc()
+        column, descending = _sort_column(order_by)
+        id_col = self.model.id
+        total: int | None = None
+        if cursor is not None:
+            cursor_value, last_id = decode_cursor(
+                cursor, column.key, column.type.python_type
+            )
+            # The row's value as stored, while it exists in this vault; the
+            # cursor's copy once it has been purged between pages.
+            stored_value = (
+                select(column)
+                .where(id_col == last_id)
+                .where(self.model.vault_id == self.vault_id)
+                .correlate(None)
+                .scalar_subquery()
+            )
+            last_value = func.coalesce(
+                stored_value, literal(cursor_value, column.type)
+            )
+            key = tuple_(column, id_col)
+            boundary = tuple_(last_value, literal(last_id, id_col.type))
+            stmt = stmt.where(key < boundary if descending else key > boundary)
+        else:
+            if count_stmt is None:
+                count_stmt = select(func.count()).select_from(stmt.subquery())
+            total = (await self.session.execute(count_stmt)).scalar_one()
+            stmt = stmt.offset(offset)
+        stmt = stmt.order_by(
+            order_by, id_col.desc() if descending else id_col.asc()
+        ).limit(limit + 1)
+        result = await self.session.execute(stmt)
+        items = result.scalars().unique().all()
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor(
+                column.key, getattr(last, column.key), last.id
+            )
+        return Page(items=items, total=total, next_cursor=next_cursor)
+
+    async def list(
+        self, *, offset: int = 0, limit: int = 50, cursor: str | None = None
+    ) -> Page[ModelT]:
+        return await self._paginate(
+            self._base_query(),
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count_stmt=self._count_query(),
+        )
+
+    async def stream(
+        self, *options: ExecutableOption, batch_size: int = STREAM_BATCH_SIZE
+    ) -> AsyncIterator[Sequence[ModelT]]:
+        """Yield every live row in ``created_at`` order, one batch at a time.
+
+        Rows come off a server-side cursor (``yield_per``), so memory stays
+        bounded by ``batch_size`` however large the vault is. Subclass eager
+        loads are not applied; pass loader ``options`` for what is needed.
+        """
+        stmt = (
+            BaseRepository._base_query(self)
+            .options(*options)
+            .order_by(self.model.created_at, self.model.id)
+            .execution_options(yield_per=batch_size)
         )
-        result = await self.session.execute(items_stmt)
-        return result.scalars().all(), total
+        result = await self.session.stream_scalars(stmt)
+        async for batch in result.partitions():
+            yield batch
 
     async def filtered_list(
         self,
@@ -56,17 +156,14 @@ class BaseRepository[ModelT: VaultScopedModel]:
         order_by: Any = None,
         offset: int = 0,
         limit: int = 50,
-    ) -> tuple[Sequence[ModelT], int]:
+        cursor: str | None = None,
+    ) -> Page[ModelT]:
         base = self._base_query()
         for f in filters:
             base = base.where(f)
-        count_stmt = select(func.count()).select_from(base.subquery())
-        total: int = (await self.session.execute(count_stmt)).scalar_one()
-        items_stmt = base.order_by(
-            order_by if order_by is not None else self.model.created_at.desc()
-        ).offset(offset).limit(limit)
-        result = await self.session.execute(items_stmt)
-        return result.scalars().all(), total
+        return await self._paginate(
+            base, order_by=order_by, offset=offset, limit=limit, cursor=cursor
+        )
 
     async def create(self, **kwargs: Any) -> ModelT:
         obj = self.model(vault_id=self.vault_id, **kwargs)
@@ -91,3 +188,15 @@ class BaseRepository[ModelT: VaultScopedModel]:
             raise NotFoundError(self.model.__name__, id)
         obj.deleted_at = datetime.now(UTC)
         await self.session.flush()
+
+
+def _sort_column(order_by: Any) -> tuple[Any, bool]:
+    """Split an ORDER BY clause such as ``col.desc()`` into column and direction."""
+    if isinstance(order_by, UnaryExpression):
+        return order_by.element, order_by.modifier is operators.desc_op
+    return order_by, False
+
+
+def escape_like(value: str) -> str:
+    """Escape LIKE wildcards in ``value``; match with ``escape="\\"``."""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
@@ -6,9 +6,10 @@ T = TypeVar("T")
 
 
 class PaginationMeta(BaseModel):
-    total: int
+    total: int | None = None
     offset: int
     limit: int
+    next_cursor: str | None = None
 
 
 class PaginatedResponse[T](BaseModel):
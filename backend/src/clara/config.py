@@ -22,6 +22,15 @@ class Settings(BaseSettings):
     pool_max_overflow: int = 10
     redis_url: RedisDsn = RedisDsn("redis://localhost:6379/0")
 
+    # argon2 releases the GIL, so threads give real parallelism; the cap
+    # keeps a burst of logins from starving the rest of the worker.
+    password_hash_workers: int = 4
+
+    auth_context_ttl_seconds: int = 30  # 0 disables the auth-context cache
+    pat_cache_ttl_seconds: int = 60
+    pat_cache_redis: bool = False
+    pat_last_used_flush_seconds: int = 60
+
     jwt_algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 30
@@ -34,6 +43,7 @@ class Settings(BaseSettings):
     frontend_url: str = "http://localhost:5173"
 
     storage_path: str = "./uploads"
+    storage_content_addressed: bool = True
     git_sync_work_dir: str = "./git_sync_repos"
     smtp_host: str = ""
     smtp_port: int = 587
@@ -43,6 +53,16 @@ class Settings(BaseSettings):
 
     max_body_size: int = 1_048_576  # 1 MB for JSON
     max_upload_size: int = 52_428_800  # 50 MB for files
+    # Import uploads above this many bytes run as a background job.
+    import_inline_max_bytes: int = 1_048_576
+    # Queued or running exports/imports with no progress for this long are
+    # taken as lost (enqueue failed or the worker died) and marked failed.
+    background_job_stale_minutes: int = 60
+    # vCard parse processes per background import; None uses the spare CPUs,
+    # 0 parses on a thread. Inline imports always parse on a thread.
+    vcard_parse_workers: int | None = None
+    # Concurrent PUT/DELETE requests per DAV server (and keep-alive pool size).
+    dav_write_concurrency: int = 8
 
     @property
     def async_database_url(self) -> str:
@@ -8,7 +8,12 @@ from clara.activities.repository import ActivityRepository
 from clara.activities.schemas import ActivityRead
 from clara.base.schema import PaginatedResponse, PaginationMeta
 from clara.contacts.repository import ContactRepository
-from clara.contacts.schemas import ContactCreate, ContactRead, ContactUpdate
+from clara.contacts.schemas import (
+    ContactCreate,
+    ContactRead,
+    ContactSuggestion,
+    ContactUpdate,
+)
 from clara.contacts.service import ContactService
 from clara.deps import Db, VaultAccess
 from clara.pagination import PaginationParams
@@ -41,9 +46,10 @@ async def list_contacts(
         if tags
         else None
     )
-    items, total = await svc.list_contacts(
+    page = await svc.list_contacts(
         offset=pagination.offset,
         limit=pagination.limit,
+        cursor=pagination.cursor,
         q=q,
         tag_ids=tag_ids,
         favorites=favorites,
@@ -51,13 +57,26 @@ async def list_contacts(
         birthday_to=birthday_to,
     )
     return PaginatedResponse(
-        items=[ContactRead.model_validate(c) for c in items],
+        items=[ContactRead.model_validate(c) for c in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
 
+@router.get("/suggest", response_model=list[ContactSuggestion])
+async def suggest_contacts(
+    svc: ContactSvc,
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=25),
+) -> list[ContactSuggestion]:
+    rows = await svc.suggest_contacts(q, limit=limit)
+    return [ContactSuggestion.model_validate(r) for r in rows]
+
+
 @router.get("/{contact_id}", response_model=ContactRead)
 async def get_contact(contact_id: uuid.UUID, svc: ContactSvc) -> ContactRead:
     return ContactRead.model_validate(await svc.get_contact(contact_id))
@@ -93,12 +112,18 @@ async def list_contact_activities(
     pagination: PaginationParams = Depends(),
 ) -> PaginatedResponse[ActivityRead]:
     repo = ActivityRepository(session=db, vault_id=vault_id)
-    items, total = await repo.list_by_contact(
-        contact_id, offset=pagination.offset, limit=pagination.limit
+    page = await repo.list_by_contact(
+        contact_id,
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
     return PaginatedResponse(
-        items=[ActivityRead.model_validate(a) for a in items],
+        items=[ActivityRead.model_validate(a) for a in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
@@ -0,0 +1,109 @@
+"""Per-run lookups of vault reference rows for the sync writers.
+
+Each table is read with one query on first use and kept current as the run
+creates rows, so a sync over thousands of contacts no longer runs a SELECT
+(and a flush) for every tag, relationship type or related contact name.
+"""
+
+import uuid
+from collections.abc import Iterable
+
+from sqlalchemy.orm import Session
+
+from clara.contacts.models import Contact, RelationshipType, Tag
+
+NameKey = tuple[str, str]
+
+
+def _name_key(first_name: str, last_name: str | None) -> NameKey:
+    return first_name, last_name or ""
+
+
+class VaultLookups:
+    """Tags and relationship types by name, live contacts by full name.
+
+    Rows created through :meth:`tag` and :meth:`relationship_type` get their
+    id up front and are only added to the session; the caller's next flush
+    inserts them. Callers that create, rename or delete contacts report them
+    with :meth:`note_contact` so name lookups stay correct within the run.
+    """
+
+    def __init__(self, session: Session, vault_id: uuid.UUID) -> None:
+        self.session = session
+        self.vault_id = vault_id
+        self._tags: dict[str, Tag] | None = None
+        self._relationship_types: dict[str, RelationshipType] | None = None
+        self._contacts: dict[NameKey, uuid.UUID] | None = None
+        self._contact_keys: dict[uuid.UUID, NameKey] = {}
+
+    def tag(self, name: str) -> Tag:
+        if self._tags is None:
+            rows = self.session.query(Tag).filter(Tag.vault_id == self.vault_id)
+            self._tags = {}
+            for row in rows.all():
+                self._tags.setdefault(row.name, row)
+        tag = self._tags.get(name)
+        if tag is None:
+            tag = Tag(id=uuid.uuid4(), vault_id=self.vault_id, name=name)
+            self.session.add(tag)
+            self._tags[name] = tag
+        return tag
+
+    def relationship_type(self, name: str) -> RelationshipType:
+        if self._relationship_types is None:
+            rows = self.session.query(RelationshipType).filter(
+                RelationshipType.vault_id == self.vault_id
+            )
+            self._relationship_types = {}
+            for row in rows.all():
+                self._relationship_types.setdefault(row.name, row)
+        rel_type = self._relationship_types.get(name)
+        if rel_type is None:
+            rel_type = RelationshipType(
+                id=uuid.uuid4(), vault_id=self.vault_id, name=name
+            )
+            self.session.add(rel_type)
+            self._relationship_types[name] = rel_type
+        return rel_type
+
+    def contact_id(self, first_name: str, last_name: str) -> uuid.UUID | None:
+        """Id of a live contact with exactly this first and last name."""
+        if self._contacts is None:
+            rows = self.session.query(
+                Contact.id, Contact.first_name, Contact.last_name
+            ).filter(Contact.vault_id == self.vault_id, Contact.deleted_at.is_(None))
+            self._contacts = {}
+            for contact_id, first, last in rows.all():
+                self._index(self._contacts, contact_id, _name_key(first, last))
+        return self._contacts.get(_name_key(first_name, last_name))
+
+    def index_contacts(self, contacts: Iterable[Contact]) -> None:
+        """Seed the name index from contacts the caller already loaded.
+
+        ``contacts`` must be every contact of the vault; deleted ones are
+        skipped.
+        """
+        self._contacts = {}
+        self._contact_keys.clear()
+        for contact in contacts:
+            if contact.deleted_at is None:
+                key = _name_key(contact.first_name, contact.last_name)
+                self._index(self._contacts, contact.id, key)
+
+    def note_contact(self, contact: Contact) -> None:
+        """Re-index a contact after it was created, renamed or deleted."""
+        index = self._contacts
+        if index is None:
+            return
+        old_key = self._contact_keys.pop(contact.id, None)
+        if old_key is not None and index.get(old_key) == contact.id:
+            del index[old_key]
+        if contact.deleted_at is None:
+            key = _name_key(contact.first_name, contact.last_name)
+            self._index(index, contact.id, key)
+
+    def _index(
+        self, index: dict[NameKey, uuid.UUID], contact_id: uuid.UUID, key: NameKey
+    ) -> None:
+        index.setdefault(key, contact_id)
+        self._contact_keys[contact_id] = key
@@ -76,14 +76,14 @@ class Contact(VaultScopedModel):
     @full_name.inplace.expression
     @classmethod
     def _full_name_expr(cls) -> ColumnElement[str]:
-        return func.concat(cls.first_name, " ", cls.last_name)
+        return func.trim(cls.first_name + " " + cls.last_name)
 
 
 class ContactMethod(VaultScopedModel):
     __tablename__ = "contact_methods"
 
     contact_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("contacts.id")
+        Uuid, ForeignKey("contacts.id"), index=True
     )
     type: Mapped[str] = mapped_column(String(50))
     label: Mapped[str] = mapped_column(String(100), default="")
@@ -96,7 +96,7 @@ class Address(VaultScopedModel):
     __tablename__ = "addresses"
 
     contact_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("contacts.id")
+        Uuid, ForeignKey("contacts.id"), index=True
     )
     label: Mapped[str] = mapped_column(String(100), default="")
     line1: Mapped[str] = mapped_column(String(500), default="")
@@ -125,7 +125,7 @@ class ContactRelationship(VaultScopedModel):
     __tablename__ = "contact_relationships"
 
     contact_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("contacts.id")
+        Uuid, ForeignKey("contacts.id"), index=True
     )
     other_contact_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("contacts.id")
@@ -156,7 +156,7 @@ class Pet(VaultScopedModel):
     __tablename__ = "pets"
 
     contact_id: Mapped[uuid.UUID] = mapped_column(
-        Uuid, ForeignKey("contacts.id")
+        Uuid, ForeignKey("contacts.id"), index=True
     )
     name: Mapped[str] = mapped_column(String(255))
     species: Mapped[str] = mapped_column(String(100), default="")
@@ -3,10 +3,10 @@ from collections.abc import Sequence
 from datetime import date
 from typing import Any
 
-from sqlalchemy import Select, func, or_, select
+from sqlalchemy import Row, Select, case, func, insert, or_, select, union
 from sqlalchemy.orm import selectinload
 
-from clara.base.repository import BaseRepository
+from clara.base.repository import BaseRepository, Page, escape_like
 from clara.contacts.models import (
     Address,
     Contact,
@@ -18,6 +18,9 @@ from clara.contacts.models import (
     contact_tags,
 )
 
+# id, display name, photo file id
+type SuggestionRow = Row[uuid.UUID, str, uuid.UUID | None]
+
 
 class ContactRepository(BaseRepository[Contact]):
     model = Contact
@@ -67,12 +70,13 @@ class ContactRepository(BaseRepository[Contact]):
         *,
         offset: int = 0,
         limit: int = 50,
+        cursor: str | None = None,
         q: str | None = None,
         tag_ids: list[uuid.UUID] | None = None,
         favorites: bool | None = None,
         birthday_from: date | None = None,
         birthday_to: date | None = None,
-    ) -> tuple[Sequence[Contact], int]:
+    ) -> Page[Contact]:
         count_stmt = self._apply_filters(
             select(func.count(func.distinct(self.model.id)))
             .select_from(self.model)
@@ -81,7 +85,6 @@ class ContactRepository(BaseRepository[Contact]):
             q=q, tag_ids=tag_ids, favorites=favorites,
             birthday_from=birthday_from, birthday_to=birthday_to,
         )
-        total: int = (await self.session.execute(count_stmt)).scalar_one()
         items_stmt = self._apply_filters(
             self._base_query(),
             q=q, tag_ids=tag_ids, favorites=favorites,
@@ -89,18 +92,75 @@ class ContactRepository(BaseRepository[Contact]):
         )
         if tag_ids:
             items_stmt = items_stmt.distinct()
-        items_stmt = (
-            items_stmt.offset(offset)
-            .limit(limit)
-            .order_by(Contact.created_at.desc())
+        return await self._paginate(
+            items_stmt,
+            order_by=Contact.created_at.desc(),
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count_stmt=count_stmt,
         )
-        result = await self.session.execute(items_stmt)
-        return result.scalars().all(), total
 
     async def search(
-        self, query: str, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Contact], int]:
-        return await self.list_filtered(q=query, offset=offset, limit=limit)
+        self,
+        query: str,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
+        return await self.list_filtered(
+            q=query, offset=offset, limit=limit, cursor=cursor
+        )
+
+    async def suggest(self, q: str, *, limit: int = 10) -> Sequence[SuggestionRow]:
+        """Lightweight name/contact-method lookup for pickers.
+
+        Selects only the columns a picker shows and skips the COUNT and
+        relationship loads of ``list_filtered``. Name and method matches are
+        collected separately so PostgreSQL can serve each ILIKE from its
+        pg_trgm GIN index instead of filtering every contact in the vault.
+        """
+        term = escape_like(q)
+        pattern = f"%{term}%"
+        by_name = (
+            select(Contact.id)
+            .where(Contact.vault_id == self.vault_id)
+            .where(Contact.deleted_at.is_(None))
+            .where(
+                or_(
+                    Contact.first_name.ilike(pattern, escape="\\"),
+                    Contact.last_name.ilike(pattern, escape="\\"),
+                    Contact.nickname.ilike(pattern, escape="\\"),
+                )
+            )
+        )
+        by_method = (
+            select(ContactMethod.contact_id)
+            .where(ContactMethod.vault_id == self.vault_id)
+            .where(ContactMethod.deleted_at.is_(None))
+            .where(ContactMethod.value.ilike(pattern, escape="\\"))
+        )
+        stmt = (
+            select(
+                Contact.id,
+                Contact.full_name.label("display_name"),
+                Contact.photo_file_id,
+            )
+            .where(Contact.id.in_(union(by_name, by_method)))
+            .where(Contact.deleted_at.is_(None))
+            .order_by(
+                case(
+                    (Contact.first_name.ilike(f"{term}%", escape="\\"), 0),
+                    (Contact.last_name.ilike(f"{term}%", escape="\\"), 1),
+                    else_=2,
+                ),
+                Contact.first_name,
+                Contact.last_name,
+            )
+            .limit(limit)
+        )
+        return (await self.session.execute(stmt)).all()
 
 
 class ContactMethodRepository(BaseRepository[ContactMethod]):
@@ -205,6 +265,19 @@ class TagRepository(BaseRepository[Tag]):
         result = await self.session.execute(stmt)
         return list(result.scalars().all())
 
+    async def create_many(self, names: Sequence[str]) -> dict[str, uuid.UUID]:
+        """Insert one tag per name in a single statement; returns their ids."""
+        ids = {name: uuid.uuid4() for name in names}
+        if ids:
+            await self.session.execute(
+                insert(Tag),
+                [
+                    {"id": id, "vault_id": self.vault_id, "name": name}
+                    for name, id in ids.items()
+                ],
+            )
+        return ids
+
 
 class RelationshipTypeRepository(BaseRepository[RelationshipType]):
     model = RelationshipType
@@ -35,6 +35,13 @@ class ContactRead(BaseModel):
     updated_at: datetime
 
 
+class ContactSuggestion(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: uuid.UUID
+    display_name: str
+    photo_file_id: uuid.UUID | None
+
+
 class ContactCreate(BaseModel):
     first_name: str
     last_name: str = ""
@@ -2,8 +2,9 @@ import uuid
 from collections.abc import Sequence
 from datetime import date
 
+from clara.base.repository import Page
 from clara.contacts.models import Contact
-from clara.contacts.repository import ContactRepository
+from clara.contacts.repository import ContactRepository, SuggestionRow
 from clara.contacts.schemas import ContactCreate, ContactUpdate
 from clara.exceptions import NotFoundError
 
@@ -17,14 +18,15 @@ class ContactService:
         *,
         offset: int = 0,
         limit: int = 50,
+        cursor: str | None = None,
         q: str | None = None,
         tag_ids: list[uuid.UUID] | None = None,
         favorites: bool | None = None,
         birthday_from: date | None = None,
         birthday_to: date | None = None,
-    ) -> tuple[Sequence[Contact], int]:
+    ) -> Page[Contact]:
         return await self.repo.list_filtered(
-            offset=offset, limit=limit, q=q, tag_ids=tag_ids,
+            offset=offset, limit=limit, cursor=cursor, q=q, tag_ids=tag_ids,
             favorites=favorites, birthday_from=birthday_from,
             birthday_to=birthday_to,
         )
@@ -57,6 +59,21 @@ class ContactService:
         await self.repo.soft_delete(contact_id)
 
     async def search_contacts(
-        self, query: str, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Contact], int]:
-        return await self.repo.search(query, offset=offset, limit=limit)
+        self,
+        query: str,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Contact]:
+        return await self.repo.search(
+            query, offset=offset, limit=limit, cursor=cursor
+        )
+
+    async def suggest_contacts(
+        self, query: str, *, limit: int = 10
+    ) -> Sequence[SuggestionRow]:
+        query = query.strip()
+        if not query:
+            return []
+        return await self.repo.suggest(query, limit=limit)
@@ -44,13 +44,19 @@ async def list_definitions(
     scope: str | None = Query(None),
     pagination: PaginationParams = Depends(),
 ) -> PaginatedResponse[CustomFieldDefinitionRead]:
-    items, total = await svc.list_definitions(
-        scope=scope, offset=pagination.offset, limit=pagination.limit
+    page = await svc.list_definitions(
+        scope=scope,
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
     return PaginatedResponse(
-        items=[CustomFieldDefinitionRead.model_validate(d) for d in items],
+        items=[CustomFieldDefinitionRead.model_validate(d) for d in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
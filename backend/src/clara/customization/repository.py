@@ -1,10 +1,8 @@
 import uuid
-from collections.abc import Sequence
 
-from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 
-from clara.base.repository import BaseRepository
+from clara.base.repository import BaseRepository, Page
 from clara.customization.models import (
     CustomFieldDefinition,
     CustomFieldValue,
@@ -33,28 +31,18 @@ class TemplateRepository(BaseRepository[Template]):
         return result.scalar_one_or_none()
 
     async def list_with_pages(
-        self, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Template], int]:
-        count_stmt = (
-            select(func.count())
-            .select_from(Template)
-            .where(Template.vault_id == self.vault_id)
-            .where(Template.deleted_at.is_(None))
+        self, *, offset: int = 0, limit: int = 50, cursor: str | None = None
+    ) -> Page[Template]:
+        items_stmt = self._base_query().options(
+            selectinload(Template.pages).selectinload(TemplatePage.modules)
         )
-        total = (await self.session.execute(count_stmt)).scalar_one()
-        items_stmt = (
-            self._base_query()
-            .options(
-                selectinload(Template.pages).selectinload(
-                    TemplatePage.modules
-                )
-            )
-            .offset(offset)
-            .limit(limit)
-            .order_by(Template.created_at.desc())
+        return await self._paginate(
+            items_stmt,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count_stmt=self._count_query(),
         )
-        result = await self.session.execute(items_stmt)
-        return result.scalars().unique().all(), total
 
 
 class TemplatePageRepository(BaseRepository[TemplatePage]):
@@ -69,25 +57,21 @@ class CustomFieldDefinitionRepository(BaseRepository[CustomFieldDefinition]):
     model = CustomFieldDefinition
 
     async def list_by_scope(
-        self, scope: str, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[CustomFieldDefinition], int]:
-        count_stmt = (
-            select(func.count())
-            .select_from(CustomFieldDefinition)
-            .where(CustomFieldDefinition.vault_id == self.vault_id)
-            .where(CustomFieldDefinition.deleted_at.is_(None))
-            .where(CustomFieldDefinition.scope == scope)
-        )
-        total = (await self.session.execute(count_stmt)).scalar_one()
-        items_stmt = (
-            self._base_query()
-            .where(CustomFieldDefinition.scope == scope)
-            .offset(offset)
-            .limit(limit)
-            .order_by(CustomFieldDefinition.created_at.desc())
+        self,
+        scope: str,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[CustomFieldDefinition]:
+        in_scope = CustomFieldDefinition.scope == scope
+        return await self._paginate(
+            self._base_query().where(in_scope),
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count_stmt=self._count_query().where(in_scope),
         )
-        result = await self.session.execute(items_stmt)
-        return result.scalars().all(), total
 
 
 class CustomFieldValueRepository(BaseRepository[CustomFieldValue]):
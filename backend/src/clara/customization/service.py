@@ -1,6 +1,6 @@
 import uuid
-from collections.abc import Sequence
 
+from clara.base.repository import Page
 from clara.customization.models import (
     CustomFieldDefinition,
     CustomFieldValue,
@@ -37,9 +37,15 @@ class TemplateService:
         self.module_repo = module_repo
 
     async def list_templates(
-        self, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Template], int]:
-        return await self.repo.list_with_pages(offset=offset, limit=limit)
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Template]:
+        return await self.repo.list_with_pages(
+            offset=offset, limit=limit, cursor=cursor
+        )
 
     async def get_template(self, template_id: uuid.UUID) -> Template:
         template = await self.repo.get_by_id_with_pages(template_id)
@@ -127,13 +133,18 @@ class CustomFieldService:
         self.val_repo = val_repo
 
     async def list_definitions(
-        self, *, scope: str | None = None, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[CustomFieldDefinition], int]:
+        self,
+        *,
+        scope: str | None = None,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[CustomFieldDefinition]:
         if scope:
             return await self.def_repo.list_by_scope(
-                scope, offset=offset, limit=limit
+                scope, offset=offset, limit=limit, cursor=cursor
             )
-        return await self.def_repo.list(offset=offset, limit=limit)
+        return await self.def_repo.list(offset=offset, limit=limit, cursor=cursor)
 
     async def get_definition(
         self, definition_id: uuid.UUID
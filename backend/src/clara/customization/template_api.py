@@ -45,13 +45,18 @@ TplSvc = Annotated[TemplateService, Depends(get_template_service)]
 async def list_templates(
     svc: TplSvc, pagination: PaginationParams = Depends()
 ) -> PaginatedResponse[TemplateRead]:
-    items, total = await svc.list_templates(
-        offset=pagination.offset, limit=pagination.limit
+    page = await svc.list_templates(
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
     return PaginatedResponse(
-        items=[TemplateRead.model_validate(t) for t in items],
+        items=[TemplateRead.model_validate(t) for t in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
@@ -1,5 +1,6 @@
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable, Callable
 
+import structlog
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -9,6 +10,12 @@ from sqlalchemy.ext.asyncio import (
 
 from clara.config import get_settings
 
+logger = structlog.get_logger()
+
+type AfterCommit = Callable[[], Awaitable[None]]
+
+_AFTER_COMMIT = "clara.after_commit"
+
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
 
@@ -38,11 +45,36 @@ def _get_session_factory() -> async_sessionmaker[AsyncSession]:
     return _session_factory
 
 
+def after_commit(session: AsyncSession, callback: AfterCommit) -> None:
+    """Run ``callback`` once the request's transaction has committed.
+
+    For side effects outside the database (Redis, the job queue, blobs) that
+    must not be seen before the rows they refer to, nor survive a rollback.
+    """
+    session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+
+
+def discard_after_commit(session: AsyncSession) -> None:
+    session.info.pop(_AFTER_COMMIT, None)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    """Run the callbacks queued by ``after_commit``; failures are logged."""
+    callbacks: list[AfterCommit] = session.info.pop(_AFTER_COMMIT, [])
+    for callback in callbacks:
+        try:
+            await callback()
+        except Exception:
+            logger.exception("after_commit_failed")
+
+
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with _get_session_factory()() as session:
         try:
             yield session
             await session.commit()
         except Exception:
+            discard_after_commit(session)
             await session.rollback()
             raise
+        await run_after_commit(session)
@@ -2,33 +2,165 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from urllib.parse import urljoin
+import html
+import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import unquote, urljoin, urlsplit
 
 import caldav
 import requests
 import vobject
 from icalendar import Calendar
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from clara.config import get_settings
+
+_UNPARSED: Any = object()
+
+
+def normalize_etag(value: str | None) -> str | None:
+    """The stored form of an entity-tag: unquoted, ``W/`` kept for weak ones.
+
+    Listings, PUT responses and caldav all go through this, so etags from
+    any of them compare equal.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    weak = value.startswith("W/")
+    opaque = value.removeprefix("W/").strip('"')
+    if not opaque:
+        return None
+    return f"W/{opaque}" if weak else opaque
+
+
+def _if_match(etag: str | None) -> dict[str, str]:
+    """``If-Match`` for a stored etag, re-quoted.
+
+    Weak etags never match under If-Match's strong comparison, so they send
+    no precondition rather than a guaranteed 412.
+    """
+    etag = normalize_etag(etag)
+    if etag is None or etag.startswith("W/"):
+        return {}
+    return {"If-Match": f'"{etag}"'}
 
 
 @dataclass
 class DavResource:
-    """A remote DAV resource (vCard, VEVENT, VTODO)."""
+    """A remote DAV resource (vCard, VEVENT, VTODO).
+
+    ``data`` is parsed lazily, at most once, by whichever of ``vcard`` or
+    ``component`` is read first; listing only pre-scans it for the UID.
+    """
 
     uid: str
     href: str
     etag: str | None
     data: str  # raw vCard/iCal text
+    _parsed: Any = field(default=_UNPARSED, init=False, repr=False, compare=False)
+
+    @property
+    def vcard(self) -> Any:
+        """The parsed vCard. Raises if ``data`` is not one."""
+        if self._parsed is _UNPARSED:
+            self._parsed = vobject.readOne(self.data)
+        return self._parsed
+
+    @property
+    def component(self) -> Any | None:
+        """The first VEVENT/VTODO, or None when there is none to parse."""
+        if self._parsed is _UNPARSED:
+            self._parsed = _first_calendar_component(self.data)
+        return self._parsed
+
+
+@dataclass
+class DavChanges:
+    """Resources changed in a collection since a sync token (RFC 6578).
+
+    ``complete`` is set when ``resources`` is a full listing of the
+    collection rather than a delta, so anything missing from it is gone.
+    """
+
+    resources: list[DavResource]
+    deleted_hrefs: set[str] = field(default_factory=set)
+    sync_token: str | None = None
+    complete: bool = False
+
+
+class SyncCollectionError(Exception):
+    """The server cannot answer a sync-collection REPORT."""
+
+
+class SyncTokenInvalid(SyncCollectionError):
+    """The stored sync token was rejected (DAV:valid-sync-token)."""
+
+
+# Idempotent or read-only methods; safe to resend after a dropped
+# connection or a 429/5xx answer.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(
+        {"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "PROPFIND", "REPORT"}
+    ),
+    raise_on_status=False,
+)
+
+# Write slots shared by every client talking to the same server, so several
+# accounts on one host together stay within the concurrency limit.
+_server_slots: dict[str, threading.BoundedSemaphore] = {}
+_server_slots_lock = threading.Lock()
+
+
+def _get_server_slots(url: str, limit: int) -> threading.BoundedSemaphore:
+    host = urlsplit(url).netloc
+    with _server_slots_lock:
+        if host not in _server_slots:
+            _server_slots[host] = threading.BoundedSemaphore(limit)
+        return _server_slots[host]
 
 
 class DavClient:
     """Client for CalDAV/CardDAV operations."""
 
-    def __init__(self, url: str, username: str, password: str) -> None:
+    def __init__(
+        self,
+        url: str,
+        username: str,
+        password: str,
+        max_concurrency: int | None = None,
+    ) -> None:
         self.url = url.rstrip("/")
         self.username = username
         self.password = password
+        self.max_concurrency = max(
+            1, max_concurrency or get_settings().dav_write_concurrency
+        )
         self._caldav_client: caldav.DAVClient | None = None
+        self._slots = _get_server_slots(self.url, self.max_concurrency)
+        self._http = requests.Session()
+        self._http.auth = (username, password)
+        adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=self.max_concurrency, max_retries=_RETRY
+        )
+        self._http.mount("https://", adapter)
+        self._http.mount("http://", adapter)
+
+    def close(self) -> None:
+        self._http.close()
+
+    @contextmanager
+    def _write_slot(self) -> Iterator[None]:
+        with self._slots:
+            yield
 
     def _get_caldav(self) -> caldav.DAVClient:
         if self._caldav_client is None:
@@ -74,10 +206,9 @@ class DavClient:
         """List all vCards from a CardDAV addressbook."""
         resources: list[DavResource] = []
         report_url = self._resolve_url(carddav_path)
-        resp = requests.request(
+        resp = self._http.request(
             "REPORT",
             report_url,
-            auth=(self.username, self.password),
             headers={"Content-Type": "application/xml; charset=utf-8", "Depth": "1"},
             data=_ADDRESSBOOK_QUERY,
             timeout=30,
@@ -87,7 +218,7 @@ class DavClient:
         for href, etag, data in _parse_multistatus(resp.text):
             if not data:
                 continue
-            uid = _extract_vcard_uid(data)
+            uid = scan_uid(data)
             if uid:
                 resources.append(
                     DavResource(
@@ -104,31 +235,148 @@ class DavClient:
     ) -> str | None:
         """Create or update a vCard. Returns new etag."""
         url = f"{carddav_path.rstrip('/')}/{uid}.vcf"
-        headers: dict[str, str] = {"Content-Type": "text/vcard; charset=utf-8"}
-        if etag:
-            headers["If-Match"] = etag
-        resp = requests.put(
-            url,
-            auth=(self.username, self.password),
-            headers=headers,
-            data=vcard_text.encode("utf-8"),
-            timeout=30,
-        )
+        headers = {"Content-Type": "text/vcard; charset=utf-8", **_if_match(etag)}
+        with self._write_slot():
+            resp = self._http.put(
+                self._resolve_url(url),
+                headers=headers,
+                data=vcard_text.encode("utf-8"),
+                timeout=30,
+            )
         resp.raise_for_status()
-        return resp.headers.get("ETag")
+        return normalize_etag(resp.headers.get("ETag"))
 
     def delete_vcard(self, href: str, etag: str | None = None) -> None:
         """Delete a vCard by href."""
-        headers: dict[str, str] = {}
-        if etag:
-            headers["If-Match"] = etag
-        resp = requests.delete(
-            self._resolve_url(href),
-            auth=(self.username, self.password),
-            headers=headers,
+        with self._write_slot():
+            resp = self._http.delete(
+                self._resolve_url(href), headers=_if_match(etag), timeout=30
+            )
+        resp.raise_for_status()
+
+    # -- Incremental sync (RFC 6578) --
+
+    def get_sync_token(self, path: str) -> str | None:
+        """Read the collection's current DAV:sync-token, if it has one."""
+        resp = self._http.request(
+            "PROPFIND",
+            self._resolve_url(path),
+            headers={"Content-Type": "application/xml; charset=utf-8", "Depth": "0"},
+            data=_SYNC_TOKEN_PROPFIND,
+            timeout=30,
+        )
+        if resp.status_code >= 400:
+            return None
+        return _parse_sync_token(resp.text)
+
+    def sync_collection(
+        self, path: str, sync_token: str | None, kind: str
+    ) -> DavChanges:
+        """Fetch what changed in a collection since ``sync_token``.
+
+        ``kind`` is ``"card"`` or ``"cal"``. An empty token asks for the
+        initial listing. Truncated (507) responses are followed up until
+        the server reports everything.
+        """
+        report_url = self._resolve_url(path)
+        body = _SYNC_COLLECTION[kind]
+        changes = DavChanges(resources=[], complete=not sync_token)
+        token = sync_token or ""
+        while True:
+            resp = self._http.request(
+                "REPORT",
+                report_url,
+                headers={
+                    "Content-Type": "application/xml; charset=utf-8",
+                    "Depth": "1",
+                },
+                data=body.format(token=_xml_escape(token)).encode("utf-8"),
+                timeout=30,
+            )
+            if resp.status_code in (403, 409) and "valid-sync-token" in resp.text:
+                raise SyncTokenInvalid(report_url)
+            if resp.status_code in (400, 403, 405, 415, 501):
+                raise SyncCollectionError(f"{resp.status_code} from {report_url}")
+            resp.raise_for_status()
+            entries, new_token = _parse_report(resp.text, kind)
+            if new_token is None:
+                raise SyncCollectionError(f"no sync-token from {report_url}")
+            truncated = False
+            bodiless: list[str] = []
+            for href, status, etag, data in entries:
+                url = self._resolve_url(href)
+                if status == 507 and _same_href(url, report_url):
+                    truncated = True
+                elif status == 404:
+                    changes.deleted_hrefs.add(url)
+                elif status is None and not _same_href(url, report_url):
+                    if data is None:
+                        # Some servers only report etags here.
+                        bodiless.append(url)
+                        continue
+                    uid = scan_uid(data)
+                    if uid:
+                        changes.resources.append(
+                            DavResource(uid=uid, href=url, etag=etag, data=data)
+                        )
+            if bodiless:
+                changes.resources.extend(self.multiget(path, bodiless, kind))
+            changes.sync_token = token = new_token
+            if not truncated:
+                return changes
+
+    # -- Two-phase listing: etags first, bodies only for what changed --
+
+    def list_etags(self, path: str) -> dict[str, str | None]:
+        """Map each member href of a collection to its etag, without bodies."""
+        collection_url = self._resolve_url(path)
+        resp = self._http.request(
+            "PROPFIND",
+            collection_url,
+            headers={"Content-Type": "application/xml; charset=utf-8", "Depth": "1"},
+            data=_ETAG_PROPFIND,
             timeout=30,
         )
         resp.raise_for_status()
+        etags: dict[str, str | None] = {}
+        for href, etag in scan_etags(resp.text):
+            url = self._resolve_url(href)
+            if href and not _same_href(url, collection_url):
+                etags[url] = etag
+        return etags
+
+    def multiget(self, path: str, hrefs: list[str], kind: str) -> list[DavResource]:
+        """Fetch the given members in batched addressbook/calendar-multiget."""
+        report_url = self._resolve_url(path)
+        resources: list[DavResource] = []
+        for start in range(0, len(hrefs), MULTIGET_BATCH_SIZE):
+            batch = hrefs[start : start + MULTIGET_BATCH_SIZE]
+            href_xml = "".join(
+                f"<D:href>{_xml_escape(urlsplit(h).path)}</D:href>" for h in batch
+            )
+            resp = self._http.request(
+                "REPORT",
+                report_url,
+                headers={
+                    "Content-Type": "application/xml; charset=utf-8",
+                    "Depth": "1",
+                },
+                data=_MULTIGET[kind].format(hrefs=href_xml).encode("utf-8"),
+                timeout=30,
+            )
+            resp.raise_for_status()
+            entries, _ = _parse_report(resp.text, kind)
+            for href, status, etag, data in entries:
+                if status is not None or not data:
+                    continue
+                uid = scan_uid(data)
+                if uid:
+                    resources.append(
+                        DavResource(
+                            uid=uid, href=self._resolve_url(href), etag=etag, data=data
+                        )
+                    )
+        return resources
 
     # -- CalDAV operations --
 
@@ -141,34 +389,47 @@ class DavClient:
             data = obj.data
             if not data:
                 continue
-            uid = _extract_ical_uid(data)
+            uid = scan_uid(data)
             if uid:
                 resources.append(
                     DavResource(
                         uid=uid,
                         href=str(obj.url),
-                        etag=getattr(obj, "etag", None),
+                        etag=normalize_etag(getattr(obj, "etag", None)),
                         data=data,
                     )
                 )
         return resources
 
-    def put_event(self, caldav_path: str, uid: str, ical_text: str) -> str | None:
-        """Create or update a calendar object."""
-        client = self._get_caldav()
-        cal = caldav.Calendar(client=client, url=caldav_path)
-        obj = cal.save_event(ical_text)
-        return getattr(obj, "etag", None)
+    def put_event(
+        self, caldav_path: str, uid: str, ical_text: str, etag: str | None = None
+    ) -> str | None:
+        """Create or update a calendar object. Returns new etag."""
+        url = f"{caldav_path.rstrip('/')}/{uid}.ics"
+        headers = {"Content-Type": "text/calendar; charset=utf-8", **_if_match(etag)}
+        with self._write_slot():
+            resp = self._http.put(
+                self._resolve_url(url),
+                headers=headers,
+                data=ical_text.encode("utf-8"),
+                timeout=30,
+            )
+        resp.raise_for_status()
+        return normalize_etag(resp.headers.get("ETag"))
 
-    def delete_event(self, href: str) -> None:
+    def delete_event(self, href: str, etag: str | None = None) -> None:
         """Delete a calendar object by href."""
-        client = self._get_caldav()
-        obj = caldav.CalendarObjectResource(client=client, url=href)
-        obj.delete()
+        with self._write_slot():
+            resp = self._http.delete(
+                self._resolve_url(href), headers=_if_match(etag), timeout=30
+            )
+        resp.raise_for_status()
 
 
 # -- Helpers --
 
+MULTIGET_BATCH_SIZE = 100
+
 _ADDRESSBOOK_QUERY = """<?xml version="1.0" encoding="utf-8"?>
 <C:addressbook-query xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">
   <D:prop>
@@ -178,6 +439,132 @@ _ADDRESSBOOK_QUERY = """<?xml version="1.0" encoding="utf-8"?>
 </C:addressbook-query>"""
 
 
+_SYNC_TOKEN_PROPFIND = """<?xml version="1.0" encoding="utf-8"?>
+<D:propfind xmlns:D="DAV:">
+  <D:prop><D:sync-token/></D:prop>
+</D:propfind>"""
+
+_SYNC_COLLECTION = {
+    "card": """<?xml version="1.0" encoding="utf-8"?>
+<D:sync-collection xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">
+  <D:sync-token>{token}</D:sync-token>
+  <D:sync-level>1</D:sync-level>
+  <D:prop>
+    <D:getetag/>
+    <C:address-data/>
+  </D:prop>
+</D:sync-collection>""",
+    "cal": """<?xml version="1.0" encoding="utf-8"?>
+<D:sync-collection xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">
+  <D:sync-token>{token}</D:sync-token>
+  <D:sync-level>1</D:sync-level>
+  <D:prop>
+    <D:getetag/>
+    <C:calendar-data/>
+  </D:prop>
+</D:sync-collection>""",
+}
+
+_ETAG_PROPFIND = """<?xml version="1.0" encoding="utf-8"?>
+<D:propfind xmlns:D="DAV:">
+  <D:prop><D:getetag/></D:prop>
+</D:propfind>"""
+
+_MULTIGET = {
+    "card": """<?xml version="1.0" encoding="utf-8"?>
+<C:addressbook-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">
+  <D:prop>
+    <D:getetag/>
+    <C:address-data/>
+  </D:prop>
+  {hrefs}
+</C:addressbook-multiget>""",
+    "cal": """<?xml version="1.0" encoding="utf-8"?>
+<C:calendar-multiget xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:caldav">
+  <D:prop>
+    <D:getetag/>
+    <C:calendar-data/>
+  </D:prop>
+  {hrefs}
+</C:calendar-multiget>""",
+}
+
+_DATA_TAGS = {
+    "card": "{urn:ietf:params:xml:ns:carddav}address-data",
+    "cal": "{urn:ietf:params:xml:ns:caldav}calendar-data",
+}
+
+
+def _xml_escape(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def href_path(href: str) -> str:
+    """Comparable form of an href: decoded path without trailing slash."""
+    return unquote(urlsplit(href).path).rstrip("/")
+
+
+def _same_href(a: str, b: str) -> bool:
+    return href_path(a) == href_path(b)
+
+
+def _status_code(text: str | None) -> int | None:
+    # "HTTP/1.1 404 Not Found" -> 404
+    parts = (text or "").split()
+    if len(parts) >= 2 and parts[1].isdigit():
+        return int(parts[1])
+    return None
+
+
+def _parse_sync_token(xml_text: str) -> str | None:
+    import defusedxml.ElementTree as ET
+
+    root = ET.fromstring(xml_text)
+    token_el = root.find(".//{DAV:}sync-token")
+    if token_el is None or not token_el.text:
+        return None
+    return token_el.text.strip()
+
+
+def _parse_report(
+    xml_text: str, kind: str
+) -> tuple[list[tuple[str, int | None, str | None, str | None]], str | None]:
+    """Parse a sync-collection or multiget multistatus.
+
+    Returns ``(href, status, etag, data)`` entries plus the new sync token.
+    ``status`` is set only for responses carrying a bare DAV:status (404
+    for removed or unknown members, 507 for a truncated result). The token
+    is None for reports that do not carry one.
+    """
+    import defusedxml.ElementTree as ET
+
+    root = ET.fromstring(xml_text)
+    ns = {"D": "DAV:"}
+    entries: list[tuple[str, int | None, str | None, str | None]] = []
+    for response in root.findall("D:response", ns):
+        href_el = response.find("D:href", ns)
+        href = (href_el.text or "") if href_el is not None else ""
+        status_el = response.find("D:status", ns)
+        if status_el is not None:
+            entries.append((href, _status_code(status_el.text), None, None))
+            continue
+        etag: str | None = None
+        data: str | None = None
+        for propstat in response.findall("D:propstat", ns):
+            if _status_code(propstat.findtext("D:status", None, ns)) != 200:
+                continue
+            etag_el = propstat.find(".//D:getetag", ns)
+            if etag_el is not None and etag_el.text:
+                etag = normalize_etag(etag_el.text)
+            data_el = propstat.find(f".//{_DATA_TAGS[kind]}")
+            if data_el is not None and data_el.text:
+                data = data_el.text
+        entries.append((href, None, etag, data))
+    token_el = root.find("D:sync-token", ns)
+    token = token_el.text.strip() if token_el is not None and token_el.text else None
+    return entries, token
+
+
 def _discover_addressbooks(url: str, username: str, password: str) -> list[str]:
     """Try to discover CardDAV addressbooks via PROPFIND."""
     resp = requests.request(
@@ -221,32 +608,72 @@ def _parse_multistatus(xml_text: str) -> list[tuple[str, str | None, str | None]
         href_el = response.find("D:href", ns)
         href = href_el.text if href_el is not None else ""
         etag_el = response.find(".//D:getetag", ns)
-        etag = etag_el.text.strip('"') if etag_el is not None and etag_el.text else None
+        etag = normalize_etag(etag_el.text) if etag_el is not None else None
         data_el = response.find(".//C:address-data", ns)
         data = data_el.text if data_el is not None else None
         results.append((href or "", etag, data))
     return results
 
 
-def _extract_vcard_uid(vcard_text: str) -> str | None:
-    """Extract UID from vCard text."""
-    try:
-        vc = vobject.readOne(vcard_text)
-        if hasattr(vc, "uid"):
-            return vc.uid.value
-    except Exception:
-        pass
-    return None
+# Cheap pre-scans for the listing phase. Full parsing is left to the
+# resources the sync actually applies.
+
+_UID_RE = re.compile(
+    r'^UID(?:;(?:"[^"]*"|[^:;\r\n])*)*:(.*(?:\r?\n[ \t].*)*)',
+    re.IGNORECASE | re.MULTILINE,
+)
+_FOLD_RE = re.compile(r"\r?\n[ \t]")
+_ALARM_RE = re.compile(
+    r"^BEGIN:VALARM\b.*?^END:VALARM\b", re.IGNORECASE | re.MULTILINE | re.DOTALL
+)
+_TEXT_ESCAPE_RE = re.compile(r"\\([\\,;])")
+
+_RESPONSE_RE = re.compile(
+    r"<(?:[\w.-]+:)?response[\s>].*?</(?:[\w.-]+:)?response\s*>", re.DOTALL
+)
+_HREF_RE = re.compile(r"<(?:[\w.-]+:)?href\s*>(.*?)</", re.DOTALL)
+_ETAG_RE = re.compile(r"<(?:[\w.-]+:)?getetag\s*>(.*?)</", re.DOTALL)
+
+
+def scan_uid(text: str) -> str | None:
+    """Read the UID of a vCard or calendar object without parsing it.
+
+    Handles folded lines and property parameters. UIDs of VALARMs are
+    skipped so an alarm cannot shadow its event's UID.
+    """
+    if "VALARM" in text or "valarm" in text:
+        text = _ALARM_RE.sub("", text)
+    match = _UID_RE.search(text)
+    if match is None:
+        return None
+    value = _FOLD_RE.sub("", match.group(1)).strip()
+    return _TEXT_ESCAPE_RE.sub(r"\1", value) or None
+
+
+def scan_etags(xml_text: str) -> list[tuple[str, str | None]]:
+    """Pull (href, etag) pairs out of an etag-only PROPFIND multistatus."""
+    results: list[tuple[str, str | None]] = []
+    for response in _RESPONSE_RE.finditer(xml_text):
+        block = response.group(0)
+        href = _HREF_RE.search(block)
+        if href is None:
+            continue
+        etag = _ETAG_RE.search(block)
+        results.append(
+            (
+                html.unescape(href.group(1).strip()),
+                normalize_etag(html.unescape(etag.group(1))) if etag else None,
+            )
+        )
+    return results
 
 
-def _extract_ical_uid(ical_text: str) -> str | None:
-    """Extract UID from iCalendar text."""
+def _first_calendar_component(ical_text: str) -> Any | None:
     try:
         cal = Calendar.from_ical(ical_text)
-        for component in cal.walk():
-            uid = component.get("uid")
-            if uid:
-                return str(uid)
     except Exception:
-        pass
+        return None
+    for component in cal.walk():
+        if component.name in ("VEVENT", "VTODO"):
+            return component
     return None
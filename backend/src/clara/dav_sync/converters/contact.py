@@ -130,10 +130,10 @@ def vcard_to_contact_data(vcard: vobject.vCard) -> dict[str, Any]:
 
     # Tags from CATEGORIES
     tags: list[str] = []
-    if hasattr(vcard, "categories"):
-        cat_val = vcard.categories.value
+    for cat_entry in getattr(vcard, "categories_list", []):
+        cat_val = cat_entry.value
         if isinstance(cat_val, list):
-            tags = [t for t in cat_val if isinstance(t, str)]
+            tags.extend(t for t in cat_val if isinstance(t, str) and t not in tags)
 
     return {
         "contact_fields": {
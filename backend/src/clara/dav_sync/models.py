@@ -2,6 +2,7 @@ import uuid
 from datetime import datetime
 
 from sqlalchemy import (
+    JSON,
     Boolean,
     DateTime,
     ForeignKey,
@@ -35,6 +36,10 @@ class DavSyncAccount(VaultScopedModel):
     last_sync_error: Mapped[str | None] = mapped_column(Text, nullable=True)
     sync_token_card: Mapped[str | None] = mapped_column(String(500), nullable=True)
     sync_token_cal: Mapped[str | None] = mapped_column(String(500), nullable=True)
+    # Entity type -> ISO time; local rows older than it were already synced.
+    local_watermarks: Mapped[dict[str, str]] = mapped_column(
+        JSON, default=dict, server_default="{}"
+    )
 
     mappings: Mapped[list["DavSyncMapping"]] = relationship(
         back_populates="account", cascade="all, delete-orphan"
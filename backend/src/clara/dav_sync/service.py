@@ -5,16 +5,15 @@ from __future__ import annotations
 import uuid
 from typing import Any
 
-import redis
-import rq
-
-from clara.config import get_settings
+from clara.database import after_commit
 from clara.dav_sync.client import DavClient
 from clara.dav_sync.models import DavSyncAccount
 from clara.dav_sync.repository import DavSyncAccountRepository, DavSyncMappingRepository
 from clara.dav_sync.schemas import DavSyncAccountCreate, DavSyncAccountUpdate
-from clara.exceptions import NotFoundError
+from clara.exceptions import ConflictError, NotFoundError
 from clara.integrations.crypto import decrypt_credential, encrypt_credential
+from clara.jobs.schedule import DAV_SCHEDULE
+from clara.redis import get_queue, get_redis
 
 
 class DavSyncService:
@@ -26,6 +25,20 @@ class DavSyncService:
         self.account_repo = account_repo
         self.mapping_repo = mapping_repo
 
+    def _schedule(self, account_id: uuid.UUID, due: float | None) -> None:
+        """Set (or with None drop) the next run once the change commits.
+
+        A scheduler tick must not run the sync before the row is visible.
+        """
+
+        async def apply() -> None:
+            if due is None:
+                DAV_SCHEDULE.remove(get_redis(), account_id)
+            else:
+                DAV_SCHEDULE.set_due(get_redis(), account_id, due)
+
+        after_commit(self.account_repo.session, apply)
+
     async def list_accounts(self) -> list[DavSyncAccount]:
         items, _ = await self.account_repo.list(offset=0, limit=1000)
         return list(items)
@@ -39,7 +52,10 @@ class DavSyncService:
     async def create_account(self, data: DavSyncAccountCreate) -> DavSyncAccount:
         fields = data.model_dump(exclude={"password"})
         fields["encrypted_password"] = encrypt_credential(data.password)
-        return await self.account_repo.create(**fields)
+        account = await self.account_repo.create(**fields)
+        due = DAV_SCHEDULE.first_run(account.sync_interval_minutes)
+        self._schedule(account.id, due)
+        return account
 
     async def update_account(
         self, account_id: uuid.UUID, data: DavSyncAccountUpdate
@@ -47,10 +63,17 @@ class DavSyncService:
         fields = data.model_dump(exclude_unset=True, exclude={"password"})
         if data.password is not None:
             fields["encrypted_password"] = encrypt_credential(data.password)
-        return await self.account_repo.update(account_id, **fields)
+        account = await self.account_repo.update(account_id, **fields)
+        if "sync_interval_minutes" in fields:
+            due = DAV_SCHEDULE.next_run(
+                account.sync_interval_minutes, account.last_synced_at
+            )
+            self._schedule(account.id, due)
+        return account
 
     async def delete_account(self, account_id: uuid.UUID) -> None:
         await self.account_repo.soft_delete(account_id)
+        self._schedule(account_id, None)
 
     async def test_connection(self, account_id: uuid.UUID) -> dict[str, str | None]:
         account = await self.get_account(account_id)
@@ -59,12 +82,10 @@ class DavSyncService:
         return client.test_connection()
 
     async def trigger_sync(self, account_id: uuid.UUID) -> None:
-        """Enqueue sync job."""
+        """Enqueue sync job; conflict if one is already queued or running."""
         await self.get_account(account_id)  # validate exists
-        settings = get_settings()
-        conn = redis.Redis.from_url(str(settings.redis_url))
-        q = rq.Queue(connection=conn)
-        q.enqueue("clara.jobs.dav_sync.sync_dav_account", str(account_id))
+        if not DAV_SCHEDULE.enqueue(get_redis(), get_queue(), account_id):
+            raise ConflictError("A sync is already queued or running")
 
     async def get_status(self, account_id: uuid.UUID) -> dict[str, Any]:
         account = await self.get_account(account_id)
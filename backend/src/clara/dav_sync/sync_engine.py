@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 from typing import Any
 
 import structlog
-import vobject
 from icalendar import Calendar
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from clara.activities.models import Activity
-from clara.contacts.models import Address, Contact, ContactMethod, Tag
-from clara.dav_sync.client import DavClient, DavResource
+from clara.contacts.lookups import VaultLookups
+from clara.contacts.models import Address, Contact, ContactMethod
+from clara.dav_sync.client import (
+    DavChanges,
+    DavClient,
+    DavResource,
+    SyncCollectionError,
+    SyncTokenInvalid,
+    href_path,
+    normalize_etag,
+)
 from clara.dav_sync.converters.activity import (
     activity_to_vevent,
     vevent_to_activity_data,
@@ -49,26 +60,229 @@ class SyncItem:
     remote_resource: DavResource | None
 
 
+# Collections synced per account, and the entity types stored in each. The
+# CalDAV types share one calendar, so its delta is fetched once per run.
+COLLECTIONS: dict[str, tuple[str, ...]] = {
+    "card": ("contact",),
+    "cal": ("activity", "task", "reminder"),
+}
+
+# Actions that apply a remote change; if one fails, the sync token must not
+# advance past it or the change would never be delivered again.
+_REMOTE_ACTIONS = frozenset(
+    {
+        SyncAction.NEW_REMOTE,
+        SyncAction.UPDATED_REMOTE,
+        SyncAction.DELETED_REMOTE,
+        SyncAction.CONFLICT,
+    }
+)
+
+
+# Actions that write to the server. Their PUT/DELETE requests are sent
+# concurrently once the rest of the run has been applied.
+_WRITE_ACTIONS = frozenset(
+    {SyncAction.NEW_LOCAL, SyncAction.UPDATED_LOCAL, SyncAction.DELETED_LOCAL}
+)
+
+
+# The watermark trails the run's start so rows committed by transactions
+# still open at that moment (or stamped by a skewed DB clock) are not missed.
+WATERMARK_OVERLAP = timedelta(minutes=5)
+
+
+def _collection_of(entity_type: str) -> str:
+    return "card" if entity_type == "contact" else "cal"
+
+
+_NO_ETAG = object()
+
+
+def fetch_remote_changes(
+    session: Session,
+    client: DavClient,
+    account: DavSyncAccount,
+    collection: str,
+) -> DavChanges | None:
+    """Fetch a collection's changes since the last run.
+
+    Uses the stored sync token when there is one. Otherwise, or when the
+    server rejects it or lacks sync-collection, lists hrefs and etags only
+    and multigets the members whose etag differs from the mapping's.
+    Returns None when the collection is not enabled for the account.
+    """
+    if collection == "card":
+        enabled, path = account.carddav_enabled, account.carddav_path
+        token = account.sync_token_card
+    else:
+        enabled, path = account.caldav_enabled, account.caldav_path
+        token = account.sync_token_cal
+    if not enabled or not path:
+        return None
+
+    if token:
+        try:
+            return client.sync_collection(path, token, collection)
+        except SyncTokenInvalid:
+            logger.info(
+                "dav_sync_token_invalid",
+                collection=collection,
+                account_id=str(account.id),
+            )
+        except SyncCollectionError:
+            logger.info(
+                "dav_sync_collection_unsupported",
+                collection=collection,
+                account_id=str(account.id),
+            )
+
+    # Read the token before listing: anything changed in between is
+    # reported again next run instead of being missed.
+    new_token = client.get_sync_token(path)
+    listing = client.list_etags(path)
+    known = _known_etags(session, account, collection)
+    listed = {href_path(href) for href in listing}
+    changed = [
+        href
+        for href, etag in listing.items()
+        if etag is None or known.get(href_path(href), _NO_ETAG) != etag
+    ]
+    resources = client.multiget(path, changed, collection) if changed else []
+    return DavChanges(
+        resources=resources,
+        deleted_hrefs={p for p in known if p not in listed},
+        sync_token=new_token,
+    )
+
+
+def _known_etags(
+    session: Session, account: DavSyncAccount, collection: str
+) -> dict[str, str | None]:
+    """Etag last seen for each mapped href in the collection."""
+    rows = (
+        session.query(DavSyncMapping.remote_href, DavSyncMapping.remote_etag)
+        .filter(
+            DavSyncMapping.account_id == account.id,
+            DavSyncMapping.entity_type.in_(COLLECTIONS[collection]),
+            DavSyncMapping.deleted_at.is_(None),
+        )
+        .all()
+    )
+    # Etags stored by older runs may still carry their quotes.
+    return {href_path(href): normalize_etag(etag) for href, etag in rows if href}
+
+
+def route_changes(
+    session: Session,
+    account: DavSyncAccount,
+    collection: str,
+    changes: DavChanges,
+) -> dict[str, DavChanges]:
+    """Split a collection's changes between the entity types stored in it.
+
+    Calendar data is parsed once here. Each VEVENT/VTODO goes to the type
+    its mapping already has, or else to the one its content implies, so
+    each entity pipeline sees only its own components.
+    """
+    entity_types = COLLECTIONS[collection]
+    if len(entity_types) == 1:
+        return {entity_types[0]: changes}
+
+    mapped: dict[str, str] = dict(
+        session.query(DavSyncMapping.remote_uid, DavSyncMapping.entity_type)
+        .filter(
+            DavSyncMapping.account_id == account.id,
+            DavSyncMapping.entity_type.in_(entity_types),
+            DavSyncMapping.deleted_at.is_(None),
+        )
+        .all()
+    )
+    routed = {
+        entity_type: DavChanges(
+            resources=[],
+            deleted_hrefs=changes.deleted_hrefs,
+            sync_token=changes.sync_token,
+            complete=changes.complete,
+        )
+        for entity_type in entity_types
+    }
+    for resource in changes.resources:
+        if resource.component is None and resource.uid not in mapped:
+            logger.warning(
+                "dav_sync_unparseable",
+                href=resource.href,
+                account_id=str(account.id),
+            )
+            continue
+        entity_type = mapped.get(resource.uid) or _component_entity_type(
+            resource.component
+        )
+        routed[entity_type].resources.append(resource)
+    return routed
+
+
+def _component_entity_type(component: Any) -> str:
+    if component.name == "VEVENT":
+        return "activity"
+    # Disambiguate VTODO: explicit CLARA type, else RRULE → reminder
+    clara_type = str(component.get("x-clara-entity-type", ""))
+    if clara_type in ("task", "reminder"):
+        return clara_type
+    return "reminder" if component.get("rrule") is not None else "task"
+
+
+def _calendar_component(resource: DavResource) -> Any:
+    if resource.component is None:
+        raise ValueError(f"No VEVENT or VTODO in {resource.href}")
+    return resource.component
+
+
+def store_sync_token(
+    account: DavSyncAccount, collection: str, changes: DavChanges
+) -> None:
+    if collection == "card":
+        account.sync_token_card = changes.sync_token
+    else:
+        account.sync_token_cal = changes.sync_token
+
+
 def sync_entity_type(
     session: Session,
     client: DavClient,
     account: DavSyncAccount,
     entity_type: str,
+    changes: DavChanges | None = None,
 ) -> dict[str, int]:
-    """Sync one entity type for an account. Returns action counts."""
-    vault_id = account.vault_id
-
-    # Fetch remote resources
-    if entity_type == "contact":
-        if not account.carddav_enabled or not account.carddav_path:
-            return {}
-        remote_resources = client.list_vcards(account.carddav_path)
-    else:
-        if not account.caldav_enabled or not account.caldav_path:
+    """Sync one entity type for an account. Returns action counts.
+
+    ``changes`` is the collection's remote delta; it is fetched when not
+    given, and must already be routed to ``entity_type`` when it is. The
+    stored sync token is left alone either way.
+    """
+    if changes is None:
+        collection = _collection_of(entity_type)
+        fetched = fetch_remote_changes(session, client, account, collection)
+        if fetched is None:
             return {}
-        remote_resources = client.list_events(account.caldav_path)
+        changes = route_changes(session, account, collection, fetched)[entity_type]
+    counts, _ = sync_changes(session, client, account, entity_type, changes)
+    return counts
+
 
-    remote_by_uid: dict[str, DavResource] = {r.uid: r for r in remote_resources}
+def sync_changes(
+    session: Session,
+    client: DavClient,
+    account: DavSyncAccount,
+    entity_type: str,
+    changes: DavChanges,
+) -> tuple[dict[str, int], bool]:
+    """Apply a remote delta for one entity type and push local changes.
+
+    Returns the action counts and whether every remote change was applied.
+    """
+    vault_id = account.vault_id
+    remote_by_uid: dict[str, DavResource] = {r.uid: r for r in changes.resources}
+    deleted_paths = {href_path(h) for h in changes.deleted_hrefs}
 
     # Fetch mappings
     mappings = (
@@ -85,10 +299,36 @@ def sync_entity_type(
     }
     mapping_by_remote: dict[str, DavSyncMapping] = {m.remote_uid: m for m in mappings}
 
-    # Fetch local entities
+    # Remote side of each mapping. Placeholders stand in for resources
+    # absent from a delta, i.e. unchanged on the server since the token.
+    remote_by_mapping: dict[uuid.UUID, DavResource | None] = {}
+    remote_touched: set[uuid.UUID] = set()
+    for mapping in mappings:
+        remote = remote_by_uid.get(mapping.remote_uid)
+        if remote is not None and remote.href and mapping.remote_href != remote.href:
+            mapping.remote_href = remote.href
+        if (
+            remote is None
+            and not changes.complete
+            and href_path(mapping.remote_href or "") not in deleted_paths
+        ):
+            remote = DavResource(
+                uid=mapping.remote_uid,
+                href=mapping.remote_href or "",
+                etag=mapping.remote_etag,
+                data="",
+            )
+        else:
+            remote_touched.add(mapping.local_id)
+        remote_by_mapping[mapping.local_id] = remote
+
+    # Fetch local entities: all of them on the first run, afterwards only
+    # those changed since the watermark plus those the remote side touched.
+    started = datetime.now(UTC)
+    watermark = _get_watermark(account, entity_type)
     model_cls = _get_model_class(entity_type)
-    local_entities = (
-        session.query(model_cls).filter(model_cls.vault_id == vault_id).all()
+    local_entities = _load_local_entities(
+        session, model_cls, vault_id, watermark, remote_touched
     )
     # Include soft-deleted for detecting local deletions
     local_by_id: dict[uuid.UUID, Any] = {e.id: e for e in local_entities}
@@ -99,14 +339,17 @@ def sync_entity_type(
     # Check mapped items
     for mapping in mappings:
         local = local_by_id.get(mapping.local_id)
-        remote = remote_by_uid.get(mapping.remote_uid)
+        remote = remote_by_mapping[mapping.local_id]
+        if watermark and local is None and mapping.local_id not in remote_touched:
+            continue  # neither side changed since the last run
 
         if local and local.deleted_at is not None:
             items.append(SyncItem(SyncAction.DELETED_LOCAL, mapping, local, remote))
         elif not remote:
             items.append(SyncItem(SyncAction.DELETED_REMOTE, mapping, local, None))
         elif local and remote:
-            remote_changed = mapping.remote_etag and remote.etag != mapping.remote_etag
+            known_etag = normalize_etag(mapping.remote_etag)
+            remote_changed = known_etag and remote.etag != known_etag
             local_changed = local.updated_at > mapping.local_updated_at
             if remote_changed and local_changed:
                 items.append(SyncItem(SyncAction.CONFLICT, mapping, local, remote))
@@ -129,22 +372,170 @@ def sync_entity_type(
         if entity.deleted_at is None and entity.id not in mapping_by_local:
             items.append(SyncItem(SyncAction.NEW_LOCAL, None, entity, None))
 
-    # Execute
+    # Execute. Local work runs in order on this thread; server writes are
+    # rendered here too (converters touch ORM state), then sent in parallel.
     counts: dict[str, int] = {}
+    applied = True
+    failed = False
+    writes: list[tuple[SyncItem, DavResource | None]] = []
+    lookups = VaultLookups(session, vault_id)
     for item in items:
         try:
-            _execute_sync_item(session, client, account, entity_type, item)
-            counts[item.action.value] = counts.get(item.action.value, 0) + 1
+            if item.action in _WRITE_ACTIONS:
+                writes.append((item, _render_write(account, entity_type, item)))
+                continue
+            _execute_sync_item(session, client, account, entity_type, item, lookups)
+        except Exception:
+            failed = True
+            if item.action in _REMOTE_ACTIONS:
+                applied = False
+            _log_item_failure(account, entity_type, item)
+            continue
+        counts[item.action.value] = counts.get(item.action.value, 0) + 1
+
+    for item, outcome in _send_writes(client, account, entity_type, writes):
+        try:
+            _finish_write(session, account, entity_type, item, outcome)
         except Exception:
-            logger.exception(
-                "sync_item_failed",
+            failed = True
+            _log_item_failure(account, entity_type, item)
+            continue
+        counts[item.action.value] = counts.get(item.action.value, 0) + 1
+
+    # A failed item is retried next run only if it is loaded again.
+    if not failed:
+        _set_watermark(account, entity_type, started - WATERMARK_OVERLAP)
+    session.flush()
+    return counts, applied
+
+
+def _get_watermark(account: DavSyncAccount, entity_type: str) -> datetime | None:
+    value = (account.local_watermarks or {}).get(entity_type)
+    return datetime.fromisoformat(value) if value else None
+
+
+def _set_watermark(
+    account: DavSyncAccount, entity_type: str, watermark: datetime
+) -> None:
+    # Reassign rather than mutate so the JSON column is marked dirty.
+    account.local_watermarks = {
+        **(account.local_watermarks or {}),
+        entity_type: watermark.isoformat(),
+    }
+
+
+def _load_local_entities(
+    session: Session,
+    model_cls: type[Any],
+    vault_id: uuid.UUID,
+    watermark: datetime | None,
+    ids: set[uuid.UUID],
+) -> list[Any]:
+    conditions = [model_cls.vault_id == vault_id]
+    if watermark is not None:
+        changed = [model_cls.updated_at > watermark, model_cls.deleted_at > watermark]
+        if ids:
+            changed.append(model_cls.id.in_(ids))
+        conditions.append(or_(*changed))
+    return session.query(model_cls).filter(*conditions).all()
+
+
+def _log_item_failure(
+    account: DavSyncAccount, entity_type: str, item: SyncItem
+) -> None:
+    logger.exception(
+        "sync_item_failed",
+        entity_type=entity_type,
+        action=item.action.value,
+        account_id=str(account.id),
+    )
+
+
+def _render_write(
+    account: DavSyncAccount, entity_type: str, item: SyncItem
+) -> DavResource | None:
+    """The resource to PUT or DELETE for a write action, if any."""
+    if item.action == SyncAction.DELETED_LOCAL:
+        remote = item.remote_resource
+        return remote if item.mapping and remote and remote.href else None
+    if item.local_entity is None:
+        return None
+    if item.action == SyncAction.UPDATED_LOCAL and item.mapping is None:
+        return None
+    return _render_local(account, entity_type, item.local_entity)
+
+
+def _send_writes(
+    client: DavClient,
+    account: DavSyncAccount,
+    entity_type: str,
+    writes: Sequence[tuple[SyncItem, DavResource | None]],
+) -> list[tuple[SyncItem, DavResource | Exception | None]]:
+    """Send PUT/DELETE requests, at most ``client.max_concurrency`` at once.
+
+    Runs no ORM code, so it is safe off the session's thread. Failures are
+    returned in place of the resource rather than raised.
+    """
+
+    def send(
+        write: tuple[SyncItem, DavResource | None],
+    ) -> DavResource | Exception | None:
+        item, resource = write
+        if resource is None:
+            return None
+        try:
+            if item.action == SyncAction.DELETED_LOCAL:
+                _delete_remote(client, account, entity_type, resource)
+            else:
+                resource.etag = _put_remote(client, account, entity_type, resource)
+        except Exception as exc:
+            return exc
+        return resource
+
+    if len(writes) <= 1:
+        results = [send(write) for write in writes]
+    else:
+        workers = min(client.max_concurrency, len(writes))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(send, writes))
+    return [(item, result) for (item, _), result in zip(writes, results, strict=True)]
+
+
+def _finish_write(
+    session: Session,
+    account: DavSyncAccount,
+    entity_type: str,
+    item: SyncItem,
+    outcome: DavResource | Exception | None,
+) -> None:
+    """Record the result of a server write on the mappings."""
+    if isinstance(outcome, Exception):
+        raise outcome
+
+    if item.action == SyncAction.NEW_LOCAL:
+        if outcome and item.local_entity:
+            mapping = DavSyncMapping(
+                vault_id=account.vault_id,
+                account_id=account.id,
                 entity_type=entity_type,
-                action=item.action.value,
-                account_id=str(account.id),
+                local_id=item.local_entity.id,
+                remote_uid=outcome.uid,
+                remote_etag=outcome.etag,
+                remote_href=outcome.href,
+                local_updated_at=item.local_entity.updated_at or datetime.now(UTC),
             )
+            session.add(mapping)
 
-    session.flush()
-    return counts
+    elif item.action == SyncAction.UPDATED_LOCAL:
+        if outcome and item.mapping and item.local_entity:
+            item.mapping.remote_etag = outcome.etag
+            item.mapping.remote_href = outcome.href
+            item.mapping.local_updated_at = (
+                item.local_entity.updated_at or datetime.now(UTC)
+            )
+
+    elif item.action == SyncAction.DELETED_LOCAL and item.mapping:
+        item.mapping.deleted_at = datetime.now(UTC)
 
 
 def _execute_sync_item(
@@ -153,6 +544,7 @@ def _execute_sync_item(
     account: DavSyncAccount,
     entity_type: str,
     item: SyncItem,
+    lookups: VaultLookups,
 ) -> None:
     vault_id = account.vault_id
 
@@ -160,7 +552,7 @@ def _execute_sync_item(
         if not item.remote_resource:
             return
         entity = _create_local_from_remote(
-            session, vault_id, entity_type, item.remote_resource
+            session, lookups, entity_type, item.remote_resource
         )
         if entity:
             mapping = DavSyncMapping(
@@ -176,30 +568,11 @@ def _execute_sync_item(
             )
             session.add(mapping)
 
-    elif item.action == SyncAction.NEW_LOCAL:
-        if not item.local_entity:
-            return
-        resource = _push_local_to_remote(
-            client, account, entity_type, item.local_entity
-        )
-        if resource:
-            mapping = DavSyncMapping(
-                vault_id=vault_id,
-                account_id=account.id,
-                entity_type=entity_type,
-                local_id=item.local_entity.id,
-                remote_uid=resource.uid,
-                remote_etag=resource.etag,
-                remote_href=resource.href,
-                local_updated_at=item.local_entity.updated_at or datetime.now(UTC),
-            )
-            session.add(mapping)
-
     elif item.action == SyncAction.UPDATED_REMOTE:
         if not (item.mapping and item.remote_resource and item.local_entity):
             return
         _update_local_from_remote(
-            session, vault_id, entity_type, item.local_entity, item.remote_resource
+            session, lookups, entity_type, item.local_entity, item.remote_resource
         )
         item.mapping.remote_etag = item.remote_resource.etag
         item.mapping.remote_updated_at = datetime.now(UTC)
@@ -207,19 +580,6 @@ def _execute_sync_item(
             UTC
         )
 
-    elif item.action == SyncAction.UPDATED_LOCAL:
-        if not (item.mapping and item.local_entity):
-            return
-        resource = _push_local_to_remote(
-            client, account, entity_type, item.local_entity
-        )
-        if resource:
-            item.mapping.remote_etag = resource.etag
-            item.mapping.remote_href = resource.href
-            item.mapping.local_updated_at = (
-                item.local_entity.updated_at or datetime.now(UTC)
-            )
-
     elif item.action == SyncAction.CONFLICT:
         # Last-write-wins by timestamp
         if not (item.mapping and item.local_entity and item.remote_resource):
@@ -235,7 +595,7 @@ def _execute_sync_item(
                 item.mapping.local_updated_at = local_time
         else:
             _update_local_from_remote(
-                session, vault_id, entity_type, item.local_entity, item.remote_resource
+                session, lookups, entity_type, item.local_entity, item.remote_resource
             )
             item.mapping.remote_etag = item.remote_resource.etag
             item.mapping.remote_updated_at = datetime.now(UTC)
@@ -243,13 +603,6 @@ def _execute_sync_item(
                 item.local_entity.updated_at or datetime.now(UTC)
             )
 
-    elif item.action == SyncAction.DELETED_LOCAL:
-        if not item.mapping:
-            return
-        if item.remote_resource:
-            _delete_remote(client, account, entity_type, item.remote_resource)
-        item.mapping.deleted_at = datetime.now(UTC)
-
     elif item.action == SyncAction.DELETED_REMOTE:
         if not (item.mapping and item.local_entity):
             return
@@ -267,10 +620,14 @@ def _get_model_class(entity_type: str) -> type[Any]:
 
 
 def _create_local_from_remote(
-    session: Session, vault_id: uuid.UUID, entity_type: str, resource: DavResource
+    session: Session,
+    lookups: VaultLookups,
+    entity_type: str,
+    resource: DavResource,
 ) -> Any | None:
+    vault_id = lookups.vault_id
     if entity_type == "contact":
-        vc = vobject.readOne(resource.data)
+        vc = resource.vcard
         data = vcard_to_contact_data(vc)
         contact = Contact(vault_id=vault_id, **data["contact_fields"])
         session.add(contact)
@@ -282,59 +639,42 @@ def _create_local_from_remote(
         for addr_data in data["addresses"]:
             session.add(Address(vault_id=vault_id, contact_id=contact.id, **addr_data))
         for tag_name in data["tags"]:
-            tag = (
-                session.query(Tag)
-                .filter(Tag.vault_id == vault_id, Tag.name == tag_name)
-                .first()
-            )
-            if not tag:
-                tag = Tag(vault_id=vault_id, name=tag_name)
-                session.add(tag)
-                session.flush()
-            contact.tags.append(tag)
+            contact.tags.append(lookups.tag(tag_name))
         session.flush()
         return contact
 
-    cal = Calendar.from_ical(resource.data)
-    for component in cal.walk():
-        if entity_type == "activity" and component.name == "VEVENT":
-            data = vevent_to_activity_data(component)
-            activity = Activity(vault_id=vault_id, **data["activity_fields"])
-            session.add(activity)
-            session.flush()
-            return activity
-        if component.name == "VTODO":
-            # Disambiguate: RRULE → reminder, else → task
-            clara_type = str(
-                component.get("x-clara-entity-type", "")
-            )
-            has_rrule = component.get("rrule") is not None
-            if entity_type == "reminder" or (
-                entity_type not in ("task",) and (clara_type == "reminder" or has_rrule)
-            ):
-                data = vtodo_to_reminder_data(component)
-                reminder = Reminder(vault_id=vault_id, **data)
-                session.add(reminder)
-                session.flush()
-                return reminder
-            if entity_type == "task" or clara_type == "task" or not has_rrule:
-                data = vtodo_to_task_data(component)
-                task = Task(vault_id=vault_id, **data)
-                session.add(task)
-                session.flush()
-                return task
+    component = _calendar_component(resource)
+    if entity_type == "activity" and component.name == "VEVENT":
+        data = vevent_to_activity_data(component)
+        activity = Activity(vault_id=vault_id, **data["activity_fields"])
+        session.add(activity)
+        session.flush()
+        return activity
+    if entity_type == "task" and component.name == "VTODO":
+        data = vtodo_to_task_data(component)
+        task = Task(vault_id=vault_id, **data)
+        session.add(task)
+        session.flush()
+        return task
+    if entity_type == "reminder" and component.name == "VTODO":
+        data = vtodo_to_reminder_data(component)
+        reminder = Reminder(vault_id=vault_id, **data)
+        session.add(reminder)
+        session.flush()
+        return reminder
     return None
 
 
 def _update_local_from_remote(
     session: Session,
-    vault_id: uuid.UUID,
+    lookups: VaultLookups,
     entity_type: str,
     entity: Any,
     resource: DavResource,
 ) -> None:
+    vault_id = lookups.vault_id
     if entity_type == "contact":
-        vc = vobject.readOne(resource.data)
+        vc = resource.vcard
         data = vcard_to_contact_data(vc)
         for key, value in data["contact_fields"].items():
             setattr(entity, key, value)
@@ -351,40 +691,35 @@ def _update_local_from_remote(
             session.add(Address(vault_id=vault_id, contact_id=entity.id, **addr_data))
         entity.tags.clear()
         for tag_name in data["tags"]:
-            tag = (
-                session.query(Tag)
-                .filter(Tag.vault_id == vault_id, Tag.name == tag_name)
-                .first()
-            )
-            if not tag:
-                tag = Tag(vault_id=vault_id, name=tag_name)
-                session.add(tag)
-                session.flush()
-            entity.tags.append(tag)
+            entity.tags.append(lookups.tag(tag_name))
         return
 
-    cal = Calendar.from_ical(resource.data)
-    for component in cal.walk():
-        if entity_type == "activity" and component.name == "VEVENT":
-            data = vevent_to_activity_data(component)
-            for key, value in data["activity_fields"].items():
-                setattr(entity, key, value)
-            return
-        if entity_type == "task" and component.name == "VTODO":
-            data = vtodo_to_task_data(component)
-            for key, value in data.items():
-                setattr(entity, key, value)
-            return
-        if entity_type == "reminder" and component.name == "VTODO":
-            data = vtodo_to_reminder_data(component)
-            for key, value in data.items():
-                setattr(entity, key, value)
-            return
+    component = _calendar_component(resource)
+    if entity_type == "activity" and component.name == "VEVENT":
+        data = vevent_to_activity_data(component)
+        for key, value in data["activity_fields"].items():
+            setattr(entity, key, value)
+    elif entity_type == "task" and component.name == "VTODO":
+        for key, value in vtodo_to_task_data(component).items():
+            setattr(entity, key, value)
+    elif entity_type == "reminder" and component.name == "VTODO":
+        for key, value in vtodo_to_reminder_data(component).items():
+            setattr(entity, key, value)
 
 
 def _push_local_to_remote(
     client: DavClient, account: DavSyncAccount, entity_type: str, entity: Any
 ) -> DavResource | None:
+    resource = _render_local(account, entity_type, entity)
+    if resource:
+        resource.etag = _put_remote(client, account, entity_type, resource)
+    return resource
+
+
+def _render_local(
+    account: DavSyncAccount, entity_type: str, entity: Any
+) -> DavResource | None:
+    """Serialize a local entity into the resource to PUT (no etag yet)."""
     uid = str(entity.id)
 
     if entity_type == "contact":
@@ -394,11 +729,10 @@ def _push_local_to_remote(
         vc.add("uid")
         vc.uid.value = uid
         vcard_text = vc.serialize()
-        etag = client.put_vcard(account.carddav_path, uid, vcard_text)
         return DavResource(
             uid=uid,
             href=f"{account.carddav_path}/{uid}.vcf",
-            etag=etag,
+            etag=None,
             data=vcard_text,
         )
 
@@ -422,9 +756,22 @@ def _push_local_to_remote(
         todo.add("uid", uid)
         cal.add_component(todo)
 
-    ical_text = cal.to_ical().decode()
-    etag = client.put_event(account.caldav_path, uid, ical_text)
-    return DavResource(uid=uid, href="", etag=etag, data=ical_text)
+    return DavResource(
+        uid=uid,
+        href=f"{account.caldav_path.rstrip('/')}/{uid}.ics",
+        etag=None,
+        data=cal.to_ical().decode(),
+    )
+
+
+def _put_remote(
+    client: DavClient, account: DavSyncAccount, entity_type: str, resource: DavResource
+) -> str | None:
+    if entity_type == "contact":
+        assert account.carddav_path
+        return client.put_vcard(account.carddav_path, resource.uid, resource.data)
+    assert account.caldav_path
+    return client.put_event(account.caldav_path, resource.uid, resource.data)
 
 
 def _delete_remote(
@@ -433,4 +780,4 @@ def _delete_remote(
     if entity_type == "contact":
         client.delete_vcard(resource.href, resource.etag)
     else:
-        client.delete_event(resource.href)
+        client.delete_event(resource.href, resource.etag)
@@ -6,10 +6,11 @@ from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from clara.auth import context_cache as auth_context
+from clara.auth import pat_cache
 from clara.auth.models import PersonalAccessToken, User, VaultMembership
-from clara.auth.security import decode_access_token, verify_password
+from clara.auth.security import decode_access_token, verify_password_async
 from clara.database import get_session
-from clara.redis import is_token_blacklisted
 
 Db = Annotated[AsyncSession, Depends(get_session)]
 
@@ -27,26 +28,43 @@ async def _extract_token(request: Request) -> str:
     )
 
 
-async def _authenticate_pat(
+async def _verify_pat(
     token: str, session: AsyncSession
-) -> tuple[User, PersonalAccessToken] | None:
-    """Look up user via Personal Access Token."""
+) -> PersonalAccessToken | None:
     prefix = token[:12]
     stmt = select(PersonalAccessToken).where(
         PersonalAccessToken.token_prefix == prefix
     )
     pats = (await session.execute(stmt)).scalars().all()
     for pat in pats:
-        if verify_password(token, pat.token_hash):
-            if pat.expires_at and pat.expires_at < datetime.now(UTC):
-                return None
-            pat.last_used_at = datetime.now(UTC)
-            await session.flush()
-            user = await session.get(User, pat.user_id)
-            return (user, pat) if user else None
+        if await verify_password_async(token, pat.token_hash):
+            return pat
     return None
 
 
+async def _authenticate_pat(
+    token: str, session: AsyncSession
+) -> tuple[User, PersonalAccessToken] | None:
+    """Look up user via Personal Access Token."""
+    pat_id = await pat_cache.lookup(token)
+    if pat_id is not None:
+        pat = await session.get(PersonalAccessToken, pat_id)
+        if pat is None:
+            await pat_cache.forget(pat_id)
+            return None
+    else:
+        pat = await _verify_pat(token, session)
+        if pat is None:
+            return None
+        await pat_cache.remember(token, pat.id)
+    now = datetime.now(UTC)
+    if pat.expires_at and pat.expires_at < now:
+        return None
+    pat_cache.record_use(pat.id, now)
+    user = await auth_context.get_user(session, pat.user_id)
+    return (user, pat) if user else None
+
+
 _WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
 
 
@@ -89,13 +107,18 @@ async def get_current_user(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token",
         )
-    jti = payload.get("jti")
-    if jti and await is_token_blacklisted(jti):
+    user_id = uuid.UUID(payload["sub"])
+    raw_vault_id = request.path_params.get("vault_id")
+    try:
+        vault_id = uuid.UUID(raw_vault_id) if raw_vault_id else None
+    except ValueError:
+        vault_id = None
+    if await auth_context.prefetch(payload.get("jti") or None, user_id, vault_id):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token has been revoked",
         )
-    jwt_user = await session.get(User, uuid.UUID(payload["sub"]))
+    jwt_user = await auth_context.get_user(session, user_id)
     if jwt_user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -114,11 +137,7 @@ async def get_vault_membership(
     user: User = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> VaultMembership:
-    stmt = select(VaultMembership).where(
-        VaultMembership.user_id == user.id,
-        VaultMembership.vault_id == vault_id,
-    )
-    membership = (await session.execute(stmt)).scalar_one_or_none()
+    membership = await auth_context.get_membership(session, user.id, vault_id)
     if membership is None:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -24,3 +24,7 @@ class ConflictError(AppError):
 
 class InvalidCredentialsError(AppError):
     pass
+
+
+class InvalidCursorError(AppError):
+    pass
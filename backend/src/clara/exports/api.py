@@ -0,0 +1,53 @@
+"""Background vault export endpoints."""
+
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse
+
+from clara.deps import CurrentUser, Db, VaultAccess
+from clara.exports.repository import VaultExportRepository
+from clara.exports.schemas import ExportCreate, ExportRead
+from clara.exports.service import ExportService
+from clara.files.storage import LocalStorage
+
+router = APIRouter()
+
+
+def get_export_service(
+    vault_id: uuid.UUID,
+    db: Db,
+    _access: VaultAccess,
+    user: CurrentUser,
+) -> ExportService:
+    repo = VaultExportRepository(session=db, vault_id=vault_id)
+    return ExportService(repo=repo, storage=LocalStorage(), requested_by=user.id)
+
+
+ExportSvc = Annotated[ExportService, Depends(get_export_service)]
+
+
+@router.post("", response_model=ExportRead, status_code=202)
+async def create_export(body: ExportCreate, svc: ExportSvc) -> ExportRead:
+    return ExportRead.model_validate(await svc.request_export(body))
+
+
+@router.get("", response_model=list[ExportRead])
+async def list_exports(svc: ExportSvc) -> list[ExportRead]:
+    return [ExportRead.model_validate(e) for e in await svc.list_exports()]
+
+
+@router.get("/{export_id}", response_model=ExportRead)
+async def get_export(export_id: uuid.UUID, svc: ExportSvc) -> ExportRead:
+    return ExportRead.model_validate(await svc.get_export(export_id))
+
+
+@router.get("/{export_id}/download")
+async def download_export(export_id: uuid.UUID, svc: ExportSvc) -> FileResponse:
+    path, export = await svc.download_path(export_id)
+    return FileResponse(
+        path,
+        media_type="application/zip",
+        filename=f"clara-export-{export.vault_id}-{export.format}.zip",
+    )
@@ -0,0 +1,81 @@
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import String, cast, func, literal, select, union_all, update
+
+from clara.base.model import VaultScopedModel
+from clara.base.repository import BaseRepository
+from clara.contacts.models import Contact, contact_tags
+from clara.exports.models import VaultExport
+from clara.files.models import File
+from clara.integrations.json_export import EXPORT_TABLES
+
+
+class VaultExportRepository(BaseRepository[VaultExport]):
+    model = VaultExport
+
+    async def fail_stale(self, cutoff: datetime) -> None:
+        """Mark in-flight exports with no progress since ``cutoff`` failed.
+
+        Progress updates bump ``updated_at``, so this only catches rows whose
+        enqueue was lost or whose worker died.
+        """
+        await self.session.execute(
+            update(VaultExport)
+            .where(VaultExport.vault_id == self.vault_id)
+            .where(VaultExport.status.in_(("queued", "running")))
+            .where(VaultExport.updated_at < cutoff)
+            .values(status="failed", error="Export stalled; request it again")
+            .execution_options(synchronize_session=False)
+        )
+
+    async def find_reusable(
+        self, fmt: str, fingerprint: str
+    ) -> VaultExport | None:
+        """Newest export of the same vault state that is done or in flight."""
+        stmt = (
+            self._base_query()
+            .where(VaultExport.format == fmt)
+            .where(VaultExport.fingerprint == fingerprint)
+            .where(VaultExport.status.in_(("queued", "running", "complete")))
+            .order_by(VaultExport.created_at.desc())
+            .limit(1)
+        )
+        return (await self.session.execute(stmt)).scalars().first()
+
+    async def content_stamps(self) -> list[tuple[str, int, str]]:
+        """Row count and latest ``updated_at`` of every exported table.
+
+        Soft deletes bump ``updated_at`` too, so any write to the vault
+        changes at least one stamp. One UNION ALL round trip.
+        """
+        tables: dict[str, type[VaultScopedModel]] = {**EXPORT_TABLES, "files": File}
+        parts = [
+            select(
+                literal(name).label("name"),
+                func.count().label("rows"),
+                cast(func.max(model.updated_at), String).label("stamp"),
+            ).where(model.vault_id == self.vault_id)
+            for name, model in tables.items()
+        ]
+        rows = (await self.session.execute(union_all(*parts))).all()
+        return sorted((r.name, r.rows, r.stamp or "") for r in rows)
+
+    async def tag_links(self) -> list[tuple[str, str]]:
+        """Contact/tag pairs; the association table carries no timestamps."""
+        stmt = (
+            select(contact_tags.c.contact_id, contact_tags.c.tag_id)
+            .join(Contact, Contact.id == contact_tags.c.contact_id)
+            .where(Contact.vault_id == self.vault_id)
+            .order_by(contact_tags.c.contact_id, contact_tags.c.tag_id)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [(str(r.contact_id), str(r.tag_id)) for r in rows]
+
+    async def list_recent(self, limit: int = 50) -> Sequence[VaultExport]:
+        stmt = (
+            self._base_query()
+            .order_by(VaultExport.created_at.desc())
+            .limit(limit)
+        )
+        return (await self.session.execute(stmt)).scalars().all()
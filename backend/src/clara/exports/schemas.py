@@ -0,0 +1,24 @@
+import uuid
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+ExportFormat = Literal["json", "ndjson"]
+
+
+class ExportCreate(BaseModel):
+    format: ExportFormat = "json"
+
+
+class ExportRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: uuid.UUID
+    vault_id: uuid.UUID
+    format: str
+    status: str
+    progress: int
+    size_bytes: int | None
+    error: str | None
+    created_at: datetime
+    completed_at: datetime | None
@@ -0,0 +1,85 @@
+"""Vault export requests, reuse of cached archives and job enqueueing."""
+
+import uuid
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import redis
+import rq
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from clara.config import get_settings
+from clara.database import after_commit
+from clara.exceptions import ConflictError, NotFoundError
+from clara.exports.archive import vault_fingerprint
+from clara.exports.models import VaultExport
+from clara.exports.repository import VaultExportRepository
+from clara.exports.schemas import ExportCreate
+from clara.files.storage import LocalStorage
+
+
+def enqueue_export(export_id: uuid.UUID) -> None:
+    settings = get_settings()
+    conn = redis.Redis.from_url(str(settings.redis_url))
+    q = rq.Queue(connection=conn)
+    q.enqueue("clara.jobs.export.run_export", str(export_id))
+
+
+class ExportService:
+    def __init__(
+        self,
+        repo: VaultExportRepository,
+        storage: LocalStorage,
+        requested_by: uuid.UUID,
+    ) -> None:
+        self.repo = repo
+        self.storage = storage
+        self.requested_by = requested_by
+
+    @property
+    def session(self) -> AsyncSession:
+        return self.repo.session
+
+    async def request_export(self, data: ExportCreate) -> VaultExport:
+        """Queue an archive build, or return one of the same vault state."""
+        fingerprint = await vault_fingerprint(
+            self.session, self.repo.vault_id, data.format
+        )
+        stale_after = timedelta(minutes=get_settings().background_job_stale_minutes)
+        await self.repo.fail_stale(datetime.now(UTC) - stale_after)
+        existing = await self.repo.find_reusable(data.format, fingerprint)
+        if existing is not None and (
+            existing.status != "complete"
+            or (existing.storage_key and self.storage.has(existing.storage_key))
+        ):
+            return existing
+        export = await self.repo.create(
+            requested_by=self.requested_by,
+            format=data.format,
+            fingerprint=fingerprint,
+        )
+        # The worker loads the row in its own session, so only enqueue once
+        # the request transaction has committed it.
+        async def enqueue() -> None:
+            enqueue_export(export.id)
+
+        after_commit(self.session, enqueue)
+        return export
+
+    async def list_exports(self) -> Sequence[VaultExport]:
+        return await self.repo.list_recent()
+
+    async def get_export(self, export_id: uuid.UUID) -> VaultExport:
+        export = await self.repo.get_by_id(export_id)
+        if export is None:
+            raise NotFoundError("VaultExport", export_id)
+        return export
+
+    async def download_path(self, export_id: uuid.UUID) -> tuple[Path, VaultExport]:
+        export = await self.get_export(export_id)
+        if export.status != "complete" or export.storage_key is None:
+            raise ConflictError(f"Export is {export.status}, not ready to download")
+        if not self.storage.has(export.storage_key):
+            raise NotFoundError("VaultExport", export_id)
+        return self.storage.path(export.storage_key), export
@@ -1,11 +1,12 @@
 import uuid
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Request, UploadFile
+from fastapi.responses import FileResponse, Response
 
 from clara.base.schema import PaginatedResponse, PaginationMeta
 from clara.deps import CurrentUser, Db, VaultAccess
+from clara.files.models import File
 from clara.files.repository import FileLinkRepository, FileRepository
 from clara.files.schemas import FileLinkCreate, FileLinkRead, FileRead, FileUpdate
 from clara.files.service import FileService
@@ -41,13 +42,19 @@ async def list_files(
     pagination: PaginationParams = Depends(),
     q: str | None = None,
 ) -> PaginatedResponse[FileRead]:
-    items, total = await svc.list_files(
-        offset=pagination.offset, limit=pagination.limit, q=q
+    page = await svc.list_files(
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+        q=q,
     )
     return PaginatedResponse(
-        items=[FileRead.model_validate(f) for f in items],
+        items=[FileRead.model_validate(f) for f in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
@@ -62,15 +69,36 @@ async def get_file(file_id: uuid.UUID, svc: FileSvc) -> FileRead:
     return FileRead.model_validate(await svc.get_file(file_id))
 
 
+def _etag(file: File) -> str | None:
+    return f'"{file.sha256}"' if file.sha256 else None
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag in tags
+
+
 @router.get("/{file_id}/download")
-async def download_file(file_id: uuid.UUID, svc: FileSvc) -> Response:
-    data, file = await svc.download_file(file_id)
-    return Response(
-        content=data,
+async def download_file(
+    file_id: uuid.UUID, request: Request, svc: FileSvc
+) -> Response:
+    path, file = await svc.download_file(file_id)
+    headers = {"Cache-Control": "private, no-cache"}
+    etag = _etag(file)
+    if etag is not None:
+        headers["ETag"] = etag
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers=headers)
+    # FileResponse streams from disk (or hands the path to the server via
+    # pathsend) and answers Range / If-Range requests itself.
+    return FileResponse(
+        path,
         media_type=file.mime_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{file.filename}"'
-        },
+        filename=file.filename,
+        headers=headers,
     )
 
 
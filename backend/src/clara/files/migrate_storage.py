@@ -0,0 +1,157 @@
+"""Rewrite legacy ``uuid4/filename`` storage keys to content-addressed ones.
+
+Each legacy blob is hashed and hard-linked (or copied) to its
+``sha256/ab/cd/…`` path, the ``File`` row is updated and committed, and only
+then is the old path removed, so an interrupted run never leaves a row
+pointing at a missing blob. Blobs whose content is already stored are simply
+dropped. Safe to re-run.
+
+Usage: ``python -m clara.files.migrate_storage [--dry-run] [--batch-size 500]``
+"""
+
+import argparse
+import contextlib
+import hashlib
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from clara.files.models import File
+from clara.files.repository import blob_lock_stmt
+from clara.files.storage import CAS_PREFIX, CHUNK_SIZE, LocalStorage, content_key
+from clara.jobs.sync_db import get_sync_session
+
+
+@dataclass
+class MigrationStats:
+    migrated: int = 0
+    deduplicated: int = 0
+    missing: int = 0
+    bytes_freed: int = 0
+
+
+def _hash_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _place(source: Path, target: Path) -> bool:
+    """Make ``target`` hold ``source``'s bytes. Returns False if it already did."""
+    if target.exists():
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+    return True
+
+
+def _remove(path: Path, base: Path) -> None:
+    path.unlink(missing_ok=True)
+    parent = path.parent
+    if parent != base:
+        with contextlib.suppress(OSError):
+            parent.rmdir()
+
+
+def migrate(
+    session: Session,
+    storage: LocalStorage,
+    *,
+    dry_run: bool = False,
+    batch_size: int = 500,
+) -> MigrationStats:
+    stats = MigrationStats()
+    dialect = session.get_bind().dialect.name
+    moved: dict[str, str] = {}
+    targets: set[str] = set()
+    last_id = uuid.UUID(int=0)
+    while True:
+        batch = (
+            session.execute(
+                select(File)
+                .where(File.storage_key.not_like(f"{CAS_PREFIX}%"))
+                .where(File.id > last_id)
+                .order_by(File.id)
+                .limit(batch_size)
+            )
+            .scalars()
+            .all()
+        )
+        if not batch:
+            break
+        last_id = batch[-1].id
+        obsolete: list[Path] = []
+        for file in batch:
+            old_key = file.storage_key
+            if old_key in moved:
+                new_key = moved[old_key]
+            else:
+                source = storage.path(old_key)
+                if not source.is_file():
+                    stats.missing += 1
+                    continue
+                sha256 = _hash_file(source)
+                new_key = content_key(sha256)
+                if dry_run:
+                    placed = (
+                        new_key not in targets
+                        and not storage.path(new_key).exists()
+                    )
+                else:
+                    # Held until the batch commits, like an upload's.
+                    lock = blob_lock_stmt(new_key, dialect)
+                    if lock is not None:
+                        session.execute(lock)
+                    placed = _place(source, storage.path(new_key))
+                if placed:
+                    stats.migrated += 1
+                else:
+                    stats.deduplicated += 1
+                    stats.bytes_freed += source.stat().st_size
+                moved[old_key] = new_key
+                targets.add(new_key)
+                obsolete.append(source)
+                file.sha256 = sha256
+            file.storage_key = new_key
+        if dry_run:
+            session.rollback()
+            continue
+        session.commit()
+        for path in obsolete:
+            _remove(path, storage.base_path)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    session = get_sync_session()
+    try:
+        stats = migrate(
+            session,
+            LocalStorage(),
+            dry_run=args.dry_run,
+            batch_size=args.batch_size,
+        )
+    finally:
+        session.close()
+    print(
+        f"migrated={stats.migrated} deduplicated={stats.deduplicated} "
+        f"missing={stats.missing} bytes_freed={stats.bytes_freed}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,10 +11,11 @@ class File(VaultScopedModel):
     uploader_id: Mapped[uuid.UUID] = mapped_column(
         Uuid, ForeignKey("users.id")
     )
-    storage_key: Mapped[str] = mapped_column(String(1000))
+    storage_key: Mapped[str] = mapped_column(String(1000), index=True)
     filename: Mapped[str] = mapped_column(String(500))
     mime_type: Mapped[str] = mapped_column(String(200))
     size_bytes: Mapped[int] = mapped_column(BigInteger)
+    sha256: Mapped[str | None] = mapped_column(String(64))
 
 
 class FileLink(VaultScopedModel):
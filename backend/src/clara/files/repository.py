@@ -1,35 +1,71 @@
 import uuid
-from collections.abc import Sequence
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, func, select
 
-from clara.base.repository import BaseRepository
+from clara.base.repository import BaseRepository, Page
 from clara.files.models import File, FileLink
+from clara.files.storage import is_content_key
+
+
+def live_references_stmt(storage_key: str) -> Select[Any]:
+    """Count live files in any vault that share a blob.
+
+    Deliberately not vault-scoped: content-addressed blobs are shared
+    across vaults.
+    """
+    return (
+        select(func.count())
+        .select_from(File)
+        .where(File.storage_key == storage_key)
+        .where(File.deleted_at.is_(None))
+    )
+
+
+def blob_lock_stmt(storage_key: str, dialect: str) -> Select[Any] | None:
+    """Transaction-scoped Postgres advisory lock on one shared blob.
+
+    Held by writers from the existence check until their ``File`` row
+    commits, and by the collector around its count and unlink, so a blob is
+    never removed while a new row that reuses it is still uncommitted.
+    Legacy keys are never shared and other databases get no lock.
+    """
+    if dialect != "postgresql" or not is_content_key(storage_key):
+        return None
+    lock_id = int(storage_key.rsplit("/", 1)[1][:15], 16)
+    return select(func.pg_advisory_xact_lock(lock_id))
 
 
 class FileRepository(BaseRepository[File]):
     model = File
 
     async def list(
-        self, *, offset: int = 0, limit: int = 50, q: str | None = None
-    ) -> tuple[Sequence[File], int]:
-        count_stmt = (
-            select(func.count())
-            .select_from(File)
-            .where(File.vault_id == self.vault_id)
-            .where(File.deleted_at.is_(None))
-        )
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+        q: str | None = None,
+    ) -> Page[File]:
+        count_stmt = self._count_query()
         items_stmt = self._base_query()
         if q:
             pattern = f"%{q}%"
             count_stmt = count_stmt.where(File.filename.ilike(pattern))
             items_stmt = items_stmt.where(File.filename.ilike(pattern))
-        total: int = (await self.session.execute(count_stmt)).scalar_one()
-        items_stmt = (
-            items_stmt.offset(offset).limit(limit).order_by(File.created_at.desc())
+        return await self._paginate(
+            items_stmt,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count_stmt=count_stmt,
         )
-        result = await self.session.execute(items_stmt)
-        return result.scalars().all(), total
+
+    async def lock_blob(self, storage_key: str) -> None:
+        """Take ``blob_lock_stmt`` for the rest of this transaction."""
+        stmt = blob_lock_stmt(storage_key, self.session.get_bind().dialect.name)
+        if stmt is not None:
+            await self.session.execute(stmt)
 
 
 class FileLinkRepository(BaseRepository[FileLink]):
@@ -1,14 +1,19 @@
+import hashlib
 import uuid
-from collections.abc import Sequence
+from collections.abc import AsyncIterator
+from pathlib import Path
 from typing import Any
 
 from fastapi import UploadFile
 
+from clara.base.repository import Page
+from clara.database import after_commit
 from clara.exceptions import NotFoundError
 from clara.files.models import File, FileLink
 from clara.files.repository import FileLinkRepository, FileRepository
 from clara.files.schemas import FileLinkCreate
-from clara.files.storage import LocalStorage
+from clara.files.storage import CHUNK_SIZE, LocalStorage, content_key
+from clara.redis import get_queue
 
 
 class FileService:
@@ -25,9 +30,16 @@ class FileService:
         self.uploader_id = uploader_id
 
     async def list_files(
-        self, *, offset: int = 0, limit: int = 50, q: str | None = None
-    ) -> tuple[Sequence[File], int]:
-        return await self.repo.list(offset=offset, limit=limit, q=q)
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+        q: str | None = None,
+    ) -> Page[File]:
+        return await self.repo.list(
+            offset=offset, limit=limit, cursor=cursor, q=q
+        )
 
     async def get_file(self, file_id: uuid.UUID) -> File:
         file = await self.repo.get_by_id(file_id)
@@ -36,30 +48,47 @@ class FileService:
         return file
 
     async def upload_file(self, upload: UploadFile) -> File:
-        data = await upload.read()
         filename = upload.filename or "unnamed"
         mime_type = upload.content_type or "application/octet-stream"
-        storage_key = await self.storage.save(data, filename)
+        # The upload is already spooled, so hash it first: a blob that is
+        # already stored is then reused without being written again.
+        size, sha256 = await _digest(upload)
+        await upload.seek(0)
+        if self.storage.content_addressed:
+            await self.repo.lock_blob(content_key(sha256))
+        stored = await self.storage.save_stream(
+            _chunks(upload), filename, size=size, sha256=sha256
+        )
         return await self.repo.create(
             uploader_id=self.uploader_id,
-            storage_key=storage_key,
+            storage_key=stored.key,
             filename=filename,
             mime_type=mime_type,
-            size_bytes=len(data),
+            size_bytes=stored.size,
+            sha256=stored.sha256,
         )
 
-    async def download_file(self, file_id: uuid.UUID) -> tuple[bytes, File]:
+    async def download_file(self, file_id: uuid.UUID) -> tuple[Path, File]:
         file = await self.get_file(file_id)
-        data = await self.storage.read(file.storage_key)
-        return data, file
+        path = self.storage.path(file.storage_key)
+        if not path.is_file():
+            raise NotFoundError("File", file_id)
+        return path, file
 
     async def update_file(self, file_id: uuid.UUID, **kwargs: Any) -> File:
         return await self.repo.update(file_id, **kwargs)
 
     async def delete_file(self, file_id: uuid.UUID) -> None:
         file = await self.get_file(file_id)
-        await self.storage.delete(file.storage_key)
         await self.repo.soft_delete(file_id)
+        # Other rows may share the blob, including uploads not committed yet;
+        # the collector job counts them under the blob's lock.
+        storage_key = file.storage_key
+
+        async def collect() -> None:
+            get_queue().enqueue("clara.jobs.blob_gc.collect_blob", storage_key)
+
+        after_commit(self.repo.session, collect)
 
     async def create_link(self, data: FileLinkCreate) -> FileLink:
         await self.get_file(data.file_id)
@@ -72,3 +101,17 @@ class FileService:
 
     async def delete_link(self, link_id: uuid.UUID) -> None:
         await self.link_repo.soft_delete(link_id)
+
+
+async def _chunks(upload: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await upload.read(CHUNK_SIZE):
+        yield chunk
+
+
+async def _digest(upload: UploadFile) -> tuple[int, str]:
+    digest = hashlib.sha256()
+    size = 0
+    async for chunk in _chunks(upload):
+        digest.update(chunk)
+        size += len(chunk)
+    return size, digest.hexdigest()
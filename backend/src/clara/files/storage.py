@@ -1,23 +1,139 @@
+"""Blob storage on the local filesystem.
+
+In content-addressed mode (``storage_content_addressed``, the default) a blob
+is keyed by its SHA-256 as ``sha256/ab/cd/abcd…``, so identical bytes are
+stored once however many ``File`` rows point at them. Those rows are the
+reference count: a blob is only unlinked once no live row uses its key (see
+``clara.jobs.blob_gc``). Legacy ``uuid4/filename`` keys are still read
+and deleted as before; ``python -m clara.files.migrate_storage`` rewrites
+them.
+"""
+
+import hashlib
+import os
 import uuid
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
 from pathlib import Path
 
 import aiofiles
 
 from clara.config import get_settings
 
+CHUNK_SIZE = 1024 * 1024
+CAS_PREFIX = "sha256/"
+
+
+@dataclass(frozen=True)
+class StoredBlob:
+    key: str
+    size: int
+    sha256: str
+
+
+def content_key(sha256: str) -> str:
+    return f"{CAS_PREFIX}{sha256[:2]}/{sha256[2:4]}/{sha256}"
+
+
+def is_content_key(key: str) -> bool:
+    return key.startswith(CAS_PREFIX)
+
 
 class LocalStorage:
     def __init__(self) -> None:
-        self.base_path = Path(get_settings().storage_path)
+        settings = get_settings()
+        self.base_path = Path(settings.storage_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.content_addressed = settings.storage_content_addressed
 
-    async def save(self, data: bytes, filename: str) -> str:
-        key = f"{uuid.uuid4()}/{filename}"
+    def path(self, key: str) -> Path:
+        return self.base_path / key
+
+    def _new_key(self, filename: str, sha256: str) -> str:
+        if self.content_addressed:
+            return content_key(sha256)
+        return f"{uuid.uuid4()}/{filename}"
+
+    def _tmp_path(self) -> Path:
+        tmp = self.base_path / "tmp"
+        tmp.mkdir(exist_ok=True)
+        return tmp / uuid.uuid4().hex
+
+    def _commit(self, tmp: Path, key: str) -> None:
         path = self.base_path / key
+        if self.content_addressed and path.exists():
+            tmp.unlink()
+            return
         path.parent.mkdir(parents=True, exist_ok=True)
-        async with aiofiles.open(path, "wb") as f:
+        os.replace(tmp, path)
+
+    def has(self, key: str) -> bool:
+        return (self.base_path / key).is_file()
+
+    def save_bytes(self, data: bytes, filename: str) -> StoredBlob:
+        """Store ``data``; a blob that already exists is not written again."""
+        sha256 = hashlib.sha256(data).hexdigest()
+        key = self._new_key(filename, sha256)
+        blob = StoredBlob(key=key, size=len(data), sha256=sha256)
+        if self.content_addressed and self.has(key):
+            return blob
+        tmp = self._tmp_path()
+        tmp.write_bytes(data)
+        self._commit(tmp, key)
+        return blob
+
+    async def save(self, data: bytes, filename: str) -> StoredBlob:
+        sha256 = hashlib.sha256(data).hexdigest()
+        key = self._new_key(filename, sha256)
+        blob = StoredBlob(key=key, size=len(data), sha256=sha256)
+        if self.content_addressed and self.has(key):
+            return blob
+        tmp = self._tmp_path()
+        async with aiofiles.open(tmp, "wb") as f:
             await f.write(data)
-        return key
+        self._commit(tmp, key)
+        return blob
+
+    async def save_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        filename: str,
+        *,
+        size: int | None = None,
+        sha256: str | None = None,
+        key: str | None = None,
+    ) -> StoredBlob:
+        """Write ``chunks`` to a blob, hashing and sizing as they arrive.
+
+        Callers that already know the digest (e.g. from a spooled upload)
+        pass ``size`` and ``sha256``; an existing blob is then reused
+        without consuming ``chunks`` at all. An explicit ``key`` stores a
+        private, overwritable blob outside the content-addressed tree.
+        """
+        if key is None and sha256 is not None and size is not None:
+            key = self._new_key(filename, sha256)
+            if self.content_addressed and self.has(key):
+                return StoredBlob(key=key, size=size, sha256=sha256)
+        digest = hashlib.sha256()
+        written = 0
+        tmp = self._tmp_path()
+        try:
+            async with aiofiles.open(tmp, "wb") as f:
+                async for chunk in chunks:
+                    digest.update(chunk)
+                    written += len(chunk)
+                    await f.write(chunk)
+            if key is None:
+                key = self._new_key(filename, digest.hexdigest())
+                self._commit(tmp, key)
+            else:
+                path = self.base_path / key
+                path.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(tmp, path)
+        except BaseException:
+            tmp.unlink(missing_ok=True)
+            raise
+        return StoredBlob(key=key, size=written, sha256=digest.hexdigest())
 
     async def read(self, key: str) -> bytes:
         path = self.base_path / key
@@ -32,25 +32,39 @@ async def list_debts(
     contact_id: uuid.UUID | None = Query(None),
 ) -> PaginatedResponse[DebtRead]:
     if settled is not None:
-        items, total = await svc.list_settled(
-            settled, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_settled(
+            settled,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     elif direction:
-        items, total = await svc.list_by_direction(
-            direction, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_direction(
+            direction,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     elif contact_id:
-        items, total = await svc.list_by_contact(
-            contact_id, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_contact(
+            contact_id,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     else:
-        items, total = await svc.list_debts(
-            offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_debts(
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     return PaginatedResponse(
-        items=[DebtRead.model_validate(d) for d in items],
+        items=[DebtRead.model_validate(d) for d in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
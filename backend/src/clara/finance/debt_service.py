@@ -1,6 +1,6 @@
 import uuid
-from collections.abc import Sequence
 
+from clara.base.repository import Page
 from clara.exceptions import NotFoundError
 from clara.finance.debt_repository import DebtRepository
 from clara.finance.debt_schemas import DebtCreate, DebtUpdate
@@ -12,29 +12,48 @@ class DebtService:
         self.repo = repo
 
     async def list_debts(
-        self, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Debt], int]:
-        return await self.repo.list(offset=offset, limit=limit)
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Debt]:
+        return await self.repo.list(offset=offset, limit=limit, cursor=cursor)
 
     async def list_settled(
-        self, settled: bool, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Debt], int]:
+        self,
+        settled: bool,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Debt]:
         return await self.repo.list_settled(
-            settled, offset=offset, limit=limit
+            settled, offset=offset, limit=limit, cursor=cursor
         )
 
     async def list_by_contact(
-        self, contact_id: uuid.UUID, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Debt], int]:
+        self,
+        contact_id: uuid.UUID,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Debt]:
         return await self.repo.list_by_contact(
-            contact_id, offset=offset, limit=limit
+            contact_id, offset=offset, limit=limit, cursor=cursor
         )
 
     async def list_by_direction(
-        self, direction: str, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Debt], int]:
+        self,
+        direction: str,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Debt]:
         return await self.repo.list_by_direction(
-            direction, offset=offset, limit=limit
+            direction, offset=offset, limit=limit, cursor=cursor
         )
 
     async def get_debt(self, debt_id: uuid.UUID) -> Debt:
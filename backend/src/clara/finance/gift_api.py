@@ -31,21 +31,32 @@ async def list_gifts(
     contact_id: uuid.UUID | None = Query(None),
 ) -> PaginatedResponse[GiftRead]:
     if direction:
-        items, total = await svc.list_by_direction(
-            direction, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_direction(
+            direction,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     elif contact_id:
-        items, total = await svc.list_by_contact(
-            contact_id, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_contact(
+            contact_id,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     else:
-        items, total = await svc.list_gifts(
-            offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_gifts(
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     return PaginatedResponse(
-        items=[GiftRead.model_validate(g) for g in items],
+        items=[GiftRead.model_validate(g) for g in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
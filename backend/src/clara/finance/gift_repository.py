@@ -1,7 +1,6 @@
 import uuid
-from collections.abc import Sequence
 
-from clara.base.repository import BaseRepository
+from clara.base.repository import BaseRepository, Page
 from clara.finance.models import Gift
 
 
@@ -9,15 +8,25 @@ class GiftRepository(BaseRepository[Gift]):
     model = Gift
 
     async def list_by_direction(
-        self, direction: str, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Gift], int]:
+        self,
+        direction: str,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Gift]:
         return await self.filtered_list(
-            Gift.direction == direction, offset=offset, limit=limit
+            Gift.direction == direction, offset=offset, limit=limit, cursor=cursor
         )
 
     async def list_by_contact(
-        self, contact_id: uuid.UUID, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Gift], int]:
+        self,
+        contact_id: uuid.UUID,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Gift]:
         return await self.filtered_list(
-            Gift.contact_id == contact_id, offset=offset, limit=limit
+            Gift.contact_id == contact_id, offset=offset, limit=limit, cursor=cursor
         )
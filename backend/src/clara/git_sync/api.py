@@ -60,8 +60,8 @@ async def delete_config(svc: GitSvc) -> None:
 
 
 @router.post("/sync", status_code=202)
-async def trigger_sync(svc: GitSvc) -> dict[str, str]:
-    await svc.trigger_sync()
+async def trigger_sync(svc: GitSvc, full: bool = False) -> dict[str, str]:
+    await svc.trigger_sync(full=full)
     return {"status": "queued"}
 
 
@@ -7,13 +7,18 @@ import tempfile
 from pathlib import Path
 
 import structlog
-from git import Repo
+from git import GitCommandError, Repo
 
 from clara.integrations.crypto import decrypt_credential
 
 logger = structlog.get_logger()
 
 
+def _is_markdown(path: str) -> bool:
+    name = path.rsplit("/", 1)[-1]
+    return name.endswith(".md") and not name.startswith(".")
+
+
 class GitRepo:
     """Manages a local git clone for sync."""
 
@@ -59,16 +64,56 @@ class GitRepo:
         diff = self._repo.git.diff("--name-only", before, after)
         return diff.strip().split("\n") if diff.strip() else []
 
-    def list_markdown_files(self, subfolder: str = "") -> list[str]:
-        """List all .md files in subfolder relative to repo root."""
-        base = self.work_dir / subfolder if subfolder else self.work_dir
-        if not base.exists():
-            return []
-        return [
-            str(p.relative_to(self.work_dir))
-            for p in base.rglob("*.md")
-            if not p.name.startswith(".")
-        ]
+    def head_commit(self) -> str:
+        assert self._repo
+        return self._repo.head.commit.hexsha
+
+    def is_ancestor(self, commit: str) -> bool:
+        """Whether ``commit`` is in HEAD's history (False if unknown)."""
+        assert self._repo
+        try:
+            # Exits 1 when not an ancestor, 128 when the commit is unknown.
+            self._repo.git.merge_base("--is-ancestor", commit, "HEAD")
+        except GitCommandError:
+            return False
+        return True
+
+    def changed_markdown_files(
+        self, since: str, subfolder: str = ""
+    ) -> tuple[list[str], list[str]]:
+        """.md files changed between ``since`` and HEAD, as (present, deleted).
+
+        Renames are reported as a delete plus an add, like a full listing
+        would see them.
+        """
+        assert self._repo
+        out = self._repo.git.diff(
+            "--name-status", "--no-renames", "-z", since, "HEAD",
+            "--", subfolder or ".",
+        )
+        fields = out.split("\0")
+        present: list[str] = []
+        deleted: list[str] = []
+        for status, path in zip(fields[0::2], fields[1::2], strict=False):
+            if not _is_markdown(path):
+                continue
+            (deleted if status == "D" else present).append(path)
+        return present, deleted
+
+    def markdown_blobs(self, subfolder: str = "") -> dict[str, str]:
+        """Blob SHA of every .md file under subfolder at HEAD, by path.
+
+        One ``git ls-tree`` call; no file is opened.
+        """
+        assert self._repo
+        out = self._repo.git.ls_tree("-r", "-z", "HEAD", "--", subfolder or ".")
+        blobs: dict[str, str] = {}
+        for entry in out.split("\0"):
+            meta, _, path = entry.partition("\t")
+            fields = meta.split()
+            if len(fields) == 3 and fields[1] == "blob" and _is_markdown(path):
+                blobs[path] = fields[2]
+        return blobs
 
     def read_file(self, path: str) -> str:
         """Read a file from the repo."""
@@ -106,14 +151,30 @@ class GitRepo:
         self._repo.remotes.origin.push(self.branch)
         return True
 
-    def file_last_modified(self, path: str) -> str | None:
-        """Get git log timestamp for a file."""
+    def last_modified_times(
+        self, subfolder: str = "", since: str | None = None
+    ) -> dict[str, str]:
+        """Author date of the newest commit touching each file, by path.
+
+        One ``git log`` pass over subfolder; with ``since`` only commits after
+        it are walked, which covers every file changed since.
+        """
         assert self._repo
-        try:
-            log = self._repo.git.log("-1", "--format=%aI", "--", path)
-            return log.strip() or None
-        except Exception:
-            return None
+        revisions = [f"{since}..HEAD"] if since else []
+        out = self._repo.git.log(
+            "-z", "--name-only", "--format=%x01%aI", *revisions,
+            "--", subfolder or ".",
+        )
+        times: dict[str, str] = {}
+        commit_time = ""
+        # Commits are newest first, so the first time seen for a path wins.
+        for token in out.split("\0"):
+            token = token.lstrip("\n")
+            if token.startswith("\x01"):
+                commit_time = token[1:]
+            elif token:
+                times.setdefault(token, commit_time)
+        return times
 
     def cleanup(self) -> None:
         """Clean up temp credential files."""
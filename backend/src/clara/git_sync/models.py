@@ -35,6 +35,8 @@ class GitSyncConfig(VaultScopedModel):
     )
     last_sync_status: Mapped[str | None] = mapped_column(String(20), nullable=True)
     last_sync_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # HEAD after the last sync; the next run only reads files changed since.
+    last_synced_commit: Mapped[str | None] = mapped_column(String(40), nullable=True)
     enabled: Mapped[bool] = mapped_column(Boolean, default=True)
 
     mappings: Mapped[list["GitSyncMapping"]] = relationship(
@@ -58,5 +60,7 @@ class GitSyncMapping(VaultScopedModel):
     last_db_updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     last_file_updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
     file_hash: Mapped[str] = mapped_column(String(64))
+    # Blob SHA at the last sync; matching the tree listing means unchanged.
+    blob_sha: Mapped[str | None] = mapped_column(String(40), nullable=True)
 
     config: Mapped[GitSyncConfig] = relationship(back_populates="mappings")
@@ -6,15 +6,18 @@ import uuid
 from collections.abc import Sequence
 from typing import Any
 
-import redis
-import rq
-
-from clara.config import get_settings
-from clara.exceptions import NotFoundError
+from clara.database import after_commit
+from clara.exceptions import ConflictError, NotFoundError
 from clara.git_sync.models import GitSyncConfig, GitSyncMapping
 from clara.git_sync.repository import GitSyncConfigRepository, GitSyncMappingRepository
 from clara.git_sync.schemas import GitSyncConfigCreate, GitSyncConfigUpdate
 from clara.integrations.crypto import encrypt_credential
+from clara.jobs.schedule import GIT_SCHEDULE
+from clara.redis import get_queue, get_redis
+
+# Changing these invalidates the last synced commit: the next run rereads
+# every file instead of diffing against it.
+_RESCAN_FIELDS = {"repo_url", "branch", "subfolder", "field_mapping_json"}
 
 
 class GitSyncService:
@@ -26,6 +29,17 @@ class GitSyncService:
         self.config_repo = config_repo
         self.mapping_repo = mapping_repo
 
+    def _schedule(self, config_id: uuid.UUID, due: float | None) -> None:
+        """Set (or with None drop) the next run once the change commits."""
+
+        async def apply() -> None:
+            if due is None:
+                GIT_SCHEDULE.remove(get_redis(), config_id)
+            else:
+                GIT_SCHEDULE.set_due(get_redis(), config_id, due)
+
+        after_commit(self.config_repo.session, apply)
+
     async def get_config(self) -> GitSyncConfig:
         config = await self.config_repo.get_for_vault()
         if config is None:
@@ -35,25 +49,43 @@ class GitSyncService:
     async def create_config(self, data: GitSyncConfigCreate) -> GitSyncConfig:
         fields = data.model_dump(exclude={"credential"})
         fields["credential_encrypted"] = encrypt_credential(data.credential)
-        return await self.config_repo.create(**fields)
+        config = await self.config_repo.create(**fields)
+        if config.enabled:
+            self._schedule(
+                config.id, GIT_SCHEDULE.first_run(config.sync_interval_minutes)
+            )
+        return config
 
     async def update_config(self, data: GitSyncConfigUpdate) -> GitSyncConfig:
         config = await self.get_config()
         fields = data.model_dump(exclude_unset=True, exclude={"credential"})
         if data.credential is not None:
             fields["credential_encrypted"] = encrypt_credential(data.credential)
-        return await self.config_repo.update(config.id, **fields)
+        if fields.keys() & _RESCAN_FIELDS:
+            fields["last_synced_commit"] = None
+        config = await self.config_repo.update(config.id, **fields)
+        if not config.enabled:
+            self._schedule(config.id, None)
+        elif fields.keys() & {"enabled", "sync_interval_minutes"}:
+            due = GIT_SCHEDULE.next_run(
+                config.sync_interval_minutes, config.last_sync_at
+            )
+            self._schedule(config.id, due)
+        return config
 
     async def delete_config(self) -> None:
         config = await self.get_config()
         await self.config_repo.soft_delete(config.id)
+        self._schedule(config.id, None)
+
+    async def trigger_sync(self, full: bool = False) -> None:
+        """Enqueue a sync; conflict if one is already queued or running.
 
-    async def trigger_sync(self) -> None:
+        A queued run would otherwise swallow a requested full resync.
+        """
         config = await self.get_config()
-        settings = get_settings()
-        conn = redis.Redis.from_url(str(settings.redis_url))
-        q = rq.Queue(connection=conn)
-        q.enqueue("clara.jobs.git_sync.run_git_sync", str(config.id))
+        if not GIT_SCHEDULE.enqueue(get_redis(), get_queue(), config.id, full=full):
+            raise ConflictError("A sync is already queued or running")
 
     async def get_status(self) -> dict[str, Any]:
         config = await self.get_config()
@@ -88,7 +120,7 @@ class GitSyncService:
             )
             try:
                 repo.clone_or_open()
-                files = repo.list_markdown_files(config.subfolder)
+                files = repo.markdown_blobs(config.subfolder)
                 return {"status": "ok", "markdown_files": len(files)}
             finally:
                 repo.cleanup()
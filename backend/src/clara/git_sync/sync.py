@@ -15,13 +15,8 @@ from slugify import slugify
 from sqlalchemy.orm import Session
 
 from clara.activities.models import Activity, ActivityParticipant
-from clara.contacts.models import (
-    Contact,
-    ContactMethod,
-    ContactRelationship,
-    RelationshipType,
-    Tag,
-)
+from clara.contacts.lookups import VaultLookups
+from clara.contacts.models import Contact, ContactMethod, ContactRelationship
 from clara.git_sync.git_ops import GitRepo
 from clara.git_sync.markdown import (
     contact_to_markdown,
@@ -52,8 +47,15 @@ def _generate_markdown_id() -> str:
     return f"{ts[:12]}{seq:02d}" if seq > 0 else ts
 
 
-def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str, int]:
-    """Execute full git sync cycle. Returns action counts."""
+def run_sync(
+    session: Session, config: GitSyncConfig, repo: GitRepo, full: bool = False
+) -> dict[str, int]:
+    """Execute one git sync cycle. Returns action counts.
+
+    Only markdown files changed since ``config.last_synced_commit`` are read.
+    Every file is read on the first sync, when ``full`` is set, or when the
+    recorded commit is no longer in HEAD's history (force-push, new branch).
+    """
     vault_id = config.vault_id
     field_mapping = _parse_json(config.field_mapping_json)
     section_mapping = _parse_json(config.section_mapping_json)
@@ -64,7 +66,24 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
     repo.pull()
 
     # Phase 2: DIFF
-    md_files = repo.list_markdown_files(subfolder)
+    since = None if full else config.last_synced_commit
+    if since is not None and not repo.is_ancestor(since):
+        since = None
+    blobs = repo.markdown_blobs(subfolder)
+    removed_files: set[str] = set()
+    if since is not None:
+        md_files, removed = repo.changed_markdown_files(since, subfolder)
+        removed_files = set(removed)
+    else:
+        md_files = list(blobs)
+    file_times: dict[str, str] | None = None  # from one git log, on first need
+    logger.info(
+        "git_sync_diff",
+        config_id=str(config.id),
+        mode="full" if since is None else "incremental",
+        files=len(md_files),
+        removed=len(removed_files),
+    )
     md_by_stem: dict[str, str] = {}  # filename stem -> path
     for path in md_files:
         stem = Path(path).stem
@@ -85,31 +104,31 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
     mapping_by_md_id: dict[str, GitSyncMapping] = {
         m.markdown_id: m for m in mappings
     }
+    mapping_by_path: dict[str, GitSyncMapping] = {}
+    for m in mappings:
+        mapping_by_path.setdefault(m.file_path, m)
 
     # Load contacts
     contacts = session.query(Contact).filter(Contact.vault_id == vault_id).all()
     contact_by_id: dict[uuid.UUID, Contact] = {c.id: c for c in contacts}
+    lookups = VaultLookups(session, vault_id)
+    lookups.index_contacts(contacts)
 
     actions: list[tuple[SyncAction, dict[str, Any]]] = []
 
     # Check each markdown file
     for path in md_files:
-        content = repo.read_file(path)
-        file_hash = _hash(content)
+        blob_sha = blobs.get(path)
         stem = Path(path).stem
 
         # Extract markdown_id: try to find it from existing mapping by path
-        mapping = None
-        for m in mappings:
-            if m.file_path == path:
-                mapping = m
-                break
-
+        mapping = mapping_by_path.get(path)
         if mapping is None:
             mapping = mapping_by_md_id.get(stem)
 
         if mapping is None:
             # NEW_FROM_FILE
+            content = repo.read_file(path)
             # First sync heuristic: match by slugified full_name
             matched_contact = None
             if not mappings:  # first sync
@@ -127,7 +146,8 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
                     {
                         "path": path,
                         "content": content,
-                        "file_hash": file_hash,
+                        "file_hash": _hash(content),
+                        "blob_sha": blob_sha,
                         "matched_contact": matched_contact,
                     },
                 )
@@ -138,11 +158,20 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
                 actions.append(
                     (SyncAction.DELETE_FILE, {"path": path, "mapping": mapping})
                 )
-            elif mapping.file_hash == file_hash:
+            elif mapping.blob_sha is not None and mapping.blob_sha == blob_sha:
                 actions.append((SyncAction.SKIP, {}))
             else:
+                content = repo.read_file(path)
+                file_hash = _hash(content)
+                if mapping.file_hash == file_hash:
+                    # Same content, blob SHA not recorded yet (older mapping).
+                    mapping.blob_sha = blob_sha
+                    actions.append((SyncAction.SKIP, {}))
+                    continue
                 # File changed — compare timestamps
-                file_ts = _parse_git_timestamp(repo.file_last_modified(path))
+                if file_times is None:
+                    file_times = repo.last_modified_times(subfolder, since)
+                file_ts = _parse_git_timestamp(file_times.get(path))
                 db_ts = (
                     contact.updated_at
                     if contact
@@ -156,6 +185,7 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
                                 "path": path,
                                 "content": content,
                                 "file_hash": file_hash,
+                                "blob_sha": blob_sha,
                                 "contact": contact,
                                 "mapping": mapping,
                             },
@@ -180,15 +210,30 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
     # Check mappings where file is gone
     existing_paths = set(md_files)
     for mapping in mappings:
-        if mapping.file_path not in existing_paths:
-            contact = contact_by_id.get(mapping.contact_id)
-            if contact and contact.deleted_at is None:
-                actions.append(
-                    (SyncAction.DELETE_DB, {"contact": contact, "mapping": mapping})
-                )
+        contact = contact_by_id.get(mapping.contact_id)
+        if since is None:
+            gone = mapping.file_path not in existing_paths
+        else:
+            gone = mapping.file_path in removed_files
+            if not gone and mapping.file_path not in existing_paths:
+                # Unchanged since the last sync, so its hash still matches:
+                # only a contact deleted in the DB needs the file removed.
+                if contact and contact.deleted_at is not None:
+                    actions.append(
+                        (
+                            SyncAction.DELETE_FILE,
+                            {"path": mapping.file_path, "mapping": mapping},
+                        )
+                    )
+                continue
+        if gone and contact and contact.deleted_at is None:
+            actions.append(
+                (SyncAction.DELETE_DB, {"contact": contact, "mapping": mapping})
+            )
 
     # Phase 3: APPLY
     counts: dict[str, int] = {}
+    failed = False
     add_count = 0
     update_count = 0
     delete_count = 0
@@ -197,7 +242,7 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
         try:
             if action == SyncAction.NEW_FROM_FILE:
                 _create_contact_from_file(
-                    session, config, repo, vault_id, data, field_mapping, subfolder
+                    session, config, repo, lookups, data, field_mapping, subfolder
                 )
                 add_count += 1
             elif action == SyncAction.NEW_FROM_DB:
@@ -213,7 +258,7 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
                 add_count += 1
             elif action == SyncAction.UPDATE_FROM_FILE:
                 _update_contact_from_file(
-                    session, vault_id, data, field_mapping, subfolder, repo
+                    session, lookups, data, field_mapping, subfolder, repo
                 )
                 update_count += 1
             elif action == SyncAction.UPDATE_FROM_DB:
@@ -228,9 +273,11 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
             elif action == SyncAction.DELETE_DB:
                 data["contact"].deleted_at = datetime.now(UTC)
                 data["mapping"].deleted_at = datetime.now(UTC)
+                lookups.note_contact(data["contact"])
                 delete_count += 1
             counts[action.value] = counts.get(action.value, 0) + 1
         except Exception:
+            failed = True
             logger.exception("git_sync_action_failed", action=action.value)
 
     session.flush()
@@ -242,6 +289,9 @@ def run_sync(session: Session, config: GitSyncConfig, repo: GitRepo) -> dict[str
     repo.commit_and_push(message)
 
     # Phase 5: UPDATE STATE
+    # A failed action keeps the old commit so the next diff retries its file.
+    if not failed:
+        config.last_synced_commit = repo.head_commit()
     config.last_sync_at = datetime.now(UTC)
     config.last_sync_status = "ok"
     config.last_sync_error = None
@@ -254,11 +304,12 @@ def _create_contact_from_file(
     session: Session,
     config: GitSyncConfig,
     repo: GitRepo,
-    vault_id: uuid.UUID,
+    lookups: VaultLookups,
     data: dict[str, Any],
     field_mapping: list[dict[str, Any]] | None,
     subfolder: str,
 ) -> None:
+    vault_id = lookups.vault_id
     content = data["content"]
     file_hash = data["file_hash"]
     path = data["path"]
@@ -274,8 +325,9 @@ def _create_contact_from_file(
         contact = Contact(vault_id=vault_id, **parsed["contact_fields"])
         session.add(contact)
         session.flush()
+    lookups.note_contact(contact)
 
-    _apply_sub_entities(session, vault_id, contact, parsed)
+    _apply_sub_entities(session, lookups, contact, parsed)
     _import_photo(session, vault_id, contact.id, parsed, subfolder, repo)
 
     now = datetime.now(UTC)
@@ -289,6 +341,7 @@ def _create_contact_from_file(
         last_db_updated_at=contact.updated_at or now,
         last_file_updated_at=now,
         file_hash=file_hash,
+        blob_sha=data["blob_sha"],
     )
     session.add(mapping)
 
@@ -325,13 +378,14 @@ def _create_file_from_contact(
         last_db_updated_at=contact.updated_at or now,
         last_file_updated_at=now,
         file_hash=_hash(content),
+        blob_sha=_blob_sha(content),
     )
     session.add(mapping)
 
 
 def _update_contact_from_file(
     session: Session,
-    vault_id: uuid.UUID,
+    lookups: VaultLookups,
     data: dict[str, Any],
     field_mapping: list[dict[str, Any]] | None,
     subfolder: str,
@@ -344,12 +398,15 @@ def _update_contact_from_file(
     parsed = markdown_to_contact_data(content, field_mapping)
     for k, v in parsed["contact_fields"].items():
         setattr(contact, k, v)
+    lookups.note_contact(contact)
 
-    _apply_sub_entities(session, vault_id, contact, parsed)
+    vault_id = lookups.vault_id
+    _apply_sub_entities(session, lookups, contact, parsed)
     _import_photo(session, vault_id, contact.id, parsed, subfolder, repo)
 
     now = datetime.now(UTC)
     mapping.file_hash = data["file_hash"]
+    mapping.blob_sha = data["blob_sha"]
     mapping.last_file_updated_at = now
     mapping.last_db_updated_at = contact.updated_at or now
 
@@ -379,17 +436,19 @@ def _update_file_from_contact(
 
     now = datetime.now(UTC)
     mapping.file_hash = _hash(content)
+    mapping.blob_sha = _blob_sha(content)
     mapping.last_db_updated_at = contact.updated_at or now
     mapping.last_file_updated_at = now
 
 
 def _apply_sub_entities(
     session: Session,
-    vault_id: uuid.UUID,
+    lookups: VaultLookups,
     contact: Contact,
     parsed: dict[str, Any],
 ) -> None:
     """Apply contact_methods, addresses, tags, activities, relationships."""
+    vault_id = lookups.vault_id
     # Full replace contact methods
     for cm in list(getattr(contact, "contact_methods", [])):
         session.delete(cm)
@@ -399,16 +458,7 @@ def _apply_sub_entities(
     # Tags
     contact.tags.clear()
     for tag_name in parsed.get("tags", []):
-        tag = (
-            session.query(Tag)
-            .filter(Tag.vault_id == vault_id, Tag.name == tag_name)
-            .first()
-        )
-        if not tag:
-            tag = Tag(vault_id=vault_id, name=tag_name)
-            session.add(tag)
-            session.flush()
-        contact.tags.append(tag)
+        contact.tags.append(lookups.tag(tag_name))
 
     # Activities — full replace participants, create new activities
     for ap in list(
@@ -461,17 +511,8 @@ def _apply_sub_entities(
         parts = name.strip().split(" ", 1)
         first = parts[0]
         last = parts[1] if len(parts) > 1 else ""
-        other = (
-            session.query(Contact)
-            .filter(
-                Contact.vault_id == vault_id,
-                Contact.first_name == first,
-                Contact.last_name == last,
-                Contact.deleted_at.is_(None),
-            )
-            .first()
-        )
-        if not other:
+        other_id = lookups.contact_id(first, last)
+        if other_id is None:
             logger.warning(
                 "git_sync_relationship_skip",
                 name=name,
@@ -480,24 +521,13 @@ def _apply_sub_entities(
             continue
 
         type_name = rel_data.get("relationship_type_name", "")
-        rel_type = (
-            session.query(RelationshipType)
-            .filter(
-                RelationshipType.vault_id == vault_id,
-                RelationshipType.name == type_name,
-            )
-            .first()
-        )
-        if not rel_type:
-            rel_type = RelationshipType(vault_id=vault_id, name=type_name)
-            session.add(rel_type)
-            session.flush()
+        rel_type = lookups.relationship_type(type_name)
 
         session.add(
             ContactRelationship(
                 vault_id=vault_id,
                 contact_id=contact.id,
-                other_contact_id=other.id,
+                other_contact_id=other_id,
                 relationship_type_id=rel_type.id,
             )
         )
@@ -542,8 +572,9 @@ def _import_photo(
     repo: GitRepo,
 ) -> None:
     """Import photo from git repo into local file storage."""
-    from clara.config import get_settings
     from clara.files.models import File
+    from clara.files.repository import blob_lock_stmt
+    from clara.files.storage import LocalStorage, content_key
 
     photo_path = parsed.get("photo_path")
     if not photo_path:
@@ -553,22 +584,34 @@ def _import_photo(
         photo_data = repo.read_binary(full_path)
     except Exception:
         return
+    sha256 = hashlib.sha256(photo_data).hexdigest()
+    contact = session.get(Contact, contact_id)
+    if contact and contact.photo_file_id:
+        current = session.get(File, contact.photo_file_id)
+        if (
+            current is not None
+            and current.deleted_at is None
+            and current.sha256 == sha256
+        ):
+            return
     filename = Path(photo_path).name
-    storage_key = f"{uuid.uuid4()}/{filename}"
-    dest = Path(get_settings().storage_path) / storage_key
-    dest.parent.mkdir(parents=True, exist_ok=True)
-    dest.write_bytes(photo_data)
+    storage = LocalStorage()
+    if storage.content_addressed:
+        lock = blob_lock_stmt(content_key(sha256), session.get_bind().dialect.name)
+        if lock is not None:
+            session.execute(lock)
+    stored = storage.save_bytes(photo_data, filename)
     file_rec = File(
         vault_id=vault_id,
         uploader_id=uuid.UUID(int=0),
-        storage_key=storage_key,
+        storage_key=stored.key,
         filename=filename,
         mime_type="image/jpeg",
-        size_bytes=len(photo_data),
+        size_bytes=stored.size,
+        sha256=stored.sha256,
     )
     session.add(file_rec)
     session.flush()
-    contact = session.get(Contact, contact_id)
     if contact:
         contact.photo_file_id = file_rec.id
 
@@ -577,6 +620,12 @@ def _hash(content: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()
 
 
+def _blob_sha(content: str) -> str:
+    """Git blob SHA of a file we write, as ``git hash-object`` computes it."""
+    data = content.encode()
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
 def _parse_git_timestamp(ts: str | None) -> datetime | None:
     if not ts:
         return None
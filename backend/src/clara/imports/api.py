@@ -0,0 +1,59 @@
+"""Background contact import endpoints."""
+
+import json
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
+
+from clara.deps import CurrentUser, Db, VaultAccess
+from clara.files.storage import LocalStorage
+from clara.imports.repository import ContactImportRepository
+from clara.imports.schemas import ContactImportRead
+from clara.imports.service import ContactImportService
+
+router = APIRouter()
+
+
+def get_import_service(
+    vault_id: uuid.UUID,
+    db: Db,
+    _access: VaultAccess,
+    user: CurrentUser,
+) -> ContactImportService:
+    repo = ContactImportRepository(session=db, vault_id=vault_id)
+    return ContactImportService(
+        repo=repo, storage=LocalStorage(), requested_by=user.id
+    )
+
+
+ImportSvc = Annotated[ContactImportService, Depends(get_import_service)]
+
+
+@router.post("/csv", response_model=ContactImportRead, status_code=202)
+async def start_csv_import(
+    file: UploadFile,
+    svc: ImportSvc,
+    field_map: str | None = Query(None),
+) -> ContactImportRead:
+    try:
+        mapping = json.loads(field_map) if field_map else None
+        contact_import = await svc.start_import(file, "csv", mapping)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from None
+    return ContactImportRead.model_validate(contact_import)
+
+
+@router.post("/vcard", response_model=ContactImportRead, status_code=202)
+async def start_vcard_import(file: UploadFile, svc: ImportSvc) -> ContactImportRead:
+    return ContactImportRead.model_validate(await svc.start_import(file, "vcard"))
+
+
+@router.get("", response_model=list[ContactImportRead])
+async def list_imports(svc: ImportSvc) -> list[ContactImportRead]:
+    return [ContactImportRead.model_validate(i) for i in await svc.list_imports()]
+
+
+@router.get("/{import_id}", response_model=ContactImportRead)
+async def get_import(import_id: uuid.UUID, svc: ImportSvc) -> ContactImportRead:
+    return ContactImportRead.model_validate(await svc.get_import(import_id))
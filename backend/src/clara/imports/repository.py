@@ -0,0 +1,16 @@
+from collections.abc import Sequence
+
+from clara.base.repository import BaseRepository
+from clara.imports.models import ContactImport
+
+
+class ContactImportRepository(BaseRepository[ContactImport]):
+    model = ContactImport
+
+    async def list_recent(self, limit: int = 50) -> Sequence[ContactImport]:
+        stmt = (
+            self._base_query()
+            .order_by(ContactImport.created_at.desc())
+            .limit(limit)
+        )
+        return (await self.session.execute(stmt)).scalars().all()
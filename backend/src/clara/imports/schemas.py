@@ -0,0 +1,25 @@
+import uuid
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+ImportFormat = Literal["csv", "vcard"]
+
+
+class ContactImportRead(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: uuid.UUID
+    vault_id: uuid.UUID
+    format: str
+    filename: str
+    status: str
+    progress: int
+    size_bytes: int
+    rows_processed: int
+    imported: int
+    failed: int
+    errors: list[str]
+    error: str | None
+    created_at: datetime
+    completed_at: datetime | None
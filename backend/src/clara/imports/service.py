@@ -0,0 +1,88 @@
+"""Background contact imports: upload staging and job enqueueing."""
+
+import uuid
+from collections.abc import AsyncIterator, Sequence
+
+import redis
+import rq
+from fastapi import UploadFile
+
+from clara.config import get_settings
+from clara.database import after_commit
+from clara.exceptions import NotFoundError
+from clara.files.storage import CHUNK_SIZE, LocalStorage
+from clara.imports.models import ContactImport
+from clara.imports.repository import ContactImportRepository
+from clara.imports.schemas import ImportFormat
+from clara.integrations.csv_io import validate_field_map
+
+
+def enqueue_import(import_id: uuid.UUID) -> None:
+    settings = get_settings()
+    conn = redis.Redis.from_url(str(settings.redis_url))
+    q = rq.Queue(connection=conn)
+    q.enqueue("clara.jobs.contact_import.run_contact_import", str(import_id))
+
+
+def upload_key(vault_id: uuid.UUID, import_id: uuid.UUID, fmt: str) -> str:
+    return f"imports/{vault_id}/{import_id}.{'vcf' if fmt == 'vcard' else 'csv'}"
+
+
+class ContactImportService:
+    def __init__(
+        self,
+        repo: ContactImportRepository,
+        storage: LocalStorage,
+        requested_by: uuid.UUID,
+    ) -> None:
+        self.repo = repo
+        self.storage = storage
+        self.requested_by = requested_by
+
+    async def start_import(
+        self,
+        upload: UploadFile,
+        fmt: ImportFormat,
+        field_map: dict[str, str] | None = None,
+    ) -> ContactImport:
+        """Store the upload as-is and queue it; parsing happens in the job.
+
+        Raises ``ValueError`` for a field map naming unknown contact fields.
+        """
+        if field_map is not None:
+            validate_field_map(field_map)
+        import_id = uuid.uuid4()
+        key = upload_key(self.repo.vault_id, import_id, fmt)
+        filename = upload.filename or key.rsplit("/", 1)[-1]
+        await upload.seek(0)
+        stored = await self.storage.save_stream(_chunks(upload), filename, key=key)
+        contact_import = await self.repo.create(
+            id=import_id,
+            requested_by=self.requested_by,
+            format=fmt,
+            filename=filename,
+            storage_key=stored.key,
+            field_map=field_map,
+            size_bytes=stored.size,
+        )
+        # The worker loads the row in its own session, so only enqueue once
+        # the request transaction has committed it.
+        async def enqueue() -> None:
+            enqueue_import(import_id)
+
+        after_commit(self.repo.session, enqueue)
+        return contact_import
+
+    async def list_imports(self) -> Sequence[ContactImport]:
+        return await self.repo.list_recent()
+
+    async def get_import(self, import_id: uuid.UUID) -> ContactImport:
+        contact_import = await self.repo.get_by_id(import_id)
+        if contact_import is None:
+            raise NotFoundError("ContactImport", import_id)
+        return contact_import
+
+
+async def _chunks(upload: UploadFile) -> AsyncIterator[bytes]:
+    while chunk := await upload.read(CHUNK_SIZE):
+        yield chunk
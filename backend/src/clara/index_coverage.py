@@ -0,0 +1,176 @@
+"""Check that repository queries on hot tables are served by an index.
+
+Runs every probe below through the real repository code against a recording
+session, then EXPLAINs the captured SQL on the configured database with
+sequential scans disabled. Any ``Seq Scan`` left on a hot table means the
+planner had no usable index and the command exits non-zero.
+
+Usage: ``python -m clara.index_coverage`` (needs a migrated PostgreSQL).
+"""
+
+import asyncio
+import json
+import sys
+import uuid
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import UTC, date, datetime
+from typing import Any
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from clara.activities.models import ActivityParticipant
+from clara.activities.repository import ActivityRepository
+from clara.contacts.models import Address, ContactMethod, Pet
+from clara.contacts.repository import ContactRepository
+from clara.database import _get_engine
+from clara.files.repository import FileRepository
+from clara.journal.repository import JournalEntryRepository
+from clara.notes.repository import NoteRepository
+from clara.notifications.repository import NotificationRepository
+from clara.pagination import encode_cursor
+from clara.reminders.repository import ReminderRepository
+from clara.tasks.repository import TaskRepository
+
+HOT_TABLES = frozenset(
+    {
+        "activities",
+        "activity_participants",
+        "addresses",
+        "contact_methods",
+        "contacts",
+        "files",
+        "journal_entries",
+        "notes",
+        "notifications",
+        "pets",
+        "reminders",
+        "tasks",
+    }
+)
+
+Probe = Callable[[AsyncSession, uuid.UUID], Awaitable[Any]]
+
+_SAMPLE_ID = uuid.UUID(int=1)
+_SAMPLE_TIME = datetime(2000, 1, 1, tzinfo=UTC)
+_TODAY = date(2026, 1, 1)
+
+
+class _StubResult:
+    def scalar_one(self) -> int:
+        return 0
+
+    def scalar_one_or_none(self) -> None:
+        return None
+
+    def scalars(self) -> "_StubResult":
+        return self
+
+    def unique(self) -> "_StubResult":
+        return self
+
+    def all(self) -> list[Any]:
+        return []
+
+
+class _RecordingSession:
+    """Stands in for an AsyncSession and keeps every executed statement."""
+
+    def __init__(self) -> None:
+        self.statements: list[Select[Any]] = []
+
+    async def execute(self, stmt: Select[Any], *args: Any, **kwargs: Any) -> Any:
+        self.statements.append(stmt)
+        return _StubResult()
+
+
+def _children(model: Any) -> Probe:
+    # selectinload children are loaded by contact_id IN (...) after the
+    # parent query, which the recording session never triggers.
+    async def probe(session: AsyncSession, vault_id: uuid.UUID) -> None:
+        await session.execute(select(model).where(model.contact_id.in_([_SAMPLE_ID])))
+
+    return probe
+
+
+PROBES: dict[str, Probe] = {
+    "contacts.list": lambda s, v: ContactRepository(s, v).list_filtered(),
+    "contacts.list.cursor": lambda s, v: ContactRepository(s, v).list_filtered(
+        cursor=encode_cursor("created_at", _SAMPLE_TIME, _SAMPLE_ID)
+    ),
+    "contact_methods.by_contact": _children(ContactMethod),
+    "addresses.by_contact": _children(Address),
+    "pets.by_contact": _children(Pet),
+    "activity_participants.by_contact": _children(ActivityParticipant),
+    "activities.list": lambda s, v: ActivityRepository(s, v).list(),
+    "activities.by_contact": lambda s, v: ActivityRepository(s, v).list_by_contact(
+        _SAMPLE_ID
+    ),
+    "notes.list": lambda s, v: NoteRepository(s, v).list(),
+    "files.list": lambda s, v: FileRepository(s, v).list(),
+    "journal.list": lambda s, v: JournalEntryRepository(s, v).list(),
+    "reminders.upcoming": lambda s, v: ReminderRepository(s, v).list_upcoming(_TODAY),
+    "reminders.overdue": lambda s, v: ReminderRepository(s, v).list_overdue(_TODAY),
+    "tasks.by_status": lambda s, v: TaskRepository(s, v).list_by_status("pending"),
+    "notifications.list": lambda s, v: NotificationRepository(
+        s, v, _SAMPLE_ID
+    ).list_for_user(),
+    "notifications.unread": lambda s, v: NotificationRepository(
+        s, v, _SAMPLE_ID
+    ).unread_count(),
+}
+
+
+async def collect_queries(
+    vault_id: uuid.UUID = _SAMPLE_ID,
+) -> list[tuple[str, Select[Any]]]:
+    """Run every probe against a recording session and return its SQL."""
+    queries: list[tuple[str, Select[Any]]] = []
+    for label, probe in PROBES.items():
+        session = _RecordingSession()
+        await probe(session, vault_id)  # type: ignore[arg-type]
+        queries.extend((label, stmt) for stmt in session.statements)
+    return queries
+
+
+def find_seq_scans(plan: dict[str, Any]) -> Iterator[str]:
+    """Yield the relation names of every Seq Scan node in a JSON plan."""
+    if plan.get("Node Type") == "Seq Scan":
+        yield plan["Relation Name"]
+    for child in plan.get("Plans", []):
+        yield from find_seq_scans(child)
+
+
+async def _explain(conn: AsyncConnection, stmt: Select[Any]) -> dict[str, Any]:
+    sql = stmt.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    result = await conn.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {sql}")
+    raw = result.scalar_one()
+    doc = json.loads(raw) if isinstance(raw, str) else raw
+    plan: dict[str, Any] = doc[0]["Plan"]
+    return plan
+
+
+async def check() -> list[str]:
+    """Return one failure line per probe query that seq-scans a hot table."""
+    failures: list[str] = []
+    async with _get_engine().connect() as conn:
+        await conn.exec_driver_sql("SET enable_seqscan = off")
+        for label, stmt in await collect_queries():
+            plan = await _explain(conn, stmt)
+            for table in find_seq_scans(plan):
+                if table in HOT_TABLES:
+                    failures.append(f"{label}: sequential scan on {table}")
+    return failures
+
+
+def main() -> None:
+    failures = asyncio.run(check())
+    for line in failures:
+        print(line)
+    if failures:
+        sys.exit(1)
+    print(f"index coverage ok ({len(PROBES)} probes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,47 @@
+import io
 import json
 import uuid
 
-from fastapi import APIRouter, Query, UploadFile
-from fastapi.responses import Response
+from fastapi import APIRouter, HTTPException, Query, Response, UploadFile
+from fastapi.responses import StreamingResponse
 
+from clara.config import get_settings
 from clara.deps import Db, VaultAccess
-from clara.integrations.csv_io import export_csv, import_csv
-from clara.integrations.json_export import export_vault_json
-from clara.integrations.vcard import export_vcard, import_vcard
+from clara.imports.api import ImportSvc
+from clara.imports.schemas import ContactImportRead
+from clara.integrations.csv_io import import_csv, iter_csv
+from clara.integrations.json_export import iter_vault_json, iter_vault_ndjson
+from clara.integrations.vcard import import_vcard, iter_vcard
 
 router = APIRouter()
 
 
+def _runs_in_background(file: UploadFile) -> bool:
+    return (file.size or 0) > get_settings().import_inline_max_bytes
+
+
 @router.post("/import/vcard", status_code=201)
 async def import_vcard_endpoint(
-    vault_id: uuid.UUID, file: UploadFile, db: Db, _access: VaultAccess
-) -> dict[str, int]:
-    data = (await file.read()).decode("utf-8")
-    contacts = await import_vcard(db, vault_id, data)
+    vault_id: uuid.UUID,
+    file: UploadFile,
+    db: Db,
+    _access: VaultAccess,
+    imports: ImportSvc,
+    response: Response,
+) -> dict[str, int] | ContactImportRead:
+    """Import inline, or answer 202 with a background import for big files."""
+    if _runs_in_background(file):
+        response.status_code = 202
+        contact_import = await imports.start_import(file, "vcard")
+        return ContactImportRead.model_validate(contact_import)
+    # Decode the spooled upload lazily instead of reading it into one string.
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        contacts = await import_vcard(db, vault_id, lines)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from None
+    finally:
+        lines.detach()
     return {"imported": len(contacts)}
 
 
@@ -27,21 +51,32 @@ async def import_csv_endpoint(
     file: UploadFile,
     db: Db,
     _access: VaultAccess,
+    imports: ImportSvc,
+    response: Response,
     field_map: str | None = Query(None),
-) -> dict[str, int]:
-    data = (await file.read()).decode("utf-8")
-    mapping = json.loads(field_map) if field_map else None
-    contacts, _errors = await import_csv(db, vault_id, data, field_map=mapping)
+) -> dict[str, int] | ContactImportRead:
+    """Import inline, or answer 202 with a background import for big files."""
+    lines = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
+    try:
+        mapping = json.loads(field_map) if field_map else None
+        if _runs_in_background(file):
+            response.status_code = 202
+            contact_import = await imports.start_import(file, "csv", mapping)
+            return ContactImportRead.model_validate(contact_import)
+        contacts, _errors = await import_csv(db, vault_id, lines, field_map=mapping)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from None
+    finally:
+        lines.detach()
     return {"imported": len(contacts)}
 
 
 @router.get("/export/vcard")
 async def export_vcard_endpoint(
     vault_id: uuid.UUID, db: Db, _access: VaultAccess
-) -> Response:
-    vcard_data = await export_vcard(db, vault_id)
-    return Response(
-        content=vcard_data,
+) -> StreamingResponse:
+    return StreamingResponse(
+        iter_vcard(db, vault_id),
         media_type="text/vcard",
         headers={
             "Content-Disposition": 'attachment; filename="contacts.vcf"'
@@ -52,10 +87,9 @@ async def export_vcard_endpoint(
 @router.get("/export/csv")
 async def export_csv_endpoint(
     vault_id: uuid.UUID, db: Db, _access: VaultAccess
-) -> Response:
-    csv_data = await export_csv(db, vault_id)
-    return Response(
-        content=csv_data,
+) -> StreamingResponse:
+    return StreamingResponse(
+        iter_csv(db, vault_id),
         media_type="text/csv",
         headers={
             "Content-Disposition": 'attachment; filename="contacts.csv"'
@@ -66,12 +100,24 @@ async def export_csv_endpoint(
 @router.get("/export/json")
 async def export_json_endpoint(
     vault_id: uuid.UUID, db: Db, _access: VaultAccess
-) -> Response:
-    vault_data = await export_vault_json(db, vault_id)
-    return Response(
-        content=json.dumps(vault_data, indent=2),
+) -> StreamingResponse:
+    return StreamingResponse(
+        iter_vault_json(db, vault_id),
         media_type="application/json",
         headers={
             "Content-Disposition": 'attachment; filename="vault_export.json"'
         },
     )
+
+
+@router.get("/export/ndjson")
+async def export_ndjson_endpoint(
+    vault_id: uuid.UUID, db: Db, _access: VaultAccess
+) -> StreamingResponse:
+    return StreamingResponse(
+        iter_vault_ndjson(db, vault_id),
+        media_type="application/x-ndjson",
+        headers={
+            "Content-Disposition": 'attachment; filename="vault_export.ndjson"'
+        },
+    )
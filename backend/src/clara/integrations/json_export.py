@@ -1,12 +1,25 @@
+"""Whole-vault JSON export.
+
+Every table is read in ``yield_per`` batches straight off a server-side
+cursor as plain column mappings (no ORM identity map) and encoded batch by
+batch, so peak memory does not grow with vault size. Two streamed formats:
+
+- ``iter_vault_json``: one JSON document, ``{"vault_id": ..., "<table>": [...]}``
+- ``iter_vault_ndjson``: one ``{"table": ..., "record": {...}}`` line per row
+"""
+
+import json
 import uuid
+from collections.abc import AsyncIterator, Sequence
 from datetime import date, datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, cast
 
-from sqlalchemy import select
+from sqlalchemy import RowMapping, Table, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from clara.activities.models import Activity, ActivityParticipant, ActivityType
+from clara.base.model import VaultScopedModel
 from clara.contacts.models import (
     Address,
     Contact,
@@ -21,61 +34,102 @@ from clara.notes.models import Note
 from clara.reminders.models import Reminder, StayInTouchConfig
 from clara.tasks.models import Task
 
+BATCH_SIZE = 1000
 
-def _serialize(obj: Any) -> dict[str, Any]:
-    result = {}
-    for col in obj.__table__.columns:
-        val = getattr(obj, col.name)
-        if isinstance(val, (datetime, date)):
-            val = val.isoformat()
-        elif isinstance(val, uuid.UUID):
-            val = str(val)
-        elif isinstance(val, Decimal):
-            val = float(val)
-        result[col.name] = val
-    return result
+EXPORT_TABLES: dict[str, type[VaultScopedModel]] = {
+    "contacts": Contact,
+    "contact_methods": ContactMethod,
+    "addresses": Address,
+    "contact_relationships": ContactRelationship,
+    "tags": Tag,
+    "pets": Pet,
+    "activity_types": ActivityType,
+    "activities": Activity,
+    "activity_participants": ActivityParticipant,
+    "notes": Note,
+    "reminders": Reminder,
+    "stay_in_touch_configs": StayInTouchConfig,
+    "tasks": Task,
+    "journal_entries": JournalEntry,
+    "journal_entry_contacts": JournalEntryContact,
+    "gifts": Gift,
+    "debts": Debt,
+}
+
+
+def _default(val: Any) -> Any:
+    if isinstance(val, (datetime, date)):
+        return val.isoformat()
+    if isinstance(val, uuid.UUID):
+        return str(val)
+    if isinstance(val, Decimal):
+        return float(val)
+    raise TypeError(f"{type(val).__name__} is not JSON serializable")
+
+
+_CONVERTED = (datetime, date, uuid.UUID, Decimal)
+
+
+def _serialize(row: RowMapping) -> dict[str, Any]:
+    return {
+        key: _default(val) if isinstance(val, _CONVERTED) else val
+        for key, val in row.items()
+    }
 
 
-async def _fetch_all(
-    session: AsyncSession, model: Any, vault_id: uuid.UUID
-) -> list[dict[str, Any]]:
+# Compact separators keep the C encoder on its fast path.
+_encoder = json.JSONEncoder(
+    separators=(",", ":"), ensure_ascii=False, default=_default
+)
+encode = _encoder.encode
+
+
+async def _batches(
+    session: AsyncSession, model: type[VaultScopedModel], vault_id: uuid.UUID
+) -> AsyncIterator[Sequence[RowMapping]]:
+    table = cast(Table, model.__table__)
     stmt = (
-        select(model)
-        .where(model.vault_id == vault_id)
-        .where(model.deleted_at.is_(None))
+        select(table)
+        .where(table.c.vault_id == vault_id)
+        .where(table.c.deleted_at.is_(None))
+        .order_by(table.c.created_at, table.c.id)
+        .execution_options(yield_per=BATCH_SIZE)
     )
-    result = await session.execute(stmt)
-    return [_serialize(row) for row in result.scalars().all()]
+    result = await session.stream(stmt)
+    async for batch in result.mappings().partitions():
+        yield batch
+
+
+async def iter_vault_json(
+    session: AsyncSession, vault_id: uuid.UUID
+) -> AsyncIterator[str]:
+    yield f"{{{encode('vault_id')}:{encode(str(vault_id))}"
+    for name, model in EXPORT_TABLES.items():
+        yield f",{encode(name)}:["
+        separator = ""
+        async for batch in _batches(session, model, vault_id):
+            yield separator + ",".join(encode(dict(row)) for row in batch)
+            separator = ","
+        yield "]"
+    yield "}\n"
+
+
+async def iter_vault_ndjson(
+    session: AsyncSession, vault_id: uuid.UUID
+) -> AsyncIterator[str]:
+    for name, model in EXPORT_TABLES.items():
+        prefix = f'{{"table":{encode(name)},"record":'
+        async for batch in _batches(session, model, vault_id):
+            yield "".join(f"{prefix}{encode(dict(row))}}}\n" for row in batch)
 
 
 async def export_vault_json(
     session: AsyncSession, vault_id: uuid.UUID
 ) -> dict[str, Any]:
-    return {
-        "vault_id": str(vault_id),
-        "contacts": await _fetch_all(session, Contact, vault_id),
-        "contact_methods": await _fetch_all(session, ContactMethod, vault_id),
-        "addresses": await _fetch_all(session, Address, vault_id),
-        "contact_relationships": await _fetch_all(
-            session, ContactRelationship, vault_id
-        ),
-        "tags": await _fetch_all(session, Tag, vault_id),
-        "pets": await _fetch_all(session, Pet, vault_id),
-        "activity_types": await _fetch_all(session, ActivityType, vault_id),
-        "activities": await _fetch_all(session, Activity, vault_id),
-        "activity_participants": await _fetch_all(
-            session, ActivityParticipant, vault_id
-        ),
-        "notes": await _fetch_all(session, Note, vault_id),
-        "reminders": await _fetch_all(session, Reminder, vault_id),
-        "stay_in_touch_configs": await _fetch_all(
-            session, StayInTouchConfig, vault_id
-        ),
-        "tasks": await _fetch_all(session, Task, vault_id),
-        "journal_entries": await _fetch_all(session, JournalEntry, vault_id),
-        "journal_entry_contacts": await _fetch_all(
-            session, JournalEntryContact, vault_id
-        ),
-        "gifts": await _fetch_all(session, Gift, vault_id),
-        "debts": await _fetch_all(session, Debt, vault_id),
-    }
+    result: dict[str, Any] = {"vault_id": str(vault_id)}
+    for name, model in EXPORT_TABLES.items():
+        rows: list[dict[str, Any]] = []
+        async for batch in _batches(session, model, vault_id):
+            rows.extend(_serialize(row) for row in batch)
+        result[name] = rows
+    return result
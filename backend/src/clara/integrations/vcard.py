@@ -1,49 +1,274 @@
-"""vCard import/export using shared DAV converters."""
+"""vCard import/export using shared DAV converters.
 
+Imports split the input into cards with a cheap line scan, parse chunks of
+cards off the event loop (vobject is pure Python and would otherwise hold
+it) and insert each chunk with one statement per table. Background imports
+parse in a process pool that lives for the job; inline imports use a thread.
+"""
+
+import asyncio
+import io
+import multiprocessing
+import os
 import uuid
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from itertools import batched
+from typing import Any
 
 import vobject
+from sqlalchemy import String, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from clara.contacts.models import Address, Contact, ContactMethod
-from clara.contacts.repository import ContactRepository
+from clara.base.model import Base
+from clara.config import get_settings
+from clara.contacts.models import Address, Contact, ContactMethod, Tag, contact_tags
+from clara.contacts.repository import ContactRepository, TagRepository
 from clara.dav_sync.converters.contact import contact_to_vcard, vcard_to_contact_data
 
-EXPORT_LIMIT = 100_000  # practical upper bound for single-file export
+VCARD_CHUNK_SIZE = 500
 
+def _parse_workers() -> int:
+    workers = get_settings().vcard_parse_workers
+    if workers is None:
+        workers = (os.cpu_count() or 1) - 1
+    return max(workers, 0)
 
-async def import_vcard(
-    session: AsyncSession, vault_id: uuid.UUID, vcard_data: str
-) -> list[Contact]:
-    repo = ContactRepository(session=session, vault_id=vault_id)
-    created: list[Contact] = []
 
-    for vcard in vobject.readComponents(vcard_data):
-        data = vcard_to_contact_data(vcard)
+@contextmanager
+def parse_pool() -> Iterator[ProcessPoolExecutor | None]:
+    """Process pool for vCard parsing, or None to parse on a thread.
 
-        contact = await repo.create(**data["contact_fields"])
+    The pool is shut down on exit, so create it per background job rather
+    than in request handlers.
+    """
+    workers = _parse_workers()
+    if workers == 0:
+        yield None
+        return
+    # spawn: the parent runs an event loop and DB threads, unsafe to fork.
+    executor = ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        yield executor
+    finally:
+        executor.shutdown(cancel_futures=True)
 
-        for cm_data in data["contact_methods"]:
-            session.add(
-                ContactMethod(vault_id=vault_id, contact_id=contact.id, **cm_data)
-            )
 
-        for addr_data in data["addresses"]:
-            session.add(Address(vault_id=vault_id, contact_id=contact.id, **addr_data))
+@dataclass
+class ParsedChunk:
+    cards: list[dict[str, Any]] = field(default_factory=list)
+    errors: list[str] = field(default_factory=list)
+    # Bytes of input read up to the end of this chunk, for progress.
+    offset: int = 0
 
-        await session.flush()
-        created.append(contact)
 
-    return created
+def split_vcards(lines: Iterable[str]) -> Iterator[str]:
+    """Cut a vCard stream into one string per card, without parsing it."""
+    card: list[str] = []
+    for line in lines:
+        if not card and not line.strip():
+            continue
+        card.append(line)
+        if line.strip().upper() == "END:VCARD":
+            yield "".join(card)
+            card = []
+    if card:
+        yield "".join(card)
 
 
-async def export_vcard(session: AsyncSession, vault_id: uuid.UUID) -> str:
+def _max_lengths(model: type[Base]) -> dict[str, int]:
+    return {
+        c.name: c.type.length
+        for c in model.__table__.columns
+        if isinstance(c.type, String) and c.type.length
+    }
+
+
+_LIMITS = {
+    "contact_fields": _max_lengths(Contact),
+    "contact_methods": _max_lengths(ContactMethod),
+    "addresses": _max_lengths(Address),
+}
+_TAG_LIMIT = _max_lengths(Tag)["name"]
+
+
+def _check(data: dict[str, Any]) -> str | None:
+    """Why a converted card cannot be inserted as-is, if anything."""
+    if not data["contact_fields"]["first_name"]:
+        return "no name"
+    rows = {
+        "contact_fields": [data["contact_fields"]],
+        "contact_methods": data["contact_methods"],
+        "addresses": data["addresses"],
+    }
+    for part, limits in _LIMITS.items():
+        for row in rows[part]:
+            for name, limit in limits.items():
+                value = row.get(name)
+                if isinstance(value, str) and len(value) > limit:
+                    return f"{name} is longer than {limit} characters"
+    if any(len(tag) > _TAG_LIMIT for tag in data["tags"]):
+        return f"tag is longer than {_TAG_LIMIT} characters"
+    return None
+
+
+def parse_vcard_chunk(cards: list[str], start: int) -> ParsedChunk:
+    """Parse ``cards`` (numbered from ``start``) into contact data.
+
+    Module-level so it can run in the parse process pool.
+    """
+    parsed = ParsedChunk()
+    for number, text in enumerate(cards, start):
+        try:
+            data = vcard_to_contact_data(vobject.readOne(text))
+        except Exception as exc:
+            parsed.errors.append(f"Card {number}: {exc}")
+            continue
+        problem = _check(data)
+        if problem is not None:
+            parsed.errors.append(f"Card {number}: {problem}")
+            continue
+        parsed.cards.append(data)
+    return parsed
+
+
+async def iter_parsed_chunks(
+    cards: Iterable[str],
+    chunk_size: int = VCARD_CHUNK_SIZE,
+    offset: Callable[[], int] | None = None,
+    executor: ProcessPoolExecutor | None = None,
+) -> AsyncIterator[ParsedChunk]:
+    """Parse ``cards`` in chunks off the event loop, yielding them in order.
+
+    Without ``executor`` chunks are parsed on the default thread pool. With
+    a process pool from :func:`parse_pool`, up to two chunks per worker are
+    in flight while the caller inserts the previous one.
+    """
+    loop = asyncio.get_running_loop()
+    window = 2 * _parse_workers() if executor is not None else 1
+    pending: deque[tuple[asyncio.Future[ParsedChunk], int]] = deque()
+    start = 1
+    for chunk in batched(cards, chunk_size):
+        future = loop.run_in_executor(executor, parse_vcard_chunk, list(chunk), start)
+        pending.append((future, offset() if offset is not None else 0))
+        start += len(chunk)
+        if len(pending) >= window:
+            future, read = pending.popleft()
+            parsed = await future
+            parsed.offset = read
+            yield parsed
+    while pending:
+        future, read = pending.popleft()
+        parsed = await future
+        parsed.offset = read
+        yield parsed
+
+
+class TagCache:
+    """Tag ids by name for one import; unknown names are created once."""
+
+    def __init__(self, session: AsyncSession, vault_id: uuid.UUID) -> None:
+        self.repo = TagRepository(session=session, vault_id=vault_id)
+        self.ids: dict[str, uuid.UUID] | None = None
+
+    async def resolve(self, names: Iterable[str]) -> dict[str, uuid.UUID]:
+        if self.ids is None:
+            self.ids = {tag.name: tag.id for tag in await self.repo.list_all()}
+        missing = {n for n in names if n not in self.ids}
+        if missing:
+            self.ids.update(await self.repo.create_many(sorted(missing)))
+        return self.ids
+
+
+async def insert_cards(
+    session: AsyncSession,
+    vault_id: uuid.UUID,
+    cards: list[dict[str, Any]],
+    tags: TagCache,
+) -> list[uuid.UUID]:
+    """Insert parsed cards with their methods, addresses and tag links.
+
+    One executemany INSERT per table, whatever the number of cards.
+    Returns the new contact ids.
+    """
+    contacts: list[dict[str, Any]] = []
+    methods: list[dict[str, Any]] = []
+    addresses: list[dict[str, Any]] = []
+    links: list[tuple[uuid.UUID, str]] = []
+    for card in cards:
+        contact_id = uuid.uuid4()
+        contacts.append(
+            {"id": contact_id, "vault_id": vault_id, **card["contact_fields"]}
+        )
+        methods.extend(
+            {"id": uuid.uuid4(), "vault_id": vault_id, "contact_id": contact_id, **m}
+            for m in card["contact_methods"]
+        )
+        addresses.extend(
+            {"id": uuid.uuid4(), "vault_id": vault_id, "contact_id": contact_id, **a}
+            for a in card["addresses"]
+        )
+        links.extend((contact_id, name) for name in dict.fromkeys(card["tags"]))
+    tag_ids = await tags.resolve(name for _, name in links)
+    for model, rows in (
+        (Contact, contacts),
+        (ContactMethod, methods),
+        (Address, addresses),
+    ):
+        if rows:
+            await session.execute(insert(model), rows)
+    if links:
+        await session.execute(
+            insert(contact_tags),
+            [{"contact_id": c, "tag_id": tag_ids[name]} for c, name in links],
+        )
+    return [c["id"] for c in contacts]
+
+
+async def import_vcard(
+    session: AsyncSession, vault_id: uuid.UUID, vcard_data: str | Iterable[str]
+) -> list[Contact]:
+    """Import every card in ``vcard_data`` in the request.
+
+    Large files go through ``clara.imports`` instead, which runs the same
+    pipeline as a background job.
+    """
+    lines = (
+        io.StringIO(vcard_data) if isinstance(vcard_data, str) else vcard_data
+    )
+    tags = TagCache(session, vault_id)
+    ids: list[uuid.UUID] = []
+    async for parsed in iter_parsed_chunks(split_vcards(lines)):
+        ids.extend(await insert_cards(session, vault_id, parsed.cards, tags))
+    if not ids:
+        return []
+    result = await session.scalars(select(Contact).where(Contact.id.in_(ids)))
+    return list(result.all())
+
+
+async def iter_vcard(
+    session: AsyncSession, vault_id: uuid.UUID
+) -> AsyncIterator[str]:
+    """Yield the vCard export one batch of contacts at a time."""
     repo = ContactRepository(session=session, vault_id=vault_id)
-    contacts, _ = await repo.list(offset=0, limit=EXPORT_LIMIT)
-    output_parts: list[str] = []
+    separator = ""
+    async for batch in repo.stream(
+        selectinload(Contact.tags),
+        selectinload(Contact.contact_methods),
+        selectinload(Contact.addresses),
+    ):
+        parts: list[str] = []
+        for contact in batch:
+            parts.append(separator + contact_to_vcard(contact).serialize())
+            separator = "\r\n"
+        yield "".join(parts)
 
-    for contact in contacts:
-        vc = contact_to_vcard(contact)
-        output_parts.append(vc.serialize())
 
-    return "\r\n".join(output_parts)
+async def export_vcard(session: AsyncSession, vault_id: uuid.UUID) -> str:
+    return "".join([chunk async for chunk in iter_vcard(session, vault_id)])
@@ -0,0 +1,25 @@
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+
+@asynccontextmanager
+async def job_session_factory() -> AsyncIterator[async_sessionmaker[AsyncSession]]:
+    """Async sessions for one job run, on an engine disposed at the end.
+
+    Jobs call ``asyncio.run`` per invocation, and pooled asyncpg connections
+    cannot outlive their event loop, so nothing is pooled across runs.
+    """
+    from clara.config import get_settings
+
+    engine = create_async_engine(get_settings().async_database_url, poolclass=NullPool)
+    try:
+        yield async_sessionmaker(engine, expire_on_commit=False)
+    finally:
+        await engine.dispose()
@@ -0,0 +1,42 @@
+"""RQ job that removes a stored blob once no live ``File`` row uses it.
+
+``FileService.delete_file`` enqueues it after the delete commits. The job
+takes the blob's advisory lock before counting, so an upload that reused the
+blob has either committed its row (and is counted) or has not yet looked for
+the blob (and writes it again).
+"""
+
+from __future__ import annotations
+
+import structlog
+from sqlalchemy.orm import Session
+
+from clara.files.repository import blob_lock_stmt, live_references_stmt
+from clara.files.storage import LocalStorage
+from clara.jobs.sync_db import get_sync_session
+
+logger = structlog.get_logger()
+
+
+def release_blob(session: Session, storage: LocalStorage, storage_key: str) -> bool:
+    """Unlink ``storage_key`` if unreferenced. Returns whether it was removed.
+
+    The lock is held until the caller ends the transaction.
+    """
+    lock = blob_lock_stmt(storage_key, session.get_bind().dialect.name)
+    if lock is not None:
+        session.execute(lock)
+    if session.execute(live_references_stmt(storage_key)).scalar_one():
+        return False
+    storage.path(storage_key).unlink(missing_ok=True)
+    return True
+
+
+def collect_blob(storage_key: str) -> None:
+    session = get_sync_session()
+    try:
+        removed = release_blob(session, LocalStorage(), storage_key)
+        session.commit()
+        logger.info("blob_collected", storage_key=storage_key, removed=removed)
+    finally:
+        session.close()
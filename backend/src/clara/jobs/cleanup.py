@@ -1,10 +1,14 @@
 from datetime import UTC, datetime, timedelta
 from importlib import import_module
 
-from sqlalchemy import delete
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
 
 from clara.auth.models import PersonalAccessToken
 from clara.base.model import Base
+from clara.config import get_settings
+from clara.files.storage import LocalStorage
+from clara.imports.models import ContactImport
 from clara.jobs.sync_db import get_sync_session
 
 _MODEL_MODULES = (
@@ -12,8 +16,10 @@ _MODEL_MODULES = (
     "clara.auth.models",
     "clara.contacts.models",
     "clara.customization.models",
+    "clara.exports.models",
     "clara.files.models",
     "clara.finance.models",
+    "clara.imports.models",
     "clara.journal.models",
     "clara.notes.models",
     "clara.reminders.models",
@@ -26,6 +32,25 @@ def _load_models() -> None:
         import_module(module_name)
 
 
+def _fail_stale_imports(session: Session, now: datetime) -> list[str]:
+    """Fail imports whose enqueue was lost or whose worker died.
+
+    Failed imports are not resumed, so the storage keys of every failed
+    import's upload are returned for removal.
+    """
+    stale_after = timedelta(minutes=get_settings().background_job_stale_minutes)
+    session.execute(
+        update(ContactImport)
+        .where(
+            ContactImport.status.in_(("queued", "running")),
+            ContactImport.updated_at < now - stale_after,
+        )
+        .values(status="failed", error="Import stalled; upload the file again")
+    )
+    stmt = select(ContactImport.storage_key).where(ContactImport.status == "failed")
+    return list(session.execute(stmt).scalars())
+
+
 def cleanup_expired_tokens() -> None:
     session = get_sync_session()
     try:
@@ -37,6 +62,7 @@ def cleanup_expired_tokens() -> None:
                 PersonalAccessToken.expires_at < now,
             )
         )
+        uploads = _fail_stale_imports(session, now)
         _load_models()
         for table in reversed(Base.metadata.sorted_tables):
             if "vault_id" not in table.c or "deleted_at" not in table.c:
@@ -48,6 +74,10 @@ def cleanup_expired_tokens() -> None:
                 )
             )
         session.commit()
+        if uploads:
+            storage = LocalStorage()
+            for key in uploads:
+                storage.path(key).unlink(missing_ok=True)
     finally:
         session.close()
 
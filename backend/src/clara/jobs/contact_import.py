@@ -0,0 +1,147 @@
+"""RQ job that bulk-imports an uploaded contacts CSV or vCard file."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from typing import BinaryIO
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from clara.files.storage import LocalStorage
+from clara.imports.models import ContactImport
+from clara.integrations.csv_io import copy_contacts, iter_import_batches
+from clara.integrations.vcard import (
+    TagCache,
+    insert_cards,
+    iter_parsed_chunks,
+    parse_pool,
+    split_vcards,
+)
+from clara.jobs.async_db import job_session_factory
+
+logger = structlog.get_logger()
+
+MAX_REPORTED_ERRORS = 1000
+
+
+class _Lines:
+    """Decode a binary file line by line, counting the bytes consumed."""
+
+    def __init__(self, f: BinaryIO) -> None:
+        self.f = f
+        self.consumed = 0
+
+    def __iter__(self) -> Iterator[str]:
+        first = True
+        for raw in self.f:
+            self.consumed += len(raw)
+            line = raw.decode("utf-8")
+            if first:
+                line = line.removeprefix("\ufeff")
+                first = False
+            yield line
+
+
+async def _record(
+    session: AsyncSession,
+    job: ContactImport,
+    *,
+    imported: int,
+    rows: int,
+    errors: list[str],
+    consumed: int,
+) -> None:
+    job.imported += imported
+    job.failed += len(errors)
+    room = MAX_REPORTED_ERRORS - len(job.errors)
+    if errors and room > 0:
+        job.errors = [*job.errors, *errors[:room]]
+    job.rows_processed += rows
+    job.progress = min(99, consumed * 100 // max(job.size_bytes, 1))
+    await session.commit()
+
+
+async def _import_csv(session: AsyncSession, job: ContactImport, lines: _Lines) -> None:
+    for batch in iter_import_batches(lines, job.field_map):
+        imported = await copy_contacts(session, job.vault_id, batch.rows)
+        await _record(
+            session,
+            job,
+            imported=imported,
+            rows=batch.lines,
+            errors=batch.errors,
+            consumed=lines.consumed,
+        )
+
+
+async def _import_vcard(
+    session: AsyncSession, job: ContactImport, lines: _Lines
+) -> None:
+    tags = TagCache(session, job.vault_id)
+    with parse_pool() as executor:
+        chunks = iter_parsed_chunks(
+            split_vcards(lines), offset=lambda: lines.consumed, executor=executor
+        )
+        async for parsed in chunks:
+            ids = await insert_cards(session, job.vault_id, parsed.cards, tags)
+            await _record(
+                session,
+                job,
+                imported=len(ids),
+                rows=len(parsed.cards) + len(parsed.errors),
+                errors=parsed.errors,
+                consumed=parsed.offset,
+            )
+
+
+_IMPORTERS = {"csv": _import_csv, "vcard": _import_vcard}
+
+
+async def import_contacts(
+    factory: async_sessionmaker[AsyncSession], import_id: uuid.UUID
+) -> None:
+    """Run one queued import, committing inserts and progress per batch."""
+    storage = LocalStorage()
+    async with factory() as session:
+        job = await session.get(ContactImport, import_id)
+        if job is None or job.status != "queued":
+            return
+        job.status = "running"
+        await session.commit()
+        try:
+            with storage.path(job.storage_key).open("rb") as f:
+                await _IMPORTERS[job.format](session, job, _Lines(f))
+        except Exception as exc:
+            logger.exception("contact_import_failed", import_id=str(import_id))
+            await session.rollback()
+            job.status = "failed"
+            job.error = str(exc)[:1000]
+            await session.commit()
+            # Failed imports are not resumed; the upload is of no further use.
+            storage.path(job.storage_key).unlink(missing_ok=True)
+            return
+        job.status = "complete"
+        job.progress = 100
+        job.completed_at = datetime.now(UTC)
+        await session.commit()
+        storage.path(job.storage_key).unlink(missing_ok=True)
+        logger.info(
+            "contact_import_complete",
+            import_id=str(import_id),
+            imported=job.imported,
+            failed=job.failed,
+        )
+
+
+async def _run(import_id: uuid.UUID) -> None:
+    async with job_session_factory() as factory:
+        await import_contacts(factory, import_id)
+
+
+def run_contact_import(import_id: str) -> None:
+    """Import the file uploaded for one ``ContactImport`` row."""
+    asyncio.run(_run(uuid.UUID(import_id)))
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import contextlib
+import time
 import uuid
+from collections.abc import Iterator
 from datetime import UTC, datetime
 
 import redis
@@ -13,8 +15,15 @@ from sqlalchemy import select
 from clara.config import get_settings
 from clara.dav_sync.client import DavClient
 from clara.dav_sync.models import DavSyncAccount
-from clara.dav_sync.sync_engine import sync_entity_type
+from clara.dav_sync.sync_engine import (
+    COLLECTIONS,
+    fetch_remote_changes,
+    route_changes,
+    store_sync_token,
+    sync_changes,
+)
 from clara.integrations.crypto import decrypt_credential
+from clara.jobs.schedule import DAV_SCHEDULE
 from clara.jobs.sync_db import get_sync_session
 
 logger = structlog.get_logger()
@@ -22,6 +31,17 @@ logger = structlog.get_logger()
 LOCK_TTL = 600  # 10 minutes
 
 
+@contextlib.contextmanager
+def _phase(name: str, **fields: object) -> Iterator[None]:
+    """Log how long one phase of a sync run took."""
+    start = time.monotonic()
+    try:
+        yield
+    finally:
+        duration_ms = round((time.monotonic() - start) * 1000, 1)
+        logger.info("dav_sync_phase", phase=name, duration_ms=duration_ms, **fields)
+
+
 def sync_dav_account(account_id: str) -> None:
     """Sync all entity types for one DAV account."""
     settings = get_settings()
@@ -31,13 +51,19 @@ def sync_dav_account(account_id: str) -> None:
 
     if not lock.acquire(blocking=False):
         logger.info("dav_sync_locked", account_id=account_id)
+        DAV_SCHEDULE.release(r, account_id)
         return
 
     session = get_sync_session()
+    client: DavClient | None = None
+    next_due: float | None = DAV_SCHEDULE.retry_at()
     try:
         account = session.get(DavSyncAccount, uuid.UUID(account_id))
         if account is None or account.deleted_at is not None:
+            next_due = None
             return
+        # Failed runs wait a full interval too rather than retrying every tick.
+        next_due = DAV_SCHEDULE.next_run(account.sync_interval_minutes)
 
         account.last_sync_status = "running"
         session.flush()
@@ -47,21 +73,51 @@ def sync_dav_account(account_id: str) -> None:
 
         all_counts: dict[str, int] = {}
         had_errors = False
-        entity_types = ("contact", "activity", "task", "reminder")
+        entity_types = [t for types in COLLECTIONS.values() for t in types]
         failed_count = 0
-        for entity_type in entity_types:
+        for collection, collection_types in COLLECTIONS.items():
             try:
-                counts = sync_entity_type(session, client, account, entity_type)
-                for k, v in counts.items():
-                    all_counts[k] = all_counts.get(k, 0) + v
+                with _phase("fetch", collection=collection, account_id=account_id):
+                    changes = fetch_remote_changes(
+                        session, client, account, collection
+                    )
+                if changes is None:
+                    continue
+                with _phase("route", collection=collection, account_id=account_id):
+                    routed = route_changes(session, account, collection, changes)
             except Exception:
                 had_errors = True
-                failed_count += 1
+                failed_count += len(collection_types)
                 logger.exception(
-                    "dav_sync_entity_failed",
-                    entity_type=entity_type,
+                    "dav_sync_fetch_failed",
+                    collection=collection,
                     account_id=account_id,
                 )
+                continue
+            complete = True
+            for entity_type in collection_types:
+                try:
+                    with _phase(
+                        "apply", entity_type=entity_type, account_id=account_id
+                    ):
+                        counts, applied = sync_changes(
+                            session, client, account, entity_type, routed[entity_type]
+                        )
+                    complete = complete and applied
+                    for k, v in counts.items():
+                        all_counts[k] = all_counts.get(k, 0) + v
+                except Exception:
+                    had_errors = True
+                    complete = False
+                    failed_count += 1
+                    logger.exception(
+                        "dav_sync_entity_failed",
+                        entity_type=entity_type,
+                        account_id=account_id,
+                    )
+            # Only move past the delta once every type has applied it.
+            if complete:
+                store_sync_token(account, collection, changes)
 
         account.last_synced_at = datetime.now(UTC)
         if failed_count == len(entity_types):
@@ -87,43 +143,39 @@ def sync_dav_account(account_id: str) -> None:
         logger.exception("dav_sync_failed", account_id=account_id)
     finally:
         session.close()
+        if client is not None:
+            client.close()
         with contextlib.suppress(Exception):
             lock.release()
+        try:
+            DAV_SCHEDULE.finish(r, account_id, next_due)
+        except Exception:
+            logger.exception("dav_sync_reschedule_failed", account_id=account_id)
 
 
 def schedule_dav_syncs() -> None:
-    """Check which DAV accounts are due for sync and enqueue them."""
+    """Enqueue the DAV accounts whose next run is due."""
     import rq
-    from rq import Retry
 
     settings = get_settings()
     r = redis.Redis.from_url(str(settings.redis_url))
-    q = rq.Queue(connection=r)
-    session = get_sync_session()
+    if not DAV_SCHEDULE.is_seeded(r):
+        _seed_dav_schedule(r)
+    DAV_SCHEDULE.enqueue_due(r, rq.Queue(connection=r))
+
 
+def _seed_dav_schedule(r: redis.Redis) -> None:
+    """Index every live account missing from the schedule (runs hourly)."""
+    session = get_sync_session()
     try:
-        now = datetime.now(UTC)
-        accounts = (
-            session.execute(
-                select(DavSyncAccount).where(DavSyncAccount.deleted_at.is_(None))
-            )
-            .scalars()
-            .all()
+        rows = session.execute(
+            select(
+                DavSyncAccount.id,
+                DavSyncAccount.last_synced_at,
+                DavSyncAccount.sync_interval_minutes,
+            ).where(DavSyncAccount.deleted_at.is_(None))
         )
-        for account in accounts:
-            if account.last_synced_at is None:
-                q.enqueue(
-                    sync_dav_account,
-                    str(account.id),
-                    retry=Retry(max=3, interval=[10, 30, 60]),
-                )
-                continue
-            elapsed = (now - account.last_synced_at).total_seconds() / 60
-            if elapsed >= account.sync_interval_minutes:
-                q.enqueue(
-                    sync_dav_account,
-                    str(account.id),
-                    retry=Retry(max=3, interval=[10, 30, 60]),
-                )
+        count = DAV_SCHEDULE.seed(r, rows.tuples())
+        logger.info("dav_sync_schedule_seeded", accounts=count)
     finally:
         session.close()
@@ -0,0 +1,110 @@
+"""RQ job that builds a vault export archive."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from typing import Any, cast
+
+import structlog
+from sqlalchemy import CursorResult, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from clara.exports.archive import archive_key, build_archive
+from clara.exports.models import VaultExport
+from clara.files.storage import LocalStorage
+from clara.jobs.async_db import job_session_factory
+
+logger = structlog.get_logger()
+
+
+async def _set(
+    factory: async_sessionmaker[AsyncSession],
+    export_id: uuid.UUID,
+    *,
+    status_is: str | None = None,
+    **values: object,
+) -> bool:
+    """Update the export row; with ``status_is`` only while it has that status.
+
+    Returns whether the row was updated.
+    """
+    stmt = update(VaultExport).where(VaultExport.id == export_id).values(**values)
+    if status_is is not None:
+        stmt = stmt.where(VaultExport.status == status_is)
+    async with factory() as session:
+        result = await session.execute(stmt)
+        await session.commit()
+    return bool(cast(CursorResult[Any], result).rowcount)
+
+
+async def _expire_superseded(
+    factory: async_sessionmaker[AsyncSession],
+    export: VaultExport,
+    storage: LocalStorage,
+) -> None:
+    """Drop artifacts of older exports of the same vault and format."""
+    async with factory() as session:
+        stmt = select(VaultExport).where(
+            VaultExport.vault_id == export.vault_id,
+            VaultExport.format == export.format,
+            VaultExport.status == "complete",
+            VaultExport.id != export.id,
+        )
+        for old in (await session.execute(stmt)).scalars():
+            if old.storage_key is not None:
+                storage.path(old.storage_key).unlink(missing_ok=True)
+            old.status = "expired"
+        await session.commit()
+
+
+async def build_export(
+    factory: async_sessionmaker[AsyncSession], export_id: uuid.UUID
+) -> None:
+    async with factory() as session:
+        export = await session.get(VaultExport, export_id)
+        if export is None or export.status not in ("queued", "failed"):
+            return
+        await _set(factory, export_id, status="running", progress=0, error=None)
+
+        async def on_progress(percent: int) -> None:
+            await _set(factory, export_id, progress=percent)
+
+        storage = LocalStorage()
+        key = archive_key(export.vault_id, export.id)
+        try:
+            size = await build_archive(
+                session, export.vault_id, export.format, storage.path(key), on_progress
+            )
+        except Exception as exc:
+            logger.exception("export_failed", export_id=str(export_id))
+            await _set(factory, export_id, status="failed", error=str(exc)[:1000])
+            return
+    # The row may have been failed as stalled and superseded meanwhile.
+    completed = await _set(
+        factory,
+        export_id,
+        status_is="running",
+        status="complete",
+        progress=100,
+        storage_key=key,
+        size_bytes=size,
+        completed_at=datetime.now(UTC),
+    )
+    if not completed:
+        storage.path(key).unlink(missing_ok=True)
+        logger.warning("export_no_longer_running", export_id=str(export_id))
+        return
+    await _expire_superseded(factory, export, storage)
+    logger.info("export_complete", export_id=str(export_id), size_bytes=size)
+
+
+async def _run(export_id: uuid.UUID) -> None:
+    async with job_session_factory() as factory:
+        await build_export(factory, export_id)
+
+
+def run_export(export_id: str) -> None:
+    """Build the archive for one ``VaultExport`` row."""
+    asyncio.run(_run(uuid.UUID(export_id)))
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import contextlib
 import uuid
-from datetime import UTC, datetime
 
 import redis
 import structlog
@@ -14,6 +13,7 @@ from clara.config import get_settings
 from clara.git_sync.git_ops import GitRepo
 from clara.git_sync.models import GitSyncConfig
 from clara.git_sync.sync import run_sync
+from clara.jobs.schedule import GIT_SCHEDULE
 from clara.jobs.sync_db import get_sync_session
 
 logger = structlog.get_logger()
@@ -21,8 +21,8 @@ logger = structlog.get_logger()
 LOCK_TTL = 600  # 10 minutes
 
 
-def run_git_sync(config_id: str) -> None:
-    """Full sync for one git sync config."""
+def run_git_sync(config_id: str, full: bool = False) -> None:
+    """Sync one git sync config; ``full`` rereads every file."""
     settings = get_settings()
     r = redis.Redis.from_url(str(settings.redis_url))
     lock_key = f"git_sync:{config_id}"
@@ -30,14 +30,19 @@ def run_git_sync(config_id: str) -> None:
 
     if not lock.acquire(blocking=False):
         logger.info("git_sync_locked", config_id=config_id)
+        GIT_SCHEDULE.release(r, config_id)
         return
 
     session = get_sync_session()
     repo: GitRepo | None = None
+    next_due: float | None = GIT_SCHEDULE.retry_at()
     try:
         config = session.get(GitSyncConfig, uuid.UUID(config_id))
         if config is None or config.deleted_at is not None or not config.enabled:
+            next_due = None
             return
+        # Failed runs wait a full interval too rather than retrying every tick.
+        next_due = GIT_SCHEDULE.next_run(config.sync_interval_minutes)
 
         config.last_sync_status = "running"
         session.flush()
@@ -51,7 +56,7 @@ def run_git_sync(config_id: str) -> None:
             credential_encrypted=config.credential_encrypted,
         )
 
-        counts = run_sync(session, config, repo)
+        counts = run_sync(session, config, repo, full=full)
         session.commit()
         logger.info("git_sync_complete", config_id=config_id, counts=counts)
 
@@ -72,44 +77,38 @@ def run_git_sync(config_id: str) -> None:
         session.close()
         with contextlib.suppress(Exception):
             lock.release()
+        try:
+            GIT_SCHEDULE.finish(r, config_id, next_due)
+        except Exception:
+            logger.exception("git_sync_reschedule_failed", config_id=config_id)
 
 
 def schedule_git_syncs() -> None:
-    """Check which git sync configs are due and enqueue them."""
+    """Enqueue the git sync configs whose next run is due."""
     import rq
-    from rq import Retry
 
     settings = get_settings()
     r = redis.Redis.from_url(str(settings.redis_url))
-    q = rq.Queue(connection=r)
-    session = get_sync_session()
+    if not GIT_SCHEDULE.is_seeded(r):
+        _seed_git_schedule(r)
+    GIT_SCHEDULE.enqueue_due(r, rq.Queue(connection=r))
 
+
+def _seed_git_schedule(r: redis.Redis) -> None:
+    """Index every enabled config missing from the schedule (runs hourly)."""
+    session = get_sync_session()
     try:
-        now = datetime.now(UTC)
-        configs = (
-            session.execute(
-                select(GitSyncConfig).where(
-                    GitSyncConfig.deleted_at.is_(None),
-                    GitSyncConfig.enabled.is_(True),
-                )
+        rows = session.execute(
+            select(
+                GitSyncConfig.id,
+                GitSyncConfig.last_sync_at,
+                GitSyncConfig.sync_interval_minutes,
+            ).where(
+                GitSyncConfig.deleted_at.is_(None),
+                GitSyncConfig.enabled.is_(True),
             )
-            .scalars()
-            .all()
         )
-        for config in configs:
-            if config.last_sync_at is None:
-                q.enqueue(
-                    run_git_sync,
-                    str(config.id),
-                    retry=Retry(max=3, interval=[10, 30, 60]),
-                )
-                continue
-            elapsed = (now - config.last_sync_at).total_seconds() / 60
-            if elapsed >= config.sync_interval_minutes:
-                q.enqueue(
-                    run_git_sync,
-                    str(config.id),
-                    retry=Retry(max=3, interval=[10, 30, 60]),
-                )
+        count = GIT_SCHEDULE.seed(r, rows.tuples())
+        logger.info("git_sync_schedule_seeded", configs=count)
     finally:
         session.close()
@@ -0,0 +1,201 @@
+"""Due-time index for the periodic sync jobs.
+
+Each kind of sync keeps a Redis sorted set of ids scored by the epoch
+second its next run is due. A scheduler tick reads only the due head of the
+set instead of loading every account, and a marker key per id keeps an id
+that is already queued or running from being enqueued again.
+
+Runs report back through :meth:`SyncSchedule.finish`, which sets the next
+due time; services call :meth:`SyncSchedule.set_due` and
+:meth:`SyncSchedule.remove` once an account's creation, edit or deletion
+has committed.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import redis
+import rq
+import structlog
+from rq import Retry
+
+logger = structlog.get_logger()
+
+# Next runs land up to this share of the interval late (capped), so accounts
+# created or synced together drift apart instead of firing on the same tick.
+JITTER_FRACTION = 0.1
+MAX_JITTER_SECONDS = 300
+# A popped id comes due again after this long if its run never reports back.
+LEASE_SECONDS = 900
+# Upper bound on the queued marker of a job that died without finishing.
+QUEUED_TTL_SECONDS = 3600
+# The index is reloaded from the DB this often, picking up ids whose
+# after-commit set_due was lost (e.g. Redis was briefly unreachable).
+SEEDED_TTL_SECONDS = 3600
+POP_BATCH_SIZE = 500
+
+
+def _jitter(interval_seconds: float) -> float:
+    spread = min(interval_seconds * JITTER_FRACTION, MAX_JITTER_SECONDS)
+    return random.uniform(0, spread)
+
+
+@dataclass(frozen=True)
+class SyncSchedule:
+    """Due times for one kind of sync; ``job`` is the RQ job's dotted path."""
+
+    name: str
+    job: str
+
+    @property
+    def key(self) -> str:
+        return f"sync_schedule:{self.name}"
+
+    @property
+    def _seeded_key(self) -> str:
+        return f"{self.key}:seeded"
+
+    def _queued_key(self, item_id: uuid.UUID | str) -> str:
+        return f"{self.key}:queued:{item_id}"
+
+    @staticmethod
+    def next_run(interval_minutes: int, last_run: datetime | None = None) -> float:
+        """Epoch second of the run after ``last_run`` (default now), jittered."""
+        base = last_run.timestamp() if last_run else time.time()
+        interval = interval_minutes * 60
+        return base + interval + _jitter(interval)
+
+    @staticmethod
+    def retry_at() -> float:
+        """Due time for a run that failed before it could read its interval."""
+        return time.time() + LEASE_SECONDS
+
+    @staticmethod
+    def first_run(interval_minutes: int) -> float:
+        """Due time for an id that has never synced: now, spread by jitter."""
+        return time.time() + _jitter(interval_minutes * 60)
+
+    def set_due(self, conn: redis.Redis, item_id: uuid.UUID | str, due: float) -> None:
+        conn.zadd(self.key, {str(item_id): due})
+
+    def remove(self, conn: redis.Redis, item_id: uuid.UUID | str) -> None:
+        pipe = conn.pipeline()
+        pipe.zrem(self.key, str(item_id))
+        pipe.delete(self._queued_key(item_id))
+        pipe.execute()
+
+    def release(self, conn: redis.Redis, item_id: uuid.UUID | str) -> None:
+        """Clear the queued marker of a run that found another one running.
+
+        The due time is left to the running job's :meth:`finish`.
+        """
+        conn.delete(self._queued_key(item_id))
+
+    def finish(
+        self, conn: redis.Redis, item_id: uuid.UUID | str, due: float | None
+    ) -> None:
+        """Record the end of a run: clear its marker and set the next due time.
+
+        ``due`` None drops the id, for accounts deleted or disabled meanwhile.
+        """
+        pipe = conn.pipeline()
+        pipe.delete(self._queued_key(item_id))
+        if due is None:
+            pipe.zrem(self.key, str(item_id))
+        else:
+            pipe.zadd(self.key, {str(item_id): due})
+        pipe.execute()
+
+    def backlog(self, conn: redis.Redis, now: float | None = None) -> int:
+        """Ids due but not yet picked up by a scheduler tick."""
+        return int(conn.zcount(self.key, "-inf", now or time.time()))
+
+    def is_seeded(self, conn: redis.Redis) -> bool:
+        """Whether the index was loaded from the DB within the last hour.
+
+        The marker lives next to the set, so losing Redis data reseeds; it
+        also expires, so ids missing from the set are added back.
+        """
+        return bool(conn.exists(self._seeded_key))
+
+    def seed(
+        self,
+        conn: redis.Redis,
+        rows: Iterable[tuple[uuid.UUID, datetime | None, int]],
+    ) -> int:
+        """Index ``(id, last_run, interval_minutes)`` rows not already present.
+
+        Safe to run twice: ids already in the set keep their due time.
+        """
+        due: dict[str, float] = {}
+        for item_id, last_run, interval in rows:
+            due[str(item_id)] = (
+                self.first_run(interval)
+                if last_run is None
+                else self.next_run(interval, last_run)
+            )
+        if due:
+            conn.zadd(self.key, due, nx=True)
+        conn.set(self._seeded_key, "1", ex=SEEDED_TTL_SECONDS)
+        return len(due)
+
+    def pop_due(
+        self, conn: redis.Redis, now: float, limit: int = POP_BATCH_SIZE
+    ) -> list[str]:
+        """Due ids, leased so the next tick skips them until the run reports."""
+        raw: list[Any] = conn.zrangebyscore(self.key, "-inf", now, start=0, num=limit)
+        ids = [i.decode() if isinstance(i, bytes) else str(i) for i in raw]
+        if ids:
+            # xx: an id removed since the read stays removed.
+            lease = now + LEASE_SECONDS
+            conn.zadd(self.key, dict.fromkeys(ids, lease), xx=True)
+        return ids
+
+    def enqueue(
+        self,
+        conn: redis.Redis,
+        queue: rq.Queue,
+        item_id: uuid.UUID | str,
+        **kwargs: Any,
+    ) -> bool:
+        """Enqueue a run unless one is already queued or running."""
+        marker = self._queued_key(item_id)
+        if not conn.set(marker, "1", nx=True, ex=QUEUED_TTL_SECONDS):
+            return False
+        queue.enqueue(self.job, str(item_id), **kwargs)
+        return True
+
+    def enqueue_due(self, conn: redis.Redis, queue: rq.Queue) -> dict[str, int]:
+        """One scheduler tick: enqueue every due id. Returns tick counts."""
+        now = time.time()
+        backlog = self.backlog(conn, now)
+        enqueued = skipped = 0
+        while True:
+            ids = self.pop_due(conn, now)
+            for item_id in ids:
+                retry = Retry(max=3, interval=[10, 30, 60])
+                if self.enqueue(conn, queue, item_id, retry=retry):
+                    enqueued += 1
+                else:
+                    skipped += 1
+            if len(ids) < POP_BATCH_SIZE:
+                break
+        counts = {"enqueued": enqueued, "skipped": skipped}
+        logger.info(
+            "sync_schedule_tick",
+            schedule=self.name,
+            backlog=backlog,
+            **counts,
+        )
+        return counts
+
+
+DAV_SCHEDULE = SyncSchedule("dav_sync", "clara.jobs.dav_sync.sync_dav_account")
+GIT_SCHEDULE = SyncSchedule("git_sync", "clara.jobs.git_sync.run_git_sync")
@@ -36,20 +36,26 @@ async def list_entries(
     date_to: date | None = Query(None),
 ) -> PaginatedResponse[JournalEntryRead]:
     if date_from and date_to:
-        items, total = await svc.list_by_date_range(
+        page = await svc.list_by_date_range(
             date_from,
             date_to,
             offset=pagination.offset,
             limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     else:
-        items, total = await svc.list_entries(
-            offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_entries(
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     return PaginatedResponse(
-        items=[JournalEntryRead.model_validate(e) for e in items],
+        items=[JournalEntryRead.model_validate(e) for e in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
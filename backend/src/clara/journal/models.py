@@ -1,7 +1,7 @@
 import uuid
 from datetime import date
 
-from sqlalchemy import Date, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import Date, ForeignKey, Index, Integer, String, Text, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from clara.base.model import VaultScopedModel
@@ -9,6 +9,16 @@ from clara.base.model import VaultScopedModel
 
 class JournalEntry(VaultScopedModel):
     __tablename__ = "journal_entries"
+    __table_args__ = (
+        Index(
+            "ix_journal_entries_vault_id_entry_date",
+            "vault_id",
+            text("entry_date DESC"),
+            text("id DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
     entry_date: Mapped[date] = mapped_column(Date)
     title: Mapped[str] = mapped_column(String(500), default="")
     body_markdown: Mapped[str] = mapped_column(Text, default="")
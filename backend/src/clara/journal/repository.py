@@ -1,10 +1,9 @@
-from collections.abc import Sequence
 from datetime import date
 
-from sqlalchemy import Select, func, select
+from sqlalchemy import Select
 from sqlalchemy.orm import selectinload
 
-from clara.base.repository import BaseRepository
+from clara.base.repository import BaseRepository, Page
 from clara.journal.models import JournalEntry
 
 
@@ -18,45 +17,35 @@ class JournalEntryRepository(BaseRepository[JournalEntry]):
         )
 
     async def list_by_date_range(
-        self, start: date, end: date, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[JournalEntry], int]:
-        base = self._base_query().where(
+        self,
+        start: date,
+        end: date,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[JournalEntry]:
+        in_range = (
             JournalEntry.entry_date >= start,
             JournalEntry.entry_date <= end,
         )
-        count_stmt = (
-            select(func.count())
-            .select_from(JournalEntry)
-            .where(JournalEntry.vault_id == self.vault_id)
-            .where(JournalEntry.deleted_at.is_(None))
-            .where(JournalEntry.entry_date >= start)
-            .where(JournalEntry.entry_date <= end)
+        return await self._paginate(
+            self._base_query().where(*in_range),
+            order_by=JournalEntry.entry_date.desc(),
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count_stmt=self._count_query().where(*in_range),
         )
-        total = (await self.session.execute(count_stmt)).scalar_one()
-        items = (
-            await self.session.execute(
-                base.order_by(JournalEntry.entry_date.desc())
-                .offset(offset)
-                .limit(limit)
-            )
-        ).scalars().unique().all()
-        return items, total
 
     async def list(
-        self, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[JournalEntry], int]:
-        count_stmt = (
-            select(func.count())
-            .select_from(JournalEntry)
-            .where(JournalEntry.vault_id == self.vault_id)
-            .where(JournalEntry.deleted_at.is_(None))
+        self, *, offset: int = 0, limit: int = 50, cursor: str | None = None
+    ) -> Page[JournalEntry]:
+        return await self._paginate(
+            self._base_query(),
+            order_by=JournalEntry.entry_date.desc(),
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count_stmt=self._count_query(),
         )
-        total = (await self.session.execute(count_stmt)).scalar_one()
-        items_stmt = (
-            self._base_query()
-            .offset(offset)
-            .limit(limit)
-            .order_by(JournalEntry.entry_date.desc())
-        )
-        result = await self.session.execute(items_stmt)
-        return result.scalars().unique().all(), total
@@ -1,9 +1,9 @@
 import uuid
-from collections.abc import Sequence
 from datetime import date
 
 from sqlalchemy import delete
 
+from clara.base.repository import Page
 from clara.exceptions import NotFoundError
 from clara.journal.models import JournalEntry, JournalEntryContact
 from clara.journal.repository import JournalEntryRepository
@@ -16,15 +16,25 @@ class JournalService:
         self.user_id = user_id
 
     async def list_entries(
-        self, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[JournalEntry], int]:
-        return await self.repo.list(offset=offset, limit=limit)
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[JournalEntry]:
+        return await self.repo.list(offset=offset, limit=limit, cursor=cursor)
 
     async def list_by_date_range(
-        self, start: date, end: date, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[JournalEntry], int]:
+        self,
+        start: date,
+        end: date,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[JournalEntry]:
         return await self.repo.list_by_date_range(
-            start, end, offset=offset, limit=limit
+            start, end, offset=offset, limit=limit, cursor=cursor
         )
 
     async def get_entry(self, entry_id: uuid.UUID) -> JournalEntry:
@@ -1,7 +1,9 @@
-from collections.abc import Callable, Coroutine
-from typing import Any
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator
 
-from fastapi import FastAPI, Request, Response
+import structlog
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
@@ -10,9 +12,40 @@ from clara.exceptions import (
     ConflictError,
     ForbiddenError,
     InvalidCredentialsError,
+    InvalidCursorError,
     NotFoundError,
 )
-from clara.middleware import CSRFMiddleware, RequestSizeLimitMiddleware
+from clara.middleware import (
+    CSRFMiddleware,
+    RequestLoggingMiddleware,
+    RequestSizeLimitMiddleware,
+)
+
+logger = structlog.get_logger()
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    from clara.auth import pat_cache
+    from clara.database import _get_session_factory
+
+    factory = _get_session_factory()
+    tasks = [asyncio.create_task(pat_cache.run_flusher(factory))]
+    if get_settings().auth_context_ttl_seconds > 0:
+        from clara.auth import context_cache
+
+        tasks.append(asyncio.create_task(context_cache.listen()))
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        try:
+            await pat_cache.flush_pending(factory)
+        except Exception:
+            logger.exception("pat_usage_flush_failed")
 
 
 def create_app() -> FastAPI:
@@ -22,6 +55,7 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs" if settings.debug else None,
         redoc_url="/redoc" if settings.debug else None,
+        lifespan=lifespan,
     )
 
     from clara.logging import setup_logging
@@ -59,29 +93,15 @@ def create_app() -> FastAPI:
     ) -> JSONResponse:
         return JSONResponse(status_code=401, content={"detail": "Invalid credentials"})
 
-    import time
-
-    import structlog
-    logger = structlog.get_logger()
-
-    @app.middleware("http")
-    async def log_requests(
-        request: Request,
-        call_next: Callable[
-            [Request], Coroutine[Any, Any, Response]
-        ],
-    ) -> Response:
-        start = time.monotonic()
-        response = await call_next(request)
-        duration_ms = round((time.monotonic() - start) * 1000, 1)
-        logger.info(
-            "request_handled",
-            method=request.method,
-            path=request.url.path,
-            status=response.status_code,
-            duration_ms=duration_ms,
+    @app.exception_handler(InvalidCursorError)
+    async def invalid_cursor_handler(
+        request: Request, exc: InvalidCursorError
+    ) -> JSONResponse:
+        return JSONResponse(
+            status_code=400, content={"detail": "Invalid pagination cursor"}
         )
-        return response
+
+    app.add_middleware(RequestLoggingMiddleware)
 
     @app.get("/api/v1/health")
     async def health() -> dict[str, str]:
@@ -225,12 +245,30 @@ def create_app() -> FastAPI:
         prefix="/api/v1/vaults/{vault_id}/dav-sync",
         tags=["dav-sync"],
     )
+    from clara.search.api import router as search_router
+    app.include_router(
+        search_router,
+        prefix="/api/v1/vaults/{vault_id}/search",
+        tags=["search"],
+    )
     from clara.git_sync.api import router as git_sync_router
     app.include_router(
         git_sync_router,
         prefix="/api/v1/vaults/{vault_id}/git-sync",
         tags=["git-sync"],
     )
+    from clara.exports.api import router as exports_router
+    app.include_router(
+        exports_router,
+        prefix="/api/v1/vaults/{vault_id}/exports",
+        tags=["exports"],
+    )
+    from clara.imports.api import router as imports_router
+    app.include_router(
+        imports_router,
+        prefix="/api/v1/vaults/{vault_id}/imports",
+        tags=["imports"],
+    )
 
     return app
 
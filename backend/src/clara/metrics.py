@@ -1,7 +1,48 @@
+from collections.abc import Iterator
+
+import structlog
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from clara.jobs.schedule import DAV_SCHEDULE, GIT_SCHEDULE
+from clara.redis import get_redis
+
+logger = structlog.get_logger()
+
 instrumentator = Instrumentator(
     should_group_status_codes=True,
     should_group_untemplated=True,
     excluded_handlers=["/api/v1/health", "/metrics"],
 )
+
+
+class SyncBacklogCollector(Collector):
+    """Sync runs past their due time and not yet enqueued, read at scrape."""
+
+    def describe(self) -> Iterator[GaugeMetricFamily]:
+        # Without this, registering would call collect() and hit Redis.
+        yield self._gauge()
+
+    def collect(self) -> Iterator[GaugeMetricFamily]:
+        gauge = self._gauge()
+        for schedule in (DAV_SCHEDULE, GIT_SCHEDULE):
+            try:
+                backlog = schedule.backlog(get_redis())
+            except Exception:
+                logger.warning("sync_backlog_unavailable", schedule=schedule.name)
+                continue
+            gauge.add_metric([schedule.name], backlog)
+        yield gauge
+
+    @staticmethod
+    def _gauge() -> GaugeMetricFamily:
+        return GaugeMetricFamily(
+            "clara_sync_schedule_backlog",
+            "Sync runs due but not yet enqueued by the scheduler.",
+            labels=["schedule"],
+        )
+
+
+REGISTRY.register(SyncBacklogCollector())
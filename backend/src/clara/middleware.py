@@ -1,53 +1,77 @@
+"""Pure ASGI middleware.
+
+These wrap ``receive``/``send`` directly instead of going through
+``BaseHTTPMiddleware``, which runs every request in an extra task and
+re-streams the response body through a memory channel.
+"""
+
 import hashlib
 import hmac
 import secrets
+import time
 
+import structlog
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
+from starlette.exceptions import HTTPException
+from starlette.requests import HTTPConnection
 from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from clara.config import get_settings
 
 CSRF_COOKIE = "csrf_token"
 CSRF_HEADER = "x-csrf-token"
 SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
-
-
-class CSRFMiddleware(BaseHTTPMiddleware):
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        # Skip CSRF for safe methods
-        if request.method in SAFE_METHODS:
-            return await call_next(request)
-
-        # Skip CSRF if using Bearer token (API/PAT auth)
-        auth_header = request.headers.get("authorization", "")
-        if auth_header.startswith("Bearer "):
-            return await call_next(request)
-
-        # Only enforce CSRF when cookie auth is present
-        access_cookie = request.cookies.get("access_token")
-        if not access_cookie:
-            return await call_next(request)
-
-        csrf_cookie = request.cookies.get(CSRF_COOKIE)
-        csrf_header = request.headers.get(CSRF_HEADER)
-
-        if (
-            not csrf_cookie
-            or not csrf_header
-            or csrf_cookie != csrf_header
-            or not _verify_csrf_token(csrf_header, access_cookie)
-        ):
-            return Response(
+# Routes that take file bodies and get ``max_upload_size`` instead.
+UPLOAD_PATH_SUFFIXES = (
+    "/files",
+    "/import/csv",
+    "/import/vcard",
+    "/imports/csv",
+    "/imports/vcard",
+)
+
+logger = structlog.get_logger()
+
+
+class CSRFMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+        if not _csrf_ok(HTTPConnection(scope)):
+            response = Response(
                 content='{"detail":"CSRF token missing or invalid"}',
                 status_code=403,
                 media_type="application/json",
             )
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+
+def _csrf_ok(conn: HTTPConnection) -> bool:
+    # Skip CSRF if using Bearer token (API/PAT auth)
+    auth_header = conn.headers.get("authorization", "")
+    if auth_header.startswith("Bearer "):
+        return True
+
+    # Only enforce CSRF when cookie auth is present
+    access_cookie = conn.cookies.get("access_token")
+    if not access_cookie:
+        return True
 
-        return await call_next(request)
+    csrf_cookie = conn.cookies.get(CSRF_COOKIE)
+    csrf_header = conn.headers.get(CSRF_HEADER)
+    return bool(
+        csrf_cookie
+        and csrf_header
+        and csrf_cookie == csrf_header
+        and _verify_csrf_token(csrf_header, access_cookie)
+    )
 
 
 def generate_csrf_token(session_token: str) -> str:
@@ -77,27 +101,105 @@ def _verify_csrf_token(csrf_token: str, session_token: str) -> bool:
     return hmac.compare_digest(sig, expected)
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    """Reject requests whose Content-Length exceeds configured limits."""
+class RequestTooLarge(HTTPException):
+    def __init__(self) -> None:
+        super().__init__(status_code=413, detail="Request body too large")
 
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
+
+class RequestSizeLimitMiddleware:
+    """Reject request bodies larger than the configured limits.
+
+    A declared Content-Length is checked up front. The body is also counted
+    as it is received, so chunked uploads without a length are cut off at
+    the limit without being buffered. Exceeding the limit mid-stream raises
+    ``RequestTooLarge`` out of ``receive``; the app's HTTPException handler
+    turns it into a 413, or we do if nothing has been sent yet.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         settings = get_settings()
-        content_length = request.headers.get("content-length")
+        is_upload = scope["path"].rstrip("/").endswith(UPLOAD_PATH_SUFFIXES)
+        limit = settings.max_upload_size if is_upload else settings.max_body_size
+
+        content_length = HTTPConnection(scope).headers.get("content-length")
         if content_length is not None:
             try:
                 length = int(content_length)
             except ValueError:
-                return JSONResponse(
+                response = JSONResponse(
                     status_code=400,
                     content={"detail": "Invalid Content-Length header"},
                 )
-            is_upload = request.url.path.rstrip("/").endswith("/files")
-            limit = settings.max_upload_size if is_upload else settings.max_body_size
+                await response(scope, receive, send)
+                return
             if length > limit:
-                return JSONResponse(
-                    status_code=413,
-                    content={"detail": "Request body too large"},
-                )
-        return await call_next(request)
+                await _too_large(scope, receive, send)
+                return
+
+        received = 0
+        started = False
+
+        async def capped_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise RequestTooLarge()
+            return message
+
+        async def tracking_send(message: Message) -> None:
+            nonlocal started
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, capped_receive, tracking_send)
+        except RequestTooLarge:
+            if started:
+                raise
+            await _too_large(scope, receive, send)
+
+
+async def _too_large(scope: Scope, receive: Receive, send: Send) -> None:
+    response = JSONResponse(
+        status_code=413, content={"detail": "Request body too large"}
+    )
+    await response(scope, receive, send)
+
+
+class RequestLoggingMiddleware:
+    """Log method, path, status and duration once the response is sent."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.monotonic()
+        status = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        duration_ms = round((time.monotonic() - start) * 1000, 1)
+        logger.info(
+            "request_handled",
+            method=scope["method"],
+            path=scope["path"],
+            status=status,
+            duration_ms=duration_ms,
+        )
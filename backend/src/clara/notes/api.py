@@ -32,21 +32,33 @@ async def list_notes(
     q: str | None = None,
 ) -> PaginatedResponse[NoteRead]:
     if contact_id is not None:
-        items, total = await svc.list_by_contact(
-            contact_id, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_contact(
+            contact_id,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     elif activity_id is not None:
-        items, total = await svc.list_by_activity(
-            activity_id, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_activity(
+            activity_id,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     else:
-        items, total = await svc.list_notes(
-            offset=pagination.offset, limit=pagination.limit, q=q
+        page = await svc.list_notes(
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
+            q=q,
         )
     return PaginatedResponse(
-        items=[NoteRead.model_validate(n) for n in items],
+        items=[NoteRead.model_validate(n) for n in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
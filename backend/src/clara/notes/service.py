@@ -1,6 +1,6 @@
 import uuid
-from collections.abc import Sequence
 
+from clara.base.repository import Page
 from clara.exceptions import NotFoundError
 from clara.notes.models import Note
 from clara.notes.repository import NoteRepository
@@ -12,9 +12,16 @@ class NoteService:
         self.repo = repo
 
     async def list_notes(
-        self, *, offset: int = 0, limit: int = 50, q: str | None = None
-    ) -> tuple[Sequence[Note], int]:
-        return await self.repo.list(offset=offset, limit=limit, q=q)
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+        q: str | None = None,
+    ) -> Page[Note]:
+        return await self.repo.list(
+            offset=offset, limit=limit, cursor=cursor, q=q
+        )
 
     async def list_by_contact(
         self,
@@ -22,9 +29,10 @@ class NoteService:
         *,
         offset: int = 0,
         limit: int = 50,
-    ) -> tuple[Sequence[Note], int]:
+        cursor: str | None = None,
+    ) -> Page[Note]:
         return await self.repo.list_by_contact(
-            contact_id, offset=offset, limit=limit
+            contact_id, offset=offset, limit=limit, cursor=cursor
         )
 
     async def list_by_activity(
@@ -33,9 +41,10 @@ class NoteService:
         *,
         offset: int = 0,
         limit: int = 50,
-    ) -> tuple[Sequence[Note], int]:
+        cursor: str | None = None,
+    ) -> Page[Note]:
         return await self.repo.list_by_activity(
-            activity_id, offset=offset, limit=limit
+            activity_id, offset=offset, limit=limit, cursor=cursor
         )
 
     async def get_note(self, note_id: uuid.UUID) -> Note:
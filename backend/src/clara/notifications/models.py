@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import Boolean, ForeignKey, String, Text, Uuid
+from sqlalchemy import Boolean, ForeignKey, Index, String, Text, Uuid, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from clara.base.model import VaultScopedModel
@@ -8,6 +8,17 @@ from clara.base.model import VaultScopedModel
 
 class Notification(VaultScopedModel):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index(
+            "ix_notifications_user_id_vault_id_read_created_at",
+            "user_id",
+            "vault_id",
+            "read",
+            text("created_at DESC"),
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     user_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("users.id"), index=True)
     title: Mapped[str] = mapped_column(String(500))
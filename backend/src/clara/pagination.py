@@ -1,9 +1,75 @@
+import base64
+import binascii
+import json
+import uuid
 from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
 
 from fastapi import Query
 
+from clara.exceptions import InvalidCursorError
+
 
 @dataclass
 class PaginationParams:
     offset: int = Query(0, ge=0)
     limit: int = Query(50, ge=1, le=200)
+    cursor: str | None = Query(
+        None,
+        description="Opaque cursor from meta.next_cursor; replaces offset",
+    )
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    if isinstance(value, Decimal | uuid.UUID):
+        return str(value)
+    return value
+
+
+def _load_value(raw: Any, python_type: type) -> Any:
+    if raw is None:
+        return None
+    if python_type is datetime:
+        return datetime.fromisoformat(raw)
+    if python_type is date:
+        return date.fromisoformat(raw)
+    if python_type is Decimal or python_type is uuid.UUID:
+        return python_type(raw)
+    if not isinstance(raw, python_type):
+        raise TypeError(raw)
+    return raw
+
+
+def encode_cursor(sort_key: str, value: Any, last_id: uuid.UUID) -> str:
+    """Build an opaque cursor pointing just past the row ``last_id``.
+
+    The row's sort value is carried in the cursor, so the next page does not
+    depend on that row still existing.
+    """
+    payload = json.dumps(
+        {"k": sort_key, "v": _dump_value(value), "id": str(last_id)},
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, sort_key: str, python_type: type
+) -> tuple[Any, uuid.UUID]:
+    """Return the sort value and row id a cursor points past.
+
+    The cursor must come from the same sort; its value is parsed back to
+    ``python_type``, the sort column's Python type.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["k"] != sort_key:
+            raise InvalidCursorError()
+        return _load_value(payload["v"], python_type), uuid.UUID(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError) as exc:
+        raise InvalidCursorError() from exc
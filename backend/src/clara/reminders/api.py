@@ -32,21 +32,32 @@ async def list_reminders(
     contact_id: uuid.UUID | None = None,
 ) -> PaginatedResponse[ReminderRead]:
     if contact_id is not None:
-        items, total = await svc.list_by_contact(
-            contact_id, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_contact(
+            contact_id,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     elif status is not None:
-        items, total = await svc.list_by_status(
-            status, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_status(
+            status,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     else:
-        items, total = await svc.list_reminders(
-            offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_reminders(
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     return PaginatedResponse(
-        items=[ReminderRead.model_validate(r) for r in items],
+        items=[ReminderRead.model_validate(r) for r in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
@@ -57,13 +68,19 @@ async def list_upcoming_reminders(
     pagination: PaginationParams = Depends(),
     as_of: date = Query(default_factory=date.today),
 ) -> PaginatedResponse[ReminderRead]:
-    items, total = await svc.list_upcoming(
-        as_of, offset=pagination.offset, limit=pagination.limit
+    page = await svc.list_upcoming(
+        as_of,
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
     return PaginatedResponse(
-        items=[ReminderRead.model_validate(r) for r in items],
+        items=[ReminderRead.model_validate(r) for r in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
@@ -74,13 +91,19 @@ async def list_overdue_reminders(
     pagination: PaginationParams = Depends(),
     as_of: date = Query(default_factory=date.today),
 ) -> PaginatedResponse[ReminderRead]:
-    items, total = await svc.list_overdue(
-        as_of, offset=pagination.offset, limit=pagination.limit
+    page = await svc.list_overdue(
+        as_of,
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
     )
     return PaginatedResponse(
-        items=[ReminderRead.model_validate(r) for r in items],
+        items=[ReminderRead.model_validate(r) for r in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
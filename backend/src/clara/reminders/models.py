@@ -1,7 +1,17 @@
 import uuid
 from datetime import date, datetime
 
-from sqlalchemy import Date, DateTime, ForeignKey, Integer, String, Text, Uuid
+from sqlalchemy import (
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    Uuid,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column
 
 from clara.base.model import VaultScopedModel
@@ -9,6 +19,16 @@ from clara.base.model import VaultScopedModel
 
 class Reminder(VaultScopedModel):
     __tablename__ = "reminders"
+    __table_args__ = (
+        Index(
+            "ix_reminders_vault_id_status_next_expected_date",
+            "vault_id",
+            "status",
+            "next_expected_date",
+            postgresql_where=text("deleted_at IS NULL"),
+            sqlite_where=text("deleted_at IS NULL"),
+        ),
+    )
     contact_id: Mapped[uuid.UUID | None] = mapped_column(
         Uuid, ForeignKey("contacts.id"), nullable=True
     )
@@ -1,8 +1,7 @@
 import uuid
-from collections.abc import Sequence
 from datetime import date
 
-from clara.base.repository import BaseRepository
+from clara.base.repository import BaseRepository, Page
 from clara.reminders.models import Reminder, StayInTouchConfig
 
 
@@ -15,12 +14,14 @@ class ReminderRepository(BaseRepository[Reminder]):
         *,
         offset: int = 0,
         limit: int = 50,
-    ) -> tuple[Sequence[Reminder], int]:
+        cursor: str | None = None,
+    ) -> Page[Reminder]:
         return await self.filtered_list(
             Reminder.status == status,
             order_by=Reminder.next_expected_date.asc(),
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
 
     async def list_by_contact(
@@ -29,12 +30,14 @@ class ReminderRepository(BaseRepository[Reminder]):
         *,
         offset: int = 0,
         limit: int = 50,
-    ) -> tuple[Sequence[Reminder], int]:
+        cursor: str | None = None,
+    ) -> Page[Reminder]:
         return await self.filtered_list(
             Reminder.contact_id == contact_id,
             order_by=Reminder.next_expected_date.asc(),
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
 
     async def list_upcoming(
@@ -43,13 +46,15 @@ class ReminderRepository(BaseRepository[Reminder]):
         *,
         offset: int = 0,
         limit: int = 50,
-    ) -> tuple[Sequence[Reminder], int]:
+        cursor: str | None = None,
+    ) -> Page[Reminder]:
         return await self.filtered_list(
             Reminder.status == "active",
             Reminder.next_expected_date >= as_of,
             order_by=Reminder.next_expected_date.asc(),
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
 
     async def list_overdue(
@@ -58,13 +63,15 @@ class ReminderRepository(BaseRepository[Reminder]):
         *,
         offset: int = 0,
         limit: int = 50,
-    ) -> tuple[Sequence[Reminder], int]:
+        cursor: str | None = None,
+    ) -> Page[Reminder]:
         return await self.filtered_list(
             Reminder.status == "active",
             Reminder.next_expected_date < as_of,
             order_by=Reminder.next_expected_date.asc(),
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
 
 
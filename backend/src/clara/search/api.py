@@ -0,0 +1,37 @@
+import uuid
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from clara.deps import Db, VaultAccess
+from clara.search.repository import SearchRepository
+from clara.search.schemas import SearchHit, SearchResponse, SearchType
+from clara.search.service import SearchService
+
+router = APIRouter()
+
+
+def get_search_service(
+    vault_id: uuid.UUID, db: Db, _access: VaultAccess
+) -> SearchService:
+    repo = SearchRepository(session=db, vault_id=vault_id)
+    return SearchService(repo=repo)
+
+
+SearchSvc = Annotated[SearchService, Depends(get_search_service)]
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    svc: SearchSvc,
+    q: str = Query(..., min_length=1, max_length=200),
+    type: list[SearchType] | None = Query(None),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+) -> SearchResponse:
+    rows = await svc.search(q, types=type, offset=offset, limit=limit)
+    return SearchResponse(
+        items=[SearchHit.model_validate(r) for r in rows],
+        offset=offset,
+        limit=limit,
+    )
@@ -0,0 +1,266 @@
+"""Full-text search across contacts, notes, activities and journal entries.
+
+On PostgreSQL every source table has a generated ``search_vector`` tsvector
+column with a GIN index. The column is created by migration only, not mapped
+on the models, so ``create_all`` keeps working on SQLite. Hits are ranked with
+``ts_rank_cd`` and snippets come from ``ts_headline``, computed only for the
+returned page. Other dialects fall back to ``LIKE`` matching with a fixed rank
+and a Python-built snippet.
+
+Snippets are HTML: the indexed text is escaped and only the highlight
+``<mark>`` tags are left as markup, so clients can render them as-is.
+"""
+
+import re
+import uuid
+from collections.abc import Sequence
+from dataclasses import dataclass
+from html import escape
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Select,
+    SQLColumnExpression,
+    String,
+    and_,
+    case,
+    cast,
+    func,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from clara.activities.models import Activity
+from clara.base.model import VaultScopedModel
+from clara.base.repository import escape_like
+from clara.contacts.models import Contact
+from clara.journal.models import JournalEntry
+from clara.notes.models import Note
+
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+# ts_headline returns raw text, so it marks matches with private-use
+# characters that are swapped for the tags after escaping.
+_HEADLINE_START = "\ue000"
+_HEADLINE_STOP = "\ue001"
+_HEADLINE_OPTIONS = (
+    f"StartSel={_HEADLINE_START}, StopSel={_HEADLINE_STOP}, "
+    "MaxWords=30, MinWords=10, MaxFragments=2"
+)
+_SNIPPET_WIDTH = 160
+
+
+@dataclass(frozen=True)
+class SearchRow:
+    type: str
+    id: uuid.UUID
+    title: str
+    snippet: str
+    rank: float
+
+
+@dataclass(frozen=True)
+class _Source:
+    name: str
+    model: type[VaultScopedModel]
+    config: str
+    title: SQLColumnExpression[str]
+    document: SQLColumnExpression[str]
+
+
+def _joined(*columns: Any) -> ColumnElement[str]:
+    expr: ColumnElement[str] = func.coalesce(columns[0], "")
+    for column in columns[1:]:
+        expr = expr + " " + func.coalesce(column, "")
+    return expr
+
+
+# Must stay in sync with the generated search_vector expressions in the
+# full-text search migration.
+SOURCES: dict[str, _Source] = {
+    "contact": _Source(
+        "contact",
+        Contact,
+        "simple",
+        func.trim(_joined(Contact.first_name, Contact.last_name)),
+        _joined(
+            Contact.first_name,
+            Contact.last_name,
+            Contact.nickname,
+            Contact.notes_summary,
+        ),
+    ),
+    "note": _Source(
+        "note", Note, "english", Note.title, _joined(Note.title, Note.body_markdown)
+    ),
+    "activity": _Source(
+        "activity",
+        Activity,
+        "english",
+        Activity.title,
+        _joined(Activity.title, Activity.description, Activity.location),
+    ),
+    "journal_entry": _Source(
+        "journal_entry",
+        JournalEntry,
+        "english",
+        JournalEntry.title,
+        _joined(JournalEntry.title, JournalEntry.body_markdown),
+    ),
+}
+
+
+class SearchRepository:
+    def __init__(self, session: AsyncSession, vault_id: uuid.UUID) -> None:
+        self.session = session
+        self.vault_id = vault_id
+
+    def _scoped(self, source: _Source, *columns: Any) -> Select[tuple[Any, ...]]:
+        model = source.model
+        return (
+            select(
+                literal_column(f"'{source.name}'", String).label("type"),
+                model.id.label("id"),
+                source.title.label("title"),
+                source.document.label("document"),
+                *columns,
+            )
+            .where(model.vault_id == self.vault_id)
+            .where(model.deleted_at.is_(None))
+        )
+
+    async def search(
+        self,
+        q: str,
+        *,
+        types: Sequence[str] | None = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[SearchRow]:
+        sources = [SOURCES[t] for t in types or SOURCES]
+        if self.session.get_bind().dialect.name == "postgresql":
+            return await self._search_fulltext(q, sources, offset, limit)
+        return await self._search_like(q, sources, offset, limit)
+
+    async def _search_fulltext(
+        self, q: str, sources: list[_Source], offset: int, limit: int
+    ) -> list[SearchRow]:
+        parts = []
+        for source in sources:
+            query = func.websearch_to_tsquery(
+                literal_column(f"'{source.config}'::regconfig"), q
+            )
+            table = source.model.__tablename__
+            vector: ColumnElement[Any] = literal_column(f"{table}.search_vector")
+            parts.append(
+                self._scoped(
+                    source,
+                    literal_column(f"'{source.config}'", String).label("config"),
+                    func.ts_rank_cd(vector, query).label("rank"),
+                ).where(vector.op("@@")(query))
+            )
+        ranked = union_all(*parts).subquery()
+        page = (
+            select(ranked)
+            .order_by(ranked.c.rank.desc(), ranked.c.id)
+            .offset(offset)
+            .limit(limit)
+            .subquery()
+        )
+        regconfig = cast(page.c.config, REGCONFIG)
+        stmt = select(
+            page.c.type,
+            page.c.id,
+            page.c.title,
+            page.c.rank,
+            func.ts_headline(
+                regconfig,
+                page.c.document,
+                func.websearch_to_tsquery(regconfig, q),
+                _HEADLINE_OPTIONS,
+            ).label("snippet"),
+        ).order_by(page.c.rank.desc(), page.c.id)
+        rows = (await self.session.execute(stmt)).all()
+        return [
+            SearchRow(
+                type=r.type,
+                id=r.id,
+                title=r.title,
+                snippet=_headline_html(r.snippet),
+                rank=r.rank,
+            )
+            for r in rows
+        ]
+
+    async def _search_like(
+        self, q: str, sources: list[_Source], offset: int, limit: int
+    ) -> list[SearchRow]:
+        terms = q.split()
+        parts = []
+        for source in sources:
+            rank = case(
+                (source.title.ilike(f"%{escape_like(q)}%", escape="\\"), 1.0),
+                else_=0.5,
+            ).cast(Float)
+            matches = (
+                source.document.ilike(f"%{escape_like(t)}%", escape="\\")
+                for t in terms
+            )
+            parts.append(self._scoped(source, rank.label("rank")).where(and_(*matches)))
+        ranked = union_all(*parts).subquery()
+        stmt = (
+            select(ranked)
+            .order_by(ranked.c.rank.desc(), ranked.c.id)
+            .offset(offset)
+            .limit(limit)
+        )
+        rows = (await self.session.execute(stmt)).all()
+        return [
+            SearchRow(
+                type=r.type,
+                id=r.id,
+                title=r.title,
+                snippet=highlight(r.document, terms),
+                rank=r.rank,
+            )
+            for r in rows
+        ]
+
+
+def _headline_html(headline: str) -> str:
+    return (
+        escape(headline)
+        .replace(_HEADLINE_START, HIGHLIGHT_START)
+        .replace(_HEADLINE_STOP, HIGHLIGHT_STOP)
+    )
+
+
+def highlight(text: str, terms: Sequence[str], width: int = _SNIPPET_WIDTH) -> str:
+    """Cut a window around the first matching term and mark every match.
+
+    Returns escaped HTML, like the PostgreSQL snippets.
+    """
+    if not terms:
+        return escape(text[:width])
+    pattern = re.compile("|".join(re.escape(t) for t in terms), re.IGNORECASE)
+    first = pattern.search(text)
+    start = max(0, first.start() - width // 3) if first else 0
+    window = text[start : start + width]
+    parts: list[str] = []
+    pos = 0
+    for match in pattern.finditer(window):
+        parts.append(escape(window[pos : match.start()]))
+        parts.append(f"{HIGHLIGHT_START}{escape(match.group(0))}{HIGHLIGHT_STOP}")
+        pos = match.end()
+    parts.append(escape(window[pos:]))
+    fragment = "".join(parts)
+    if start > 0:
+        fragment = "…" + fragment
+    if start + width < len(text):
+        fragment += "…"
+    return fragment
@@ -0,0 +1,21 @@
+import uuid
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+SearchType = Literal["contact", "note", "activity", "journal_entry"]
+
+
+class SearchHit(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    type: SearchType
+    id: uuid.UUID
+    title: str
+    snippet: str
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    items: list[SearchHit]
+    offset: int
+    limit: int
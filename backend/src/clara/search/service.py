@@ -0,0 +1,21 @@
+from collections.abc import Sequence
+
+from clara.search.repository import SearchRepository, SearchRow
+
+
+class SearchService:
+    def __init__(self, repo: SearchRepository) -> None:
+        self.repo = repo
+
+    async def search(
+        self,
+        q: str,
+        *,
+        types: Sequence[str] | None = None,
+        offset: int = 0,
+        limit: int = 20,
+    ) -> list[SearchRow]:
+        q = q.strip()
+        if not q:
+            return []
+        return await self.repo.search(q, types=types, offset=offset, limit=limit)
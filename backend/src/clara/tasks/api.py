@@ -34,25 +34,39 @@ async def list_tasks(
     overdue: bool = Query(False, description="Only overdue tasks"),
 ) -> PaginatedResponse[TaskRead]:
     if overdue:
-        items, total = await svc.list_overdue(
-            offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_overdue(
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     elif status:
-        items, total = await svc.list_by_status(
-            status, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_status(
+            status,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     elif due_from and due_to:
-        items, total = await svc.list_by_due_date_range(
-            due_from, due_to, offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_by_due_date_range(
+            due_from,
+            due_to,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     else:
-        items, total = await svc.list_tasks(
-            offset=pagination.offset, limit=pagination.limit
+        page = await svc.list_tasks(
+            offset=pagination.offset,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
         )
     return PaginatedResponse(
-        items=[TaskRead.model_validate(t) for t in items],
+        items=[TaskRead.model_validate(t) for t in page.items],
         meta=PaginationMeta(
-            total=total, offset=pagination.offset, limit=pagination.limit
+            total=page.total,
+            offset=pagination.offset,
+            limit=pagination.limit,
+            next_cursor=page.next_cursor,
         ),
     )
 
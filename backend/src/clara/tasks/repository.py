@@ -1,7 +1,6 @@
-from collections.abc import Sequence
 from datetime import date
 
-from clara.base.repository import BaseRepository
+from clara.base.repository import BaseRepository, Page
 from clara.tasks.models import Task
 
 
@@ -9,26 +8,42 @@ class TaskRepository(BaseRepository[Task]):
     model = Task
 
     async def list_by_status(
-        self, status: str, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Task], int]:
+        self,
+        status: str,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Task]:
         return await self.filtered_list(
-            Task.status == status, offset=offset, limit=limit
+            Task.status == status, offset=offset, limit=limit, cursor=cursor
         )
 
     async def list_by_due_date_range(
-        self, start: date, end: date, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Task], int]:
+        self,
+        start: date,
+        end: date,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Task]:
         return await self.filtered_list(
             Task.due_date >= start,
             Task.due_date <= end,
             order_by=Task.due_date.asc(),
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
 
     async def list_overdue(
-        self, *, offset: int = 0, limit: int = 50
-    ) -> tuple[Sequence[Task], int]:
+        self,
+        *,
+        offset: int = 0,
+        limit: int = 50,
+        cursor: str | None = None,
+    ) -> Page[Task]:
         today = date.today()
         return await self.filtered_list(
             Task.due_date < today,
@@ -36,4 +51,5 @@ class TaskRepository(BaseRepository[Task]):
             order_by=Task.due_date.asc(),
             offset=offset,
             limit=limit,
+            cursor=cursor,
         )
@@ -2,6 +2,7 @@ import importlib
 import os
 import pkgutil
 from collections.abc import AsyncGenerator
+from typing import Any
 
 import pytest
 from httpx import ASGITransport, AsyncClient
@@ -20,6 +21,7 @@ os.environ.setdefault("COOKIE_SECURE", "false")
 from clara.auth.models import User, Vault, VaultMembership, VaultSettings
 from clara.auth.security import hash_password
 from clara.base.model import Base
+from clara.database import discard_after_commit, run_after_commit
 from clara.database import get_session as db_get_session
 from clara.deps import get_session as deps_get_session
 from clara.main import create_app
@@ -46,7 +48,38 @@ def fake_redis(monkeypatch: pytest.MonkeyPatch) -> None:
         def exists(self, key: str) -> int:
             return 1 if key in store else 0
 
+    class FakePipeline:
+        def __init__(self, redis: "FakeAsyncRedis") -> None:
+            self.redis = redis
+            self.calls: list[Any] = []
+
+        def exists(self, key: str) -> "FakePipeline":
+            self.calls.append(self.redis.exists(key))
+            return self
+
+        def get(self, key: str) -> "FakePipeline":
+            self.calls.append(self.redis.get(key))
+            return self
+
+        async def execute(self) -> list[Any]:
+            return [await call for call in self.calls]
+
     class FakeAsyncRedis:
+        published: list[tuple[str, str]] = []
+
+        async def get(self, key: str) -> int | str | None:
+            return store.get(key)
+
+        async def delete(self, *keys: str) -> int:
+            return sum(store.pop(key, None) is not None for key in keys)
+
+        async def publish(self, channel: str, message: str) -> int:
+            self.published.append((channel, message))
+            return 0
+
+        def pipeline(self, transaction: bool = True) -> FakePipeline:
+            return FakePipeline(self)
+
         async def incr(self, key: str) -> int:
             val = int(store.get(key, 0)) + 1
             store[key] = val
@@ -68,6 +101,18 @@ def fake_redis(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("clara.redis.get_redis", lambda: fake)
     monkeypatch.setattr("clara.redis.get_async_redis", lambda: fake_async)
     monkeypatch.setattr("clara.auth.api.get_async_redis", lambda: fake_async)
+    monkeypatch.setattr(
+        "clara.auth.context_cache.get_async_redis", lambda: fake_async
+    )
+    monkeypatch.setattr("clara.auth.pat_cache.get_async_redis", lambda: fake_async)
+
+
+@pytest.fixture(autouse=True)
+def reset_auth_caches() -> None:
+    from clara.auth import context_cache, pat_cache
+
+    pat_cache.reset()
+    context_cache.reset()
 
 
 def _import_model_modules() -> None:
@@ -113,7 +158,15 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app = create_app()
 
     async def override_get_session() -> AsyncGenerator[AsyncSession, None]:
-        yield db_session
+        # The test transaction is rolled back at the end, so the end of a
+        # request stands in for its commit.
+        try:
+            yield db_session
+        except Exception:
+            discard_after_commit(db_session)
+            raise
+        await db_session.flush()
+        await run_after_commit(db_session)
 
     app.dependency_overrides[deps_get_session] = override_get_session
     app.dependency_overrides[db_get_session] = override_get_session
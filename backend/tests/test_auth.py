@@ -1,3 +1,6 @@
+import uuid
+from datetime import UTC, datetime
+
 import pytest
 from httpx import AsyncClient
 
@@ -184,3 +187,231 @@ async def test_register_rate_limited(client: AsyncClient):
         },
     )
     assert resp.status_code == 429
+
+
+async def test_pat_verification_cached_and_revocation_evicts(
+    authenticated_client: AsyncClient,
+    vault,
+    db_session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    import clara.deps
+    from clara.auth import pat_cache
+
+    resp = await authenticated_client.post(
+        "/api/v1/auth/tokens", json={"name": "cached"}
+    )
+    token_id = resp.json()["id"]
+    token = resp.json()["token"]
+
+    calls = 0
+    real_verify = clara.deps.verify_password_async
+
+    async def counting_verify(plain: str, hashed: str) -> bool:
+        nonlocal calls
+        calls += 1
+        return await real_verify(plain, hashed)
+
+    monkeypatch.setattr(clara.deps, "verify_password_async", counting_verify)
+    pat_headers = {"Authorization": f"Bearer {token}", "Cookie": ""}
+    for _ in range(3):
+        resp = await authenticated_client.get(
+            f"/api/v1/vaults/{vault.id}/contacts", headers=pat_headers
+        )
+        assert resp.status_code == 200
+    assert calls == 1
+
+    resp = await authenticated_client.delete(f"/api/v1/auth/tokens/{token_id}")
+    assert resp.status_code == 204
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/contacts", headers=pat_headers
+    )
+    assert resp.status_code == 401
+    # Buffered usage for a deleted token is dropped without error.
+    assert await pat_cache.flush_usage(db_session) == 1
+
+
+async def test_pat_last_used_at_flushed_in_batches(
+    authenticated_client: AsyncClient, vault, db_session
+):
+    from clara.auth import pat_cache
+    from clara.auth.models import PersonalAccessToken
+
+    resp = await authenticated_client.post(
+        "/api/v1/auth/tokens", json={"name": "usage"}
+    )
+    token_id = uuid.UUID(resp.json()["id"])
+    token = resp.json()["token"]
+
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/contacts",
+        headers={"Authorization": f"Bearer {token}", "Cookie": ""},
+    )
+    assert resp.status_code == 200
+    pat = await db_session.get(PersonalAccessToken, token_id)
+    assert pat is not None and pat.last_used_at is None
+
+    assert await pat_cache.flush_usage(db_session) == 1
+    await db_session.refresh(pat)
+    assert pat.last_used_at is not None
+
+
+async def test_pat_usage_stays_buffered_until_the_flush_commits(engine):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from clara.auth import pat_cache
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    pat_cache.record_use(uuid.uuid4(), datetime.now(UTC))
+    async with factory() as session:
+        assert await pat_cache.flush_usage(session) == 1
+        await session.rollback()
+
+    assert await pat_cache.flush_pending(factory) == 1
+    assert await pat_cache.flush_pending(factory) == 0
+
+
+async def test_lifespan_flushes_pat_usage_on_shutdown(
+    engine, monkeypatch: pytest.MonkeyPatch
+):
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    import clara.database
+    from clara.auth import pat_cache
+    from clara.config import get_settings
+    from clara.main import app, lifespan
+
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    monkeypatch.setattr(clara.database, "_get_session_factory", lambda: factory)
+    monkeypatch.setattr(get_settings(), "auth_context_ttl_seconds", 0)
+
+    async with lifespan(app):
+        pat_cache.record_use(uuid.uuid4(), datetime.now(UTC))
+
+    async with factory() as session:
+        assert await pat_cache.flush_usage(session) == 0
+
+
+async def test_auth_context_cached_and_role_change_invalidates(
+    authenticated_client: AsyncClient, user, vault, db_session
+):
+    from sqlalchemy import event
+
+    from clara.auth import context_cache
+
+    url = f"/api/v1/vaults/{vault.id}/contacts"
+    assert (await authenticated_client.get(url)).status_code == 200
+
+    auth_queries: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement or "FROM vault_memberships" in statement:
+            auth_queries.append(statement)
+
+    sync_engine = db_session.bind.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", record)
+    try:
+        assert (await authenticated_client.get(url)).status_code == 200
+    finally:
+        event.remove(sync_engine, "before_cursor_execute", record)
+    assert auth_queries == []
+
+    resp = await authenticated_client.patch(
+        f"/api/v1/vaults/{vault.id}/members/{user.id}", json={"role": "owner"}
+    )
+    assert resp.status_code == 200
+    redis = context_cache.get_async_redis()
+    assert (
+        context_cache.CHANNEL,
+        f"member:{user.id}:{vault.id}",
+    ) in redis.published
+    assert context_cache._get_memberships().get((user.id, vault.id)) is None
+
+
+async def test_auth_context_invalidation_waits_for_commit(
+    authenticated_client: AsyncClient, user, vault, db_session
+):
+    from clara.auth import context_cache
+    from clara.database import discard_after_commit, run_after_commit
+
+    url = f"/api/v1/vaults/{vault.id}/contacts"
+    assert (await authenticated_client.get(url)).status_code == 200
+    key = (user.id, vault.id)
+    published = context_cache.get_async_redis().published
+    published.clear()
+
+    context_cache.invalidate_membership(db_session, user.id, vault.id)
+    assert context_cache._get_memberships().get(key) is not None
+    discard_after_commit(db_session)  # rolled back: nothing to forget
+    await run_after_commit(db_session)
+    assert context_cache._get_memberships().get(key) is not None
+    assert published == []
+
+    context_cache.invalidate_membership(db_session, user.id, vault.id)
+    await run_after_commit(db_session)
+    assert context_cache._get_memberships().get(key) is None
+    assert published == [(context_cache.CHANNEL, f"member:{user.id}:{vault.id}")]
+
+
+async def test_delete_vault_invalidates_member_contexts(
+    authenticated_client: AsyncClient, user, vault
+):
+    from clara.auth import context_cache
+
+    url = f"/api/v1/vaults/{vault.id}/contacts"
+    assert (await authenticated_client.get(url)).status_code == 200
+
+    resp = await authenticated_client.delete(f"/api/v1/vaults/{vault.id}")
+
+    assert resp.status_code == 204
+    assert context_cache._get_memberships().get((user.id, vault.id)) is None
+    assert (
+        context_cache.CHANNEL,
+        f"member:{user.id}:{vault.id}",
+    ) in context_cache.get_async_redis().published
+
+
+async def test_auth_context_listener_reconnects_after_redis_errors(monkeypatch):
+    import asyncio
+
+    from clara.auth import context_cache
+
+    user_id = uuid.uuid4()
+    sleeps: list[float] = []
+    attempts: list[str] = []
+
+    class FakePubSub:
+        async def subscribe(self, channel: str) -> None:
+            attempts.append(channel)
+            if len(attempts) <= 2:
+                raise ConnectionError("redis down")
+
+        async def listen(self):
+            yield {"type": "subscribe", "data": 1}
+            yield {"type": "message", "data": f"user:{user_id}".encode()}
+            raise ConnectionError("connection dropped")
+
+        async def aclose(self) -> None:
+            pass
+
+    class FakeRedis:
+        def pubsub(self) -> FakePubSub:
+            return FakePubSub()
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+        if len(sleeps) == 4:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(context_cache, "get_async_redis", lambda: FakeRedis())
+    monkeypatch.setattr(context_cache.asyncio, "sleep", fake_sleep)
+    evicted: list[str] = []
+    monkeypatch.setattr(context_cache, "_evict", evicted.append)
+
+    with pytest.raises(asyncio.CancelledError):
+        await context_cache.listen()
+
+    assert len(attempts) == 4
+    # Backoff doubles while down and resets once a subscribe succeeds.
+    assert sleeps == [1.0, 2.0, 1.0, 1.0]
+    assert evicted == [f"user:{user_id}", f"user:{user_id}"]
@@ -1,6 +1,10 @@
+import threading
+
 from clara.auth.security import (
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
     create_access_token,
     decode_access_token,
     encrypt_totp_secret,
@@ -14,6 +18,23 @@ def test_password_hash_verify():
     assert not verify_password("wrong", h)
 
 
+async def test_password_hash_verify_async_runs_off_loop(monkeypatch):
+    import clara.auth.security as security
+
+    threads = []
+    real_verify = security.verify_password
+
+    def spy(plain, hashed):
+        threads.append(threading.current_thread().name)
+        return real_verify(plain, hashed)
+
+    monkeypatch.setattr(security, "verify_password", spy)
+    h = await hash_password_async("secret")
+    assert await verify_password_async("secret", h)
+    assert not await verify_password_async("wrong", h)
+    assert all(name.startswith("clara-hash") for name in threads)
+
+
 def test_jwt_roundtrip(monkeypatch):
     monkeypatch.setenv("SECRET_KEY", "test")
     monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@localhost/db")
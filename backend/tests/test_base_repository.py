@@ -7,7 +7,8 @@ from sqlalchemy.orm import Mapped, mapped_column
 
 from clara.base.model import VaultScopedModel
 from clara.base.repository import BaseRepository
-from clara.exceptions import NotFoundError
+from clara.exceptions import InvalidCursorError, NotFoundError
+from clara.pagination import encode_cursor
 
 
 class FakeModel(VaultScopedModel):
@@ -169,3 +170,86 @@ async def test_filtered_list(db_session: AsyncSession):
 
     assert total == 2
     assert {i.name for i in items} == {"apple", "apricot"}
+
+
+async def test_list_cursor_pagination(db_session: AsyncSession):
+    vault_id = uuid.uuid4()
+    repo = FakeRepo(db_session, vault_id)
+    for i in range(5):
+        await repo.create(name=f"Item {i}")
+
+    first = await repo.list(limit=2)
+    assert first.total == 5
+    assert first.next_cursor is not None
+
+    second = await repo.list(limit=2, cursor=first.next_cursor)
+    assert second.total is None
+    assert len(second.items) == 2
+
+    third = await repo.list(limit=2, cursor=second.next_cursor)
+    assert len(third.items) == 1
+    assert third.next_cursor is None
+
+    offset_ids = [o.id for o in (await repo.list(limit=5)).items]
+    cursor_ids = [o.id for p in (first, second, third) for o in p.items]
+    assert cursor_ids == offset_ids
+
+
+async def test_filtered_list_cursor_uses_custom_order(db_session: AsyncSession):
+    vault_id = uuid.uuid4()
+    repo = FakeRepo(db_session, vault_id)
+    for name in ("d", "b", "a", "c"):
+        await repo.create(name=name)
+
+    first = await repo.filtered_list(order_by=FakeModel.name.asc(), limit=2)
+    second = await repo.filtered_list(
+        order_by=FakeModel.name.asc(), limit=2, cursor=first.next_cursor
+    )
+
+    assert [o.name for o in first.items] == ["a", "b"]
+    assert [o.name for o in second.items] == ["c", "d"]
+    assert second.next_cursor is None
+
+
+async def test_cursor_survives_purged_boundary_row(db_session: AsyncSession):
+    repo = FakeRepo(db_session, uuid.uuid4())
+    for name in ("a", "b", "c", "d"):
+        await repo.create(name=name)
+    order = FakeModel.name.asc()
+    first = await repo.filtered_list(order_by=order, limit=2)
+
+    await db_session.delete(first.items[-1])
+    await db_session.flush()
+    second = await repo.filtered_list(
+        order_by=order, limit=2, cursor=first.next_cursor
+    )
+
+    assert [o.name for o in second.items] == ["c", "d"]
+
+
+async def test_cursor_boundary_is_read_from_own_vault_only(db_session: AsyncSession):
+    repo = FakeRepo(db_session, uuid.uuid4())
+    for name in ("a", "b", "c"):
+        await repo.create(name=name)
+    other = await FakeRepo(db_session, uuid.uuid4()).create(name="zzz")
+    other.id = uuid.UUID(int=2**128 - 1)
+    await db_session.flush()
+
+    cursor = encode_cursor("name", "a", other.id)
+    page = await repo.filtered_list(order_by=FakeModel.name.asc(), cursor=cursor)
+
+    assert [o.name for o in page.items] == ["b", "c"]
+
+
+async def test_cursor_from_other_sort_rejected(db_session: AsyncSession):
+    repo = FakeRepo(db_session, uuid.uuid4())
+    for i in range(3):
+        await repo.create(name=f"Item {i}")
+    page = await repo.list(limit=1)
+
+    with pytest.raises(InvalidCursorError):
+        await repo.filtered_list(
+            order_by=FakeModel.name.asc(), cursor=page.next_cursor
+        )
+    with pytest.raises(InvalidCursorError):
+        await repo.list(cursor="not-a-cursor")
@@ -2,8 +2,17 @@ import uuid
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
 from clara.auth.models import PersonalAccessToken
-from clara.jobs.cleanup import cleanup_expired_tokens
+from clara.base.model import Base
+from clara.imports.models import ContactImport
+from clara.jobs.cleanup import (
+    _fail_stale_imports,
+    _load_models,
+    cleanup_expired_tokens,
+)
 
 
 def _make_session_with_tokens(tokens: list[PersonalAccessToken]) -> MagicMock:
@@ -57,3 +66,40 @@ def test_session_closed_on_error(mock_get_session):
         pass
 
     session.close.assert_called_once()
+
+
+def test_stalled_imports_fail_and_failed_uploads_are_listed():
+    _load_models()
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    now = datetime.now(UTC)
+
+    def job(status: str, age: timedelta) -> ContactImport:
+        return ContactImport(
+            vault_id=uuid.uuid4(),
+            requested_by=uuid.uuid4(),
+            format="csv",
+            filename="people.csv",
+            storage_key=f"imports/{status}-{age.total_seconds():.0f}.csv",
+            status=status,
+            size_bytes=1,
+            updated_at=now - age,
+        )
+
+    with Session(engine) as session:
+        stalled = job("running", timedelta(hours=2))
+        fresh = job("queued", timedelta(minutes=1))
+        failed = job("failed", timedelta(minutes=1))
+        done = job("complete", timedelta(hours=2))
+        session.add_all([stalled, fresh, failed, done])
+        session.commit()
+
+        uploads = _fail_stale_imports(session, now)
+        session.commit()
+
+        assert sorted(uploads) == sorted([stalled.storage_key, failed.storage_key])
+        session.refresh(stalled)
+        session.refresh(fresh)
+        assert stalled.status == "failed"
+        assert stalled.error == "Import stalled; upload the file again"
+        assert fresh.status == "queued"
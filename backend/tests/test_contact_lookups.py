@@ -0,0 +1,118 @@
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from clara.contacts.lookups import VaultLookups
+from clara.contacts.models import Contact, ContactRelationship, RelationshipType, Tag
+
+
+@contextmanager
+def _record_selects(session: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def before_execute(conn, cursor, statement, params, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append(statement)
+
+    bind = session.get_bind()
+    event.listen(bind, "before_cursor_execute", before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", before_execute)
+
+
+async def test_tags_load_once_and_create_missing_once(db_session: AsyncSession):
+    vault_id = uuid.uuid4()
+    db_session.add(Tag(vault_id=vault_id, name="friends"))
+    db_session.add(Tag(vault_id=uuid.uuid4(), name="work"))
+    await db_session.flush()
+
+    def run(session: Session) -> None:
+        lookups = VaultLookups(session, vault_id)
+        contacts = [
+            Contact(vault_id=vault_id, first_name=f"C{i}", tags=[]) for i in range(3)
+        ]
+        session.add_all(contacts)
+        with _record_selects(session) as selects:
+            for contact in contacts:
+                contact.tags.append(lookups.tag("friends"))
+                contact.tags.append(lookups.tag("work"))
+            session.flush()
+        assert len(selects) == 1
+        assert lookups.tag("work") is contacts[0].tags[1]
+
+    await db_session.run_sync(run)
+
+    names = (
+        await db_session.scalars(select(Tag.name).where(Tag.vault_id == vault_id))
+    ).all()
+    assert sorted(names) == ["friends", "work"]
+
+
+async def test_contact_index_follows_renames_and_deletes(db_session: AsyncSession):
+    vault_id = uuid.uuid4()
+    ann = Contact(vault_id=vault_id, first_name="Ann", last_name="Lee")
+    gone = Contact(
+        vault_id=vault_id, first_name="Old", last_name="Friend",
+        deleted_at=datetime.now(UTC),
+    )
+    db_session.add_all([ann, gone])
+    await db_session.flush()
+
+    def run(session: Session) -> None:
+        lookups = VaultLookups(session, vault_id)
+        assert lookups.contact_id("Ann", "Lee") == ann.id
+        assert lookups.contact_id("Old", "Friend") is None
+
+        bob = Contact(vault_id=vault_id, first_name="Bob", last_name="")
+        session.add(bob)
+        session.flush()
+        lookups.note_contact(bob)
+        assert lookups.contact_id("Bob", "") == bob.id
+
+        ann.last_name = "Park"
+        lookups.note_contact(ann)
+        assert lookups.contact_id("Ann", "Lee") is None
+        assert lookups.contact_id("Ann", "Park") == ann.id
+
+        bob.deleted_at = datetime.now(UTC)
+        lookups.note_contact(bob)
+        assert lookups.contact_id("Bob", "") is None
+
+    await db_session.run_sync(run)
+
+
+async def test_new_relationship_type_is_usable_before_flush(db_session: AsyncSession):
+    vault_id = uuid.uuid4()
+    ann = Contact(vault_id=vault_id, first_name="Ann")
+    ben = Contact(vault_id=vault_id, first_name="Ben")
+    db_session.add_all([ann, ben])
+    await db_session.flush()
+
+    def run(session: Session) -> None:
+        lookups = VaultLookups(session, vault_id)
+        rel_type = lookups.relationship_type("sibling")
+        assert lookups.relationship_type("sibling") is rel_type
+        session.add(
+            ContactRelationship(
+                vault_id=vault_id,
+                contact_id=ann.id,
+                other_contact_id=ben.id,
+                relationship_type_id=rel_type.id,
+            )
+        )
+        session.flush()
+
+    await db_session.run_sync(run)
+
+    rel = await db_session.scalar(
+        select(ContactRelationship).where(ContactRelationship.contact_id == ann.id)
+    )
+    rel_type = await db_session.get(RelationshipType, rel.relationship_type_id)
+    assert rel_type.name == "sibling"
@@ -213,3 +213,64 @@ async def test_contacts_sorting_by_created_at(
     items = resp.json()["items"]
     dates = [item["created_at"] for item in items]
     assert dates == sorted(dates, reverse=True)
+
+
+async def test_list_contacts_cursor(authenticated_client: AsyncClient, vault: Vault):
+    for name in ("Ann", "Ben", "Cat"):
+        await authenticated_client.post(
+            f"/api/v1/vaults/{vault.id}/contacts", json={"first_name": name}
+        )
+    url = f"/api/v1/vaults/{vault.id}/contacts"
+
+    first = (await authenticated_client.get(f"{url}?limit=2")).json()
+    assert first["meta"]["total"] == 3
+    cursor = first["meta"]["next_cursor"]
+    assert cursor
+
+    second = (
+        await authenticated_client.get(url, params={"limit": 2, "cursor": cursor})
+    ).json()
+    assert second["meta"]["total"] is None
+    assert second["meta"]["next_cursor"] is None
+    names = {c["first_name"] for c in first["items"] + second["items"]}
+    assert names == {"Ann", "Ben", "Cat"}
+
+
+async def test_list_contacts_invalid_cursor(
+    authenticated_client: AsyncClient, vault: Vault
+):
+    response = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/contacts?cursor=garbage"
+    )
+    assert response.status_code == 400
+
+
+async def test_suggest_contacts(authenticated_client: AsyncClient, vault: Vault):
+    base = f"/api/v1/vaults/{vault.id}/contacts"
+    ada = (await authenticated_client.post(
+        base, json={"first_name": "Ada", "last_name": "Lovelace"}
+    )).json()["id"]
+    grace = (await authenticated_client.post(
+        base, json={"first_name": "Grace", "last_name": "Hopper"}
+    )).json()["id"]
+    resp = await authenticated_client.post(
+        f"{base}/{grace}/methods",
+        json={"type": "email", "value": "amazing.grace@example.com"},
+    )
+    assert resp.status_code == 201
+
+    resp = await authenticated_client.get(f"{base}/suggest", params={"q": "ada"})
+    assert resp.status_code == 200
+    assert resp.json() == [
+        {"id": ada, "display_name": "Ada Lovelace", "photo_file_id": None}
+    ]
+
+    resp = await authenticated_client.get(f"{base}/suggest", params={"q": "amazing"})
+    assert [s["id"] for s in resp.json()] == [grace]
+
+    resp = await authenticated_client.get(f"{base}/suggest", params={"q": "%"})
+    assert resp.json() == []
+
+    await authenticated_client.post(base, json={"first_name": "Cher"})
+    resp = await authenticated_client.get(f"{base}/suggest", params={"q": "cher"})
+    assert [s["display_name"] for s in resp.json()] == ["Cher"]
@@ -64,3 +64,29 @@ async def test_roundtrip(db_session: AsyncSession):
     imported_names = {(c.first_name, c.last_name) for c in imported}
     assert ("Alice", "Smith") in imported_names
     assert ("Bob", "Jones") in imported_names
+
+
+async def test_export_csv_streams_in_batches(
+    authenticated_client, vault, db_session: AsyncSession, monkeypatch
+):
+    from clara.base.repository import BaseRepository
+
+    repo = ContactRepository(session=db_session, vault_id=vault.id)
+    for i in range(5):
+        await repo.create(first_name=f"Person{i}", last_name="Batch")
+    batches = [len(b) async for b in repo.stream(batch_size=2)]
+    assert batches == [2, 2, 1]
+
+    real_stream = BaseRepository.stream
+
+    def small_batches(self, *options, batch_size=2):
+        return real_stream(self, *options, batch_size=batch_size)
+
+    monkeypatch.setattr(BaseRepository, "stream", small_batches)
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/export/csv"
+    )
+    assert resp.status_code == 200
+    assert "content-length" not in resp.headers
+    rows = list(csv.DictReader(io.StringIO(resp.text)))
+    assert sorted(r["first_name"] for r in rows) == [f"Person{i}" for i in range(5)]
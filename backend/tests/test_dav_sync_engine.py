@@ -10,9 +10,24 @@ from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-from clara.dav_sync.client import DavResource
+import pytest
+
+from clara.dav_sync.client import (
+    DavChanges,
+    DavClient,
+    DavResource,
+    SyncTokenInvalid,
+    normalize_etag,
+    scan_etags,
+    scan_uid,
+)
 from clara.dav_sync.models import DavSyncMapping
-from clara.dav_sync.sync_engine import sync_entity_type
+from clara.dav_sync.sync_engine import (
+    WATERMARK_OVERLAP,
+    fetch_remote_changes,
+    route_changes,
+    sync_entity_type,
+)
 
 VAULT_ID = uuid.uuid4()
 ACCOUNT_ID = uuid.uuid4()
@@ -36,11 +51,23 @@ def _make_account(**overrides):
         caldav_enabled=False,
         carddav_path="/dav/addressbook",
         caldav_path=None,
+        sync_token_card=None,
+        sync_token_cal=None,
+        local_watermarks={},
     )
     defaults.update(overrides)
     return SimpleNamespace(**defaults)
 
 
+def _serve(client, resources):
+    """Make a mock client list ``resources`` via etag listing + multiget."""
+    client.get_sync_token.return_value = None
+    client.list_etags.return_value = {r.href: r.etag for r in resources}
+    client.multiget.side_effect = lambda path, hrefs, kind: [
+        r for r in resources if r.href in hrefs
+    ]
+
+
 def _make_contact(contact_id=None, deleted_at=None, updated_at=None):
     return SimpleNamespace(
         id=contact_id or uuid.uuid4(),
@@ -70,9 +97,13 @@ def _mock_session(mappings, contacts):
 
     from clara.contacts.models import Contact
 
-    def query_side_effect(model_cls):
+    def query_side_effect(model_cls, *columns):
         chain = MagicMock()
-        if model_cls is DavSyncMapping:
+        if columns:  # (remote_href, remote_etag) rows for the etag listing
+            chain.filter.return_value.all.return_value = [
+                (m.remote_href, m.remote_etag) for m in mappings
+            ]
+        elif model_cls is DavSyncMapping:
             chain.filter.return_value.all.return_value = mappings
         elif model_cls is Contact:
             chain.filter.return_value.all.return_value = contacts
@@ -94,7 +125,7 @@ def test_new_remote_creates_local_entity(mock_create):
         uid="new-remote-uid", href="/dav/ab/new.vcf", etag="e1", data=VCARD_DATA
     )
     client = MagicMock()
-    client.list_vcards.return_value = [remote]
+    _serve(client, [remote])
 
     account = _make_account()
     session = _mock_session(mappings=[], contacts=[])
@@ -117,29 +148,60 @@ def test_new_remote_creates_local_entity(mock_create):
 # -- NEW_LOCAL: local entity with no mapping → pushes to remote --
 
 
-@patch("clara.dav_sync.sync_engine._push_local_to_remote")
-def test_new_local_pushes_to_remote(mock_push):
+@patch("clara.dav_sync.sync_engine._render_local")
+def test_new_local_pushes_to_remote(mock_render):
     """Local contact not in mappings → classified NEW_LOCAL, pushed to remote."""
     contact = _make_contact()
     client = MagicMock()
-    client.list_vcards.return_value = []
+    _serve(client, [])
+    client.put_vcard.return_value = "e-pushed"
 
     account = _make_account()
     session = _mock_session(mappings=[], contacts=[contact])
 
-    pushed = DavResource(
-        uid=str(contact.id), href="/dav/ab/x.vcf", etag="e-pushed", data=""
+    mock_render.return_value = DavResource(
+        uid=str(contact.id), href="/dav/ab/x.vcf", etag=None, data="BEGIN:VCARD"
     )
-    mock_push.return_value = pushed
 
     counts = sync_entity_type(session, client, account, "contact")
 
     assert counts.get("new_local") == 1
-    mock_push.assert_called_once()
+    mock_render.assert_called_once()
+    client.put_vcard.assert_called_once_with(
+        "/dav/addressbook", str(contact.id), "BEGIN:VCARD"
+    )
     session.add.assert_called()
     added = session.add.call_args[0][0]
     assert isinstance(added, DavSyncMapping)
     assert added.local_id == contact.id
+    assert added.remote_etag == "e-pushed"
+
+
+@patch("clara.dav_sync.sync_engine._render_local")
+def test_new_local_writes_are_sent_concurrently(mock_render):
+    """Several pushes go through the bounded pool; failures are isolated."""
+    contacts = [_make_contact() for _ in range(5)]
+    client = MagicMock()
+    client.max_concurrency = 3
+    _serve(client, [])
+    mock_render.side_effect = lambda account, entity_type, entity: DavResource(
+        uid=str(entity.id), href=f"/dav/ab/{entity.id}.vcf", etag=None, data=""
+    )
+
+    def put(path, uid, text):
+        if uid == str(contacts[0].id):
+            raise RuntimeError("412 Precondition Failed")
+        return f"etag-{uid}"
+
+    client.put_vcard.side_effect = put
+    session = _mock_session(mappings=[], contacts=contacts)
+
+    counts = sync_entity_type(session, client, _make_account(), "contact")
+
+    assert counts == {"new_local": 4}
+    added = [c.args[0] for c in session.add.call_args_list]
+    assert {m.local_id for m in added} == {c.id for c in contacts[1:]}
+    assert all(m.remote_etag == f"etag-{m.local_id}" for m in added)
 
 
 # -- UNCHANGED: mapping exists, etag same, local not changed --
@@ -158,7 +220,7 @@ def test_unchanged_no_action():
     )
 
     client = MagicMock()
-    client.list_vcards.return_value = [remote]
+    _serve(client, [remote])
 
     account = _make_account()
     session = _mock_session(mappings=[mapping], contacts=[contact])
@@ -183,7 +245,7 @@ def test_deleted_remote_soft_deletes_local():
 
     # Remote list does NOT include this UID
     client = MagicMock()
-    client.list_vcards.return_value = []
+    _serve(client, [])
 
     account = _make_account()
     session = _mock_session(mappings=[mapping], contacts=[contact])
@@ -194,3 +256,395 @@ def test_deleted_remote_soft_deletes_local():
     # Local entity and mapping should be soft-deleted
     assert contact.deleted_at is not None
     assert mapping.deleted_at is not None
+
+
+# -- Incremental sync (RFC 6578 sync-collection) --
+
+
+def test_delta_keeps_unlisted_mappings_and_applies_deletions():
+    """Mappings absent from a delta are unchanged unless their href was removed."""
+    kept, gone = _make_contact(), _make_contact()
+    kept_mapping = _make_mapping(kept.id, "kept-uid")
+    gone_mapping = _make_mapping(gone.id, "gone-uid")
+    client = MagicMock()
+    changes = DavChanges(
+        resources=[],
+        deleted_hrefs={"https://dav.example.com/dav/addressbook/gone-uid.vcf"},
+        sync_token="tok-2",
+    )
+    session = _mock_session([kept_mapping, gone_mapping], [kept, gone])
+
+    counts = sync_entity_type(session, client, _make_account(), "contact", changes)
+
+    assert counts == {"unchanged": 1, "deleted_remote": 1}
+    assert kept.deleted_at is None
+    assert gone.deleted_at is not None
+    client.list_etags.assert_not_called()
+
+
+@patch("clara.dav_sync.sync_engine._render_local")
+def test_delta_pushes_local_change_of_unlisted_mapping(mock_render):
+    contact = _make_contact(updated_at=NOW)
+    mapping = _make_mapping(contact.id, "uid-1", local_updated_at=PAST)
+    mock_render.return_value = DavResource(
+        uid="uid-1", href="/dav/addressbook/uid-1.vcf", etag=None, data=""
+    )
+    client = MagicMock()
+    client.put_vcard.return_value = "etag-2"
+    session = _mock_session([mapping], [contact])
+
+    counts = sync_entity_type(
+        session, client, _make_account(), "contact", DavChanges(resources=[])
+    )
+
+    assert counts == {"updated_local": 1}
+    assert mapping.remote_etag == "etag-2"
+
+
+def test_fetch_falls_back_to_etag_listing_on_invalid_token():
+    client = MagicMock()
+    client.sync_collection.side_effect = SyncTokenInvalid("/dav/addressbook")
+    _serve(client, [])
+    client.get_sync_token.return_value = "tok-new"
+    account = _make_account(sync_token_card="tok-old")
+
+    changes = fetch_remote_changes(_mock_session([], []), client, account, "card")
+
+    assert changes is not None
+    assert changes.sync_token == "tok-new"
+    client.sync_collection.assert_called_once_with(
+        "/dav/addressbook", "tok-old", "card"
+    )
+    client.list_etags.assert_called_once_with("/dav/addressbook")
+    client.list_vcards.assert_not_called()
+
+
+def test_etag_listing_multigets_only_changed_members():
+    """Unchanged etags are not fetched; mapped hrefs missing from the listing are
+    reported deleted."""
+    same, edited, gone = (_make_contact() for _ in range(3))
+    mappings = [
+        _make_mapping(same.id, "same-uid"),
+        _make_mapping(edited.id, "edited-uid"),
+        _make_mapping(gone.id, "gone-uid"),
+    ]
+    client = MagicMock()
+    _serve(
+        client,
+        [
+            DavResource("same-uid", "/dav/addressbook/same-uid.vcf", "etag-1", ""),
+            DavResource("edited-uid", "/dav/addressbook/edited-uid.vcf", "etag-2", ""),
+            DavResource("new-uid", "/dav/addressbook/new-uid.vcf", "etag-1", ""),
+        ],
+    )
+
+    changes = fetch_remote_changes(
+        _mock_session(mappings, []), client, _make_account(), "card"
+    )
+
+    assert changes is not None
+    client.multiget.assert_called_once_with(
+        "/dav/addressbook",
+        ["/dav/addressbook/edited-uid.vcf", "/dav/addressbook/new-uid.vcf"],
+        "card",
+    )
+    assert {r.uid for r in changes.resources} == {"edited-uid", "new-uid"}
+    assert changes.deleted_hrefs == {"/dav/addressbook/gone-uid.vcf"}
+
+
+def test_fetch_uses_sync_collection_with_stored_token():
+    client = MagicMock()
+    delta = DavChanges(resources=[], sync_token="tok-2")
+    client.sync_collection.return_value = delta
+    account = _make_account(sync_token_card="tok-1")
+
+    session = _mock_session([], [])
+    assert fetch_remote_changes(session, client, account, "card") is delta
+    client.list_etags.assert_not_called()
+
+
+SYNC_RESPONSE = f"""<?xml version="1.0" encoding="utf-8"?>
+<D:multistatus xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">
+  <D:response>
+    <D:href>/dav/addressbook/remote-uid-1.vcf</D:href>
+    <D:propstat>
+      <D:prop>
+        <D:getetag>"etag-9"</D:getetag>
+        <C:address-data>{VCARD_DATA}</C:address-data>
+      </D:prop>
+      <D:status>HTTP/1.1 200 OK</D:status>
+    </D:propstat>
+  </D:response>
+  <D:response>
+    <D:href>/dav/addressbook/old.vcf</D:href>
+    <D:status>HTTP/1.1 404 Not Found</D:status>
+  </D:response>
+  <D:sync-token>http://example.com/sync/2</D:sync-token>
+</D:multistatus>"""
+
+
+@patch("clara.dav_sync.client.requests.Session.request")
+def test_client_sync_collection_parses_changes_and_deletions(mock_request):
+    mock_request.return_value = MagicMock(status_code=207, text=SYNC_RESPONSE)
+    client = DavClient("https://dav.example.com", "u", "p")
+
+    changes = client.sync_collection("/dav/addressbook", "tok-1", "card")
+
+    assert [(r.uid, r.etag) for r in changes.resources] == [("remote-uid-1", "etag-9")]
+    assert changes.deleted_hrefs == {"https://dav.example.com/dav/addressbook/old.vcf"}
+    assert changes.sync_token == "http://example.com/sync/2"
+    assert not changes.complete
+    body = mock_request.call_args.kwargs["data"]
+    assert b"<D:sync-token>tok-1</D:sync-token>" in body
+
+
+@patch("clara.dav_sync.client.requests.Session.request")
+def test_client_sync_collection_rejects_invalid_token(mock_request):
+    mock_request.return_value = MagicMock(
+        status_code=403,
+        text='<D:error xmlns:D="DAV:"><D:valid-sync-token/></D:error>',
+    )
+    client = DavClient("https://dav.example.com", "u", "p")
+
+    with pytest.raises(SyncTokenInvalid):
+        client.sync_collection("/dav/addressbook", "stale", "card")
+
+
+MULTIGET_RESPONSE = f"""<?xml version="1.0" encoding="utf-8"?>
+<D:multistatus xmlns:D="DAV:" xmlns:C="urn:ietf:params:xml:ns:carddav">
+  <D:response>
+    <D:href>/dav/addressbook/remote-uid-1.vcf</D:href>
+    <D:propstat>
+      <D:prop>
+        <D:getetag>"etag-9"</D:getetag>
+        <C:address-data>{VCARD_DATA}</C:address-data>
+      </D:prop>
+      <D:status>HTTP/1.1 200 OK</D:status>
+    </D:propstat>
+  </D:response>
+  <D:response>
+    <D:href>/dav/addressbook/vanished.vcf</D:href>
+    <D:status>HTTP/1.1 404 Not Found</D:status>
+  </D:response>
+</D:multistatus>"""
+
+
+@patch("clara.dav_sync.client.MULTIGET_BATCH_SIZE", 1)
+@patch("clara.dav_sync.client.requests.Session.request")
+def test_client_multiget_batches_hrefs(mock_request):
+    mock_request.return_value = MagicMock(status_code=207, text=MULTIGET_RESPONSE)
+    client = DavClient("https://dav.example.com", "u", "p")
+
+    resources = client.multiget(
+        "/dav/addressbook",
+        [
+            "https://dav.example.com/dav/addressbook/remote-uid-1.vcf",
+            "https://dav.example.com/dav/addressbook/vanished.vcf",
+        ],
+        "card",
+    )
+
+    assert mock_request.call_count == 2
+    first_body = mock_request.call_args_list[0].kwargs["data"]
+    assert b"<D:href>/dav/addressbook/remote-uid-1.vcf</D:href>" in first_body
+    assert b"addressbook-multiget" in first_body
+    assert [r.uid for r in resources] == ["remote-uid-1", "remote-uid-1"]
+
+
+# -- Calendar routing: one listing, parsed once, split by entity type --
+
+
+def _ical(uid, component, extra=""):
+    return (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:-//test//EN\r\n"
+        f"BEGIN:{component}\r\nUID:{uid}\r\nSUMMARY:{uid}\r\n{extra}"
+        f"END:{component}\r\nEND:VCALENDAR\r\n"
+    )
+
+
+def test_route_changes_splits_calendar_components():
+    resources = [
+        DavResource("event", "/cal/event.ics", "e", _ical("event", "VEVENT")),
+        DavResource("todo", "/cal/todo.ics", "e", _ical("todo", "VTODO")),
+        DavResource(
+            "weekly", "/cal/weekly.ics", "e",
+            _ical("weekly", "VTODO", "RRULE:FREQ=WEEKLY\r\n"),
+        ),
+        # Already synced as a task: gaining an RRULE must not re-route it.
+        DavResource(
+            "mapped", "/cal/mapped.ics", "e",
+            _ical("mapped", "VTODO", "RRULE:FREQ=DAILY\r\n"),
+        ),
+        DavResource("broken", "/cal/broken.ics", "e", "not ical"),
+    ]
+    session = MagicMock()
+    session.query.return_value.filter.return_value.all.return_value = [
+        ("mapped", "task")
+    ]
+    changes = DavChanges(resources=resources, deleted_hrefs={"/cal/x.ics"})
+
+    routed = route_changes(session, _make_account(), "cal", changes)
+
+    assert {t: [r.uid for r in c.resources] for t, c in routed.items()} == {
+        "activity": ["event"],
+        "task": ["todo", "mapped"],
+        "reminder": ["weekly"],
+    }
+    assert routed["task"].deleted_hrefs == {"/cal/x.ics"}
+    assert routed["activity"].resources[0].component.name == "VEVENT"
+
+
+def test_route_changes_passes_addressbook_through():
+    changes = DavChanges(resources=[])
+
+    assert route_changes(MagicMock(), _make_account(), "card", changes) == {
+        "contact": changes
+    }
+
+
+def test_client_pools_connections_and_shares_write_slots():
+    first = DavClient("https://pool.example.com", "u", "p", max_concurrency=2)
+    second = DavClient("https://pool.example.com/other", "v", "q")
+
+    adapter = first._http.get_adapter("https://pool.example.com/dav")
+    assert adapter.max_retries.total == 3
+    assert "PUT" in adapter.max_retries.allowed_methods
+    # Both accounts live on one server, so they share its write limit.
+    assert first._slots is second._slots
+
+
+@patch("clara.dav_sync.client.requests.Session.request")
+def test_client_stores_etags_unquoted_and_requotes_if_match(mock_request):
+    mock_request.return_value = MagicMock(
+        status_code=201, headers={"ETag": '"etag-3"'}
+    )
+    client = DavClient("https://dav.example.com", "u", "p")
+
+    etag = client.put_event("/cal", "uid-1", "BEGIN:VCALENDAR", etag="etag-2")
+    client.delete_event("/cal/uid-1.ics", etag)
+    client.delete_vcard("/ab/uid-2.vcf", "W/weak")
+
+    # Same form as listings report, so the next run sees it as unchanged.
+    assert etag == "etag-3"
+    put, delete, weak = mock_request.call_args_list
+    assert put.kwargs["headers"]["If-Match"] == '"etag-2"'
+    assert delete.kwargs["headers"] == {"If-Match": '"etag-3"'}
+    assert weak.kwargs["headers"] == {}
+
+
+@pytest.mark.parametrize(
+    ("raw", "stored"),
+    [('"abc"', "abc"), ("abc", "abc"), (' W/"abc" ', "W/abc"), ('""', None)],
+)
+def test_normalize_etag(raw, stored):
+    assert normalize_etag(raw) == stored
+
+
+# -- Parse-once resources and listing pre-scans --
+
+
+@pytest.mark.parametrize(
+    ("text", "uid"),
+    [
+        (VCARD_DATA, "remote-uid-1"),
+        (
+            "BEGIN:VCARD\r\nUID;VALUE=text:urn:uuid:12\r\n 34\r\nEND:VCARD",
+            "urn:uuid:1234",
+        ),
+        ("BEGIN:VCARD\nuid:a\\,b\nEND:VCARD", "a,b"),
+        (
+            "BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nBEGIN:VALARM\r\nUID:alarm\r\n"
+            "END:VALARM\r\nUID:event-1\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n",
+            "event-1",
+        ),
+        ("BEGIN:VCARD\r\nFN:No Uid\r\nEND:VCARD", None),
+    ],
+)
+def test_scan_uid(text, uid):
+    assert scan_uid(text) == uid
+
+
+def test_scan_etags_reads_any_prefix_and_unescapes():
+    xml = """<?xml version="1.0"?>
+<d:multistatus xmlns:d="DAV:">
+  <d:response><d:href>/ab/</d:href><d:propstat><d:prop><d:getetag/></d:prop>
+    <d:status>HTTP/1.1 404 Not Found</d:status></d:propstat></d:response>
+  <d:response><d:href>/ab/a%20b.vcf?x=1&amp;y=2</d:href><d:propstat><d:prop>
+    <d:getetag>&quot;e-1&quot;</d:getetag></d:prop></d:propstat></d:response>
+  <response xmlns="DAV:"><href>/ab/c.vcf</href><propstat><prop>
+    <getetag>"e-2"</getetag></prop></propstat></response>
+</d:multistatus>"""
+
+    assert scan_etags(xml) == [
+        ("/ab/", None),
+        ("/ab/a%20b.vcf?x=1&y=2", "e-1"),
+        ("/ab/c.vcf", "e-2"),
+    ]
+
+
+def test_resource_parses_data_once():
+    resource = DavResource("remote-uid-1", "/ab/1.vcf", "e", VCARD_DATA)
+
+    with patch("clara.dav_sync.client.vobject.readOne") as read_one:
+        first = resource.vcard
+        assert resource.vcard is first
+    read_one.assert_called_once_with(VCARD_DATA)
+
+
+# -- Watermark-scoped local loading --
+
+
+def test_clean_run_advances_watermark():
+    account = _make_account()
+    before = datetime.now(UTC)
+
+    sync_entity_type(
+        _mock_session([], []), MagicMock(), account, "contact", DavChanges([])
+    )
+
+    stored = datetime.fromisoformat(account.local_watermarks["contact"])
+    assert before - WATERMARK_OVERLAP <= stored <= datetime.now(UTC)
+
+
+@patch("clara.dav_sync.sync_engine._render_local")
+def test_watermark_scopes_local_query_and_skips_untouched_mappings(mock_render):
+    from clara.dav_sync import sync_engine
+
+    quiet = _make_contact()
+    gone = _make_contact()
+    fresh = _make_contact()
+    mappings = [_make_mapping(quiet.id, "quiet-uid"), _make_mapping(gone.id, "gone")]
+    # Only rows the scoped query would return: the new one and the one the
+    # remote deleted. ``quiet`` is neither changed nor touched remotely.
+    session = _mock_session(mappings, [fresh, gone])
+    mock_render.return_value = DavResource(str(fresh.id), "/ab/f.vcf", None, "")
+    client = MagicMock()
+    client.put_vcard.return_value = "etag-f"
+    account = _make_account(local_watermarks={"contact": PAST.isoformat()})
+    changes = DavChanges([], deleted_hrefs={"/dav/addressbook/gone.vcf"})
+
+    with patch.object(
+        sync_engine, "_load_local_entities", wraps=sync_engine._load_local_entities
+    ) as load:
+        counts = sync_entity_type(session, client, account, "contact", changes)
+
+    _, _, _, watermark, ids = load.call_args.args
+    assert watermark == PAST
+    assert ids == {gone.id}
+    assert counts == {"deleted_remote": 1, "new_local": 1}
+    assert quiet.deleted_at is None
+    assert datetime.fromisoformat(account.local_watermarks["contact"]) > PAST
+
+
+@patch("clara.dav_sync.sync_engine._render_local")
+def test_failed_item_keeps_watermark(mock_render):
+    contact = _make_contact()
+    mock_render.side_effect = RuntimeError("converter failed")
+    account = _make_account(local_watermarks={"contact": PAST.isoformat()})
+
+    counts = sync_entity_type(
+        _mock_session([], [contact]), MagicMock(), account, "contact", DavChanges([])
+    )
+
+    assert counts == {}
+    assert account.local_watermarks == {"contact": PAST.isoformat()}
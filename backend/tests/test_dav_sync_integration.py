@@ -37,11 +37,23 @@ def _make_account(**overrides):
         caldav_enabled=False,
         carddav_path="/dav/addressbook",
         caldav_path=None,
+        sync_token_card=None,
+        sync_token_cal=None,
+        local_watermarks={},
     )
     defaults.update(overrides)
     return SimpleNamespace(**defaults)
 
 
+def _serve(client, resources):
+    """Make a mock client list ``resources`` via etag listing + multiget."""
+    client.get_sync_token.return_value = None
+    client.list_etags.return_value = {r.href: r.etag for r in resources}
+    client.multiget.side_effect = lambda path, hrefs, kind: [
+        r for r in resources if r.href in hrefs
+    ]
+
+
 def _make_contact(contact_id=None, deleted_at=None, updated_at=None):
     return SimpleNamespace(
         id=contact_id or uuid.uuid4(),
@@ -71,9 +83,13 @@ def _mock_session(mappings, contacts):
 
     from clara.contacts.models import Contact
 
-    def query_side_effect(model_cls):
+    def query_side_effect(model_cls, *columns):
         chain = MagicMock()
-        if model_cls is DavSyncMapping:
+        if columns:  # (remote_href, remote_etag) rows for the etag listing
+            chain.filter.return_value.all.return_value = [
+                (m.remote_href, m.remote_etag) for m in mappings
+            ]
+        elif model_cls is DavSyncMapping:
             chain.filter.return_value.all.return_value = mappings
         elif model_cls is Contact:
             chain.filter.return_value.all.return_value = contacts
@@ -100,7 +116,7 @@ def test_error_in_one_item_does_not_block_others(mock_create):
                              data=VCARD_DATA)
 
     client = MagicMock()
-    client.list_vcards.return_value = [bad_remote, good_remote]
+    _serve(client, [bad_remote, good_remote])
 
     account = _make_account()
     session = _mock_session(mappings=[], contacts=[])
@@ -144,7 +160,7 @@ def test_conflict_local_wins_when_newer(mock_update_local, mock_push):
                          data=VCARD_DATA)
 
     client = MagicMock()
-    client.list_vcards.return_value = [remote]
+    _serve(client, [remote])
 
     account = _make_account()
     session = _mock_session(mappings=[mapping], contacts=[contact])
@@ -182,7 +198,7 @@ def test_conflict_remote_wins_when_newer(mock_update_local, mock_push):
                          data=VCARD_DATA)
 
     client = MagicMock()
-    client.list_vcards.return_value = [remote]
+    _serve(client, [remote])
 
     account = _make_account()
     session = _mock_session(mappings=[mapping], contacts=[contact])
@@ -199,8 +215,8 @@ def test_conflict_remote_wins_when_newer(mock_update_local, mock_push):
 
 
 @patch("clara.dav_sync.sync_engine._create_local_from_remote")
-@patch("clara.dav_sync.sync_engine._push_local_to_remote")
-def test_mixed_success_and_failure_counts(mock_push, mock_create):
+@patch("clara.dav_sync.sync_engine._render_local")
+def test_mixed_success_and_failure_counts(mock_render, mock_create):
     """Mixed results: counts reflect only successes."""
     remote_ok = DavResource(
         uid="r-ok", href="/dav/ab/ok.vcf", etag="e1", data=VCARD_DATA
@@ -212,7 +228,7 @@ def test_mixed_success_and_failure_counts(mock_push, mock_create):
     local_contact = _make_contact()
 
     client = MagicMock()
-    client.list_vcards.return_value = [remote_bad, remote_ok]
+    _serve(client, [remote_bad, remote_ok])
 
     account = _make_account()
     session = _mock_session(mappings=[], contacts=[local_contact])
@@ -222,9 +238,10 @@ def test_mixed_success_and_failure_counts(mock_push, mock_create):
     # _create_local_from_remote: first call fails, second succeeds
     mock_create.side_effect = [RuntimeError("parse error"), created_entity]
 
-    pushed = DavResource(uid=str(local_contact.id), href="/dav/ab/x.vcf",
-                         etag="e-pushed", data="")
-    mock_push.return_value = pushed
+    rendered = DavResource(uid=str(local_contact.id), href="/dav/ab/x.vcf",
+                           etag=None, data="")
+    mock_render.return_value = rendered
+    client.put_vcard.return_value = "e-pushed"
 
     counts = sync_entity_type(session, client, account, "contact")
 
@@ -0,0 +1,232 @@
+import io
+import json
+import uuid
+import zipfile
+
+import pytest
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from clara.base.model import Base
+from clara.config import get_settings
+from clara.contacts.repository import ContactRepository
+from clara.exports import archive as archive_mod
+from clara.exports import service as export_service
+from clara.exports.archive import archive_key, build_archive, vault_fingerprint
+from clara.exports.models import VaultExport
+from clara.files.repository import FileRepository
+from clara.files.storage import LocalStorage
+from clara.jobs import export as export_job
+
+
+@pytest.fixture()
+def enqueued(monkeypatch, tmp_path) -> list[uuid.UUID]:
+    monkeypatch.setattr(get_settings(), "storage_path", str(tmp_path))
+    calls: list[uuid.UUID] = []
+    monkeypatch.setattr(export_service, "enqueue_export", calls.append)
+    return calls
+
+
+async def test_export_enqueued_on_commit_and_reused(
+    authenticated_client, vault, db_session, enqueued
+):
+    url = f"/api/v1/vaults/{vault.id}/exports"
+    resp = await authenticated_client.post(url, json={"format": "ndjson"})
+    assert resp.status_code == 202
+    first = resp.json()
+    assert first["status"] == "queued"
+    assert first["format"] == "ndjson"
+    assert enqueued == [uuid.UUID(first["id"])]
+
+    resp = await authenticated_client.post(url, json={"format": "ndjson"})
+    assert resp.json()["id"] == first["id"]
+
+    resp = await authenticated_client.post(url, json={"format": "json"})
+    assert resp.json()["id"] != first["id"]
+
+    repo = ContactRepository(session=db_session, vault_id=vault.id)
+    await repo.create(first_name="Alice")
+    resp = await authenticated_client.post(url, json={"format": "ndjson"})
+    assert resp.json()["id"] != first["id"]
+
+    resp = await authenticated_client.get(url)
+    assert len(resp.json()) == 3
+
+
+async def test_stalled_export_is_failed_not_reused(
+    authenticated_client, vault, db_session, enqueued
+):
+    from datetime import UTC, datetime, timedelta
+
+    from sqlalchemy import update
+
+    url = f"/api/v1/vaults/{vault.id}/exports"
+    stuck_id = uuid.UUID((await authenticated_client.post(url, json={})).json()["id"])
+    await db_session.execute(
+        update(VaultExport)
+        .where(VaultExport.id == stuck_id)
+        .values(updated_at=datetime.now(UTC) - timedelta(hours=2))
+    )
+
+    resp = await authenticated_client.post(url, json={})
+
+    assert resp.json()["id"] != str(stuck_id)
+    assert enqueued == [stuck_id, uuid.UUID(resp.json()["id"])]
+    stuck = await db_session.get(VaultExport, stuck_id, populate_existing=True)
+    assert stuck.status == "failed"
+
+
+async def test_download_requires_complete_export(
+    authenticated_client, vault, enqueued
+):
+    url = f"/api/v1/vaults/{vault.id}/exports"
+    export_id = (await authenticated_client.post(url, json={})).json()["id"]
+
+    resp = await authenticated_client.get(f"{url}/{export_id}/download")
+
+    assert resp.status_code == 409
+
+
+async def test_build_archive_and_download(
+    authenticated_client, vault, user, db_session: AsyncSession, enqueued
+):
+    contacts = ContactRepository(session=db_session, vault_id=vault.id)
+    await contacts.create(first_name="Alice", last_name="Smith")
+    storage = LocalStorage()
+    blob = await storage.save(b"photo bytes", "photo.jpg")
+    files = FileRepository(session=db_session, vault_id=vault.id)
+    file = await files.create(
+        uploader_id=user.id,
+        storage_key=blob.key,
+        filename="photo.jpg",
+        mime_type="image/jpeg",
+        size_bytes=blob.size,
+        sha256=blob.sha256,
+    )
+    export = VaultExport(
+        vault_id=vault.id,
+        requested_by=user.id,
+        format="ndjson",
+        fingerprint=await vault_fingerprint(db_session, vault.id, "ndjson"),
+    )
+    db_session.add(export)
+    await db_session.flush()
+
+    progress: list[int] = []
+
+    async def on_progress(percent: int) -> None:
+        progress.append(percent)
+
+    key = archive_key(vault.id, export.id)
+    size = await build_archive(
+        db_session, vault.id, "ndjson", storage.path(key), on_progress
+    )
+    export.status = "complete"
+    export.storage_key = key
+    export.size_bytes = size
+    await db_session.flush()
+
+    assert progress == sorted(progress)
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/exports/{export.id}/download"
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/zip"
+    with zipfile.ZipFile(io.BytesIO(resp.content)) as zf:
+        names = set(zf.namelist())
+        assert {
+            "vault.ndjson",
+            "contacts.csv",
+            "contacts.vcf",
+            "files/manifest.ndjson",
+            f"files/{file.id}/photo.jpg",
+        } <= names
+        records = [json.loads(line) for line in zf.read("vault.ndjson").splitlines()]
+        assert {"table": "contacts"}.items() <= records[0].items()
+        assert "Alice" in zf.read("contacts.csv").decode()
+        assert zf.read(f"files/{file.id}/photo.jpg") == b"photo bytes"
+
+    # Same vault state: the finished artifact is handed back, not rebuilt.
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/exports", json={"format": "ndjson"}
+    )
+    assert resp.json()["id"] == str(export.id)
+    assert resp.json()["status"] == "complete"
+    assert enqueued == []
+
+
+async def test_build_archive_reports_progress_while_streaming_files(
+    vault, user, db_session: AsyncSession, enqueued, monkeypatch
+):
+    storage = LocalStorage()
+    files = FileRepository(session=db_session, vault_id=vault.id)
+    for i in range(3):
+        blob = await storage.save(f"blob {i}".encode(), f"f{i}.txt")
+        await files.create(
+            uploader_id=user.id,
+            storage_key=blob.key,
+            filename=f"f{i}.txt",
+            mime_type="text/plain",
+            size_bytes=blob.size,
+            sha256=blob.sha256,
+        )
+    monkeypatch.setattr(archive_mod, "PROGRESS_INTERVAL_SECONDS", 0)
+    progress: list[int] = []
+
+    async def on_progress(percent: int) -> None:
+        progress.append(percent)
+
+    await build_archive(
+        db_session, vault.id, "json", storage.path("exports/x.zip"), on_progress
+    )
+
+    # The section start plus one heartbeat per file.
+    assert progress.count(70) == 4
+
+
+@pytest.fixture()
+async def job_engine(engine: AsyncEngine):
+    job_engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with job_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield job_engine
+    await job_engine.dispose()
+
+
+async def test_export_failed_as_stalled_is_not_completed(
+    job_engine, enqueued, monkeypatch
+):
+    factory = async_sessionmaker(job_engine, expire_on_commit=False)
+    async with factory() as session:
+        export = VaultExport(
+            vault_id=uuid.uuid4(),
+            requested_by=uuid.uuid4(),
+            format="json",
+            fingerprint="f",
+        )
+        session.add(export)
+        await session.commit()
+
+    async def slow_build(session, vault_id, fmt, dest, on_progress):
+        # Meanwhile a new request took the export as stalled.
+        await export_job._set(factory, export.id, status="failed", error="stalled")
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(b"zip")
+        return 3
+
+    monkeypatch.setattr(export_job, "build_archive", slow_build)
+    await export_job.build_export(factory, export.id)
+
+    async with factory() as session:
+        done = await session.get(VaultExport, export.id)
+    assert (done.status, done.storage_key) == ("failed", None)
+    assert not LocalStorage().path(archive_key(export.vault_id, export.id)).exists()
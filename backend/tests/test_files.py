@@ -1,3 +1,5 @@
+from unittest.mock import MagicMock
+
 import pytest
 from httpx import AsyncClient
 
@@ -49,3 +51,151 @@ async def test_file_rename(authenticated_client: AsyncClient, vault: Vault):
     )
     assert resp.status_code == 200
     assert resp.json()["filename"] == "renamed.txt"
+
+
+async def test_file_download_range_and_etag(
+    authenticated_client: AsyncClient, vault: Vault
+):
+    import hashlib
+
+    body = b"hello world" * 1000
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/files",
+        files={"file": ("big.bin", body, "application/octet-stream")},
+    )
+    assert resp.status_code == 201
+    assert resp.json()["size_bytes"] == len(body)
+    url = f"/api/v1/vaults/{vault.id}/files/{resp.json()['id']}/download"
+
+    resp = await authenticated_client.get(url)
+    assert resp.status_code == 200
+    assert resp.content == body
+    etag = resp.headers["etag"]
+    assert etag == f'"{hashlib.sha256(body).hexdigest()}"'
+    assert resp.headers["accept-ranges"] == "bytes"
+    assert 'filename="big.bin"' in resp.headers["content-disposition"]
+
+    resp = await authenticated_client.get(url, headers={"Range": "bytes=6-10"})
+    assert resp.status_code == 206
+    assert resp.content == b"world"
+    assert resp.headers["content-range"] == f"bytes 6-10/{len(body)}"
+
+    resp = await authenticated_client.get(url, headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+    assert resp.content == b""
+    assert resp.headers["etag"] == etag
+
+
+async def test_identical_uploads_share_one_blob(
+    authenticated_client: AsyncClient,
+    vault: Vault,
+    db_session,
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from sqlalchemy import select
+
+    from clara.config import get_settings
+    from clara.files.models import File
+    from clara.files.storage import LocalStorage
+    from clara.jobs.blob_gc import release_blob
+
+    monkeypatch.setattr(get_settings(), "storage_path", str(tmp_path))
+    queue = MagicMock()
+    monkeypatch.setattr("clara.files.service.get_queue", lambda: queue)
+
+    async def upload(name: str) -> str:
+        resp = await authenticated_client.post(
+            f"/api/v1/vaults/{vault.id}/files",
+            files={"file": (name, b"same bytes", "image/jpeg")},
+        )
+        assert resp.status_code == 201
+        return resp.json()["id"]
+
+    async def delete(file_id: str) -> str:
+        resp = await authenticated_client.delete(
+            f"/api/v1/vaults/{vault.id}/files/{file_id}"
+        )
+        assert resp.status_code == 204
+        job, key = queue.enqueue.call_args.args
+        assert job == "clara.jobs.blob_gc.collect_blob"
+        return key
+
+    async def collect(key: str) -> bool:
+        return await db_session.run_sync(release_blob, LocalStorage(), key)
+
+    ids = [await upload("a.jpg"), await upload("b.jpg")]
+    keys = set(
+        (await db_session.execute(select(File.storage_key))).scalars().all()
+    )
+    assert len(keys) == 1
+    blob = tmp_path / keys.pop()
+    assert blob.read_bytes() == b"same bytes"
+
+    # Deleting never unlinks inline; the collector sees the other reference.
+    key = await delete(ids[0])
+    assert blob.exists()
+    assert not await collect(key)
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/files/{ids[1]}/download"
+    )
+    assert resp.content == b"same bytes"
+
+    # The last reference goes, but the same bytes are uploaded again before
+    # the collector runs: it counts the new row and keeps the blob.
+    key = await delete(ids[1])
+    assert blob.exists()
+    reupload = await upload("c.jpg")
+    assert not await collect(key)
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/files/{reupload}/download"
+    )
+    assert resp.content == b"same bytes"
+
+    key = await delete(reupload)
+    assert await collect(key)
+    assert not blob.exists()
+
+
+async def test_upload_locks_blob_before_reusing_it(
+    authenticated_client: AsyncClient,
+    vault: Vault,
+    tmp_path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    from clara.config import get_settings
+    from clara.files.repository import FileRepository
+    from clara.files.storage import LocalStorage
+
+    monkeypatch.setattr(get_settings(), "storage_path", str(tmp_path))
+    calls: list[str] = []
+
+    async def lock_blob(_self, key: str) -> None:
+        calls.append(f"lock {key}")
+
+    def has(_self, key: str) -> bool:
+        calls.append(f"has {key}")
+        return False
+
+    monkeypatch.setattr(FileRepository, "lock_blob", lock_blob)
+    monkeypatch.setattr(LocalStorage, "has", has)
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/files",
+        files={"file": ("a.txt", b"bytes", "text/plain")},
+    )
+
+    assert resp.status_code == 201
+    key = calls[0].removeprefix("lock ")
+    assert calls == [f"lock {key}", f"has {key}"]
+
+
+async def test_blob_lock_is_postgres_only_and_per_key():
+    from clara.files.repository import blob_lock_stmt
+    from clara.files.storage import content_key
+
+    key = content_key("ab" * 32)
+    stmt = blob_lock_stmt(key, "postgresql")
+    assert stmt is not None
+    assert "pg_advisory_xact_lock" in str(stmt)
+    assert blob_lock_stmt(key, "sqlite") is None
+    assert blob_lock_stmt("legacy-uuid/photo.jpg", "postgresql") is None
@@ -0,0 +1,127 @@
+"""GitRepo against a real local repository."""
+
+import os
+
+os.environ.setdefault("SECRET_KEY", "test-secret-key-for-clara-tests-123")
+os.environ.setdefault("DATABASE_URL", "postgresql://u:p@localhost/testdb")
+
+from datetime import UTC, datetime
+
+import pytest
+from git import Actor, Repo
+
+from clara.git_sync.git_ops import GitRepo
+from clara.git_sync.sync import _blob_sha
+
+AUTHOR = Actor("Test", "test@example.com")
+
+
+def _commit(repo: Repo, message: str) -> str:
+    repo.git.add(A=True)
+    return repo.index.commit(message, author=AUTHOR, committer=AUTHOR).hexsha
+
+
+@pytest.fixture()
+def repo(tmp_path):
+    raw = Repo.init(tmp_path, initial_branch="main")
+    (tmp_path / "people").mkdir()
+    (tmp_path / "people" / "alice.md").write_text("alice")
+    (tmp_path / "people" / "bob.md").write_text("bob")
+    (tmp_path / "README.md").write_text("readme")
+    _commit(raw, "initial")
+    git_repo = GitRepo(
+        work_dir=str(tmp_path),
+        repo_url="unused",
+        branch="main",
+        auth_type="none",
+        credential_encrypted="",
+    )
+    git_repo.clone_or_open()
+    return raw, git_repo
+
+
+def test_changed_markdown_files_since_commit(repo):
+    raw, git_repo = repo
+    since = git_repo.head_commit()
+    work = git_repo.work_dir
+    (work / "people" / "alice.md").write_text("alice v2")
+    (work / "people" / "bob.md").unlink()
+    (work / "people" / "carol.md").write_text("carol")
+    (work / "people" / ".hidden.md").write_text("hidden")
+    (work / "people" / "photo.txt").write_text("not markdown")
+    (work / "README.md").write_text("outside the subfolder")
+    _commit(raw, "edit")
+
+    present, deleted = git_repo.changed_markdown_files(since, "people")
+
+    assert sorted(present) == ["people/alice.md", "people/carol.md"]
+    assert deleted == ["people/bob.md"]
+    assert git_repo.changed_markdown_files(git_repo.head_commit(), "people") == (
+        [],
+        [],
+    )
+
+
+def test_rename_is_reported_as_delete_and_add(repo):
+    raw, git_repo = repo
+    since = git_repo.head_commit()
+    raw.git.mv("people/bob.md", "people/robert.md")
+    _commit(raw, "rename")
+
+    present, deleted = git_repo.changed_markdown_files(since)
+
+    assert present == ["people/robert.md"]
+    assert deleted == ["people/bob.md"]
+
+
+def test_is_ancestor(repo):
+    raw, git_repo = repo
+    first = git_repo.head_commit()
+    (git_repo.work_dir / "new.md").write_text("new")
+    _commit(raw, "second")
+
+    assert git_repo.is_ancestor(first)
+    assert git_repo.is_ancestor(git_repo.head_commit())
+    assert not git_repo.is_ancestor("0" * 40)
+
+    raw.git.checkout("--orphan", "rewritten")
+    _commit(raw, "unrelated history")
+    assert not git_repo.is_ancestor(first)
+
+
+def test_markdown_blobs_lists_tree_without_reading(repo):
+    raw, git_repo = repo
+    (git_repo.work_dir / "people" / "notes.txt").write_text("not markdown")
+    (git_repo.work_dir / "people" / "ünïcode.md").write_text("ü")
+    _commit(raw, "more")
+
+    blobs = git_repo.markdown_blobs("people")
+
+    assert sorted(blobs) == ["people/alice.md", "people/bob.md", "people/ünïcode.md"]
+    for path, sha in blobs.items():
+        assert sha == raw.git.hash_object(path)
+    assert blobs["people/alice.md"] == _blob_sha("alice")
+    assert git_repo.markdown_blobs("missing") == {}
+
+
+def test_last_modified_times_newest_commit_per_file(repo):
+    raw, git_repo = repo
+    first = git_repo.head_commit()
+    (git_repo.work_dir / "people" / "alice.md").write_text("alice v2")
+    later = datetime(2030, 5, 1, 12, 0, tzinfo=UTC)
+    raw.git.add(A=True)
+    raw.index.commit(
+        "edit",
+        author=AUTHOR,
+        committer=AUTHOR,
+        author_date=f"{int(later.timestamp())} +0000",
+    )
+
+    times = git_repo.last_modified_times("people")
+
+    assert set(times) == {"people/alice.md", "people/bob.md"}
+    assert datetime.fromisoformat(times["people/alice.md"]) == later
+    assert datetime.fromisoformat(times["people/bob.md"]) < later
+    assert git_repo.last_modified_times("people", since=first) == {
+        "people/alice.md": times["people/alice.md"]
+    }
@@ -10,7 +10,7 @@ from datetime import UTC, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock
 
-from clara.git_sync.sync import _hash, run_sync
+from clara.git_sync.sync import _blob_sha, _hash, run_sync
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -60,7 +60,7 @@ def _make_contact(
     return c
 
 
-def _make_config(config_id=None, vault_id=None, subfolder=""):
+def _make_config(config_id=None, vault_id=None, subfolder="", last_synced_commit=None):
     return SimpleNamespace(
         id=config_id or CONFIG_ID,
         vault_id=vault_id or VAULT_ID,
@@ -70,6 +70,7 @@ def _make_config(config_id=None, vault_id=None, subfolder=""):
         last_sync_at=None,
         last_sync_status=None,
         last_sync_error=None,
+        last_synced_commit=last_synced_commit,
     )
 
 
@@ -83,6 +84,7 @@ def _make_mapping(
     deleted_at=None,
     last_db_updated_at=None,
     last_file_updated_at=None,
+    blob_sha=None,
 ):
     now = datetime.now(UTC)
     return SimpleNamespace(
@@ -93,6 +95,7 @@ def _make_mapping(
         markdown_id=markdown_id,
         file_path=file_path,
         file_hash=file_hash,
+        blob_sha=blob_sha,
         last_db_updated_at=last_db_updated_at or now,
         last_file_updated_at=last_file_updated_at or now,
         deleted_at=deleted_at,
@@ -122,12 +125,14 @@ def _mock_repo(files=None, file_timestamps=None):
     repo = MagicMock()
     repo.clone_or_open.return_value = None
     repo.pull.return_value = []
-    repo.list_markdown_files.return_value = list(files.keys())
+    repo.markdown_blobs.return_value = {p: _blob_sha(c) for p, c in files.items()}
     repo.read_file.side_effect = lambda p: files[p]
     repo.write_file.return_value = None
     repo.delete_file.return_value = None
     repo.commit_and_push.return_value = True
-    repo.file_last_modified.side_effect = lambda p: file_timestamps.get(p)
+    repo.last_modified_times.return_value = dict(file_timestamps)
+    repo.head_commit.return_value = "head-sha"
+    repo.is_ancestor.return_value = True
     return repo
 
 
@@ -337,6 +342,207 @@ class TestUpdateFromFile:
         assert mapping.file_hash == new_hash
 
 
+class TestIncrementalSync:
+    """With a recorded commit, only files changed since it are read."""
+
+    def test_reads_only_changed_files(self):
+        changed = _md_content("Alice Smith")
+        files = {"alice-smith.md": changed, "bob-jones.md": _md_content("Bob Jones")}
+        ts = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        repo = _mock_repo(files, dict.fromkeys(files, ts))
+        repo.changed_markdown_files.return_value = (["alice-smith.md"], [])
+        config = _make_config(last_synced_commit="old-sha")
+        session = _mock_session(mappings=[], contacts=[])
+
+        counts = run_sync(session, config, repo)
+
+        assert counts == {"new_from_file": 1}
+        repo.changed_markdown_files.assert_called_once_with("old-sha", "")
+        repo.read_file.assert_called_once_with("alice-smith.md")
+        assert config.last_synced_commit == "head-sha"
+
+    def test_rescans_when_recorded_commit_left_history(self):
+        files = {"alice-smith.md": _md_content("Alice Smith")}
+        ts = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        repo = _mock_repo(files, dict.fromkeys(files, ts))
+        repo.is_ancestor.return_value = False
+        config = _make_config(last_synced_commit="rewritten-sha")
+        session = _mock_session(mappings=[], contacts=[])
+
+        run_sync(session, config, repo)
+
+        repo.changed_markdown_files.assert_not_called()
+        repo.read_file.assert_called_once_with("alice-smith.md")
+
+    def test_full_flag_forces_rescan(self):
+        repo = _mock_repo({})
+        config = _make_config(last_synced_commit="old-sha")
+
+        run_sync(_mock_session(), config, repo, full=True)
+
+        repo.markdown_blobs.assert_called_once_with("")
+        repo.changed_markdown_files.assert_not_called()
+        repo.is_ancestor.assert_not_called()
+
+    def test_deleted_file_and_deleted_contact_without_reading(self):
+        kept = _make_contact(first_name="Kept", last_name="One")
+        gone_file = _make_contact(first_name="File", last_name="Gone")
+        gone_contact = _make_contact(
+            first_name="Db", last_name="Gone", deleted_at=datetime.now(UTC)
+        )
+        slugs = [
+            (kept, "kept-one"),
+            (gone_file, "file-gone"),
+            (gone_contact, "db-gone"),
+        ]
+        mappings = [
+            _make_mapping(
+                contact_id=c.id,
+                markdown_id=f"2026010112000{i}",
+                file_path=f"{slug}.md",
+                file_hash="unchanged",
+            )
+            for i, (c, slug) in enumerate(slugs)
+        ]
+        repo = _mock_repo({})
+        repo.changed_markdown_files.return_value = ([], ["file-gone.md"])
+        config = _make_config(last_synced_commit="old-sha")
+        session = _mock_session(
+            mappings=mappings, contacts=[kept, gone_file, gone_contact]
+        )
+
+        counts = run_sync(session, config, repo)
+
+        assert counts == {"delete_db": 1, "delete_file": 1}
+        repo.read_file.assert_not_called()
+        repo.delete_file.assert_called_once_with("db-gone.md")
+        assert gone_file.deleted_at is not None
+        assert kept.deleted_at is None
+
+    def test_failed_action_keeps_recorded_commit(self):
+        files = {"alice-smith.md": _md_content("Alice Smith")}
+        ts = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        repo = _mock_repo(files, dict.fromkeys(files, ts))
+        repo.changed_markdown_files.return_value = (["alice-smith.md"], [])
+        config = _make_config(last_synced_commit="old-sha")
+        session = _mock_session(mappings=[], contacts=[])
+        session.flush.side_effect = [RuntimeError("db down"), None, None, None]
+
+        counts = run_sync(session, config, repo)
+
+        assert counts == {}
+        assert config.last_synced_commit == "old-sha"
+
+
+class TestBlobShaDetection:
+    """The tree listing's blob SHAs decide which files need reading."""
+
+    def _mapped(self, content, **mapping_fields):
+        contact = _make_contact(first_name="Jane", last_name="Doe")
+        mapping = _make_mapping(
+            contact_id=contact.id,
+            markdown_id="20260101120000",
+            file_path="jane-doe.md",
+            **mapping_fields,
+        )
+        repo = _mock_repo({"jane-doe.md": content})
+        return contact, mapping, repo
+
+    def test_matching_blob_sha_skips_without_reading(self):
+        content = _md_content("Jane Doe")
+        contact, mapping, repo = self._mapped(
+            content, file_hash="stale", blob_sha=_blob_sha(content)
+        )
+        session = _mock_session(mappings=[mapping], contacts=[contact])
+
+        counts = run_sync(session, _make_config(), repo)
+
+        assert counts == {"skip": 1}
+        repo.read_file.assert_not_called()
+        repo.last_modified_times.assert_not_called()
+
+    def test_mapping_without_blob_sha_is_backfilled(self):
+        content = _md_content("Jane Doe")
+        contact, mapping, repo = self._mapped(content, file_hash=_hash(content))
+        session = _mock_session(mappings=[mapping], contacts=[contact])
+
+        counts = run_sync(session, _make_config(), repo)
+
+        assert counts == {"skip": 1}
+        assert mapping.blob_sha == _blob_sha(content)
+
+    def test_changed_files_share_one_log_pass(self):
+        old_ts = datetime.now(UTC) - timedelta(hours=2)
+        new_ts = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        contacts, mappings, files = [], [], {}
+        for i, name in enumerate(["Ann", "Ben", "Cat"]):
+            contact = _make_contact(first_name=name, last_name="Lee")
+            path = f"{name.lower()}-lee.md"
+            contacts.append(contact)
+            mappings.append(
+                _make_mapping(
+                    contact_id=contact.id,
+                    markdown_id=f"2026010112000{i}",
+                    file_path=path,
+                    file_hash="old",
+                    blob_sha="0" * 40,
+                    last_db_updated_at=old_ts,
+                )
+            )
+            files[path] = _md_content(f"{name}ny Lee")
+        repo = _mock_repo(files, dict.fromkeys(files, new_ts))
+        session = _mock_session(mappings=mappings, contacts=contacts)
+
+        counts = run_sync(session, _make_config(), repo)
+
+        assert counts == {"update_from_file": 3}
+        repo.last_modified_times.assert_called_once_with("", None)
+        assert [m.blob_sha for m in mappings] == [_blob_sha(c) for c in files.values()]
+
+    def test_written_file_records_its_blob_sha(self):
+        from clara.git_sync.models import GitSyncMapping
+
+        contact = _make_contact(first_name="Bob", last_name="Jones")
+        repo = _mock_repo(files={})
+        session = _mock_session(mappings=[], contacts=[contact])
+
+        run_sync(session, _make_config(), repo)
+
+        written = repo.write_file.call_args.args[1]
+        (mapping,) = [
+            c.args[0]
+            for c in session.add.call_args_list
+            if isinstance(c.args[0], GitSyncMapping)
+        ]
+        assert mapping.blob_sha == _blob_sha(written)
+
+
+class TestReferenceLookups:
+    """Tags are read once per run and created once, whatever the file count."""
+
+    def test_tags_queried_once_per_run(self):
+        from clara.contacts.models import Tag
+
+        ts = (datetime.now(UTC) + timedelta(hours=1)).isoformat()
+        files = {
+            f"person-{i}.md": _md_content(f"Person {i}", tags=["friends", "club"])
+            for i in range(5)
+        }
+        repo = _mock_repo(files, dict.fromkeys(files, ts))
+        existing = Tag(id=uuid.uuid4(), vault_id=VAULT_ID, name="friends")
+        session = _mock_session(mappings=[], contacts=[], tags=[existing])
+
+        counts = run_sync(session, _make_config(), repo)
+
+        assert counts.get("new_from_file", 0) == 5
+        tag_queries = [c for c in session.query.call_args_list if c.args == (Tag,)]
+        assert len(tag_queries) == 1
+        new_tags = [
+            c.args[0] for c in session.add.call_args_list if isinstance(c.args[0], Tag)
+        ]
+        assert [t.name for t in new_tags] == ["club"]
+
+
 class TestDeleteFile:
     """Mapped contact soft-deleted -> calls repo.delete_file."""
 
@@ -440,3 +646,38 @@ class TestSyncStateUpdate:
         assert config.last_sync_status == "ok"
         assert config.last_sync_error is None
         assert config.last_sync_at is not None
+
+
+class TestPhotoImport:
+    """_import_photo does not store the same photo twice."""
+
+    def test_unchanged_photo_is_not_reimported(self, tmp_path, monkeypatch):
+        import hashlib
+
+        from clara.config import get_settings
+        from clara.git_sync.sync import _import_photo
+
+        monkeypatch.setattr(get_settings(), "storage_path", str(tmp_path))
+        photo = b"\xff\xd8jpeg bytes"
+        contact = SimpleNamespace(photo_file_id=uuid.uuid4())
+        current = SimpleNamespace(
+            deleted_at=None, sha256=hashlib.sha256(photo).hexdigest()
+        )
+        session = MagicMock()
+        session.get.side_effect = lambda model, _id: (
+            contact if model.__name__ == "Contact" else current
+        )
+        repo = MagicMock()
+        repo.read_binary.return_value = photo
+        parsed = {"photo_path": "assets/jane.jpg"}
+
+        _import_photo(session, VAULT_ID, uuid.uuid4(), parsed, "", repo)
+        session.add.assert_not_called()
+        assert not any(p.is_file() for p in tmp_path.rglob("*"))
+
+        current.sha256 = "0" * 64
+        for _ in range(2):
+            _import_photo(session, VAULT_ID, uuid.uuid4(), parsed, "", repo)
+        assert session.add.call_count == 2
+        blobs = [p for p in tmp_path.rglob("*") if p.is_file()]
+        assert [b.read_bytes() for b in blobs] == [photo]
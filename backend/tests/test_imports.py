@@ -0,0 +1,310 @@
+import os
+import uuid
+from datetime import date
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import StaticPool
+
+from clara.base.model import Base
+from clara.config import get_settings
+from clara.contacts.models import Contact
+from clara.files.storage import LocalStorage
+from clara.imports import service as import_service
+from clara.imports.models import ContactImport
+from clara.jobs.contact_import import import_contacts
+
+CSV = (
+    "\ufefffirst_name,last_name,birthdate,favorite\n"
+    "Alice,Smith,1990-04-01,true\n"
+    "Bob,Jones,not-a-date,\n"
+    ",,,\n"
+    ",Nofirst,,\n"
+    f"{'x' * 300},Long,,\n"
+    "Carol,,,false\n"
+)
+
+
+@pytest.fixture()
+def enqueued(monkeypatch, tmp_path) -> list[uuid.UUID]:
+    monkeypatch.setattr(get_settings(), "storage_path", str(tmp_path))
+    calls: list[uuid.UUID] = []
+    monkeypatch.setattr(import_service, "enqueue_import", calls.append)
+    return calls
+
+
+@pytest.fixture()
+async def job_engine(engine: AsyncEngine):
+    # The job commits per batch, so give it a database of its own.
+    job_engine = create_async_engine(
+        "sqlite+aiosqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with job_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield job_engine
+    await job_engine.dispose()
+
+
+async def test_csv_import_is_stored_and_enqueued(
+    authenticated_client, vault, db_session, enqueued
+):
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/imports/csv",
+        files={"file": ("people.csv", CSV.encode(), "text/csv")},
+    )
+    assert resp.status_code == 202
+    body = resp.json()
+    assert body["status"] == "queued"
+    assert body["size_bytes"] == len(CSV.encode())
+    contact_import = await db_session.get(ContactImport, uuid.UUID(body["id"]))
+    assert LocalStorage().path(contact_import.storage_key).read_text() == CSV
+    assert enqueued == [contact_import.id]
+
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/imports/{body['id']}"
+    )
+    assert resp.json()["id"] == body["id"]
+
+
+async def test_csv_import_rejects_unknown_field(authenticated_client, vault, enqueued):
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/imports/csv",
+        params={"field_map": '{"name": "vault_id"}'},
+        files={"file": ("people.csv", CSV.encode(), "text/csv")},
+    )
+    assert resp.status_code == 400
+
+
+async def _run_job(job_engine, vault_id, fmt: str, data: str) -> ContactImport:
+    factory = async_sessionmaker(job_engine, expire_on_commit=False)
+    storage = LocalStorage()
+    key = import_service.upload_key(vault_id, uuid.uuid4(), fmt)
+    storage.path(key).parent.mkdir(parents=True, exist_ok=True)
+    storage.path(key).write_text(data)
+    async with factory() as session:
+        job = ContactImport(
+            vault_id=vault_id,
+            requested_by=uuid.uuid4(),
+            format=fmt,
+            filename=f"people.{fmt}",
+            storage_key=key,
+            size_bytes=len(data.encode()),
+        )
+        session.add(job)
+        await session.commit()
+
+    await import_contacts(factory, job.id)
+
+    async with factory() as session:
+        done = await session.get(ContactImport, job.id)
+    assert not storage.path(key).exists()
+    return done
+
+
+async def test_import_job_reports_row_errors(job_engine, enqueued):
+    factory = async_sessionmaker(job_engine, expire_on_commit=False)
+    vault_id = uuid.uuid4()
+
+    done = await _run_job(job_engine, vault_id, "csv", CSV)
+
+    async with factory() as session:
+        contacts = (
+            await session.scalars(
+                select(Contact).where(Contact.vault_id == vault_id)
+            )
+        ).all()
+    assert done.status == "complete"
+    assert done.progress == 100
+    assert (done.imported, done.failed, done.rows_processed) == (2, 3, 6)
+    assert [e.split(":")[0] for e in done.errors] == ["Row 3", "Row 5", "Row 6"]
+    assert "birthdate" in done.errors[0]
+    by_name = {c.first_name: c for c in contacts}
+    assert by_name["Alice"].birthdate.isoformat() == "1990-04-01"
+    assert by_name["Alice"].favorite is True
+    assert by_name["Carol"].last_name == ""
+
+
+async def test_failed_import_removes_its_upload(job_engine, enqueued, monkeypatch):
+    from clara.jobs import contact_import
+
+    async def explode(session, job, lines):
+        raise RuntimeError("disk on fire")
+
+    monkeypatch.setitem(contact_import._IMPORTERS, "csv", explode)
+
+    done = await _run_job(job_engine, uuid.uuid4(), "csv", CSV)
+
+    assert (done.status, done.error) == ("failed", "disk on fire")
+
+
+POSTGRES_URL = os.environ.get("CLARA_TEST_POSTGRES_URL")
+
+
+@pytest.mark.postgres
+@pytest.mark.skipif(
+    not POSTGRES_URL,
+    reason="set CLARA_TEST_POSTGRES_URL to a scratch postgresql+asyncpg:// database",
+)
+async def test_copy_contacts_uses_copy_on_postgres():
+    from clara.auth.models import User, Vault
+    from clara.integrations.csv_io import copy_contacts
+
+    pg_engine = create_async_engine(POSTGRES_URL)
+    try:
+        async with pg_engine.connect() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.commit()
+            session = AsyncSession(bind=conn)
+            user = User(email=f"{uuid.uuid4()}@example.com", hashed_password="x")
+            session.add(user)
+            await session.flush()
+            vault = Vault(name="V", owner_user_id=user.id)
+            session.add(vault)
+            await session.flush()
+            assert conn.dialect.driver == "asyncpg"
+
+            rows = [
+                {"first_name": "Ann", "birthdate": date(1990, 4, 1), "favorite": True},
+                {"first_name": "Ben", "last_name": "Lee"},
+            ]
+            assert await copy_contacts(session, vault.id, rows) == 2
+            # The staging table is reused and emptied between batches.
+            assert await copy_contacts(session, vault.id, rows[1:]) == 1
+
+            contacts = (
+                await session.scalars(
+                    select(Contact)
+                    .where(Contact.vault_id == vault.id)
+                    .order_by(Contact.first_name)
+                )
+            ).all()
+            assert [(c.first_name, c.last_name) for c in contacts] == [
+                ("Ann", ""), ("Ben", "Lee"), ("Ben", "Lee"),
+            ]
+            assert contacts[0].birthdate == date(1990, 4, 1)
+            assert contacts[0].favorite is True
+            assert contacts[0].created_at is not None
+            await conn.rollback()
+    finally:
+        await pg_engine.dispose()
+
+
+async def test_inline_csv_import_streams_upload(authenticated_client, vault):
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/import/csv",
+        files={"file": ("people.csv", CSV.encode(), "text/csv")},
+    )
+    assert resp.status_code == 201
+    assert resp.json() == {"imported": 2}
+
+
+def _card(given: str, *lines: str) -> str:
+    body = "".join(f"{line}\r\n" for line in lines)
+    return (
+        f"BEGIN:VCARD\r\nVERSION:3.0\r\nN:Doe;{given};;;\r\nFN:{given} Doe\r\n"
+        f"{body}END:VCARD\r\n"
+    )
+
+
+VCARDS = (
+    _card("Ann", "EMAIL;TYPE=home:ann@example.com", "CATEGORIES:Family,Work")
+    + _card("Ben", "TEL;TYPE=cell:+123", "ADR;TYPE=home:;;1 Main St;Town;;99;US")
+    + "BEGIN:VCARD\r\nVERSION:3.0\r\nEMAIL:nobody@example.com\r\nEND:VCARD\r\n"
+    + _card("Cat", "CATEGORIES:Work", "CATEGORIES:Book club")
+)
+
+
+async def test_vcard_job_batches_and_dedupes_tags(job_engine, db_session, enqueued):
+    from clara.contacts.models import Address, ContactMethod, Tag, contact_tags
+
+    vault_id = uuid.uuid4()
+    factory = async_sessionmaker(job_engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(Tag(vault_id=vault_id, name="Work"))
+        await session.commit()
+
+    done = await _run_job(job_engine, vault_id, "vcard", VCARDS)
+
+    assert (done.status, done.imported, done.failed) == ("complete", 3, 1)
+    assert done.errors == ["Card 3: no name"]
+    async with factory() as session:
+        tags = (
+            await session.scalars(select(Tag.name).where(Tag.vault_id == vault_id))
+        ).all()
+        links = (
+            await session.execute(
+                select(Contact.first_name, Tag.name)
+                .join(contact_tags, contact_tags.c.contact_id == Contact.id)
+                .join(Tag, Tag.id == contact_tags.c.tag_id)
+                .where(Contact.vault_id == vault_id)
+            )
+        ).all()
+        methods = (
+            await session.scalars(
+                select(ContactMethod.value).where(ContactMethod.vault_id == vault_id)
+            )
+        ).all()
+        cities = (
+            await session.scalars(
+                select(Address.city).where(Address.vault_id == vault_id)
+            )
+        ).all()
+    assert sorted(tags) == ["Book club", "Family", "Work"]
+    assert sorted(links) == [
+        ("Ann", "Family"), ("Ann", "Work"), ("Cat", "Book club"), ("Cat", "Work"),
+    ]
+    assert sorted(methods) == ["+123", "ann@example.com"]
+    assert cities == ["Town"]
+
+
+async def test_vcard_parse_pool_keeps_order(monkeypatch):
+    from clara.integrations import vcard
+
+    monkeypatch.setattr(get_settings(), "vcard_parse_workers", 2)
+    cards = [_card(f"P{i}") for i in range(7)]
+    with vcard.parse_pool() as executor:
+        assert executor is not None
+        chunks = [
+            c
+            async for c in vcard.iter_parsed_chunks(
+                cards, chunk_size=2, executor=executor
+            )
+        ]
+
+    names = [c["contact_fields"]["first_name"] for ch in chunks for c in ch.cards]
+    assert names == [f"P{i}" for i in range(7)]
+
+
+async def test_inline_vcard_import_rejects_undecodable_file(
+    authenticated_client, vault, db_session
+):
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/import/vcard",
+        files={"file": ("people.vcf", b"BEGIN:VCARD\r\nFN:\xff\r\n", "text/vcard")},
+    )
+    assert resp.status_code == 400
+    count = await db_session.scalar(
+        select(func.count()).select_from(Contact).where(Contact.vault_id == vault.id)
+    )
+    assert count == 0
+
+
+async def test_large_inline_import_runs_in_background(
+    authenticated_client, vault, enqueued, monkeypatch
+):
+    monkeypatch.setattr(get_settings(), "import_inline_max_bytes", 10)
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/import/vcard",
+        files={"file": ("people.vcf", VCARDS.encode(), "text/vcard")},
+    )
+    assert resp.status_code == 202
+    assert resp.json()["format"] == "vcard"
+    assert resp.json()["status"] == "queued"
@@ -0,0 +1,38 @@
+from sqlalchemy import Select
+
+from clara.index_coverage import PROBES, collect_queries, find_seq_scans
+
+
+def test_find_seq_scans_walks_nested_plans() -> None:
+    plan = {
+        "Node Type": "Nested Loop",
+        "Plans": [
+            {"Node Type": "Seq Scan", "Relation Name": "contacts"},
+            {
+                "Node Type": "Index Scan",
+                "Relation Name": "notes",
+                "Plans": [{"Node Type": "Seq Scan", "Relation Name": "tags"}],
+            },
+        ],
+    }
+    assert list(find_seq_scans(plan)) == ["contacts", "tags"]
+
+
+async def test_collect_queries_covers_every_probe() -> None:
+    queries = await collect_queries()
+    labels = {label for label, _ in queries}
+    assert labels == set(PROBES)
+    assert all(isinstance(stmt, Select) for _, stmt in queries)
+
+
+async def test_collected_queries_compile_for_postgres() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    for _, stmt in await collect_queries():
+        sql = str(
+            stmt.compile(
+                dialect=postgresql.dialect(),
+                compile_kwargs={"literal_binds": True},
+            )
+        )
+        assert sql.startswith("SELECT")
@@ -41,3 +41,31 @@ async def test_export_json_empty_vault(db_session: AsyncSession):
     assert set(result.keys()) == EXPECTED_KEYS
     for key in EXPECTED_KEYS - {"vault_id"}:
         assert result[key] == []
+
+
+async def test_streamed_json_matches_export(db_session: AsyncSession):
+    from clara.integrations.json_export import iter_vault_json
+
+    vault_id = uuid.uuid4()
+    repo = ContactRepository(session=db_session, vault_id=vault_id)
+    await repo.create(first_name="Alice", last_name="Smith")
+    await repo.create(first_name="Bob", last_name="Jones")
+
+    streamed = "".join([c async for c in iter_vault_json(db_session, vault_id)])
+
+    assert json.loads(streamed) == await export_vault_json(db_session, vault_id)
+
+
+async def test_ndjson_endpoint(authenticated_client, vault, db_session):
+    repo = ContactRepository(session=db_session, vault_id=vault.id)
+    await repo.create(first_name="Alice", last_name="Smith")
+
+    resp = await authenticated_client.get(f"/api/v1/vaults/{vault.id}/export/ndjson")
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    contacts = [line["record"] for line in lines if line["table"] == "contacts"]
+    assert [c["first_name"] for c in contacts] == ["Alice"]
+    assert contacts[0]["vault_id"] == str(vault.id)
+    assert {line["table"] for line in lines} <= EXPECTED_KEYS
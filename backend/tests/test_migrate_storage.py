@@ -0,0 +1,67 @@
+import hashlib
+import uuid
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from clara.base.model import Base
+from clara.config import get_settings
+from clara.files.migrate_storage import migrate
+from clara.files.models import File
+from clara.files.storage import LocalStorage, content_key
+
+
+def _legacy(tmp_path: Path, data: bytes) -> str:
+    key = f"{uuid.uuid4()}/photo.jpg"
+    (tmp_path / key).parent.mkdir(parents=True)
+    (tmp_path / key).write_bytes(data)
+    return key
+
+
+def test_migrate_rewrites_legacy_keys_and_dedupes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(get_settings(), "storage_path", str(tmp_path))
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[File.__table__])
+    vault_id = uuid.uuid4()
+    with Session(engine) as session:
+        for data in (b"one", b"one", b"two"):
+            session.add(
+                File(
+                    vault_id=vault_id,
+                    uploader_id=uuid.UUID(int=0),
+                    storage_key=_legacy(tmp_path, data),
+                    filename="photo.jpg",
+                    mime_type="image/jpeg",
+                    size_bytes=len(data),
+                )
+            )
+        session.add(
+            File(
+                vault_id=vault_id,
+                uploader_id=uuid.UUID(int=0),
+                storage_key="gone/photo.jpg",
+                filename="photo.jpg",
+                mime_type="image/jpeg",
+                size_bytes=1,
+            )
+        )
+        session.commit()
+
+        stats = migrate(session, LocalStorage(), batch_size=2)
+        assert (stats.migrated, stats.deduplicated, stats.missing) == (2, 1, 1)
+
+        keys = session.execute(select(File.storage_key)).scalars().all()
+        one = content_key(hashlib.sha256(b"one").hexdigest())
+        two = content_key(hashlib.sha256(b"two").hexdigest())
+        assert sorted(keys) == sorted([one, one, two, "gone/photo.jpg"])
+        assert (tmp_path / one).read_bytes() == b"one"
+        blobs = [p for p in tmp_path.rglob("*") if p.is_file()]
+        assert len(blobs) == 2
+
+        # Re-running finds nothing left to do.
+        stats = migrate(session, LocalStorage())
+        assert (stats.migrated, stats.deduplicated, stats.missing) == (0, 0, 1)
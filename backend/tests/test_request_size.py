@@ -23,3 +23,22 @@ async def test_normal_json_accepted(authenticated_client: AsyncClient, vault: Va
         json={"first_name": "Alice"},
     )
     assert resp.status_code == 201
+
+
+async def test_chunked_body_without_length_capped(
+    authenticated_client: AsyncClient, vault: Vault
+):
+    """A streamed body with no Content-Length is cut off at max_body_size."""
+
+    async def chunks():
+        for _ in range(64):
+            yield b"x" * 65_536
+
+    resp = await authenticated_client.post(
+        f"/api/v1/vaults/{vault.id}/contacts",
+        content=chunks(),
+        headers={"content-type": "application/json"},
+    )
+    assert "content-length" not in resp.request.headers
+    assert resp.status_code == 413
+    assert resp.json()["detail"] == "Request body too large"
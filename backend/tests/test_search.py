@@ -0,0 +1,92 @@
+from httpx import AsyncClient
+
+from clara.auth.models import Vault
+from clara.search.repository import highlight
+
+
+async def _seed(client: AsyncClient, vault_id: str) -> dict[str, str]:
+    base = f"/api/v1/vaults/{vault_id}"
+    contact = await client.post(
+        f"{base}/contacts", json={"first_name": "Hazel", "last_name": "Marsh"}
+    )
+    note = await client.post(
+        f"{base}/notes",
+        json={
+            "title": "Garden plans",
+            "body_markdown": "Ask Hazel about the hazel tree",
+        },
+    )
+    entry = await client.post(
+        f"{base}/journal",
+        json={"entry_date": "2026-01-02", "title": "Walk", "body_markdown": "Rain"},
+    )
+    return {
+        "contact": contact.json()["id"],
+        "note": note.json()["id"],
+        "journal_entry": entry.json()["id"],
+    }
+
+
+async def test_search_returns_typed_ranked_hits(
+    authenticated_client: AsyncClient, vault: Vault
+):
+    ids = await _seed(authenticated_client, str(vault.id))
+
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/search", params={"q": "hazel"}
+    )
+    assert resp.status_code == 200
+    items = resp.json()["items"]
+    assert [(i["type"], i["id"]) for i in items] == [
+        ("contact", ids["contact"]),
+        ("note", ids["note"]),
+    ]
+    assert items[0]["title"] == "Hazel Marsh"
+    assert "<mark>hazel</mark> tree" in items[1]["snippet"]
+
+
+async def test_search_filters_by_type(authenticated_client: AsyncClient, vault: Vault):
+    ids = await _seed(authenticated_client, str(vault.id))
+
+    resp = await authenticated_client.get(
+        f"/api/v1/vaults/{vault.id}/search",
+        params={"q": "hazel", "type": "note"},
+    )
+    assert [i["id"] for i in resp.json()["items"]] == [ids["note"]]
+
+
+async def test_search_requires_query(authenticated_client: AsyncClient, vault: Vault):
+    resp = await authenticated_client.get(f"/api/v1/vaults/{vault.id}/search")
+    assert resp.status_code == 422
+
+
+def test_highlight_windows_long_text():
+    text = "x" * 200 + " needle " + "y" * 200
+    snippet = highlight(text, ["needle"], width=60)
+    assert snippet.startswith("…") and snippet.endswith("…")
+    assert "<mark>needle</mark>" in snippet
+
+
+def test_highlight_escapes_text_around_marks():
+    snippet = highlight('<img src=x onerror="alert(1)"> & <b>needle</b>', ["needle"])
+    assert snippet == (
+        "&lt;img src=x onerror=&quot;alert(1)&quot;&gt; &amp; "
+        "&lt;b&gt;<mark>needle</mark>&lt;/b&gt;"
+    )
+
+
+async def test_search_treats_like_wildcards_literally(
+    authenticated_client: AsyncClient, vault: Vault
+):
+    base = f"/api/v1/vaults/{vault.id}"
+    await authenticated_client.post(
+        f"{base}/notes", json={"title": "Rates", "body_markdown": "up 5% today"}
+    )
+    await authenticated_client.post(
+        f"{base}/notes", json={"title": "Plain", "body_markdown": "up 50 today"}
+    )
+
+    resp = await authenticated_client.get(f"{base}/search", params={"q": "5%"})
+    assert [i["title"] for i in resp.json()["items"]] == ["Rates"]
+    resp = await authenticated_client.get(f"{base}/search", params={"q": "_"})
+    assert resp.json()["items"] == []
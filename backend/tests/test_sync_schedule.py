@@ -0,0 +1,298 @@
+import time
+import uuid
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+import redis
+
+from clara.jobs import schedule as schedule_mod
+from clara.jobs.schedule import LEASE_SECONDS, MAX_JITTER_SECONDS, SyncSchedule
+
+
+class FakeZSetRedis:
+    """The sorted-set and string commands SyncSchedule uses."""
+
+    def __init__(self) -> None:
+        self.zsets: dict[str, dict[str, float]] = {}
+        self.strings: dict[str, str] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    def zadd(self, key, mapping, nx=False, xx=False):
+        zset = self.zsets.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if (nx and member in zset) or (xx and member not in zset):
+                continue
+            added += member not in zset
+            zset[member] = score
+        return added
+
+    def zrem(self, key, *members):
+        zset = self.zsets.get(key, {})
+        return sum(zset.pop(m, None) is not None for m in members)
+
+    def zcount(self, key, _min, max_):
+        return sum(score <= max_ for score in self.zsets.get(key, {}).values())
+
+    def zrangebyscore(self, key, _min, max_, start=0, num=None):
+        due = sorted(
+            (score, m) for m, score in self.zsets.get(key, {}).items() if score <= max_
+        )
+        members = [m.encode() for _, m in due]
+        return members[start : start + num if num is not None else None]
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.strings:
+            return None
+        self.strings[key] = value
+        self.ttls[key] = ex
+        return True
+
+    def exists(self, key):
+        return int(key in self.strings)
+
+    def delete(self, *keys):
+        return sum(self.strings.pop(k, None) is not None for k in keys)
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+SCHEDULE = SyncSchedule("test_sync", "clara.jobs.test.run")
+
+
+@pytest.fixture()
+def conn() -> FakeZSetRedis:
+    return FakeZSetRedis()
+
+
+def test_tick_enqueues_only_due_ids_once(conn):
+    due_id, later_id = uuid.uuid4(), uuid.uuid4()
+    SCHEDULE.set_due(conn, due_id, time.time() - 5)
+    SCHEDULE.set_due(conn, later_id, time.time() + 3600)
+    queue = MagicMock()
+
+    assert SCHEDULE.enqueue_due(conn, queue) == {"enqueued": 1, "skipped": 0}
+    queue.enqueue.assert_called_once()
+    assert queue.enqueue.call_args.args == (SCHEDULE.job, str(due_id))
+    # Leased: the next tick does not pick it up again while it runs.
+    lease = conn.zsets[SCHEDULE.key][str(due_id)]
+    assert lease >= time.time() + LEASE_SECONDS - 5
+    assert SCHEDULE.enqueue_due(conn, queue) == {"enqueued": 0, "skipped": 0}
+
+
+def test_queued_or_running_id_is_skipped(conn):
+    item_id = uuid.uuid4()
+    queue = MagicMock()
+    assert SCHEDULE.enqueue(conn, queue, item_id)
+
+    SCHEDULE.set_due(conn, item_id, time.time() - 1)
+    assert SCHEDULE.enqueue_due(conn, queue) == {"enqueued": 0, "skipped": 1}
+    assert not SCHEDULE.enqueue(conn, queue, item_id)
+    assert queue.enqueue.call_count == 1
+
+    SCHEDULE.finish(conn, item_id, time.time() + 60)
+    assert SCHEDULE.enqueue(conn, queue, item_id)
+
+
+def test_finish_sets_next_due_or_drops_id(conn):
+    kept, dropped = uuid.uuid4(), uuid.uuid4()
+    SCHEDULE.set_due(conn, kept, 0)
+    SCHEDULE.set_due(conn, dropped, 0)
+
+    SCHEDULE.finish(conn, kept, 1234.0)
+    SCHEDULE.finish(conn, dropped, None)
+
+    assert conn.zsets[SCHEDULE.key] == {str(kept): 1234.0}
+
+
+def test_removed_id_is_not_resurrected_by_lease(conn, monkeypatch):
+    item_id = uuid.uuid4()
+    SCHEDULE.set_due(conn, item_id, 0)
+    real_zadd = conn.zadd
+
+    def remove_then_zadd(key, mapping, **kwargs):
+        SCHEDULE.remove(conn, item_id)  # deleted between read and lease
+        return real_zadd(key, mapping, **kwargs)
+
+    monkeypatch.setattr(conn, "zadd", remove_then_zadd)
+    SCHEDULE.pop_due(conn, time.time())
+
+    assert str(item_id) not in conn.zsets[SCHEDULE.key]
+
+
+def test_next_run_adds_interval_and_bounded_jitter():
+    last = datetime(2026, 1, 1, tzinfo=UTC)
+    for _ in range(50):
+        due = SCHEDULE.next_run(15, last)
+        offset = due - (last + timedelta(minutes=15)).timestamp()
+        assert 0 <= offset <= 15 * 60 * schedule_mod.JITTER_FRACTION
+    for _ in range(50):
+        due = SCHEDULE.next_run(24 * 60, last)
+        offset = due - (last + timedelta(days=1)).timestamp()
+        assert 0 <= offset <= MAX_JITTER_SECONDS
+
+
+def test_seed_keeps_existing_due_times_and_marks_seeded(conn):
+    known, never, fresh = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+    SCHEDULE.set_due(conn, known, 42.0)
+    last = datetime.now(UTC) - timedelta(minutes=5)
+    assert not SCHEDULE.is_seeded(conn)
+
+    SCHEDULE.seed(conn, [(known, None, 15), (never, None, 15), (fresh, last, 15)])
+
+    assert SCHEDULE.is_seeded(conn)
+    assert conn.ttls[SCHEDULE._seeded_key] == schedule_mod.SEEDED_TTL_SECONDS
+    scores = conn.zsets[SCHEDULE.key]
+    assert scores[str(known)] == 42.0
+    assert scores[str(never)] <= time.time() + MAX_JITTER_SECONDS
+    assert scores[str(fresh)] >= (last + timedelta(minutes=15)).timestamp()
+    assert SCHEDULE.backlog(conn) == 1
+
+
+def test_backlog_metric_reads_due_counts(conn, monkeypatch):
+    from clara.metrics import SyncBacklogCollector
+
+    monkeypatch.setattr("clara.metrics.get_redis", lambda: conn)
+    schedule_mod.DAV_SCHEDULE.set_due(conn, uuid.uuid4(), 0)
+    schedule_mod.DAV_SCHEDULE.set_due(conn, uuid.uuid4(), time.time() + 600)
+
+    (family,) = SyncBacklogCollector().collect()
+
+    values = {s.labels["schedule"]: s.value for s in family.samples}
+    assert values == {"dav_sync": 1, "git_sync": 0}
+
+
+def test_release_clears_marker_and_keeps_due_time(conn):
+    item_id = uuid.uuid4()
+    SCHEDULE.set_due(conn, item_id, 1234.0)
+    queue = MagicMock()
+    assert SCHEDULE.enqueue(conn, queue, item_id)
+
+    SCHEDULE.release(conn, item_id)
+
+    assert conn.zsets[SCHEDULE.key] == {str(item_id): 1234.0}
+    assert SCHEDULE.enqueue(conn, queue, item_id)
+
+
+def test_locked_sync_job_releases_its_marker(conn, monkeypatch):
+    import redis
+
+    from clara.jobs import dav_sync
+    from clara.jobs.schedule import DAV_SCHEDULE
+
+    lock = MagicMock()
+    lock.acquire.return_value = False
+    monkeypatch.setattr(conn, "lock", lambda *a, **kw: lock, raising=False)
+    monkeypatch.setattr(redis.Redis, "from_url", lambda *a, **kw: conn)
+    account_id = str(uuid.uuid4())
+    assert DAV_SCHEDULE.enqueue(conn, MagicMock(), account_id)
+
+    dav_sync.sync_dav_account(account_id)
+
+    assert not conn.exists(DAV_SCHEDULE._queued_key(account_id))
+
+
+async def test_new_account_is_scheduled_only_after_commit(
+    conn, db_session, vault, monkeypatch
+):
+    from clara.database import run_after_commit
+    from clara.dav_sync.repository import (
+        DavSyncAccountRepository,
+        DavSyncMappingRepository,
+    )
+    from clara.dav_sync.schemas import DavSyncAccountCreate
+    from clara.dav_sync.service import DavSyncService
+    from clara.jobs.schedule import DAV_SCHEDULE
+
+    monkeypatch.setattr("clara.dav_sync.service.get_redis", lambda: conn)
+    service = DavSyncService(
+        DavSyncAccountRepository(session=db_session, vault_id=vault.id),
+        DavSyncMappingRepository(session=db_session, vault_id=vault.id),
+    )
+    account = await service.create_account(
+        DavSyncAccountCreate(
+            name="Home", server_url="https://dav.example", username="u", password="p"
+        )
+    )
+    assert DAV_SCHEDULE.key not in conn.zsets
+
+    await run_after_commit(db_session)
+    assert str(account.id) in conn.zsets[DAV_SCHEDULE.key]
+
+
+async def test_account_lost_by_failed_set_due_is_added_by_reseed(
+    conn, db_session, vault, monkeypatch
+):
+    from clara.database import run_after_commit
+    from clara.dav_sync.repository import (
+        DavSyncAccountRepository,
+        DavSyncMappingRepository,
+    )
+    from clara.dav_sync.schemas import DavSyncAccountCreate
+    from clara.dav_sync.service import DavSyncService
+    from clara.jobs import dav_sync
+    from clara.jobs.schedule import DAV_SCHEDULE
+
+    def redis_down(*args, **kwargs):
+        raise ConnectionError("redis unavailable")
+
+    DAV_SCHEDULE.seed(conn, [])  # seeded before the account existed
+    monkeypatch.setattr(SyncSchedule, "set_due", redis_down)
+    monkeypatch.setattr("clara.dav_sync.service.get_redis", lambda: conn)
+    service = DavSyncService(
+        DavSyncAccountRepository(session=db_session, vault_id=vault.id),
+        DavSyncMappingRepository(session=db_session, vault_id=vault.id),
+    )
+    account = await service.create_account(
+        DavSyncAccountCreate(
+            name="Home", server_url="https://dav.example", username="u", password="p"
+        )
+    )
+    await run_after_commit(db_session)  # logs the failure
+    assert str(account.id) not in conn.zsets.get(DAV_SCHEDULE.key, {})
+
+    # The seeded marker expires; the next tick reloads the index.
+    conn.delete(DAV_SCHEDULE._seeded_key)
+    monkeypatch.setattr(redis.Redis, "from_url", lambda *a, **kw: conn)
+    monkeypatch.setattr(SyncSchedule, "enqueue_due", lambda *a, **kw: {})
+    sync_session = db_session.sync_session
+    monkeypatch.setattr(sync_session, "close", lambda: None)
+    monkeypatch.setattr(dav_sync, "get_sync_session", lambda: sync_session)
+    await db_session.run_sync(lambda _: dav_sync.schedule_dav_syncs())
+
+    assert str(account.id) in conn.zsets[DAV_SCHEDULE.key]
+
+
+async def test_manual_full_sync_conflicts_with_queued_run(
+    conn, db_session, vault, monkeypatch
+):
+    from clara.exceptions import ConflictError
+    from clara.git_sync.repository import (
+        GitSyncConfigRepository,
+        GitSyncMappingRepository,
+    )
+    from clara.git_sync.schemas import GitSyncConfigCreate
+    from clara.git_sync.service import GitSyncService
+
+    queue = MagicMock()
+    monkeypatch.setattr("clara.git_sync.service.get_redis", lambda: conn)
+    monkeypatch.setattr("clara.git_sync.service.get_queue", lambda: queue)
+    service = GitSyncService(
+        GitSyncConfigRepository(session=db_session, vault_id=vault.id),
+        GitSyncMappingRepository(session=db_session, vault_id=vault.id),
+    )
+    await service.create_config(
+        GitSyncConfigCreate(
+            repo_url="https://git.example/notes.git", auth_type="pat", credential="t"
+        )
+    )
+
+    await service.trigger_sync()
+    with pytest.raises(ConflictError):
+        await service.trigger_sync(full=True)
+    assert queue.enqueue.call_count == 1
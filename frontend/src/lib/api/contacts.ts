@@ -3,6 +3,7 @@ import type {
   Address,
   Contact,
   ContactMethod,
+  ContactSuggestion,
   ContactRelationship,
   Pet,
   RelationshipType,
@@ -35,6 +36,12 @@ export const contactsApi = {
     );
   },
 
+  suggest(vaultId: string, q: string, limit?: number) {
+    return api.get<ContactSuggestion[]>(
+      `/vaults/${vaultId}/contacts/suggest${qs({ q, limit })}`
+    );
+  },
+
   get(vaultId: string, contactId: string) {
     return api.get<Contact>(`/vaults/${vaultId}/contacts/${contactId}`);
   },
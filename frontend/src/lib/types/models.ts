@@ -69,6 +69,12 @@ export interface Contact {
   updated_at: string;
 }
 
+export interface ContactSuggestion {
+  id: string;
+  display_name: string;
+  photo_file_id: string | null;
+}
+
 // --- Activities ---
 
 export interface ActivityType {